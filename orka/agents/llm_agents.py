@@ -817,18 +817,21 @@ class OpenAIBinaryAgent(OpenAIAnswerBuilder):
         enhanced_input = ctx.copy()
         enhanced_input["prompt"] = enhanced_prompt
 
-        # Store the agent-enhanced prompt with template variables resolved
-        # We need to render the enhanced prompt with the input data to show the actual prompt sent
-        try:
-            template = Template(enhanced_prompt)
-            rendered_enhanced_prompt = template.render(input=ctx.get("input", ""))
-            self._last_formatted_prompt = rendered_enhanced_prompt
-        except Exception:
-            # Fallback: simple replacement if Jinja2 fails
-            self._last_formatted_prompt = enhanced_prompt.replace(
-                "{{ input }}",
-                str(ctx.get("input", "")),
-            )
+        # Resolve the agent-enhanced prompt for this call only, reusing the prompt
+        # already rendered by the execution engine when there is one
+        if ctx.get("formatted_prompt"):
+            formatted_prompt = f"{ctx['formatted_prompt']}\n\n{constraints}"
+        else:
+            try:
+                template = Template(enhanced_prompt)
+                rendered_enhanced_prompt = template.render(input=ctx.get("input", ""))
+                formatted_prompt = rendered_enhanced_prompt
+            except Exception:
+                # Fallback: simple replacement if Jinja2 fails
+                formatted_prompt = enhanced_prompt.replace(
+                    "{{ input }}",
+                    str(ctx.get("input", "")),
+                )
 
         # Get the answer using the enhanced prompt
         response_data = await super()._run_impl(enhanced_input)
@@ -841,16 +844,14 @@ class OpenAIBinaryAgent(OpenAIAnswerBuilder):
             else:
                 answer = response_data.get("response", "")
             # Preserve metrics and LLM response details for bubbling up
-            self._last_metrics = response_data.get("_metrics", {})
-            self._last_response = response_data.get("response", "")
-            self._last_confidence = response_data.get("confidence", "0.0")
-            self._last_internal_reasoning = response_data.get("internal_reasoning", "")
+            metrics = response_data.get("_metrics", {})
+            confidence = response_data.get("confidence", "0.0")
+            internal_reasoning = response_data.get("internal_reasoning", "")
         else:
             answer = str(response_data)  # type: ignore [unreachable]
-            self._last_metrics = {}
-            self._last_response = answer
-            self._last_confidence = "0.0"
-            self._last_internal_reasoning = "Non-JSON response from LLM"
+            metrics = {}
+            confidence = "0.0"
+            internal_reasoning = "Non-JSON response from LLM"
 
         # Convert to binary decision
         if isinstance(answer, bool):
@@ -866,12 +867,11 @@ class OpenAIBinaryAgent(OpenAIAnswerBuilder):
         # Return a dictionary matching the supertype's return
         return {
             "response": is_true,
-            "confidence": self._last_confidence,
-            "internal_reasoning": self._last_internal_reasoning,
-            "_metrics": self._last_metrics,
-            "formatted_prompt": response_data.get(
-                "formatted_prompt", ""
-            ),  # [OK] FIX: Preserve formatted_prompt
+            "confidence": confidence,
+            "internal_reasoning": internal_reasoning,
+            "_metrics": metrics,
+            "formatted_prompt": response_data.get("formatted_prompt")
+            or formatted_prompt,  # [OK] FIX: Preserve formatted_prompt
         }
 
 
@@ -938,18 +938,21 @@ class OpenAIClassificationAgent(OpenAIAnswerBuilder):
         enhanced_input = ctx.copy()
         enhanced_input["prompt"] = enhanced_prompt
 
-        # Store the agent-enhanced prompt with template variables resolved
-        # We need to render the enhanced prompt with the input data to show the actual prompt sent
-        try:
-            template = Template(enhanced_prompt)
-            rendered_enhanced_prompt = template.render(input=ctx.get("input", ""))
-            self._last_formatted_prompt = rendered_enhanced_prompt
-        except Exception:
-            # Fallback: simple replacement if Jinja2 fails
-            self._last_formatted_prompt = enhanced_prompt.replace(
-                "{{ input }}",
-                str(ctx.get("input", "")),
-            )
+        # Resolve the agent-enhanced prompt for this call only, reusing the prompt
+        # already rendered by the execution engine when there is one
+        if ctx.get("formatted_prompt"):
+            formatted_prompt = f"{ctx['formatted_prompt']} {constrains}\n Options:{categories}"
+        else:
+            try:
+                template = Template(enhanced_prompt)
+                rendered_enhanced_prompt = template.render(input=ctx.get("input", ""))
+                formatted_prompt = rendered_enhanced_prompt
+            except Exception:
+                # Fallback: simple replacement if Jinja2 fails
+                formatted_prompt = enhanced_prompt.replace(
+                    "{{ input }}",
+                    str(ctx.get("input", "")),
+                )
 
         # Use parent class to make the API call
         response_data = await super()._run_impl(enhanced_input)
@@ -960,16 +963,14 @@ class OpenAIClassificationAgent(OpenAIAnswerBuilder):
             raw_category = response_data.get("category")
             answer = raw_category if raw_category is not None else response_data.get("response", "")
             # Preserve metrics and LLM response details for bubbling up
-            self._last_metrics = response_data.get("_metrics", {})
-            self._last_response = response_data.get("response", "")
-            self._last_confidence = response_data.get("confidence", "0.0")
-            self._last_internal_reasoning = response_data.get("internal_reasoning", "")
+            metrics = response_data.get("_metrics", {})
+            confidence = response_data.get("confidence", "0.0")
+            internal_reasoning = response_data.get("internal_reasoning", "")
         else:
             answer = str(response_data)  # type: ignore [unreachable]
-            self._last_metrics = {}
-            self._last_response = answer
-            self._last_confidence = "0.0"
-            self._last_internal_reasoning = "Non-JSON response from LLM"
+            metrics = {}
+            confidence = "0.0"
+            internal_reasoning = "Non-JSON response from LLM"
 
         # Validate category against provided options if present
         if categories and isinstance(answer, str) and answer not in categories:
@@ -978,10 +979,9 @@ class OpenAIClassificationAgent(OpenAIAnswerBuilder):
         # Return a dictionary matching the supertype's return
         return {
             "response": answer,
-            "confidence": self._last_confidence,
-            "internal_reasoning": self._last_internal_reasoning,
-            "_metrics": self._last_metrics,
-            "formatted_prompt": response_data.get(
-                "formatted_prompt", ""
-            ),  # [OK] FIX: Preserve formatted_prompt
+            "confidence": confidence,
+            "internal_reasoning": internal_reasoning,
+            "_metrics": metrics,
+            "formatted_prompt": response_data.get("formatted_prompt")
+            or formatted_prompt,  # [OK] FIX: Preserve formatted_prompt
         }
@@ -120,7 +120,7 @@ class Brain:
 
         # Core components
         self._analyzer = ContextAnalyzer(llm_client=llm_client)
-        self._graph = SkillGraph(memory=memory)
+        self._graph = SkillGraph(memory=memory, embedder=embedder)
         self._transfer = SkillTransferEngine(
             skill_graph=self._graph,
             context_analyzer=self._analyzer,
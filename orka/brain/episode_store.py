@@ -21,6 +21,11 @@ Episodes are indexed by:
 
 Retention is count-based (sliding window per domain), not TTL-based.
 Failure episodes get 2× retention because they carry more information.
+
+Semantic recall keeps each domain's recent candidates in memory as a
+unit-normalised embedding matrix, so a query costs one ``ZREVRANGE`` to check
+the candidate list plus a single matrix-vector product. Episodes that are new
+to the process are fetched in one ``MGET`` (episode JSON and vectors).
 """
 
 from __future__ import annotations
@@ -28,6 +33,8 @@ from __future__ import annotations
 import json
 import logging
 import math
+import threading
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
@@ -48,6 +55,39 @@ _TYPE_PREFIX = "orka:brain:episode:type:"
 _CLEANUP_INTERVAL_SECONDS = 3600  # 1 hour
 _DEFAULT_MAX_PER_DOMAIN = 200
 _FAILURE_RETENTION_FACTOR = 2
+_RECALL_CANDIDATES = 200
+
+
+@dataclass
+class _RecallIndex:
+    """Recency-ordered recall candidates with their embedding matrix.
+
+    ``vectors`` is parallel to ``episodes`` (``None`` where no vector exists).
+    Matrices are built lazily per query dimension and cached.
+    """
+
+    ids: tuple[str, ...]
+    episodes: list[Episode]
+    vectors: list[Any]
+    _matrices: dict[int, tuple[Any, Any, Any]] = field(default_factory=dict, repr=False)
+
+    def matrix(self, dim: int) -> tuple[Any, Any, Any]:
+        """Return ``(unit_rows, positions, nonzero)`` for candidates with ``dim``-sized vectors."""
+        cached = self._matrices.get(dim)
+        if cached is None:
+            import numpy as np
+
+            positions = [i for i, vec in enumerate(self.vectors) if vec is not None and vec.shape == (dim,)]
+            if positions:
+                rows = np.vstack([self.vectors[i] for i in positions]).astype(np.float32, copy=False)
+            else:
+                rows = np.empty((0, dim), dtype=np.float32)
+            norms = np.linalg.norm(rows, axis=1, keepdims=True)
+            nonzero = norms[:, 0] > 0
+            unit_rows = np.divide(rows, norms, out=np.zeros_like(rows), where=norms > 0)
+            cached = (unit_rows, np.asarray(positions, dtype=np.intp), nonzero)
+            self._matrices[dim] = cached
+        return cached
 
 
 class EpisodeStore:
@@ -67,6 +107,10 @@ class EpisodeStore:
         self._memory = getattr(memory, "redis", None) or memory
         self._embedder = embedder
         self._last_cleanup: datetime = datetime.now(UTC)
+        # In-process recall cache: episode rows by ID and candidate indexes by domain
+        self._rows: dict[str, tuple[Episode, Any]] = {}
+        self._recall_indexes: dict[str | None, _RecallIndex] = {}
+        self._recall_lock = threading.Lock()
 
     # ========== Storage ==========
 
@@ -109,8 +153,11 @@ class EpisodeStore:
 
         # Compute the embedding ONCE here so recall doesn't re-embed every candidate
         # on every query. Best-effort: recall lazily backfills if this is missing.
+        vec = None
         if self._embedder is not None:
-            self._store_embedding(episode.id, episode.to_embedding_text())
+            vec = self._store_embedding(episode.id, episode.to_embedding_text())
+        with self._recall_lock:
+            self._rows[episode.id] = (episode, vec)
 
         logger.debug(
             "Saved episode '%s' (domain=%s, success=%s)",
@@ -129,7 +176,7 @@ class EpisodeStore:
         try:
             import numpy as np
 
-            vec = np.asarray(self._embedder.encode(text), dtype=np.float32)
+            vec = np.asarray(self._embedder.encode(text), dtype=np.float32).ravel()
             self._memory.set(f"{_VEC_PREFIX}{episode_id}", vec.tobytes())
             return vec
         except Exception:  # pragma: no cover - embedding cache is best-effort
@@ -164,6 +211,23 @@ class EpisodeStore:
         data = json.loads(raw)
         return Episode.from_dict(data)
 
+    def _get_episodes(self, episode_ids: list[str]) -> list[Episode]:
+        """Retrieve several episodes in one round trip, skipping missing ones."""
+        raws = self._mget([f"{_EPISODE_PREFIX}{eid}" for eid in episode_ids])
+        return [Episode.from_dict(json.loads(raw)) for raw in raws if raw is not None]
+
+    def _mget(self, keys: list[str]) -> list[Any]:
+        """``MGET`` when the backend supports it, one ``GET`` per key otherwise."""
+        if not keys:
+            return []
+        mget = getattr(self._memory, "mget", None)
+        if callable(mget):
+            try:
+                return list(mget(keys))
+            except Exception:
+                logger.debug("MGET failed, loading %d keys one by one", len(keys))
+        return [self._memory.get(key) for key in keys]
+
     def delete_episode(self, episode_id: str) -> bool:
         """Remove an episode and clean up all indexes.
 
@@ -195,6 +259,8 @@ class EpisodeStore:
             self._memory.delete(f"{_VEC_PREFIX}{episode_id}")
         except Exception:  # pragma: no cover
             pass
+        with self._recall_lock:
+            self._rows.pop(episode_id, None)
 
         logger.debug("Deleted episode %s", episode_id)
         return True
@@ -220,13 +286,7 @@ class EpisodeStore:
         else:
             ids = self._memory.zrevrange(_TIMELINE_KEY, 0, limit - 1)
 
-        episodes = []
-        for eid in ids:
-            eid_str = eid if isinstance(eid, str) else eid.decode("utf-8")
-            ep = self.get_episode(eid_str)
-            if ep is not None:
-                episodes.append(ep)
-        return episodes
+        return self._get_episodes(_decode_ids(ids))
 
     def find_by_domain(self, domain: str, limit: int = 50) -> list[Episode]:
         """Find episodes in a specific domain, newest first.
@@ -250,13 +310,7 @@ class EpisodeStore:
             List of failed episodes.
         """
         ids = self._memory.zrevrange(_FAILURES_KEY, 0, limit - 1)
-        episodes = []
-        for eid in ids:
-            eid_str = eid if isinstance(eid, str) else eid.decode("utf-8")
-            ep = self.get_episode(eid_str)
-            if ep is not None:
-                episodes.append(ep)
-        return episodes
+        return self._get_episodes(_decode_ids(ids))
 
     def count(self, domain: str | None = None) -> int:
         """Count stored episodes.
@@ -291,58 +345,125 @@ class EpisodeStore:
         Returns:
             List of ``(episode, similarity_score)`` tuples, sorted by score.
         """
-        # Get candidate episodes
-        candidates = self.list_episodes(domain=domain, limit=200)
-        if not candidates:
+        index = self._recall_index(domain)
+        if not index.episodes:
             return []
 
         if self._embedder is not None:
-            return self._vector_search(query_text, candidates, top_k)
-        return self._keyword_search(query_text, candidates, top_k)
+            return self._vector_search(query_text, index.episodes, top_k, recall_index=index)
+        return self._keyword_search(query_text, index.episodes, top_k)
+
+    def _recall_index(self, domain: str | None) -> _RecallIndex:
+        """Return the recall candidates for ``domain``, reusing the cached index.
+
+        The candidate IDs are always read from Redis, so episodes written or
+        removed by other processes are picked up. Only rows this process has
+        not seen yet are fetched.
+        """
+        key = f"{_DOMAIN_PREFIX}{domain}" if domain else _TIMELINE_KEY
+        ids = tuple(_decode_ids(self._memory.zrevrange(key, 0, _RECALL_CANDIDATES - 1)))
+        cached = self._recall_indexes.get(domain)
+        if cached is not None and cached.ids == ids:
+            return cached
+
+        index = self._build_recall_index(ids)
+        with self._recall_lock:
+            self._recall_indexes[domain] = index
+            live = {eid for cached_index in self._recall_indexes.values() for eid in cached_index.ids}
+            for eid in [eid for eid in self._rows if eid not in live]:
+                del self._rows[eid]
+        return index
+
+    def _build_recall_index(
+        self,
+        ids: tuple[str, ...],
+        episodes: dict[str, Episode] | None = None,
+    ) -> _RecallIndex:
+        """Assemble a recall index for ``ids``, batch-loading uncached rows.
+
+        ``episodes`` supplies already-loaded episodes so only their vectors are
+        fetched.
+        """
+        with self._recall_lock:
+            rows = {eid: self._rows[eid] for eid in ids if eid in self._rows}
+        missing = [eid for eid in ids if eid not in rows]
+
+        if missing:
+            if episodes is not None:
+                loaded = [episodes[eid] for eid in missing]
+            else:
+                raws = self._mget([f"{_EPISODE_PREFIX}{eid}" for eid in missing])
+                loaded = [Episode.from_dict(json.loads(raw)) if raw is not None else None for raw in raws]
+
+            vectors: list[Any] = [None] * len(missing)
+            if self._embedder is not None:
+                import numpy as np
+
+                raw_vectors = self._mget([f"{_VEC_PREFIX}{eid}" for eid in missing])
+                vectors = [np.frombuffer(raw, dtype=np.float32) if raw else None for raw in raw_vectors]
+
+            new_rows = {}
+            for eid, ep, vec in zip(missing, loaded, vectors):
+                if ep is None:
+                    continue
+                if vec is None and self._embedder is not None:
+                    # Backfill: episode saved before the embedding cache existed.
+                    vec = self._store_embedding(eid, ep.to_embedding_text())
+                new_rows[eid] = (ep, vec)
+            rows.update(new_rows)
+            with self._recall_lock:
+                self._rows.update(new_rows)
+
+        present = [eid for eid in ids if eid in rows]
+        return _RecallIndex(
+            ids=ids,
+            episodes=[rows[eid][0] for eid in present],
+            vectors=[rows[eid][1] for eid in present],
+        )
 
     def _vector_search(
         self,
         query_text: str,
         candidates: list[Episode],
         top_k: int,
+        recall_index: _RecallIndex | None = None,
     ) -> list[tuple[Episode, float]]:
         """Semantic search via sentence embeddings.
 
-        Encodes the query ONCE and reuses each episode's vector persisted at save time
-        (lazily backfilling any episode that predates the embedding cache), instead of
-        re-encoding every candidate on every call.
+        Encodes the query once and scores every candidate with a single
+        matrix-vector product against the vectors persisted at save time, then
+        selects the top ``top_k`` with ``argpartition``. Ties keep recency order.
         """
         if self._embedder is None:
             return self._keyword_search(query_text, candidates, top_k)
         try:
             import numpy as np
 
-            query_vec = np.asarray(self._embedder.encode(query_text), dtype=np.float32)
+            query_vec = np.asarray(self._embedder.encode(query_text), dtype=np.float32).ravel()
         except Exception:
             logger.warning("Embedder failed, falling back to keyword search")
             return self._keyword_search(query_text, candidates, top_k)
 
+        if recall_index is None:
+            recall_index = self._build_recall_index(
+                tuple(ep.id for ep in candidates), episodes={ep.id: ep for ep in candidates}
+            )
+
+        unit_rows, positions, nonzero = recall_index.matrix(query_vec.shape[0])
+        if top_k <= 0 or not len(positions):
+            return []
+
         norm_q = float(np.linalg.norm(query_vec))
-        scored: list[tuple[Episode, float]] = []
-        for ep in candidates:
-            ep_vec = self._load_embedding(ep.id)
-            if ep_vec is None:
-                # Backfill: episode saved before the embedding cache existed.
-                ep_vec = self._store_embedding(ep.id, ep.to_embedding_text())
-            if ep_vec is None:
-                continue
-            try:
-                norm_e = float(np.linalg.norm(ep_vec))
-                if norm_q > 0 and norm_e > 0:
-                    sim = (float(np.dot(query_vec, ep_vec)) / (norm_q * norm_e) + 1) / 2
-                else:
-                    sim = 0.0
-                scored.append((ep, sim))
-            except Exception:
-                continue
+        if norm_q > 0:
+            scores = (unit_rows @ (query_vec / norm_q) + 1) / 2
+            scores[~nonzero] = 0.0
+        else:
+            scores = np.zeros(len(positions), dtype=np.float32)
 
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:top_k]
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(recall_index.episodes[positions[i]], float(scores[i])) for i in top]
 
     def _keyword_search(
         self,
@@ -430,3 +551,7 @@ class EpisodeStore:
         if (now - self._last_cleanup).total_seconds() >= _CLEANUP_INTERVAL_SECONDS:
             self.cleanup(max_per_domain=max_per_domain)
             self._last_cleanup = now
+
+
+def _decode_ids(ids: list[Any]) -> list[str]:
+    return [eid if isinstance(eid, str) else eid.decode("utf-8") for eid in ids]
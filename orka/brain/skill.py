@@ -367,6 +367,10 @@ class Skill:
             anti_signals=data.get("anti_signals", []),
         )
 
+    def to_semantic_text(self) -> str:
+        """Text compared on the transfer engine's semantic axis (meaning, not structure)."""
+        return self.task_description or self.description or self.to_embedding_text()
+
     def to_embedding_text(self) -> str:
         """Generate text representation for vector embedding.
 
@@ -26,10 +26,15 @@ The graph enables:
 2. Composing complex skills from simpler building blocks
 3. Tracing the lineage of skill evolution
 4. Identifying skill clusters and gaps
+
+When an embedder is supplied, each skill's semantic text is embedded at save
+time and persisted next to the skill (prefixed with a digest of the text, so a
+vector is only reused while the text it was computed from is unchanged).
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from datetime import UTC, datetime
@@ -56,6 +61,14 @@ _SKILL_INDEX = "orka:brain:skill_index"
 _SKILL_TAGS_PREFIX = "orka:brain:tags:"
 _SKILL_TYPE_INDEX_PREFIX = "orka:brain:type_index:"
 _SKILL_DOMAIN_INDEX_PREFIX = "orka:brain:domain_index:"
+_SKILL_VEC_PREFIX = "orka:brain:skill_vec:"
+
+# Stored vectors are prefixed with the SHA-1 of the text they embed
+_DIGEST_SIZE = 20
+
+
+def _text_digest(text: str) -> bytes:
+    return hashlib.sha1(text.encode("utf-8")).digest()
 
 
 class SkillGraph:
@@ -70,13 +83,16 @@ class SkillGraph:
     Args:
         memory: A memory logger instance (RedisStackMemoryLogger or compatible)
             that provides Redis primitive operations (hset, hget, etc.).
+        embedder: Optional sentence embedding model. When given, skill vectors
+            are computed at save time for :class:`~orka.brain.transfer_engine.SkillTransferEngine`.
     """
 
-    def __init__(self, memory: Any) -> None:
+    def __init__(self, memory: Any, embedder: Any | None = None) -> None:
         # Uses raw Redis primitives (hset/sadd/srem/smembers/...) which the
         # RedisStackMemoryLogger does not fully proxy; it exposes the raw client as
         # `.redis`. Test fakes implement the primitives directly (no `.redis`).
         self._memory = getattr(memory, "redis", None) or memory
+        self._embedder = embedder
 
     # ========== Skill CRUD ==========
 
@@ -94,14 +110,7 @@ class SkillGraph:
         self._memory.set(key, data)
 
         # Set Redis native TTL for automatic eviction
-        if skill.expires_at:
-            try:
-                expires_dt = datetime.fromisoformat(skill.expires_at)
-                ttl_seconds = int((expires_dt - datetime.now(UTC)).total_seconds())
-                if ttl_seconds > 0 and hasattr(self._memory, "expire"):
-                    self._memory.expire(key, ttl_seconds)
-            except (ValueError, TypeError):
-                pass
+        self._expire_with_skill(key, skill)
 
         # Index by name for fast lookup
         self._memory.hset(_SKILL_INDEX, skill.id, skill.name)
@@ -118,9 +127,70 @@ class SkillGraph:
         for domain in skill.domain_keywords:
             self._memory.sadd(f"{_SKILL_DOMAIN_INDEX_PREFIX}{domain}", skill.id)
 
+        if self._embedder is not None:
+            self._embed_skill(skill)
+
         logger.debug(f"Saved skill '{skill.name}' ({skill.id})")
         return skill.id
 
+    def _expire_with_skill(self, key: str, skill: Skill) -> None:
+        """Give ``key`` the skill's remaining TTL, if it has one."""
+        if not skill.expires_at:
+            return
+        try:
+            expires_dt = datetime.fromisoformat(skill.expires_at)
+            ttl_seconds = int((expires_dt - datetime.now(UTC)).total_seconds())
+            if ttl_seconds > 0 and hasattr(self._memory, "expire"):
+                self._memory.expire(key, ttl_seconds)
+        except (ValueError, TypeError):
+            pass
+
+    # ---- embedding cache (vectors persisted alongside skills) ----
+
+    def _embed_skill(self, skill: Skill) -> None:
+        """Persist the skill's vector unless the stored one already matches its text."""
+        try:
+            import numpy as np
+
+            text = skill.to_semantic_text()
+            stored = self._memory.get(f"{_SKILL_VEC_PREFIX}{skill.id}")
+            if isinstance(stored, bytes) and stored[:_DIGEST_SIZE] == _text_digest(text):
+                return
+            self.store_skill_vector(skill, np.asarray(self._embedder.encode(text), dtype=np.float32))
+        except Exception:  # pragma: no cover - embedding cache is best-effort
+            logger.debug(f"Failed to store embedding for skill {skill.id}")
+
+    def store_skill_vector(self, skill: Skill, vector: Any) -> None:
+        """Persist ``vector`` as the embedding of ``skill``'s current semantic text."""
+        import numpy as np
+
+        key = f"{_SKILL_VEC_PREFIX}{skill.id}"
+        record = _text_digest(skill.to_semantic_text()) + np.asarray(vector, dtype=np.float32).ravel().tobytes()
+        self._memory.set(key, record)
+        self._expire_with_skill(key, skill)
+
+    def load_skill_vectors(self, skills: list[Skill]) -> list[Any]:
+        """Load the stored vectors of ``skills`` in one round trip.
+
+        Returns:
+            One float32 vector per skill, or ``None`` where no vector is stored
+            or it was computed from a different text.
+        """
+        import numpy as np
+
+        raws = self._mget([f"{_SKILL_VEC_PREFIX}{skill.id}" for skill in skills])
+        vectors: list[Any] = []
+        for skill, raw in zip(skills, raws):
+            if (
+                isinstance(raw, bytes)
+                and len(raw) > _DIGEST_SIZE
+                and raw[:_DIGEST_SIZE] == _text_digest(skill.to_semantic_text())
+            ):
+                vectors.append(np.frombuffer(raw[_DIGEST_SIZE:], dtype=np.float32))
+            else:
+                vectors.append(None)
+        return vectors
+
     def get_skill(self, skill_id: str) -> Skill | None:
         """Retrieve a skill by ID.
 
@@ -137,6 +207,24 @@ class SkillGraph:
         data = json.loads(raw)
         return Skill.from_dict(data)
 
+    def _get_skills(self, skill_ids: list[Any]) -> list[Skill]:
+        """Retrieve several skills in one round trip, skipping missing ones."""
+        ids = [sid if isinstance(sid, str) else sid.decode("utf-8") for sid in skill_ids]
+        raws = self._mget([f"{_SKILL_PREFIX}{sid}" for sid in ids])
+        return [Skill.from_dict(json.loads(raw)) for raw in raws if raw is not None]
+
+    def _mget(self, keys: list[str]) -> list[Any]:
+        """``MGET`` when the backend supports it, one ``GET`` per key otherwise."""
+        if not keys:
+            return []
+        mget = getattr(self._memory, "mget", None)
+        if callable(mget):
+            try:
+                return list(mget(keys))
+            except Exception:
+                logger.debug(f"MGET failed, loading {len(keys)} keys one by one")
+        return [self._memory.get(key) for key in keys]
+
     def delete_skill(self, skill_id: str) -> bool:
         """Remove a skill and its edges from the graph.
 
@@ -180,6 +268,7 @@ class SkillGraph:
 
         self._memory.delete(edge_key)
         self._memory.delete(f"{_SKILL_PREFIX}{skill_id}")
+        self._memory.delete(f"{_SKILL_VEC_PREFIX}{skill_id}")
 
         logger.debug(f"Deleted skill {skill_id}")
         return True
@@ -191,13 +280,7 @@ class SkillGraph:
             List of all stored, non-expired skills.
         """
         skill_ids = self._memory.hkeys(_SKILL_INDEX)
-        skills = []
-        for sid in skill_ids:
-            sid_str = sid if isinstance(sid, str) else sid.decode("utf-8")
-            skill = self.get_skill(sid_str)
-            if skill and not skill.is_expired:
-                skills.append(skill)
-        return skills
+        return [skill for skill in self._get_skills(skill_ids) if not skill.is_expired]
 
     def find_by_tag(self, tag: str) -> list[Skill]:
         """Find skills that have a specific tag.
@@ -209,13 +292,7 @@ class SkillGraph:
             List of matching skills.
         """
         skill_ids = self._memory.smembers(f"{_SKILL_TAGS_PREFIX}{tag}")
-        skills = []
-        for sid in skill_ids:
-            sid_str = sid if isinstance(sid, str) else sid.decode("utf-8")
-            skill = self.get_skill(sid_str)
-            if skill:
-                skills.append(skill)
-        return skills
+        return self._get_skills(list(skill_ids))
 
     def find_by_type(self, skill_type: str) -> list[Skill]:
         """Find skills of a given type (e.g. ``execution_recipe``).
@@ -227,13 +304,7 @@ class SkillGraph:
             Non-expired skills matching *skill_type*.
         """
         skill_ids = self._memory.smembers(f"{_SKILL_TYPE_INDEX_PREFIX}{skill_type}")
-        skills = []
-        for sid in skill_ids:
-            sid_str = sid if isinstance(sid, str) else sid.decode("utf-8")
-            skill = self.get_skill(sid_str)
-            if skill and not skill.is_expired:
-                skills.append(skill)
-        return skills
+        return [skill for skill in self._get_skills(list(skill_ids)) if not skill.is_expired]
 
     def find_by_domain(self, domain: str) -> list[Skill]:
         """Find skills indexed under a domain keyword.
@@ -245,13 +316,7 @@ class SkillGraph:
             Non-expired skills matching *domain*.
         """
         skill_ids = self._memory.smembers(f"{_SKILL_DOMAIN_INDEX_PREFIX}{domain}")
-        skills = []
-        for sid in skill_ids:
-            sid_str = sid if isinstance(sid, str) else sid.decode("utf-8")
-            skill = self.get_skill(sid_str)
-            if skill and not skill.is_expired:
-                skills.append(skill)
-        return skills
+        return [skill for skill in self._get_skills(list(skill_ids)) if not skill.is_expired]
 
     def find_filtered(
         self,
@@ -286,12 +351,7 @@ class SkillGraph:
         if candidate_ids is None:
             return self.list_skills()
 
-        skills: list[Skill] = []
-        for sid in candidate_ids:
-            skill = self.get_skill(sid)
-            if skill and not skill.is_expired:
-                skills.append(skill)
-        return skills
+        return [skill for skill in self._get_skills(list(candidate_ids)) if not skill.is_expired]
 
     def cleanup_expired_skills(self) -> dict[str, int]:
         """Delete all expired skills from the graph.
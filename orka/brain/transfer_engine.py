@@ -115,6 +115,9 @@ class SkillTransferEngine:
         self._graph = skill_graph
         self._analyzer = context_analyzer or ContextAnalyzer()
         self._embedder = embedder
+        # Skill vectors by ID (with the text they embed) and the last scored matrix
+        self._skill_vectors: dict[str, tuple[str, Any]] = {}
+        self._skill_matrix: tuple[tuple[tuple[str, str], ...], Any, Any] | None = None
 
     def find_transferable_skills(
         self,
@@ -172,10 +175,11 @@ class SkillTransferEngine:
             logger.debug("No skills in graph, nothing to transfer")
             return []
 
-        # Score each skill
+        # Score each skill; the semantic axis is scored for all skills in one pass
+        semantic_scores = self._semantic_scores(all_skills, target_features)
         candidates: list[TransferCandidate] = []
-        for skill in all_skills:
-            candidate = self._score_skill(skill, target_features, target_context)
+        for skill, semantic in zip(all_skills, semantic_scores):
+            candidate = self._score_skill(skill, target_features, target_context, semantic=semantic)
             if candidate.combined_score >= min_score:
                 candidates.append(candidate)
 
@@ -189,6 +193,7 @@ class SkillTransferEngine:
         skill: Skill,
         target_features: ContextFeatures,
         target_context: dict[str, Any],
+        semantic: float | None = None,
     ) -> TransferCandidate:
         """Score a single skill's applicability to a target context.
 
@@ -196,6 +201,8 @@ class SkillTransferEngine:
             skill: The skill to evaluate.
             target_features: Abstract features of the target context.
             target_context: Raw target context dictionary.
+            semantic: Precomputed semantic similarity; computed for this skill
+                alone when omitted.
 
         Returns:
             A scored TransferCandidate.
@@ -205,7 +212,8 @@ class SkillTransferEngine:
         structural = target_features.similarity_to(source_features)
 
         # 2. Semantic similarity (via embeddings if available)
-        semantic = self._compute_semantic_similarity(skill, target_features)
+        if semantic is None:
+            semantic = self._compute_semantic_similarity(skill, target_features)
 
         # Semantic floor — if content is unrelated, don't transfer
         if semantic < 0.1 and structural < 0.6:
@@ -251,6 +259,72 @@ class SkillTransferEngine:
             reasoning=reasoning,
         )
 
+    def _semantic_scores(self, skills: list[Skill], target_features: ContextFeatures) -> list[float]:
+        """Semantic similarity of every skill to the target context.
+
+        With an embedder, the target text is encoded once and all skills are scored
+        with a single matrix-vector product against their cached vectors. Falls back
+        to keyword overlap when embedding fails.
+        """
+        if self._embedder is not None:
+            try:
+                import numpy as np
+
+                target_vec = np.asarray(
+                    self._embedder.encode(self._target_text(target_features)), dtype=np.float32
+                ).ravel()
+                unit_rows, nonzero = self._skill_matrix_for(skills, target_vec.shape[0])
+                norm = float(np.linalg.norm(target_vec))
+                if norm == 0:
+                    return [0.0] * len(skills)
+                # Normalize cosine from [-1, 1] to [0, 1]
+                scores = np.maximum((unit_rows @ (target_vec / norm) + 1.0) / 2.0, 0.0)
+                scores[~nonzero] = 0.0
+                return [float(score) for score in scores]
+            except Exception:
+                logger.debug("Embedder failed, falling back to keyword overlap")
+
+        return [self._keyword_similarity(skill, target_features) for skill in skills]
+
+    def _skill_matrix_for(self, skills: list[Skill], dim: int) -> tuple[Any, Any]:
+        """Unit-normalized skill vectors (one row per skill) and a non-zero-row mask.
+
+        The matrix is reused while the skills and their semantic texts are
+        unchanged; saving a skill with a new text produces a new key.
+        """
+        import numpy as np
+
+        key = tuple((skill.id, skill.to_semantic_text()) for skill in skills)
+        cached = self._skill_matrix
+        if cached is not None and cached[0] == key and cached[1].shape[1] == dim:
+            return cached[1], cached[2]
+
+        vectors: list[Any] = [None] * len(skills)
+        missing: list[int] = []
+        for i, (skill_id, text) in enumerate(key):
+            row = self._skill_vectors.get(skill_id)
+            if row is not None and row[0] == text and row[1].shape == (dim,):
+                vectors[i] = row[1]
+            else:
+                missing.append(i)
+
+        if missing:
+            loaded = self._graph.load_skill_vectors([skills[i] for i in missing])
+            for i, vec in zip(missing, loaded):
+                if vec is None or vec.shape != (dim,):
+                    # Backfill: skill saved without an embedder, or its text changed
+                    vec = np.asarray(self._embedder.encode(key[i][1]), dtype=np.float32).ravel()
+                    self._graph.store_skill_vector(skills[i], vec)
+                vectors[i] = vec
+                self._skill_vectors[key[i][0]] = (key[i][1], vec)
+
+        rows = np.vstack(vectors) if vectors else np.empty((0, dim), dtype=np.float32)
+        norms = np.linalg.norm(rows, axis=1, keepdims=True)
+        unit_rows = np.divide(rows, norms, out=np.zeros_like(rows), where=norms > 0)
+        nonzero = norms[:, 0] > 0
+        self._skill_matrix = (key, unit_rows, nonzero)
+        return unit_rows, nonzero
+
     def _compute_semantic_similarity(self, skill: Skill, target_features: ContextFeatures) -> float:
         """Compute semantic similarity between a skill and target context.
 
@@ -259,17 +333,8 @@ class SkillTransferEngine:
         """
         if self._embedder is not None:
             try:
-                # The SEMANTIC axis compares MEANING (task/description), not structural
-                # tokens — structure is already scored separately by structural_score, so
-                # embedding the shared "structures:/patterns:" boilerplate here would
-                # double-count it and dilute discrimination. Prefer the concrete
-                # task_description/description and the target's goal+task.
-                skill_text = skill.task_description or skill.description or skill.to_embedding_text()
-                target_text = " ".join(
-                    p for p in [target_features.abstract_goal, *target_features.domain_hints] if p
-                ) or target_features.to_embedding_text()
-                skill_vec = self._embedder.encode(skill_text)
-                target_vec = self._embedder.encode(target_text)
+                skill_vec = self._embedder.encode(skill.to_semantic_text())
+                target_vec = self._embedder.encode(self._target_text(target_features))
                 # Cosine similarity
                 import numpy as np
 
@@ -286,6 +351,20 @@ class SkillTransferEngine:
         # Fallback: keyword overlap
         return self._keyword_similarity(skill, target_features)
 
+    @staticmethod
+    def _target_text(target_features: ContextFeatures) -> str:
+        """Text embedded for the target on the semantic axis.
+
+        The SEMANTIC axis compares MEANING (task/description), not structural
+        tokens — structure is already scored separately by structural_score, so
+        embedding the shared "structures:/patterns:" boilerplate here would
+        double-count it and dilute discrimination. Skills use
+        :meth:`Skill.to_semantic_text`; the target uses its goal and domain hints.
+        """
+        return " ".join(
+            p for p in [target_features.abstract_goal, *target_features.domain_hints] if p
+        ) or target_features.to_embedding_text()
+
     def _keyword_similarity(self, skill: Skill, target_features: ContextFeatures) -> float:
         """Simple keyword overlap similarity as a fallback."""
         skill_words = set(skill.to_embedding_text().lower().split())
@@ -20,12 +20,13 @@ for running OrKa workflows.
 
 import logging
 import sys
-from typing import Any
+from typing import Any, Awaitable, TypeVar
 import argparse
 import asyncio
 import json
 
 from orka.orchestrator import Orchestrator
+from orka.orchestrator.execution.trace_writer import wait_for_pending_traces
 from .types import Event
 from .utils import setup_logging
 
@@ -82,6 +83,17 @@ def deep_sanitize_result(obj: Any) -> Any:
         return obj
 
 
+T = TypeVar("T")
+
+
+async def finish_with_traces(run: Awaitable[T]) -> T:
+    """Await ``run``, then the deferred traces it scheduled, before the event loop closes."""
+    try:
+        return await run
+    finally:
+        await wait_for_pending_traces()
+
+
 async def run_cli_entrypoint(
     config_path: str,
     input_text: Any,
@@ -188,7 +200,7 @@ def run_cli(argv: list[str] | None = None) -> int:
 
     if args.command == "run":
         result = asyncio.run(
-            run_cli_entrypoint(args.config, args.input, args.log_to_file, args.verbose)
+            finish_with_traces(run_cli_entrypoint(args.config, args.input, args.log_to_file, args.verbose))
         )
         # Distinguish between None (real failure) and falsy values (valid but empty)
         if result is None:
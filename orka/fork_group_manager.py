@@ -36,13 +36,54 @@ The implementation uses Redis as a coordination mechanism to ensure reliable
 operation in distributed environments.
 """
 
+import asyncio
+import os
+import threading
 import time
-from typing import Any, Dict, List, Optional, Set, Union
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from redis import Redis
 from redis.client import Redis as RedisType
 
 
+def run_id_from(context: Any) -> Optional[str]:
+    """
+    Resolve the run ID for a node invocation context.
+
+    Looks for an explicit ``run_id`` first, then at the orchestrator passed along
+    in the context. Returns None when neither carries a string run ID.
+    """
+    if not isinstance(context, dict):
+        return None
+    run_id = context.get("run_id")
+    if not isinstance(run_id, str):
+        run_id = getattr(context.get("orchestrator"), "run_id", None)
+    return run_id if isinstance(run_id, str) and run_id else None
+
+
+def run_scoped_key(key: str, run_id: Optional[str] = None) -> str:
+    """
+    Namespace a coordination key to a single orchestrator run.
+
+    Keys such as the fork group mapping are looked up by node ID, which is shared by
+    every run of a workflow; prefixing them with the run ID keeps concurrent runs
+    apart. Without a run ID the key is returned unchanged.
+    """
+    return f"run:{run_id}:{key}" if run_id else key
+
+
+def fork_group_mapping_key(node_id: str, run_id: Optional[str] = None) -> str:
+    """Key of the hash mapping a fork node to the group it created in a run."""
+    return run_scoped_key(f"fork_group_mapping:{node_id}", run_id)
+
+
+def fork_agent_to_group_key(run_id: Optional[str] = None) -> str:
+    """Key of the hash mapping forked agents to their fork group in a run."""
+    return run_scoped_key("fork_agent_to_group", run_id)
+
+
 class ForkGroupManager:
     """
     Manages fork groups in the OrKa orchestrator.
@@ -133,7 +174,9 @@ class ForkGroupManager:
         Returns:
             str: A unique fork group ID.
         """
-        return f"{base_id}_{int(time.time())}"
+        # The random suffix keeps groups created in the same second (concurrent
+        # runs of one workflow) apart while ids still sort by creation time.
+        return f"{base_id}_{int(time.time())}-{uuid.uuid4().hex[:8]}"
 
     def _group_key(self, fork_group_id: str) -> str:
         """
@@ -281,7 +324,9 @@ class SimpleForkGroupManager:
         Returns:
             str: A unique fork group ID.
         """
-        return f"{base_id}_{int(time.time())}"
+        # The random suffix keeps groups created in the same second (concurrent
+        # runs of one workflow) apart while ids still sort by creation time.
+        return f"{base_id}_{int(time.time())}-{uuid.uuid4().hex[:8]}"
 
     def track_branch_sequence(self, fork_group_id: str, agent_sequence: List[str]) -> None:
         """
@@ -327,3 +372,209 @@ class SimpleForkGroupManager:
         if group_id not in self._groups:
             raise KeyError(f"Group {group_id} not found")
         self.delete_group(group_id)
+
+
+DEFAULT_MAX_TRACKED_FORK_GROUPS = 1024
+
+
+class _ForkGroupCompletion:
+    """Completion state of one fork group inside this process."""
+
+    __slots__ = ("run_id", "node_id", "expected", "results", "running", "event")
+
+    def __init__(self, expected: List[str], run_id: Optional[str], node_id: Optional[str]) -> None:
+        self.run_id = run_id
+        self.node_id = node_id
+        self.expected = set(expected)
+        self.results: Dict[str, Any] = {}
+        self.running = 0
+        self.event: Optional[asyncio.Event] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.expected.issubset(self.results)
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+
+
+class ForkCompletionRegistry:
+    """
+    In-process completion tracking for fork groups.
+
+    ForkNode opens a group with the agents it expects. The ParallelExecutor and the
+    ResponseProcessor record each agent's result as it finishes. A JoinNode in the same
+    process then merges the recorded results directly. If the group's parallel branches
+    are still running, it awaits them. This replaces polling Redis for pending inputs.
+    The fork keys in Redis are still written, for durability and for joins running in
+    another process.
+
+    The number of tracked groups is bounded (``ORKA_FORK_TRACKED_GROUPS``); the oldest
+    groups are dropped first, and a dropped group simply falls back to Redis.
+    """
+
+    def __init__(self, max_groups: Optional[int] = None) -> None:
+        if max_groups is None:
+            max_groups = int(
+                os.getenv("ORKA_FORK_TRACKED_GROUPS", str(DEFAULT_MAX_TRACKED_FORK_GROUPS))
+            )
+        self.max_groups = max(1, max_groups)
+        self._groups: "OrderedDict[str, _ForkGroupCompletion]" = OrderedDict()
+        self._agent_groups: Dict[Tuple[Optional[str], str], str] = {}
+        self._node_groups: Dict[Tuple[Optional[str], str], str] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "opened": 0,
+            "completed": 0,
+            "joined_in_process": 0,
+            "fallbacks": 0,
+            "evictions": 0,
+        }
+
+    def open(
+        self,
+        group_id: str,
+        agents: List[str],
+        run_id: Optional[str] = None,
+        node_id: Optional[str] = None,
+    ) -> None:
+        """Start tracking ``group_id`` (created by fork ``node_id``) and the agents it waits for."""
+        with self._lock:
+            self._drop(group_id)
+            self._groups[group_id] = _ForkGroupCompletion(agents, run_id, node_id)
+            for agent_id in agents:
+                self._agent_groups[(run_id, agent_id)] = group_id
+            if node_id:
+                self._node_groups[(run_id, node_id)] = group_id
+            self._stats["opened"] += 1
+            while len(self._groups) > self.max_groups:
+                oldest = next(iter(self._groups))
+                self._drop(oldest)
+                self._stats["evictions"] += 1
+
+    def tracks(self, group_id: Optional[str]) -> bool:
+        with self._lock:
+            return group_id in self._groups
+
+    def group_for(self, agent_id: str, run_id: Optional[str] = None) -> Optional[str]:
+        """Return the tracked fork group ``agent_id`` belongs to in ``run_id``."""
+        with self._lock:
+            return self._agent_groups.get((run_id, agent_id))
+
+    def group_for_node(self, node_id: str, run_id: Optional[str] = None) -> Optional[str]:
+        """Return the tracked fork group most recently created by fork ``node_id`` in ``run_id``."""
+        with self._lock:
+            return self._node_groups.get((run_id, node_id))
+
+    def record(self, group_id: str, agent_id: str, result: Any) -> bool:
+        """Store an agent's result; returns True once the group is complete."""
+        with self._lock:
+            state = self._groups.get(group_id)
+            if state is None:
+                return False
+            was_complete = state.complete
+            state.results[agent_id] = result
+            complete = state.complete
+            if complete and not was_complete:
+                self._stats["completed"] += 1
+        if complete:
+            state.wake()
+        return complete
+
+    def begin(self, group_id: str) -> None:
+        """Mark branches of ``group_id`` as executing in this process."""
+        with self._lock:
+            state = self._groups.get(group_id)
+            if state is not None:
+                state.running += 1
+
+    def end(self, group_id: str) -> None:
+        """Mark branch execution of ``group_id`` as finished (successfully or not)."""
+        with self._lock:
+            state = self._groups.get(group_id)
+            if state is None:
+                return
+            state.running = max(0, state.running - 1)
+            idle = state.running == 0
+        if idle:
+            state.wake()
+
+    def completed_results(self, group_id: str) -> Optional[Dict[str, Any]]:
+        """Return the group's results if every expected agent has reported."""
+        with self._lock:
+            state = self._groups.get(group_id)
+            if state is None or not state.complete:
+                return None
+            return {agent_id: state.results[agent_id] for agent_id in sorted(state.expected)}
+
+    async def wait(self, group_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the group's results, awaiting branches still running in this process.
+
+        Returns None when the group is not tracked, cannot complete here (no branch is
+        running and results are missing) or ``timeout`` expires; the caller then falls
+        back to the Redis join state.
+        """
+        with self._lock:
+            state = self._groups.get(group_id)
+            if state is None:
+                return None
+            if not state.complete and state.running:
+                if state.event is None:
+                    state.event = asyncio.Event()
+                event: Optional[asyncio.Event] = state.event
+            else:
+                event = None
+
+        if event is not None:
+            try:
+                while True:
+                    event.clear()
+                    with self._lock:
+                        if state.complete or not state.running:
+                            break
+                    await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        results = self.completed_results(group_id)
+        with self._lock:
+            self._stats["joined_in_process" if results is not None else "fallbacks"] += 1
+        return results
+
+    def discard(self, group_id: str) -> None:
+        """Stop tracking ``group_id`` (after its join completed)."""
+        with self._lock:
+            self._drop(group_id)
+
+    def _drop(self, group_id: str) -> None:
+        state = self._groups.pop(group_id, None)
+        if state is None:
+            return
+        for agent_id in state.expected:
+            key = (state.run_id, agent_id)
+            if self._agent_groups.get(key) == group_id:
+                del self._agent_groups[key]
+        if state.node_id and self._node_groups.get((state.run_id, state.node_id)) == group_id:
+            del self._node_groups[(state.run_id, state.node_id)]
+        state.wake()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return counters and the number of groups currently tracked."""
+        with self._lock:
+            return {**self._stats, "tracked": len(self._groups), "max_groups": self.max_groups}
+
+
+_fork_completion_registry: Optional[ForkCompletionRegistry] = None
+_fork_completion_registry_lock = threading.Lock()
+
+
+def get_fork_completion_registry() -> ForkCompletionRegistry:
+    """Return the process-wide fork completion registry."""
+    global _fork_completion_registry
+    if _fork_completion_registry is None:
+        with _fork_completion_registry_lock:
+            if _fork_completion_registry is None:
+                _fork_completion_registry = ForkCompletionRegistry()
+    return _fork_completion_registry
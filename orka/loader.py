@@ -91,8 +91,10 @@ Usage Example
     agents_config = loader.get_agents()
 """
 
+import copy
+
 import yaml
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 import orka.utils.template_validator as template_validator
 
 
@@ -102,15 +104,20 @@ class YAMLLoader:
     Loads and validates the configuration for the OrKa orchestrator.
     """
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: Union[str, Dict[str, Any]]) -> None:
         """
         Initialize the YAML loader with the path to the configuration file.
 
         Args:
-            path: Path to the YAML configuration file.
+            path: Path to the YAML configuration file, or an already parsed
+                configuration dict (copied, so the caller's dict is not shared).
         """
-        self.path = path
-        self.config = self._load_yaml()
+        if isinstance(path, dict):
+            self.path: Optional[str] = None
+            self.config = copy.deepcopy(path)
+        else:
+            self.path = path
+            self.config = self._load_yaml()
 
     def _load_yaml(self) -> Dict[str, Any]:
         """
@@ -119,7 +126,7 @@ class YAMLLoader:
         Returns:
             The loaded YAML configuration.
         """
-        with open(self.path, encoding='utf-8') as f:
+        with open(str(self.path), encoding='utf-8') as f:
             return yaml.safe_load(f)  # type: ignore
 
     def get_orchestrator(self) -> Dict[str, Any]:
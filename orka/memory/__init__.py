@@ -204,6 +204,12 @@ except ImportError:
         def search_memories(self, *args: Any, **kwargs: Any) -> list[dict[str, Any]]:
             raise NotImplementedError
 
+        async def alog_memory(self, *args: Any, **kwargs: Any) -> str:
+            raise NotImplementedError
+
+        async def asearch_memories(self, *args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+            raise NotImplementedError
+
     RedisStackMemoryLogger = _DummyRedisStackMemoryLogger  # type: ignore
 
 
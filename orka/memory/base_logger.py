@@ -28,6 +28,9 @@ This class has been refactored into smaller mixins in the base_logger/ package:
 import logging
 import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from typing import Any
 
@@ -42,6 +45,31 @@ from .base_logger_mixins.cost_analysis_mixin import CostAnalysisMixin
 
 logger = logging.getLogger(__name__)
 
+# Events logged while an orchestrator run is active go to that run's own list, so a
+# backend shared by concurrent runs keeps no cross-run state and nothing piles up
+# between runs.
+_run_events: ContextVar[list[dict[str, Any]] | None] = ContextVar("orka_run_events", default=None)
+
+
+@contextmanager
+def run_event_buffer() -> Iterator[list[dict[str, Any]]]:
+    """
+    Collect the events logged in the current context in one list.
+
+    The outermost buffer owns the list; nested runs (loop sub-workflows, callers
+    that wrap a run) log into it as well.
+    """
+    events = _run_events.get()
+    if events is not None:
+        yield events
+        return
+    events = []
+    token = _run_events.set(events)
+    try:
+        yield events
+    finally:
+        _run_events.reset(token)
+
 
 class BaseMemoryLogger(
     ABC,
@@ -111,6 +139,16 @@ class BaseMemoryLogger(
         self._blob_usage: dict[str, int] = {}
         self._blob_threshold = 200
 
+    @property
+    def memory(self) -> list[dict[str, Any]]:
+        """Events logged by the active run, or by this logger outside of any run."""
+        events = _run_events.get()
+        return events if events is not None else self._memory
+
+    @memory.setter
+    def memory(self, value: list[dict[str, Any]]) -> None:
+        self._memory = value
+
     # ========== Abstract Methods ==========
 
     @abstractmethod
@@ -197,3 +235,48 @@ class BaseMemoryLogger(
     @abstractmethod
     def scan(self, cursor: int = 0, match: str | None = None, count: int = 10):
         """Scan keys matching a pattern."""
+
+    def write_batch(
+        self,
+        hashes: dict[str, dict[str, Any]] | None = None,
+        sets: dict[str, list[str]] | None = None,
+        values: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Apply a group of hash, set and string writes.
+
+        Backends that can pipeline (Redis, RedisStack) send the whole group in one
+        MULTI/EXEC round trip; this default applies the writes one by one.
+
+        Args:
+            hashes: Hash name to ``{field: value}`` mapping for HSET.
+            sets: Set name to members for SADD.
+            values: Key to value for SET.
+        """
+        for name, fields in (hashes or {}).items():
+            for field, value in fields.items():
+                self.hset(name, field, value)
+        for name, members in (sets or {}).items():
+            if members:
+                self.sadd(name, *members)
+        for key, value in (values or {}).items():
+            self.set(key, value)
+
+
+def write_batch(
+    memory: Any,
+    hashes: dict[str, dict[str, Any]] | None = None,
+    sets: dict[str, list[str]] | None = None,
+    values: dict[str, Any] | None = None,
+) -> None:
+    """
+    Apply a group of coordination writes through ``memory``.
+
+    Memory loggers go through :meth:`BaseMemoryLogger.write_batch` (pipelined where
+    the backend supports it); any other object exposing ``hset``/``sadd``/``set``
+    gets the writes one by one.
+    """
+    if isinstance(memory, BaseMemoryLogger):
+        memory.write_batch(hashes=hashes, sets=sets, values=values)
+        return
+    BaseMemoryLogger.write_batch(memory, hashes=hashes, sets=sets, values=values)
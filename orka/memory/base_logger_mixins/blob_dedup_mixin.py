@@ -78,17 +78,22 @@ class BlobDeduplicationMixin:
         except Exception:
             return False
 
-    def _store_blob(self, obj: Any) -> str:
+    def _store_blob(self, obj: Any, blob_store: dict[str, Any] | None = None) -> str:
         """
         Store a blob and return its reference hash.
 
         Args:
             obj: Object to store as blob
+            blob_store: Store to add the blob to instead of the logger's own
+                (usage is not counted for caller-owned stores)
 
         Returns:
             SHA256 hash reference
         """
         blob_hash = self._compute_blob_hash(obj)
+        if blob_store is not None:
+            blob_store.setdefault(blob_hash, obj)
+            return blob_hash
 
         if blob_hash not in self._blob_store:
             self._blob_store[blob_hash] = obj
@@ -123,25 +128,29 @@ class BlobDeduplicationMixin:
 
         return ref
 
-    def _recursive_deduplicate(self, obj: Any) -> Any:
+    def _recursive_deduplicate(self, obj: Any, blob_store: dict[str, Any] | None = None) -> Any:
         """Recursively apply deduplication."""
         if isinstance(obj, dict):
-            return self._deduplicate_dict_content(obj)
+            return self._deduplicate_dict_content(obj, blob_store)
         elif isinstance(obj, list):
-            return [self._recursive_deduplicate(item) for item in obj]
+            return [self._recursive_deduplicate(item, blob_store) for item in obj]
         else:
             return obj
 
-    def _deduplicate_dict_content(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _deduplicate_dict_content(
+        self, data: Dict[str, Any], blob_store: dict[str, Any] | None = None
+    ) -> Dict[str, Any]:
         """
         Recursively deduplicate content within a dictionary.
+
+        Blobs go to ``blob_store`` when given, otherwise to the logger's own store.
         """
         processed_data = {}
         for key, value in data.items():
-            processed_data[key] = self._recursive_deduplicate(value)
+            processed_data[key] = self._recursive_deduplicate(value, blob_store)
 
         if self._should_deduplicate_blob(processed_data):
-            blob_hash = self._store_blob(processed_data)
+            blob_hash = self._store_blob(processed_data, blob_store)
             return self._create_blob_reference(blob_hash, list(processed_data.keys()))
 
         return processed_data
@@ -78,10 +78,13 @@ class CostAnalysisMixin:
     def _apply_deduplication_to_enhanced_trace(
         self, enhanced_data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Apply blob deduplication to enhanced trace data."""
+        """Apply blob deduplication to enhanced trace data.
+
+        Blobs are collected in a store local to this call, so traces finalized
+        concurrently on the same backend never see each other's blobs.
+        """
         try:
-            original_blob_store = getattr(self, "_blob_store", {})
-            self._blob_store = {}
+            blob_store: Dict[str, Any] = {}
 
             events = []
             blob_stats = {
@@ -112,7 +115,7 @@ class CostAnalysisMixin:
 
                         if payload_size > getattr(self, "_blob_threshold", 200):
                             original_size = payload_size
-                            deduplicated_payload = self._deduplicate_dict_content(payload)
+                            deduplicated_payload = self._deduplicate_dict_content(payload, blob_store)
                             new_size = len(
                                 json.dumps(
                                     deduplicated_payload,
@@ -135,20 +138,21 @@ class CostAnalysisMixin:
 
                     events.append(event)
 
-            use_dedup_format = bool(self._blob_store)
+            use_dedup_format = bool(blob_store)
 
             if use_dedup_format:
-                cost_analysis = self._extract_cost_analysis(enhanced_data, events)
+                # Blob references in the events resolve through the trace's own store
+                cost_analysis = self._extract_cost_analysis({**enhanced_data, "blob_store": blob_store}, events)
                 result = {
                     "_metadata": {
                         "version": "1.2.0",
                         "deduplication_enabled": True,
                         "blob_threshold_chars": getattr(self, "_blob_threshold", 200),
-                        "total_blobs_stored": len(self._blob_store),
+                        "total_blobs_stored": len(blob_store),
                         "stats": blob_stats,
                         "generated_at": datetime.now(UTC).isoformat(),
                     },
-                    "blob_store": self._blob_store.copy(),
+                    "blob_store": blob_store,
                     "events": events,
                     "cost_analysis": cost_analysis,
                 }
@@ -161,13 +165,10 @@ class CostAnalysisMixin:
                 }
                 result["cost_analysis"] = self._extract_cost_analysis(enhanced_data, events)
 
-            self._blob_store = original_blob_store
             return result
 
         except Exception as e:
             logger.error(f"Failed to apply deduplication to enhanced trace: {e}")
-            if "original_blob_store" in locals():
-                self._blob_store = original_blob_store
             return enhanced_data
 
     def _extract_cost_analysis(
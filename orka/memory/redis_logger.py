@@ -20,11 +20,12 @@ import json
 import logging
 import os
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import AbstractSet, Any
 
 import redis
 
 from .base_logger import BaseMemoryLogger
+from .stream_writer import WriteBehindStreamWriter
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,8 @@ class RedisMemoryLogger(BaseMemoryLogger):
         debug_keep_previous_outputs: bool = False,
         decay_config: dict[str, Any] | None = None,
         memory_preset: str | None = None,
+        write_behind: bool | None = None,
+        write_behind_config: dict[str, Any] | None = None,
     ) -> None:
         """
         Initialize the Redis memory logger.
@@ -107,6 +110,11 @@ class RedisMemoryLogger(BaseMemoryLogger):
             debug_keep_previous_outputs: If True, keeps previous_outputs in log files for debugging.
             decay_config: Configuration for memory decay functionality.
             memory_preset: Name of memory preset (sensory, working, episodic, semantic, procedural, meta).
+            write_behind: If True, stream writes go through a background pipelined writer
+                instead of one blocking XADD per call. Defaults to ORKA_LOG_WRITE_BEHIND
+                (off, so readers see each entry as soon as log() returns).
+            write_behind_config: Options for WriteBehindStreamWriter (max_queue_size,
+                batch_size, flush_interval, block_timeout).
         """
         super().__init__(stream_key, debug_keep_previous_outputs, decay_config, memory_preset)
         self.redis_url = (
@@ -116,6 +124,12 @@ class RedisMemoryLogger(BaseMemoryLogger):
         )
         self.client = redis.from_url(self.redis_url)
 
+        if write_behind is None:
+            write_behind = os.getenv("ORKA_LOG_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+        self._stream_writer: WriteBehindStreamWriter | None = (
+            WriteBehindStreamWriter(self.client, **(write_behind_config or {})) if write_behind else None
+        )
+
     @property
     def redis(self) -> redis.Redis:
         """
@@ -157,7 +171,9 @@ class RedisMemoryLogger(BaseMemoryLogger):
         if not agent_id:
             raise ValueError("Event must contain 'agent_id'")
 
-        # Create a copy of the payload to avoid modifying the original
+        # Create a copy of the payload to avoid modifying the original. This also
+        # runs with write-behind, so the queued entry never shares mutable state
+        # with the caller.
         safe_payload = self._sanitize_for_json(payload)
 
         # Determine which decay config to use
@@ -243,42 +259,42 @@ class RedisMemoryLogger(BaseMemoryLogger):
             event["fork_group"] = fork_group
         if parent:
             event["parent"] = parent
+        sanitized_previous_outputs = None
         if previous_outputs:
-            event["previous_outputs"] = self._sanitize_for_json(previous_outputs)
+            sanitized_previous_outputs = self._sanitize_for_json(previous_outputs)
+            event["previous_outputs"] = sanitized_previous_outputs
 
         self.memory.append(event)
 
         # Determine which stream(s) to write to based on memory category
-        streams_to_write = []
-
-        # Get memory category from decay metadata
-        memory_category = decay_metadata.get("orka_memory_category", "log")
+        streams_to_write = self._streams_for_event(
+            event_type,
+            safe_payload,
+            decay_metadata.get("orka_memory_category", "log"),
+        )
 
-        if memory_category == "stored" and event_type == "write" and isinstance(safe_payload, dict):
-            # For stored memories, only write to namespace-specific stream
-            namespace = safe_payload.get("namespace")
-            session = safe_payload.get("session", "default")
-            if namespace:
-                namespace_stream = f"orka:memory:{namespace}:{session}"
-                streams_to_write.append(namespace_stream)
-                logger.info(
-                    f"Writing stored memory to namespace-specific stream: {namespace_stream}",
-                )
-            else:
-                # Fallback to general stream if no namespace
-                streams_to_write.append(self.stream_key)
-        else:
-            # For orchestration logs and other events, write to general stream
-            streams_to_write.append(self.stream_key)
+        if self._stream_writer is not None:
+            self._submit_write_behind(
+                streams_to_write,
+                {
+                    "agent_id": agent_id,
+                    "event_type": event_type,
+                    "timestamp": event["timestamp"],
+                    "run_id": run_id or "default",
+                    "step": str(step or -1),
+                    **decay_metadata,
+                    "payload": safe_payload,
+                    "previous_outputs": sanitized_previous_outputs,
+                },
+            )
+            return
 
         try:
             # Sanitize previous outputs if present
             safe_previous_outputs = None
             if previous_outputs:
                 try:
-                    safe_previous_outputs = json.dumps(
-                        self._sanitize_for_json(previous_outputs),
-                    )
+                    safe_previous_outputs = json.dumps(sanitized_previous_outputs)
                 except Exception as e:
                     logger.error(f"Failed to serialize previous_outputs: {e!s}")
                     safe_previous_outputs = json.dumps(
@@ -350,6 +366,52 @@ class RedisMemoryLogger(BaseMemoryLogger):
                     f"Failed to log event to Redis: {e!s} and fallback also failed: {inner_e!s}",
                 )
 
+    def _streams_for_event(
+        self,
+        event_type: str,
+        safe_payload: Any,
+        memory_category: str,
+    ) -> list[str]:
+        """Return the stream(s) an event is written to, based on its memory category."""
+        if memory_category == "stored" and event_type == "write" and isinstance(safe_payload, dict):
+            # For stored memories, only write to namespace-specific stream
+            namespace = safe_payload.get("namespace")
+            session = safe_payload.get("session", "default")
+            if namespace:
+                namespace_stream = f"orka:memory:{namespace}:{session}"
+                logger.info(
+                    f"Writing stored memory to namespace-specific stream: {namespace_stream}",
+                )
+                return [namespace_stream]
+        # Orchestration logs, other events and stored memories without a
+        # namespace go to the general stream
+        return [self.stream_key]
+
+    def _submit_write_behind(self, streams: list[str], entry: dict[str, Any]) -> None:
+        """Queue an already sanitized entry on the background writer for each stream."""
+        writer = self._stream_writer
+        if writer is None:
+            return
+        for stream_key in streams:
+            writer.submit(stream_key, entry, ("payload", "previous_outputs"))
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """
+        Wait for queued write-behind stream entries to reach Redis.
+
+        Returns:
+            True when nothing is pending (always True without write-behind).
+        """
+        if self._stream_writer is None:
+            return True
+        return self._stream_writer.flush(timeout)
+
+    def get_write_behind_stats(self) -> dict[str, Any]:
+        """Return write-behind queue counters, or an empty dict when disabled."""
+        if self._stream_writer is None:
+            return {}
+        return self._stream_writer.get_stats()
+
     def tail(self, count: int = 10) -> list[dict[str, Any]]:
         """
         Retrieve the most recent events from the Redis stream.
@@ -361,6 +423,8 @@ class RedisMemoryLogger(BaseMemoryLogger):
             List of recent events.
         """
         try:
+            # Make sure queued writes are visible to readers
+            self.flush()
             results = self.client.xrevrange(self.stream_key, count=count)
             # Sanitize results for JSON serialization before returning
             sanitized: list[dict[str, Any]] = self._sanitize_for_json(results) if results else []
@@ -576,6 +640,34 @@ class RedisMemoryLogger(BaseMemoryLogger):
             logger.error(f"Failed to scan keys: {e!s}")
             return (0, [])
 
+    def write_batch(
+        self,
+        hashes: dict[str, dict[str, Any]] | None = None,
+        sets: dict[str, list[str]] | None = None,
+        values: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Apply hash, set and string writes in a single MULTI/EXEC round trip.
+
+        Args:
+            hashes: Hash name to ``{field: value}`` mapping for HSET.
+            sets: Set name to members for SADD.
+            values: Key to value for SET.
+        """
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            for name, fields in (hashes or {}).items():
+                if fields:
+                    pipe.hset(name, mapping=fields)
+            for name, members in (sets or {}).items():
+                if members:
+                    pipe.sadd(name, *members)
+            for key, value in (values or {}).items():
+                pipe.set(key, value)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to apply batched writes: {e!s}")
+
     def close(self) -> None:
         """Close the Redis client connection and stop background threads."""
         try:
@@ -583,6 +675,10 @@ class RedisMemoryLogger(BaseMemoryLogger):
             # This must be called first to ensure no new operations occur
             self.stop_decay_scheduler()
 
+            # Drain queued stream writes before the client goes away
+            if getattr(self, "_stream_writer", None) is not None:
+                self._stream_writer.close()
+
             self.client.close()
             # Only log if logging system is still available
             try:
@@ -629,6 +725,16 @@ class RedisMemoryLogger(BaseMemoryLogger):
         """
         Clean up expired memory entries based on decay configuration.
 
+        Streams are discovered with SCAN and processed incrementally. Each stream keeps
+        a persistent cursor (the last entry read) and an expiry schedule: a ZSET of the
+        IDs of entries that were still live when read, scored by their expire time. A
+        pass deletes the scheduled entries that are now due, then reads only the entries
+        added after the cursor, in chunks of ``decay_config["cleanup_batch_size"]``.
+        Expired entries at the head of a stream, with nothing older left alive, are cut
+        server-side with ``XTRIM MINID`` (stream IDs are time-ordered); other expired
+        entries are removed with XDEL. The cursor and schedule of a stream that no
+        longer exists are deleted.
+
         Args:
             dry_run: If True, return what would be deleted without actually deleting
 
@@ -644,6 +750,7 @@ class RedisMemoryLogger(BaseMemoryLogger):
                 "start_time": current_time.isoformat(),
                 "dry_run": dry_run,
                 "deleted_count": 0,
+                "trimmed_count": 0,
                 "deleted_entries": [],
                 "error_count": 0,
                 "streams_processed": 0,
@@ -659,64 +766,24 @@ class RedisMemoryLogger(BaseMemoryLogger):
 
             processed_streams = set()
             for pattern in stream_patterns:
-                stream_keys = self.client.keys(pattern)
-
-                for stream_key_bytes in stream_keys:
-                    stream_key = stream_key_bytes.decode()
+                for stream_key_bytes in self.client.scan_iter(match=pattern, count=500, _type="stream"):
+                    stream_key = (
+                        stream_key_bytes.decode() if isinstance(stream_key_bytes, bytes) else str(stream_key_bytes)
+                    )
                     if stream_key in processed_streams:
                         continue
                     processed_streams.add(stream_key)
 
                     try:
-                        # Get all entries from the stream
-                        entries = self.client.xrange(stream_key_bytes)
+                        self._cleanup_stream(stream_key, current_time, dry_run, stats)
                         stats["streams_processed"] += 1
-                        stats["total_entries_checked"] += len(entries)
-
-                        for entry_id, entry_data in entries:
-                            expire_time_str = entry_data.get(b"orka_expire_time")
-                            if not expire_time_str:
-                                continue  # Skip entries without expiration time
-
-                            try:
-                                expire_time = datetime.fromisoformat(expire_time_str.decode())
-                                if current_time > expire_time:
-                                    # Entry has expired
-                                    entry_info = {
-                                        "stream": stream_key,
-                                        "entry_id": entry_id.decode(),
-                                        "agent_id": entry_data.get(
-                                            b"agent_id",
-                                            b"unknown",
-                                        ).decode(),
-                                        "event_type": entry_data.get(
-                                            b"event_type",
-                                            b"unknown",
-                                        ).decode(),
-                                        "expire_time": expire_time_str.decode(),
-                                        "memory_type": entry_data.get(
-                                            b"orka_memory_type",
-                                            b"unknown",
-                                        ).decode(),
-                                    }
-
-                                    if not dry_run:
-                                        # Actually delete the entry
-                                        self.client.xdel(stream_key_bytes, entry_id)
-
-                                    stats["deleted_entries"].append(entry_info)
-                                    stats["deleted_count"] += 1
-
-                            except (ValueError, TypeError) as e:
-                                logger.warning(
-                                    f"Invalid expire_time format in entry {entry_id.decode()}: {e}",
-                                )
-                                stats["error_count"] += 1
-
                     except Exception as e:
                         logger.error(f"Error processing stream {str(stream_key)}: {e}")
                         stats["error_count"] += 1
 
+            if not dry_run:
+                self._prune_cleanup_watermarks(processed_streams)
+
             stats["end_time"] = datetime.now(UTC).isoformat()
             stats["duration_seconds"] = (datetime.now(UTC) - current_time).total_seconds()
 
@@ -739,6 +806,208 @@ class RedisMemoryLogger(BaseMemoryLogger):
                 "deleted_count": 0,
             }
 
+    # Cleanup bookkeeping lives outside the orka:memory:* namespace so SCAN never
+    # mistakes it for a memory stream.
+    _CLEANUP_WATERMARKS_KEY = "orka:cleanup:watermarks"
+    _CLEANUP_SCHEDULE_PREFIX = "orka:cleanup:schedule:"
+
+    def _cleanup_schedule_key(self, stream_key: str) -> str:
+        """Return the ZSET of a stream's live entry IDs, scored by expire timestamp."""
+        return f"{self._CLEANUP_SCHEDULE_PREFIX}{stream_key}"
+
+    def _load_cleanup_state(self, stream_key: str) -> dict[str, Any]:
+        raw = self.client.hget(self._CLEANUP_WATERMARKS_KEY, stream_key)
+        if isinstance(raw, (bytes, str)):
+            try:
+                state = json.loads(raw)
+                if isinstance(state, dict):
+                    return {"cursor": state.get("cursor"), "pinned": state.get("pinned")}
+            except ValueError:
+                logger.warning(f"Ignoring corrupt cleanup watermark for stream {stream_key}")
+        return {"cursor": None, "pinned": None}
+
+    def _prune_cleanup_watermarks(self, seen_streams: AbstractSet[str]) -> None:
+        """Drop the cleanup state of streams that SCAN no longer finds and that no longer exist."""
+        stale = []
+        for raw_key in self.client.hkeys(self._CLEANUP_WATERMARKS_KEY) or []:
+            stream_key = raw_key.decode() if isinstance(raw_key, bytes) else str(raw_key)
+            if stream_key not in seen_streams:
+                stale.append(stream_key)
+        if not stale:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for stream_key in stale:
+            pipe.exists(stream_key)
+        # Streams owned by loggers with other key patterns still exist and keep theirs
+        gone = [key for key, exists in zip(stale, pipe.execute()) if not exists]
+        if gone:
+            self.client.hdel(self._CLEANUP_WATERMARKS_KEY, *gone)
+            self.client.delete(*(self._cleanup_schedule_key(key) for key in gone))
+
+    @staticmethod
+    def _next_stream_id(entry_id: str) -> str:
+        """Return the smallest stream ID strictly greater than ``entry_id``."""
+        ms, _, seq = entry_id.partition("-")
+        return f"{ms}-{int(seq or 0) + 1}"
+
+    @staticmethod
+    def _expired_entry_info(stream_key: str, entry_id: str, entry_data: dict[Any, Any]) -> dict[str, Any]:
+        def field(name: bytes) -> str:
+            value = entry_data.get(name, b"unknown")
+            return value.decode() if isinstance(value, bytes) else str(value)
+
+        return {
+            "stream": stream_key,
+            "entry_id": entry_id,
+            "agent_id": field(b"agent_id"),
+            "event_type": field(b"event_type"),
+            "expire_time": field(b"orka_expire_time"),
+            "memory_type": field(b"orka_memory_type"),
+        }
+
+    @staticmethod
+    def _entry_expire_time(entry_id: str, entry_data: dict[Any, Any], stats: dict[str, Any]) -> datetime | None:
+        expire_time_str = entry_data.get(b"orka_expire_time")
+        if not expire_time_str:
+            return None
+        try:
+            return datetime.fromisoformat(expire_time_str.decode())
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Invalid expire_time format in entry {entry_id}: {e}")
+            stats["error_count"] += 1
+            return None
+
+    def _delete_stream_entries(
+        self,
+        stream_key: str,
+        entry_ids: list[str],
+        trim_head: bool,
+        stats: dict[str, Any],
+    ) -> None:
+        """Delete entries, cutting them server-side with XTRIM MINID when they form the stream head."""
+        if not entry_ids:
+            return
+        if trim_head:
+            try:
+                trimmed = self.client.xtrim(stream_key, minid=self._next_stream_id(entry_ids[-1]), approximate=False)
+                stats["trimmed_count"] += int(trimmed or 0)
+                return
+            except redis.ResponseError:
+                # Server without XTRIM MINID (Redis < 6.2): delete explicitly.
+                pass
+        self.client.xdel(stream_key, *entry_ids)
+
+    def _cleanup_due_entries(
+        self,
+        stream_key: str,
+        current_time: datetime,
+        batch_size: int,
+        dry_run: bool,
+        stats: dict[str, Any],
+    ) -> list[str]:
+        """Delete scheduled entries whose expire time has passed and return their IDs."""
+        schedule_key = self._cleanup_schedule_key(stream_key)
+        now = current_time.timestamp()
+        due_ids: list[str] = []
+        while True:
+            # Without deletions (dry run) the due range does not shrink, so page through it
+            offset = len(due_ids) if dry_run else 0
+            due = self.client.zrangebyscore(schedule_key, "-inf", now, start=offset, num=batch_size, withscores=True)
+            if not due:
+                break
+            ids = [raw.decode() if isinstance(raw, bytes) else str(raw) for raw, _ in due]
+            stats["total_entries_checked"] += len(ids)
+            for entry_id, (_, score) in zip(ids, due):
+                expire_time = datetime.fromtimestamp(score, UTC).isoformat()
+                stats["deleted_entries"].append(
+                    {"stream": stream_key, "entry_id": entry_id, "expire_time": expire_time},
+                )
+            due_ids.extend(ids)
+            if not dry_run:
+                self.client.xdel(stream_key, *ids)
+                self.client.zrem(schedule_key, *ids)
+            if len(due) < batch_size:
+                break
+        stats["deleted_count"] += len(due_ids)
+        return due_ids
+
+    def _cleanup_new_entries(
+        self,
+        stream_key: str,
+        state: dict[str, Any],
+        current_time: datetime,
+        batch_size: int,
+        dry_run: bool,
+        stats: dict[str, Any],
+        head_clear: bool,
+    ) -> None:
+        """Read the entries added since the cursor once, deleting or scheduling each of them."""
+        schedule_key = self._cleanup_schedule_key(stream_key)
+        while True:
+            cursor = self._next_stream_id(state["cursor"]) if state["cursor"] else "-"
+            entries = self.client.xrange(stream_key, min=cursor, max="+", count=batch_size)
+            if not entries:
+                break
+            stats["total_entries_checked"] += len(entries)
+
+            head_ids: list[str] = []
+            expired_ids: list[str] = []
+            schedule: dict[str, float] = {}
+            for raw_id, entry_data in entries:
+                entry_id = raw_id.decode() if isinstance(raw_id, bytes) else str(raw_id)
+                state["cursor"] = entry_id
+                expire_time = self._entry_expire_time(entry_id, entry_data, stats)
+                if expire_time is None:
+                    # Never expires: XTRIM may only cut the stream below it.
+                    state["pinned"] = state["pinned"] or entry_id
+                    head_clear = False
+                elif current_time > expire_time:
+                    (head_ids if head_clear else expired_ids).append(entry_id)
+                    stats["deleted_entries"].append(self._expired_entry_info(stream_key, entry_id, entry_data))
+                else:
+                    schedule[entry_id] = expire_time.timestamp()
+                    head_clear = False
+
+            stats["deleted_count"] += len(head_ids) + len(expired_ids)
+            if not dry_run:
+                self._delete_stream_entries(stream_key, head_ids, True, stats)
+                self._delete_stream_entries(stream_key, expired_ids, False, stats)
+                if schedule:
+                    self.client.zadd(schedule_key, schedule)
+
+            if len(entries) < batch_size:
+                break
+
+    def _cleanup_stream(
+        self,
+        stream_key: str,
+        current_time: datetime,
+        dry_run: bool,
+        stats: dict[str, Any],
+    ) -> None:
+        """Run one incremental cleanup pass over a single stream.
+
+        Entries scheduled by earlier passes are deleted once due; entries added since
+        the cursor are read once and are deleted, scheduled, or (never expiring) left
+        alone. The cursor always advances past every entry read.
+        """
+        batch_size = max(1, int(self.decay_config.get("cleanup_batch_size", 1000)))
+        state = self._load_cleanup_state(stream_key)
+        saved = dict(state)
+
+        due_ids = self._cleanup_due_entries(stream_key, current_time, batch_size, dry_run, stats)
+        # With no scheduled survivor and no never-expiring entry, everything before the
+        # cursor is gone, so expired new entries at the head can be trimmed server-side.
+        survivors = int(self.client.zcard(self._cleanup_schedule_key(stream_key)) or 0)
+        if dry_run:
+            survivors -= len(due_ids)
+        head_clear = state["pinned"] is None and survivors <= 0
+
+        self._cleanup_new_entries(stream_key, state, current_time, batch_size, dry_run, stats, head_clear)
+
+        if not dry_run and state != saved:
+            self.client.hset(self._CLEANUP_WATERMARKS_KEY, stream_key, json.dumps(state))
+
     def get_memory_stats(self) -> dict[str, Any]:
         """
         Get memory usage statistics.
@@ -19,6 +19,7 @@ Features
 --------
 - Connection pooling for efficient Redis operations
 - Thread-safe client access
+- ``redis.asyncio`` clients for coroutine callers, pooled per event loop
 - Connection statistics and monitoring
 - Graceful cleanup and resource management
 
@@ -29,17 +30,20 @@ from orka.memory.redisstack.connection_manager import ConnectionManager
 
 conn_mgr = ConnectionManager(redis_url="redis://localhost:6380/0")
 client = conn_mgr.get_thread_safe_client()
+aclient = conn_mgr.get_async_client()  # inside a running event loop
 stats = conn_mgr.get_connection_stats()
 conn_mgr.close()
 ```
 """
 
+import asyncio
 import logging
 import weakref
 from threading import Lock
 from typing import Any
 
 import redis
+import redis.asyncio as aioredis
 from redis import Redis
 from redis.connection import ConnectionPool
 
@@ -91,6 +95,11 @@ class ConnectionManager:
         # Connection pool for efficient connection management
         self._connection_pool = self._create_connection_pool()
 
+        # asyncio pools are bound to the loop that created their connections
+        self._async_pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, aioredis.ConnectionPool
+        ] = weakref.WeakKeyDictionary()
+
         # Lazy initialization - don't test connection during init
         self._redis_client: redis.Redis | None = None
         self._client_initialized = False
@@ -170,6 +179,53 @@ class ConnectionManager:
             logger.error(f"Failed to get thread-safe Redis client: {e}")
             return self.get_client()
 
+    def get_async_client(self) -> aioredis.Redis:
+        """
+        Get a ``redis.asyncio`` client for the running event loop.
+
+        Each event loop gets its own pool (same settings as the sync pool), created
+        on first use.
+
+        Raises:
+            RuntimeError: If called outside a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._connection_lock:
+            pool = self._async_pools.get(loop)
+            if pool is None:
+                pool = aioredis.ConnectionPool.from_url(
+                    self.redis_url,
+                    decode_responses=False,
+                    socket_keepalive=True,
+                    retry_on_timeout=True,
+                    health_check_interval=self.health_check_interval,
+                    max_connections=self.max_connections,
+                    socket_connect_timeout=self.socket_connect_timeout,
+                    socket_timeout=self.socket_timeout,
+                )
+                self._async_pools[loop] = pool
+        return aioredis.Redis(connection_pool=pool)
+
+    def _disconnect_async_pools(self) -> None:
+        """Disconnect asyncio pools on their own loops; pools of stopped loops are dropped."""
+        with self._connection_lock:
+            pools = list(self._async_pools.items())
+            self._async_pools.clear()
+        try:
+            current_loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for loop, pool in pools:
+            try:
+                if loop.is_closed():
+                    continue
+                if loop is current_loop:
+                    loop.create_task(pool.disconnect())
+                elif loop.is_running():
+                    asyncio.run_coroutine_threadsafe(pool.disconnect(), loop)
+            except Exception as e:
+                logger.debug(f"Error disconnecting async connection pool: {e}")
+
     def get_connection_stats(self) -> dict[str, Any]:
         """Get connection pool statistics for monitoring."""
         try:
@@ -239,6 +295,8 @@ class ConnectionManager:
                     self._connection_pool.disconnect()
                 except Exception as e:
                     logger.debug(f"Error disconnecting connection pool: {e}")
+
+            self._disconnect_async_pools()
         except Exception as e:
             logger.error(f"Error closing ConnectionManager: {e}")
 
@@ -14,15 +14,64 @@ Memory CRUD Operations Mixin
 ============================
 
 Provides Create, Read, Update, Delete operations for memory entries.
+
+Listing index
+-------------
+Memory hashes are additionally tracked in sorted sets so listings do not have to
+walk every ``orka_memory:*`` key:
+
+- ``orka_memory_idx:by_time`` - every memory, scored by timestamp (ms)
+- ``orka_memory_idx:stored`` - stored memories only (log_type ``memory`` / category ``stored``)
+- ``orka_memory_idx:by_expiry`` - memories with an expiry, scored by ``orka_expire_time``
+
+Pages of keys are read newest-first with ZREVRANGE and their hashes fetched in a
+single pipeline, so latency grows with the page size instead of the database size.
+The index is backfilled once per database (``ensure_listing_index``); until the
+``orka_memory_idx:ready`` marker exists, listings fall back to the key scan.
+
+Writers that do not maintain the index (older OrKa versions, or tools writing
+``orka_memory:*`` hashes directly) are picked up by ``reconcile_listing_index``,
+which re-runs the backfill at most once per ``ORKA_MEMORY_INDEX_RECONCILE_INTERVAL``
+seconds per database (default 3600, ``0`` disables it) and drops index members
+whose hash no longer exists. Members whose hash expired through a Redis TTL are
+also dropped whenever a listing page finds them empty.
 """
 
 import json
 import logging
+import os
 import time
+from collections.abc import Iterator
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+MEMORY_KEY_PATTERN = "orka_memory:*"
+
+# Index keys live outside the ``orka_memory:`` prefix so neither the RediSearch
+# index nor ``orka_memory:*`` scans pick them up.
+MEMORY_BY_TIME_KEY = "orka_memory_idx:by_time"
+MEMORY_STORED_KEY = "orka_memory_idx:stored"
+MEMORY_BY_EXPIRY_KEY = "orka_memory_idx:by_expiry"
+MEMORY_INDEX_READY_KEY = "orka_memory_idx:ready"
+MEMORY_INDEX_RECONCILED_KEY = "orka_memory_idx:reconciled"
+MEMORY_INDEX_KEYS = (MEMORY_BY_TIME_KEY, MEMORY_STORED_KEY, MEMORY_BY_EXPIRY_KEY)
+
+LISTING_PAGE_SIZE = 100
+BACKFILL_BATCH_SIZE = 500
+DEFAULT_INDEX_RECONCILE_INTERVAL = 3600.0
+
+
+def index_reconcile_interval() -> float:
+    """Seconds between listing index reconciliations (``ORKA_MEMORY_INDEX_RECONCILE_INTERVAL``)."""
+    try:
+        return max(
+            0.0,
+            float(os.getenv("ORKA_MEMORY_INDEX_RECONCILE_INTERVAL", str(DEFAULT_INDEX_RECONCILE_INTERVAL))),
+        )
+    except ValueError:
+        return DEFAULT_INDEX_RECONCILE_INTERVAL
+
 
 class MemoryCRUDMixin:
     """Mixin providing CRUD operations for Redis memory entries."""
@@ -39,19 +88,246 @@ class MemoryCRUDMixin:
                 return default
         return value
 
+    # ==========================================================================
+    # Listing Index
+    # ==========================================================================
+
+    @staticmethod
+    def _is_stored_memory(metadata: dict[str, Any]) -> bool:
+        """Whether metadata marks an entry as a stored memory rather than a log."""
+        return metadata.get("log_type", "log") == "memory" or metadata.get("category", "log") == "stored"
+
+    def _listing_index_ready(self, client: Any) -> bool:
+        """Whether the sorted-set listing index has been built for this database."""
+        try:
+            return client.get(MEMORY_INDEX_READY_KEY) in (b"1", "1")
+        except Exception:
+            return False
+
+    def _index_memory(
+        self,
+        client: Any,
+        key: str,
+        timestamp_ms: int,
+        metadata: dict[str, Any],
+        expire_time_ms: int | None = None,
+    ) -> None:
+        """Add a memory key to the listing index."""
+        try:
+            pipe = client.pipeline(transaction=False)
+            self._queue_index_memory(pipe, key, timestamp_ms, metadata, expire_time_ms)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to index memory {key}: {e}")
+
+    def _queue_index_memory(
+        self,
+        pipe: Any,
+        key: str,
+        timestamp_ms: int,
+        metadata: dict[str, Any],
+        expire_time_ms: int | None = None,
+    ) -> None:
+        """Queue the listing index writes for a memory key on a pipeline."""
+        pipe.zadd(MEMORY_BY_TIME_KEY, {key: timestamp_ms})
+        if self._is_stored_memory(metadata):
+            pipe.zadd(MEMORY_STORED_KEY, {key: timestamp_ms})
+        if expire_time_ms is not None:
+            pipe.zadd(MEMORY_BY_EXPIRY_KEY, {key: expire_time_ms})
+
+    def _unindex_memories(self, client: Any, keys: list[Any]) -> None:
+        """Remove memory keys from the listing index."""
+        if not keys:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for index_key in MEMORY_INDEX_KEYS:
+                pipe.zrem(index_key, *keys)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to remove {len(keys)} keys from memory index: {e}")
+
+    def ensure_listing_index(self) -> bool:
+        """Build the listing index from existing memories unless it is already in place."""
+        try:
+            client = self._get_thread_safe_client()
+            if self._listing_index_ready(client):
+                self.reconcile_listing_index(client)
+                return True
+
+            indexed = self._backfill_from_scan(client)
+            client.set(MEMORY_INDEX_READY_KEY, "1")
+            interval = index_reconcile_interval()
+            if interval > 0:
+                client.set(MEMORY_INDEX_RECONCILED_KEY, "1", ex=max(1, int(interval)))
+            if indexed:
+                logger.info(f"Built memory listing index for {indexed} existing memories")
+            return True
+        except Exception as e:
+            logger.warning(f"Memory listing index unavailable, falling back to key scans: {e}")
+            return False
+
+    def reconcile_listing_index(self, client: Any | None = None) -> int:
+        """
+        Re-sync the listing index with the stored hashes if the last pass is stale.
+
+        The ``orka_memory_idx:reconciled`` key is taken with ``SET NX EX`` so only one
+        process per database reconciles per interval.
+
+        Returns:
+            Number of index members added or removed.
+        """
+        interval = index_reconcile_interval()
+        if interval <= 0:
+            return 0
+        try:
+            client = client or self._get_thread_safe_client()
+            if not client.set(MEMORY_INDEX_RECONCILED_KEY, "1", ex=max(1, int(interval)), nx=True):
+                return 0
+
+            indexed = self._backfill_from_scan(client)
+            pruned = self._prune_listing_index(client)
+            if indexed or pruned:
+                logger.info(f"Reconciled memory listing index: {indexed} indexed, {pruned} dangling removed")
+            return indexed + pruned
+        except Exception as e:
+            logger.warning(f"Failed to reconcile memory listing index: {e}")
+            return 0
+
+    def _backfill_from_scan(self, client: Any) -> int:
+        """Index every ``orka_memory:*`` hash found by SCAN (ZADD makes this idempotent)."""
+        indexed = 0
+        batch: list[Any] = []
+        for key in client.scan_iter(match=MEMORY_KEY_PATTERN, count=1000):
+            batch.append(key)
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                indexed += self._backfill_listing_index(client, batch)
+                batch = []
+        if batch:
+            indexed += self._backfill_listing_index(client, batch)
+        return indexed
+
+    def _prune_listing_index(self, client: Any) -> int:
+        """Drop index members whose memory hash no longer exists."""
+        pruned = 0
+        batch: list[Any] = []
+        for key, _score in client.zscan_iter(MEMORY_BY_TIME_KEY, count=1000):
+            batch.append(key)
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                pruned += self._unindex_missing(client, batch)
+                batch = []
+        if batch:
+            pruned += self._unindex_missing(client, batch)
+        return pruned
+
+    def _unindex_missing(self, client: Any, keys: list[Any]) -> int:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.exists(key)
+        missing = [key for key, exists in zip(keys, pipe.execute()) if not exists]
+        self._unindex_memories(client, missing)
+        return len(missing)
+
+    def _backfill_listing_index(self, client: Any, keys: list[Any]) -> int:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hmget(key, "timestamp", "metadata", "orka_expire_time")
+        rows = pipe.execute()
+
+        indexed = 0
+        pipe = client.pipeline(transaction=False)
+        for key, (timestamp, metadata_value, expire_time) in zip(keys, rows):
+            if timestamp is None:
+                continue
+            try:
+                metadata = json.loads(metadata_value or "{}")
+            except Exception:
+                metadata = {}
+            score = int(float(timestamp))
+            pipe.zadd(MEMORY_BY_TIME_KEY, {key: score})
+            if isinstance(metadata, dict) and self._is_stored_memory(metadata):
+                pipe.zadd(MEMORY_STORED_KEY, {key: score})
+            if expire_time:
+                pipe.zadd(MEMORY_BY_EXPIRY_KEY, {key: int(float(expire_time))})
+            indexed += 1
+        pipe.execute()
+        return indexed
+
+    def _iter_indexed_memories(self, client: Any, index_key: str) -> Iterator[tuple[Any, dict]]:
+        """Yield ``(key, hash)`` pairs newest first, one pipelined page at a time."""
+        start = 0
+        seen: set[Any] = set()
+        while True:
+            keys = client.zrevrange(index_key, start, start + LISTING_PAGE_SIZE - 1)
+            if not keys:
+                return
+
+            pipe = client.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+            rows = pipe.execute()
+
+            # Hashes removed by Redis TTL leave dangling index entries behind
+            missing = [key for key, data in zip(keys, rows) if not data]
+            if missing:
+                self._unindex_memories(client, missing)
+
+            for key, memory_data in zip(keys, rows):
+                if memory_data and key not in seen:
+                    seen.add(key)
+                    yield key, memory_data
+
+            if len(keys) < LISTING_PAGE_SIZE:
+                return
+            start += len(keys) - len(missing)
+
+    def _iter_memory_hashes(self, client: Any, index_key: str) -> Iterator[tuple[Any, dict]]:
+        """Yield ``(key, hash)`` pairs from the listing index, or from a key scan without it."""
+        if self._listing_index_ready(client):
+            yield from self._iter_indexed_memories(client, index_key)
+            return
+
+        for key in client.keys(MEMORY_KEY_PATTERN):
+            try:
+                memory_data = client.hgetall(key)
+            except Exception as e:
+                logger.warning(f"Error processing memory {key}: {e}")
+                continue
+            if memory_data:
+                yield key, memory_data
+
+    def _memory_from_hash(self, key: Any, memory_data: dict, metadata: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "content": self._safe_get_redis_value(memory_data, "content", ""),
+            "node_id": self._safe_get_redis_value(memory_data, "node_id", ""),
+            "trace_id": self._safe_get_redis_value(memory_data, "trace_id", ""),
+            "importance_score": float(self._safe_get_redis_value(memory_data, "importance_score", "0")),
+            "memory_type": self._safe_get_redis_value(memory_data, "memory_type", ""),
+            "timestamp": int(self._safe_get_redis_value(memory_data, "timestamp", "0")),
+            "metadata": metadata,
+            "key": key.decode() if isinstance(key, bytes) else key,
+        }
+
+    def _parse_metadata(self, key: Any, memory_data: dict) -> dict[str, Any]:
+        try:
+            metadata_value = self._safe_get_redis_value(memory_data, "metadata", "{}")
+            return json.loads(metadata_value)
+        except Exception as e:
+            logger.debug(f"Error parsing metadata for key {key}: {e}")
+            return {}
+
+    # ==========================================================================
+    # CRUD Operations
+    # ==========================================================================
+
     def get_all_memories(self, trace_id: str | None = None) -> list[dict[str, Any]]:
         """Get all memories, optionally filtered by trace_id."""
         try:
-            pattern = "orka_memory:*"
-            keys = self._get_thread_safe_client().keys(pattern)
+            client = self._get_thread_safe_client()
 
             memories = []
-            for key in keys:
+            for key, memory_data in self._iter_memory_hashes(client, MEMORY_BY_TIME_KEY):
                 try:
-                    memory_data = self._get_thread_safe_client().hgetall(key)
-                    if not memory_data:
-                        continue
-
                     if (
                         trace_id
                         and self._safe_get_redis_value(memory_data, "trace_id")
@@ -62,36 +338,8 @@ class MemoryCRUDMixin:
                     if self._is_expired(memory_data):
                         continue
 
-                    try:
-                        metadata_value = self._safe_get_redis_value(
-                            memory_data, "metadata", "{}"
-                        )
-                        metadata = json.loads(metadata_value)
-                    except Exception as e:
-                        logger.debug(f"Error parsing metadata for key {key}: {e}")
-                        metadata = {}
-
-                    memory = {
-                        "content": self._safe_get_redis_value(memory_data, "content", ""),
-                        "node_id": self._safe_get_redis_value(memory_data, "node_id", ""),
-                        "trace_id": self._safe_get_redis_value(
-                            memory_data, "trace_id", ""
-                        ),
-                        "importance_score": float(
-                            self._safe_get_redis_value(
-                                memory_data, "importance_score", "0"
-                            )
-                        ),
-                        "memory_type": self._safe_get_redis_value(
-                            memory_data, "memory_type", ""
-                        ),
-                        "timestamp": int(
-                            self._safe_get_redis_value(memory_data, "timestamp", "0")
-                        ),
-                        "metadata": metadata,
-                        "key": key.decode() if isinstance(key, bytes) else key,
-                    }
-                    memories.append(memory)
+                    metadata = self._parse_metadata(key, memory_data)
+                    memories.append(self._memory_from_hash(key, memory_data, metadata))
 
                 except Exception as e:
                     logger.warning(f"Error processing memory {key}: {e}")
@@ -107,7 +355,9 @@ class MemoryCRUDMixin:
     def delete_memory(self, key: str) -> bool:
         """Delete a specific memory entry."""
         try:
-            result = self._get_thread_safe_client().delete(key)
+            client = self._get_thread_safe_client()
+            result = client.delete(key)
+            self._unindex_memories(client, [key])
             logger.debug(f"Deleted memory key: {key}")
             return bool(result > 0)
         except Exception as e:
@@ -117,10 +367,10 @@ class MemoryCRUDMixin:
     def clear_all_memories(self) -> None:
         """Clear all memories from the RedisStack storage."""
         try:
-            pattern = "orka_memory:*"
-            keys = self._get_thread_safe_client().keys(pattern)
+            client = self._get_thread_safe_client()
+            keys = client.keys(MEMORY_KEY_PATTERN)
             if keys:
-                deleted = self._get_thread_safe_client().delete(*keys)
+                deleted = client.delete(*keys, *MEMORY_INDEX_KEYS)
                 logger.info(f"Cleared {deleted} memories from RedisStack")
             else:
                 logger.info("No memories to clear")
@@ -131,62 +381,30 @@ class MemoryCRUDMixin:
         """Get recent stored memories (log_type='memory' only), sorted by timestamp."""
         try:
             client = self._get_thread_safe_client()
-            pattern = "orka_memory:*"
-            keys = client.keys(pattern)
+            # The index yields newest first, so the scan can stop after ``count`` hits
+            ordered = self._listing_index_ready(client)
 
             stored_memories = []
             current_time_ms = int(time.time() * 1000)
 
-            for key in keys:
+            for key, memory_data in self._iter_memory_hashes(client, MEMORY_STORED_KEY):
                 try:
-                    memory_data = client.hgetall(key)
-                    if not memory_data:
-                        continue
-
                     if self._is_expired(memory_data):
                         continue
 
-                    try:
-                        metadata_value = self._safe_get_redis_value(
-                            memory_data, "metadata", "{}"
-                        )
-                        metadata = json.loads(metadata_value)
-                    except Exception as e:
-                        logger.debug(f"Error parsing metadata for key {key}: {e}")
-                        metadata = {}
-
-                    memory_log_type = metadata.get("log_type", "log")
-                    memory_category = metadata.get("category", "log")
-
-                    if memory_log_type != "memory" and memory_category != "stored":
+                    metadata = self._parse_metadata(key, memory_data)
+                    if not self._is_stored_memory(metadata):
                         continue
 
                     expiry_info = self._get_ttl_info(key, memory_data, current_time_ms)
                     if not expiry_info:
                         continue
 
-                    memory = {
-                        "content": self._safe_get_redis_value(memory_data, "content", ""),
-                        "node_id": self._safe_get_redis_value(memory_data, "node_id", ""),
-                        "trace_id": self._safe_get_redis_value(
-                            memory_data, "trace_id", ""
-                        ),
-                        "importance_score": float(
-                            self._safe_get_redis_value(
-                                memory_data, "importance_score", "0"
-                            )
-                        ),
-                        "memory_type": self._safe_get_redis_value(
-                            memory_data, "memory_type", ""
-                        ),
-                        "timestamp": int(
-                            self._safe_get_redis_value(memory_data, "timestamp", "0")
-                        ),
-                        "metadata": metadata,
-                        "key": key.decode() if isinstance(key, bytes) else key,
-                        **expiry_info,
-                    }
+                    memory = self._memory_from_hash(key, memory_data, metadata)
+                    memory.update(expiry_info)
                     stored_memories.append(memory)
+                    if ordered and len(stored_memories) >= count:
+                        break
 
                 except Exception as e:
                     logger.warning(f"Error processing memory {key}: {e}")
@@ -202,10 +420,23 @@ class MemoryCRUDMixin:
     def tail(self, count: int = 10) -> list[dict[str, Any]]:
         """Get recent memory entries."""
         try:
-            memories = self.get_all_memories()
-            memories.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-            return memories[:count]
+            client = self._get_thread_safe_client()
+            if not self._listing_index_ready(client):
+                memories = self.get_all_memories()
+                memories.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
+                return memories[:count]
+
+            recent: list[dict[str, Any]] = []
+            if count <= 0:
+                return recent
+            for key, memory_data in self._iter_indexed_memories(client, MEMORY_BY_TIME_KEY):
+                if self._is_expired(memory_data):
+                    continue
+                metadata = self._parse_metadata(key, memory_data)
+                recent.append(self._memory_from_hash(key, memory_data, metadata))
+                if len(recent) >= count:
+                    break
+            return recent
         except Exception as e:
             logger.error(f"Error in tail operation: {e}")
             return []
-
@@ -19,7 +19,8 @@ Features
 --------
 - Memory expiration checking
 - TTL calculation and formatting
-- Expired memory cleanup with dry-run support
+- Expired memory cleanup with dry-run support (served by the listing index's
+  expiry sorted set when available, see ``crud_mixin``)
 - Configurable decay rules
 
 Usage
@@ -36,6 +37,8 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from .crud_mixin import MEMORY_BY_EXPIRY_KEY, MEMORY_INDEX_KEYS
+
 if TYPE_CHECKING:
     import redis
 
@@ -49,6 +52,8 @@ class MemoryDecayMixin:
     Requires the host class to provide:
     - `_get_thread_safe_client()` method
     - `_safe_get_redis_value()` method
+    - `_listing_index_ready()` method (optional, enables index-based cleanup)
+    - `reconcile_listing_index()` method (optional, run before index-based cleanup)
     - `memory_decay_config` attribute
     - `_connection_pool` attribute (optional, for cleanup checks)
     """
@@ -74,6 +79,19 @@ class MemoryDecayMixin:
         self, key: bytes, memory_data: dict[str, Any], current_time_ms: int
     ) -> dict[str, Any] | None:
         """Calculate TTL information for a memory entry."""
+        redis_ttl = None
+        try:
+            client = self._get_thread_safe_client()
+            redis_ttl = client.ttl(key)
+        except Exception as e:
+            key_str = key.decode() if isinstance(key, bytes) else str(key)
+            logger.debug(f"Error getting Redis TTL for {key_str}: {e}")
+        return self._expiry_info(memory_data, current_time_ms, redis_ttl)
+
+    def _expiry_info(
+        self, memory_data: dict[str, Any], current_time_ms: int, redis_ttl: Any
+    ) -> dict[str, Any]:
+        """Build TTL information from an already fetched Redis TTL (or None)."""
         ttl_seconds = -1
         expires_at = None
         expires_at_formatted = "N/A"
@@ -81,9 +99,7 @@ class MemoryDecayMixin:
 
         # Check for Redis TTL
         try:
-            client = self._get_thread_safe_client()
-            redis_ttl = client.ttl(key)
-            if redis_ttl > 0:
+            if redis_ttl is not None and redis_ttl > 0:
                 ttl_seconds = redis_ttl
                 expires_at = current_time_ms + (ttl_seconds * 1000)
                 expires_at_formatted = time.strftime(
@@ -91,8 +107,7 @@ class MemoryDecayMixin:
                 )
                 has_expiry = True
         except Exception as e:
-            key_str = key.decode() if isinstance(key, bytes) else str(key)
-            logger.debug(f"Error getting Redis TTL for {key_str}: {e}")
+            logger.debug(f"Invalid Redis TTL {redis_ttl!r}: {e}")
 
         # Check for orka_expire_time field if Redis TTL is not set
         if not has_expiry:
@@ -199,6 +214,15 @@ class MemoryDecayMixin:
                     "errors": [f"Connection failed: {e}"],
                 }
 
+            listing_index_ready = getattr(self, "_listing_index_ready", None)
+            if listing_index_ready is not None and listing_index_ready(client):
+                # Cleanup runs periodically, so it also keeps the index in sync with
+                # hashes written by processes that do not maintain it.
+                reconcile_listing_index = getattr(self, "reconcile_listing_index", None)
+                if reconcile_listing_index is not None:
+                    reconcile_listing_index(client)
+                return self._cleanup_indexed_memories(client, dry_run)
+
             pattern = "orka_memory:*"
             keys = client.keys(pattern)
             total_checked = len(keys)
@@ -248,3 +272,39 @@ class MemoryDecayMixin:
                 "errors": errors + [str(e)],
             }
 
+    def _cleanup_indexed_memories(self, client: "redis.Redis", dry_run: bool) -> dict[str, Any]:
+        """Remove memories whose expiry score has passed, without scanning live keys."""
+        batch_size = 100
+        cleaned = 0
+        errors: list[str] = []
+        now_ms = int(time.time() * 1000)
+
+        # Everything scored at or below "now" in the expiry index is due. Hashes that
+        # Redis TTL already removed only need their index entries dropped.
+        expired_keys = client.zrangebyscore(MEMORY_BY_EXPIRY_KEY, "-inf", now_ms) or []
+
+        if not dry_run:
+            for i in range(0, len(expired_keys), batch_size):
+                batch = expired_keys[i : i + batch_size]
+                try:
+                    pipe = client.pipeline(transaction=False)
+                    pipe.delete(*batch)
+                    for index_key in MEMORY_INDEX_KEYS:
+                        pipe.zrem(index_key, *batch)
+                    deleted_count = pipe.execute()[0]
+                    cleaned += deleted_count
+                    logger.debug(f"Deleted batch of {deleted_count} expired memories")
+                except Exception as e:
+                    errors.append(f"Batch deletion error: {e}")
+
+        if cleaned > 0:
+            logger.info(f"Cleanup completed: {cleaned} expired memories removed")
+
+        return {
+            "cleaned": cleaned,
+            "total_checked": len(expired_keys),
+            "expired_found": len(expired_keys),
+            "dry_run": dry_run,
+            "cleanup_type": "redisstack",
+            "errors": errors,
+        }
@@ -14,9 +14,19 @@ Embedding Operations Mixin
 ==========================
 
 Provides embedding generation and content formatting operations.
+
+Two embedding paths are available:
+
+- ``_get_embedding_sync`` for scripts and sync call sites. When called from inside
+  a running event loop it cannot await the model and degrades to the embedder's
+  hash-based fallback vectors.
+- ``_get_embedding_async`` for async call sites (``alog_memory`` /
+  ``asearch_memories``). It awaits the real embedder, whose model calls run off
+  the event loop, so async deployments store real semantic vectors.
 """
 
 import asyncio
+import inspect
 import logging
 from typing import Any
 
@@ -68,9 +78,12 @@ class EmbeddingMixin:
                 in_async = False
 
             if in_async:
-                # In async context - use fallback encoding if available
+                # In async context - use fallback encoding if available.
+                # Async callers should use _get_embedding_async for real embeddings.
                 if hasattr(self.embedder, "_fallback_encode"):
-                    logger.debug("In async context, using fallback encoding")
+                    logger.debug(
+                        "In async context, using fallback encoding (use the async API for real embeddings)"
+                    )
                     result = self.embedder._fallback_encode(text)
                     if result is not None:
                         return result
@@ -92,3 +105,30 @@ class EmbeddingMixin:
             embedding_dim = getattr(self.embedder, "embedding_dim", 384)
             return np.zeros(embedding_dim, dtype=np.float32)
 
+    async def _get_embedding_async(self, text: str) -> np.ndarray | None:
+        """Get a real embedding from inside a running event loop without blocking it.
+
+        Coroutine ``encode`` implementations (``AsyncEmbedder``) are awaited directly;
+        synchronous embedders are run in a worker thread.
+        """
+        if not self.embedder:
+            return None
+
+        try:
+            encode = getattr(self.embedder, "encode", None)
+            if encode is None:
+                return None
+            if inspect.iscoroutinefunction(encode):
+                result = await encode(text)
+            else:
+                result = await asyncio.to_thread(encode, text)
+                if inspect.isawaitable(result):
+                    result = await result
+            if result is None:
+                return None
+            return np.asarray(result, dtype=np.float32)
+        except Exception as e:
+            error_msg = str(e) if str(e) else type(e).__name__
+            logger.warning(f"Failed to get embedding: {error_msg}")
+            embedding_dim = getattr(self.embedder, "embedding_dim", 384)
+            return np.zeros(embedding_dim, dtype=np.float32)
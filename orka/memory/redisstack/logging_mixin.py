@@ -14,6 +14,21 @@ Orchestration Logging Mixin
 ===========================
 
 Provides orchestration event logging functionality for memory operations.
+
+Tiered storage
+--------------
+Orchestration telemetry (``log_type="log"``) is short-lived and never vector-searched,
+so by default only ``stored``/``memory`` entries are embedded; telemetry is written as
+a plain hash without a vector. The host's ``log_embedding_policy`` controls this:
+
+```python
+{
+    "mode": "tiered",  # "tiered" (default), "all" or "none"
+    "agents": {"summarizer": True},  # per-agent overrides
+}
+```
+
+An agent's decay configuration may also carry ``embed: true|false``.
 """
 
 import json
@@ -23,6 +38,9 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+LOG_EMBEDDING_MODES = ("tiered", "all", "none")
+DEFAULT_LOG_EMBEDDING_POLICY: dict[str, Any] = {"mode": "tiered", "agents": {}}
+
 
 class OrchestrationLoggingMixin:
     """Mixin providing orchestration event logging for memory storage."""
@@ -58,6 +76,13 @@ class OrchestrationLoggingMixin:
             if log_type == "log":
                 expiry_hours = 0.2  # 12 minutes for orchestration logs
 
+            category = self._classify_memory_category(
+                event_type,
+                agent_id,
+                payload,
+                log_type,
+            )
+
             self.log_memory(
                 content=content,
                 node_id=agent_id,
@@ -74,16 +99,12 @@ class OrchestrationLoggingMixin:
                     ),
                     "agent_decay_config": agent_decay_config,
                     "log_type": log_type,
-                    "category": self._classify_memory_category(
-                        event_type,
-                        agent_id,
-                        payload,
-                        log_type,
-                    ),
+                    "category": category,
                 },
                 importance_score=importance_score,
                 memory_type=memory_type,
                 expiry_hours=expiry_hours,
+                embed=self._should_embed_log(agent_id, log_type, category, agent_decay_config),
             )
 
             trace_entry = {
@@ -103,6 +124,29 @@ class OrchestrationLoggingMixin:
         except Exception as e:
             logger.error(f"Failed to log orchestration event: {e}")
 
+    def _should_embed_log(
+        self,
+        agent_id: str,
+        log_type: str,
+        category: str,
+        agent_decay_config: dict[str, Any] | None = None,
+    ) -> bool:
+        """Decide whether an orchestration entry gets a vector embedding."""
+        policy = getattr(self, "log_embedding_policy", None) or DEFAULT_LOG_EMBEDDING_POLICY
+
+        agents = policy.get("agents") or {}
+        if agent_id in agents:
+            return bool(agents[agent_id])
+        if agent_decay_config and "embed" in agent_decay_config:
+            return bool(agent_decay_config["embed"])
+
+        mode = policy.get("mode", "tiered")
+        if mode == "all":
+            return True
+        if mode == "none":
+            return False
+        return log_type == "memory" or category == "stored"
+
     def _extract_content_from_payload(
         self, payload: dict[str, Any], event_type: str
     ) -> str:
@@ -16,6 +16,8 @@ Redis Interface Mixin
 Provides thread-safe Redis operation delegations.
 """
 
+from typing import Any
+
 
 class RedisInterfaceMixin:
     """Mixin providing thread-safe Redis interface methods."""
@@ -60,3 +62,20 @@ class RedisInterfaceMixin:
     def delete(self, *keys: str) -> int:
         return self._get_thread_safe_client().delete(*keys)
 
+    def write_batch(
+        self,
+        hashes: dict[str, dict[str, Any]] | None = None,
+        sets: dict[str, list[str]] | None = None,
+        values: dict[str, Any] | None = None,
+    ) -> None:
+        """Apply hash, set and string writes in a single MULTI/EXEC round trip."""
+        pipe = self._get_thread_safe_client().pipeline(transaction=True)
+        for name, fields in (hashes or {}).items():
+            if fields:
+                pipe.hset(name, mapping=fields)
+        for name, members in (sets or {}).items():
+            if members:
+                pipe.sadd(name, *members)
+        for key, value in (values or {}).items():
+            pipe.set(key, value)
+        pipe.execute()
@@ -33,11 +33,12 @@ class RedisStackMemoryLogger(BaseMemoryLogger, MemorySearchMixin):
 ```
 """
 
+import asyncio
 import json
 import logging
 import math
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 import numpy as np
 
@@ -46,6 +47,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# KNN window multiplier used when some filters can only be applied after the search
+SEARCH_OVERFETCH_FACTOR = 4
+# Upper bound on KNN candidates fetched for a single memory search
+MAX_SEARCH_CANDIDATES = 1000
+
 
 class MemorySearchMixin:
     """
@@ -55,9 +61,12 @@ class MemorySearchMixin:
     - `_get_thread_safe_client()` method
     - `_safe_get_redis_value()` method
     - `_get_embedding_sync()` method
+    - `_get_embedding_async()` coroutine (for `asearch_memories`)
     - `_is_expired()` method
-    - `_get_ttl_info()` method
+    - `_get_ttl_info()` and `_expiry_info()` methods
+    - `_get_async_client()` method (for the native `asearch_memories` path)
     - `_ensure_index()` method
+    - `_index_mgr` attribute (optional; caches index verification)
     - `embedder` attribute
     - `index_name` attribute
     - `vector_params` attribute
@@ -72,8 +81,11 @@ class MemorySearchMixin:
     # - _get_thread_safe_client() -> redis.Redis
     # - _safe_get_redis_value(memory_data, key, default) -> Any
     # - _get_embedding_sync(text) -> np.ndarray | None
+    # - _get_embedding_async(text) -> np.ndarray | None (awaitable)
     # - _is_expired(memory_data) -> bool
     # - _get_ttl_info(key, memory_data, current_time_ms) -> dict | None
+    # - _expiry_info(memory_data, current_time_ms, redis_ttl) -> dict
+    # - _get_async_client() -> redis.asyncio.Redis
     # - _ensure_index() -> None
 
     def _escape_redis_search_query(
@@ -203,17 +215,12 @@ class MemorySearchMixin:
                             namespace,
                         )
 
-                    from orka.utils.bootstrap_memory_index import (
-                        hybrid_vector_search,
-                        verify_memory_index,
-                    )
-
                     logger.debug(f"Performing vector search for: {query}")
 
                     client = self._get_thread_safe_client()
 
-                    # Verify index exists
-                    index_status = verify_memory_index(client, self.index_name)
+                    # Verify index exists (cached by the index manager)
+                    index_status = self._get_index_status(client)
                     if not index_status["exists"]:
                         logger.error(
                             f"Memory index {self.index_name} does not exist: "
@@ -224,7 +231,7 @@ class MemorySearchMixin:
                                 f"Attempting to recreate missing index {self.index_name}"
                             )
                             self._ensure_index()
-                            index_status = verify_memory_index(client, self.index_name)
+                            index_status = self._get_index_status(client, refresh=True)
                             if (
                                 not index_status["exists"]
                                 or not index_status["vector_field_exists"]
@@ -264,7 +271,7 @@ class MemorySearchMixin:
                             self._ensure_index()
                             self.vector_params["force_recreate"] = original_force_recreate
 
-                            index_status = verify_memory_index(client, self.index_name)
+                            index_status = self._get_index_status(client, refresh=True)
                             if not index_status["vector_field_exists"]:
                                 return self._fallback_text_search(
                                     query,
@@ -296,25 +303,13 @@ class MemorySearchMixin:
                         f"Index verification passed: {index_status['num_docs']} docs"
                     )
 
-                    results = hybrid_vector_search(
-                        redis_client=client,
-                        query_text=query,
-                        query_vector=query_vector,
-                        num_results=num_results,
-                        index_name=self.index_name,
-                        trace_id=trace_id,
-                    )
-
-                    logger.debug(f"Vector search returned {len(results)} results")
-
-                    if len(results) == 0:
-                        logger.warning(
-                            f"Vector search found no results for query: '{query}'"
-                        )
-
-                    # Convert and filter results
-                    formatted_results = self._process_search_results(
-                        results,
+                    formatted_results = self._vector_search(
+                        client,
+                        index_status,
+                        query,
+                        query_vector,
+                        num_results,
+                        trace_id,
                         node_id,
                         memory_type,
                         min_importance,
@@ -368,6 +363,273 @@ class MemorySearchMixin:
             logger.error(f"Memory search failed: {e}")
             return []
 
+    async def asearch_memories(
+        self,
+        query: str,
+        num_results: int = 10,
+        trace_id: str | None = None,
+        node_id: str | None = None,
+        memory_type: str | None = None,
+        min_importance: float | None = None,
+        log_type: str = "memory",
+        namespace: str | None = None,
+        query_vector: Any | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Async variant of ``search_memories`` for use inside a running event loop.
+
+        The query embedding is awaited from the real embedder. While the index status
+        is cached, the KNN search runs on the ``redis.asyncio`` client (one FT.SEARCH
+        plus one pipelined TTL lookup). Index recreation and the text fallbacks run
+        ``search_memories`` in a worker thread. Arguments match ``search_memories``.
+        """
+        if query_vector is None and self.embedder and query.strip():
+            query_vector = await self._get_embedding_async(query)
+
+        index_status = self._cached_index_status()
+        if query_vector is not None and index_status is not None:
+            try:
+                formatted_results = await self._async_vector_search(
+                    index_status,
+                    query_vector,
+                    num_results,
+                    trace_id,
+                    node_id,
+                    memory_type,
+                    min_importance,
+                    log_type,
+                    namespace,
+                )
+                if formatted_results or not query.strip():
+                    return formatted_results
+                logger.info("Vector search returned 0 results, falling back to text search")
+                return await asyncio.to_thread(
+                    self._fallback_text_search,
+                    query,
+                    num_results,
+                    trace_id,
+                    node_id,
+                    memory_type,
+                    min_importance,
+                    log_type,
+                    namespace,
+                )
+            except Exception as e:
+                from orka.utils.bootstrap_memory_index import is_missing_index_error
+
+                if is_missing_index_error(e):
+                    self._invalidate_index_status()
+                logger.warning(f"Async vector search failed, using blocking search: {e}")
+
+        return await asyncio.to_thread(
+            self.search_memories,
+            query,
+            num_results,
+            trace_id,
+            node_id,
+            memory_type,
+            min_importance,
+            log_type,
+            namespace,
+            query_vector,
+        )
+
+    def _vector_search(
+        self,
+        client: Any,
+        index_status: dict[str, Any],
+        query: str,
+        query_vector: Any,
+        num_results: int,
+        trace_id: str | None,
+        node_id: str | None,
+        memory_type: str | None,
+        min_importance: float | None,
+        log_type: str,
+        namespace: str | None,
+    ) -> list[dict[str, Any]]:
+        """Run the filtered KNN search, widening the window while filters leave it short."""
+        from orka.utils.bootstrap_memory_index import (
+            hybrid_vector_search,
+            is_missing_index_error,
+        )
+
+        filter_expression, k = self._plan_vector_search(
+            index_status,
+            num_results,
+            trace_id,
+            node_id,
+            memory_type,
+            min_importance,
+            log_type,
+            namespace,
+        )
+        while True:
+            try:
+                results = hybrid_vector_search(
+                    redis_client=client,
+                    query_text=query,
+                    query_vector=query_vector,
+                    num_results=k,
+                    index_name=self.index_name,
+                    trace_id=trace_id,
+                    filter_expression=filter_expression,
+                )
+            except Exception as search_error:
+                if is_missing_index_error(search_error):
+                    # The cached status was stale: rebuild for the next search
+                    logger.warning(
+                        f"Memory index {self.index_name} disappeared, rebuilding"
+                    )
+                    self._invalidate_index_status()
+                    self._ensure_index()
+                raise
+
+            logger.debug(f"Vector search returned {len(results)} results")
+
+            # Convert and filter results
+            formatted_results = self._process_search_results(
+                results,
+                node_id,
+                memory_type,
+                min_importance,
+                log_type,
+                namespace,
+            )
+            next_k = self._widen_search_window(
+                k, num_results, len(formatted_results), len(results)
+            )
+            if next_k is None:
+                break
+            k = next_k
+
+        if len(results) == 0:
+            logger.warning(f"Vector search found no results for query: '{query}'")
+        return formatted_results[:num_results]
+
+    async def _async_vector_search(
+        self,
+        index_status: dict[str, Any],
+        query_vector: Any,
+        num_results: int,
+        trace_id: str | None,
+        node_id: str | None,
+        memory_type: str | None,
+        min_importance: float | None,
+        log_type: str,
+        namespace: str | None,
+    ) -> list[dict[str, Any]]:
+        from orka.utils.bootstrap_memory_index import ahybrid_vector_search
+
+        client = self._get_async_client()
+        filter_expression, k = self._plan_vector_search(
+            index_status,
+            num_results,
+            trace_id,
+            node_id,
+            memory_type,
+            min_importance,
+            log_type,
+            namespace,
+        )
+        while True:
+            results = await ahybrid_vector_search(
+                client,
+                np.asarray(query_vector, dtype=np.float32),
+                num_results=k,
+                index_name=self.index_name,
+                trace_id=trace_id,
+                filter_expression=filter_expression,
+            )
+            formatted_results = await self._aprocess_search_results(
+                client,
+                results,
+                node_id,
+                memory_type,
+                min_importance,
+                log_type,
+                namespace,
+            )
+            next_k = self._widen_search_window(
+                k, num_results, len(formatted_results), len(results)
+            )
+            if next_k is None:
+                return formatted_results[:num_results]
+            k = next_k
+
+    def _plan_vector_search(
+        self,
+        index_status: dict[str, Any],
+        num_results: int,
+        trace_id: str | None,
+        node_id: str | None,
+        memory_type: str | None,
+        min_importance: float | None,
+        log_type: str,
+        namespace: str | None,
+    ) -> tuple[str | None, int]:
+        """Return the FT.SEARCH pre-filter and the first KNN window size."""
+        from orka.utils.bootstrap_memory_index import build_memory_filter
+
+        filter_expression, pushed_down = build_memory_filter(
+            index_status.get("fields"),
+            trace_id=trace_id,
+            node_id=node_id,
+            memory_type=memory_type,
+            min_importance=min_importance,
+            log_type=log_type,
+            namespace=namespace,
+        )
+        requested = {
+            name
+            for name, value in (
+                ("trace_id", trace_id),
+                ("node_id", node_id),
+                ("memory_type", memory_type),
+                ("min_importance", min_importance),
+                ("log_type", log_type in ("memory", "log")),
+                ("namespace", namespace),
+            )
+            if value
+        }
+
+        # Over-fetch only for filters FT.SEARCH cannot apply
+        k = num_results
+        if requested - pushed_down:
+            k = num_results * SEARCH_OVERFETCH_FACTOR
+        return filter_expression, max(1, min(k, MAX_SEARCH_CANDIDATES))
+
+    @staticmethod
+    def _widen_search_window(
+        k: int, num_results: int, num_kept: int, num_fetched: int
+    ) -> int | None:
+        """Next KNN window when filtering left the page short, or None to stop."""
+        if num_kept >= num_results or num_fetched < k or k >= MAX_SEARCH_CANDIDATES:
+            return None
+        return min(k * SEARCH_OVERFETCH_FACTOR, MAX_SEARCH_CANDIDATES)
+
+    def _get_index_status(self, client: Any, refresh: bool = False) -> dict[str, Any]:
+        """Index status from the host's index manager cache, or a direct FT.INFO."""
+        index_mgr = getattr(self, "_index_mgr", None)
+        if index_mgr is not None:
+            return cast(dict[str, Any], index_mgr.get_index_health(client, refresh=refresh))
+
+        from orka.utils.bootstrap_memory_index import verify_memory_index
+
+        return verify_memory_index(client, self.index_name)
+
+    def _cached_index_status(self) -> dict[str, Any] | None:
+        """The index manager's cached status, without any Redis round trip."""
+        index_mgr = getattr(self, "_index_mgr", None)
+        if index_mgr is None:
+            return None
+        return cast("dict[str, Any] | None", index_mgr.peek_index_health())
+
+    def _invalidate_index_status(self) -> None:
+        index_mgr = getattr(self, "_index_mgr", None)
+        if index_mgr is not None:
+            index_mgr.invalidate_index_health()
+
     def _process_search_results(
         self,
         results: list[dict[str, Any]],
@@ -382,63 +644,21 @@ class MemorySearchMixin:
 
         for result in results:
             try:
-                memory_data = self._get_thread_safe_client().hgetall(result["key"])
-                if not memory_data:
-                    continue
-
-                # Apply filters
-                if (
-                    node_id
-                    and self._safe_get_redis_value(memory_data, "node_id") != node_id
-                ):
-                    continue
-                if (
-                    memory_type
-                    and self._safe_get_redis_value(memory_data, "memory_type")
-                    != memory_type
-                ):
-                    continue
-
-                importance_str = self._safe_get_redis_value(
+                # Vector hits carry their hash fields; older callers only pass keys.
+                memory_data = result.get("fields")
+                if not self._has_hit_fields(result):
+                    memory_data = self._get_thread_safe_client().hgetall(result["key"])
+                metadata = self._filter_search_hit(
+                    result,
                     memory_data,
-                    "importance_score",
-                    "0",
-                )
-                if min_importance and float(importance_str) < min_importance:
-                    continue
-
-                if self._is_expired(memory_data):
-                    continue
-
-                # Parse metadata
-                try:
-                    metadata_value = self._safe_get_redis_value(
-                        memory_data,
-                        "metadata",
-                        "{}",
-                    )
-                    metadata = json.loads(metadata_value)
-                except Exception as e:
-                    logger.debug(f"Error parsing metadata for key {result['key']}: {e}")
-                    metadata = {}
-
-                # Check log type
-                memory_log_type = metadata.get("log_type", "log")
-                memory_category = metadata.get("category", "log")
-                is_stored_memory = (
-                    memory_log_type == "memory" or memory_category == "stored"
+                    node_id,
+                    memory_type,
+                    min_importance,
+                    log_type,
+                    namespace,
                 )
-
-                if log_type == "memory" and not is_stored_memory:
+                if metadata is None:
                     continue
-                if log_type == "log" and is_stored_memory:
-                    continue
-
-                # Filter by namespace
-                if namespace:
-                    memory_namespace = metadata.get("namespace")
-                    if memory_namespace is not None and memory_namespace != namespace:
-                        continue
 
                 # Calculate TTL information
                 current_time_ms = int(time.time() * 1000)
@@ -447,57 +667,183 @@ class MemorySearchMixin:
                     memory_data,
                     current_time_ms,
                 )
+                formatted_results.append(
+                    self._format_search_hit(result, memory_data, metadata, expiry_info)
+                )
 
-                formatted_result = {
-                    "content": self._safe_get_redis_value(memory_data, "content", ""),
-                    "node_id": self._safe_get_redis_value(memory_data, "node_id", ""),
-                    "trace_id": self._safe_get_redis_value(memory_data, "trace_id", ""),
-                    "importance_score": float(
-                        self._safe_get_redis_value(
-                            memory_data,
-                            "importance_score",
-                            "0",
-                        ),
-                    ),
-                    "memory_type": self._safe_get_redis_value(
-                        memory_data,
-                        "memory_type",
-                        "",
-                    ),
-                    "timestamp": int(
-                        self._safe_get_redis_value(memory_data, "timestamp", "0"),
-                    ),
-                    "metadata": metadata,
-                    "similarity_score": self._validate_similarity_score(
-                        result.get("score", 0.0),
-                    ),
-                    "key": result["key"],
-                    "ttl_seconds": (
-                        expiry_info.get("ttl_seconds", -1) if expiry_info else -1
-                    ),
-                    "ttl_formatted": (
-                        expiry_info.get("ttl_formatted", "N/A") if expiry_info else "N/A"
-                    ),
-                    "expires_at": (
-                        expiry_info.get("expires_at") if expiry_info else None
-                    ),
-                    "expires_at_formatted": (
-                        expiry_info.get("expires_at_formatted", "N/A")
-                        if expiry_info
-                        else "N/A"
-                    ),
-                    "has_expiry": (
-                        expiry_info.get("has_expiry", False) if expiry_info else False
-                    ),
-                }
-                formatted_results.append(formatted_result)
+            except Exception as e:
+                logger.warning(f"Error processing search result: {e}")
+                continue
 
+        return formatted_results
+
+    async def _aprocess_search_results(
+        self,
+        client: Any,
+        results: list[dict[str, Any]],
+        node_id: str | None,
+        memory_type: str | None,
+        min_importance: float | None,
+        log_type: str,
+        namespace: str | None,
+    ) -> list[dict[str, Any]]:
+        """``_process_search_results`` on an asyncio client, batching every lookup."""
+        hit_data = [result.get("fields") for result in results]
+        missing = [i for i, result in enumerate(results) if not self._has_hit_fields(result)]
+        if missing:
+            pipe = client.pipeline(transaction=False)
+            for i in missing:
+                pipe.hgetall(results[i]["key"])
+            for i, memory_data in zip(missing, await pipe.execute()):
+                hit_data[i] = memory_data
+
+        kept = []
+        for result, memory_data in zip(results, hit_data):
+            try:
+                metadata = self._filter_search_hit(
+                    result,
+                    memory_data,
+                    node_id,
+                    memory_type,
+                    min_importance,
+                    log_type,
+                    namespace,
+                )
             except Exception as e:
                 logger.warning(f"Error processing search result: {e}")
                 continue
+            if metadata is not None:
+                kept.append((result, memory_data, metadata))
+        if not kept:
+            return []
+
+        pipe = client.pipeline(transaction=False)
+        for result, _, _ in kept:
+            pipe.ttl(result["key"])
+        ttls = await pipe.execute(raise_on_error=False)
 
+        current_time_ms = int(time.time() * 1000)
+        formatted_results = []
+        for (result, memory_data, metadata), redis_ttl in zip(kept, ttls):
+            if isinstance(redis_ttl, Exception):
+                redis_ttl = None
+            expiry_info = self._expiry_info(memory_data, current_time_ms, redis_ttl)
+            formatted_results.append(
+                self._format_search_hit(result, memory_data, metadata, expiry_info)
+            )
         return formatted_results
 
+    @staticmethod
+    def _has_hit_fields(result: dict[str, Any]) -> bool:
+        fields = result.get("fields")
+        return isinstance(fields, dict) and isinstance(fields.get("metadata"), (str, bytes))
+
+    def _filter_search_hit(
+        self,
+        result: dict[str, Any],
+        memory_data: Any,
+        node_id: str | None,
+        memory_type: str | None,
+        min_importance: float | None,
+        log_type: str,
+        namespace: str | None,
+    ) -> dict[str, Any] | None:
+        """Apply the search filters to a hit; returns its parsed metadata if it is kept."""
+        if not memory_data:
+            return None
+
+        # Apply filters
+        if node_id and self._safe_get_redis_value(memory_data, "node_id") != node_id:
+            return None
+        if (
+            memory_type
+            and self._safe_get_redis_value(memory_data, "memory_type") != memory_type
+        ):
+            return None
+
+        importance_str = self._safe_get_redis_value(
+            memory_data,
+            "importance_score",
+            "0",
+        )
+        if min_importance and float(importance_str) < min_importance:
+            return None
+
+        if self._is_expired(memory_data):
+            return None
+
+        # Parse metadata
+        try:
+            metadata_value = self._safe_get_redis_value(
+                memory_data,
+                "metadata",
+                "{}",
+            )
+            metadata = json.loads(metadata_value)
+        except Exception as e:
+            logger.debug(f"Error parsing metadata for key {result['key']}: {e}")
+            metadata = {}
+
+        # Check log type
+        memory_log_type = metadata.get("log_type", "log")
+        memory_category = metadata.get("category", "log")
+        is_stored_memory = memory_log_type == "memory" or memory_category == "stored"
+
+        if log_type == "memory" and not is_stored_memory:
+            return None
+        if log_type == "log" and is_stored_memory:
+            return None
+
+        # Filter by namespace
+        if namespace:
+            memory_namespace = metadata.get("namespace")
+            if memory_namespace is not None and memory_namespace != namespace:
+                return None
+
+        return cast(dict[str, Any], metadata)
+
+    def _format_search_hit(
+        self,
+        result: dict[str, Any],
+        memory_data: Any,
+        metadata: dict[str, Any],
+        expiry_info: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        return {
+            "content": self._safe_get_redis_value(memory_data, "content", ""),
+            "node_id": self._safe_get_redis_value(memory_data, "node_id", ""),
+            "trace_id": self._safe_get_redis_value(memory_data, "trace_id", ""),
+            "importance_score": float(
+                self._safe_get_redis_value(
+                    memory_data,
+                    "importance_score",
+                    "0",
+                ),
+            ),
+            "memory_type": self._safe_get_redis_value(
+                memory_data,
+                "memory_type",
+                "",
+            ),
+            "timestamp": int(
+                self._safe_get_redis_value(memory_data, "timestamp", "0"),
+            ),
+            "metadata": metadata,
+            "similarity_score": self._validate_similarity_score(
+                result.get("score", 0.0),
+            ),
+            "key": result["key"],
+            "ttl_seconds": (expiry_info.get("ttl_seconds", -1) if expiry_info else -1),
+            "ttl_formatted": (
+                expiry_info.get("ttl_formatted", "N/A") if expiry_info else "N/A"
+            ),
+            "expires_at": (expiry_info.get("expires_at") if expiry_info else None),
+            "expires_at_formatted": (
+                expiry_info.get("expires_at_formatted", "N/A") if expiry_info else "N/A"
+            ),
+            "has_expiry": (expiry_info.get("has_expiry", False) if expiry_info else False),
+        }
+
     def _fallback_text_search(
         self,
         query: str,
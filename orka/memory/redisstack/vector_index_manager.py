@@ -21,6 +21,16 @@ Features
 - Index verification and health checks
 - Automatic index recreation on schema mismatch
 - Thread-safe index operations
+- Cached index health so searches do not issue FT.INFO every time
+
+Index health
+------------
+``get_index_health()`` returns the last ``verify_memory_index`` result while it is
+younger than ``ORKA_INDEX_HEALTH_TTL`` seconds (default 300; 0 disables the cache).
+Once used, a daemon thread refreshes it every half TTL, so the search path only
+pays for FT.INFO when Redis was unreachable. A search that reports a missing index
+calls ``invalidate_index_health()`` and rebuilds. Rebuild counters are aggregated
+by ``get_index_health_stats()`` for the server health report.
 
 Usage
 -----
@@ -35,8 +45,11 @@ index_mgr.ensure_index(vector_dim=384)
 """
 
 import logging
+import os
 import queue
 import threading
+import time
+import weakref
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -44,6 +57,60 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_INDEX_HEALTH_TTL = 300.0
+
+_managers: "weakref.WeakSet[VectorIndexManager]" = weakref.WeakSet()
+
+
+def index_health_ttl() -> float:
+    """Seconds a verified index state is trusted (``ORKA_INDEX_HEALTH_TTL``)."""
+    try:
+        return max(0.0, float(os.getenv("ORKA_INDEX_HEALTH_TTL", str(DEFAULT_INDEX_HEALTH_TTL))))
+    except ValueError:
+        return DEFAULT_INDEX_HEALTH_TTL
+
+
+def get_index_health_stats() -> dict[str, Any]:
+    """Index health cache and rebuild counters summed over the live index managers."""
+    totals: dict[str, Any] = {
+        "managers": 0,
+        "health_checks": 0,
+        "cache_hits": 0,
+        "invalidations": 0,
+        "rebuilds": 0,
+        "rebuild_failures": 0,
+        "last_rebuild_at": None,
+    }
+    for manager in list(_managers):
+        stats = manager.get_index_stats()
+        totals["managers"] += 1
+        for name in ("health_checks", "cache_hits", "invalidations", "rebuilds", "rebuild_failures"):
+            totals[name] += stats[name]
+        if stats["last_rebuild_at"] and (
+            totals["last_rebuild_at"] is None or stats["last_rebuild_at"] > totals["last_rebuild_at"]
+        ):
+            totals["last_rebuild_at"] = stats["last_rebuild_at"]
+    return totals
+
+
+def _refresh_health_loop(
+    manager_ref: "weakref.ref[VectorIndexManager]",
+    stop: threading.Event,
+    interval: float,
+    index_name: str,
+) -> None:
+    """Re-verify the manager's index every ``interval`` seconds until stopped or collected."""
+    while not stop.wait(interval):
+        manager = manager_ref()
+        if manager is None:
+            return
+        try:
+            manager.get_index_health(refresh=True)
+        except Exception as e:
+            logger.debug(f"Background index health refresh failed for {index_name}: {e}")
+        finally:
+            del manager
+
 
 class VectorIndexManager:
     """
@@ -83,6 +150,23 @@ class VectorIndexManager:
         self.vector_params = vector_params or {}
         self.embedder = embedder
 
+        self.health_ttl = index_health_ttl()
+        self._health: dict[str, Any] | None = None
+        self._health_checked_at = 0.0
+        self._health_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+        self._refresh_stop = threading.Event()
+        self.stats: dict[str, Any] = {
+            "health_checks": 0,
+            "cache_hits": 0,
+            "invalidations": 0,
+            "rebuilds": 0,
+            "rebuild_failures": 0,
+            "last_rebuild_at": None,
+            "last_rebuild_reason": None,
+        }
+        _managers.add(self)
+
         logger.debug(f"VectorIndexManager initialized with index_name={index_name}")
 
     def ensure_index(
@@ -149,6 +233,8 @@ class VectorIndexManager:
             local_force_recreate = force_recreate or self.vector_params.get(
                 "force_recreate", False
             )
+            rebuild_reason = "forced" if local_force_recreate else None
+            self.invalidate_index_health()
             vector_field_name = self.vector_params.get(
                 "vector_field_name", "content_vector"
             )
@@ -168,6 +254,8 @@ class VectorIndexManager:
                     redis_client=redis_client,
                     index_name=self.index_name,
                 )
+                if not index_info["exists"]:
+                    rebuild_reason = rebuild_reason or "missing"
 
                 if index_info["exists"] and not index_info["vector_field_exists"]:
                     logger.warning(
@@ -176,6 +264,7 @@ class VectorIndexManager:
                         f"Will attempt to fix based on configuration."
                     )
                     local_force_recreate = True
+                    rebuild_reason = rebuild_reason or "schema"
 
                 if index_info["exists"] and not index_info["content_field_exists"]:
                     logger.warning(
@@ -184,6 +273,7 @@ class VectorIndexManager:
                         f"Will attempt to fix based on configuration."
                     )
                     local_force_recreate = True
+                    rebuild_reason = rebuild_reason or "schema"
 
             # Try multiple times with increasing force_recreate if needed
             max_attempts = 2
@@ -211,6 +301,7 @@ class VectorIndexManager:
                         and index_info["content_field_exists"]
                     ):
                         logger.info(f"Index verification successful after attempt {attempt + 1}")
+                        self._store_index_health(index_info)
                         break
                     elif attempt < max_attempts - 1:
                         logger.warning(
@@ -230,6 +321,9 @@ class VectorIndexManager:
                     else:
                         logger.error("Index creation failed after all attempts")
 
+            if rebuild_reason:
+                self._record_rebuild(rebuild_reason, success)
+
             if success:
                 logger.info(
                     f"Enhanced HNSW memory index ready with dimension {vector_dim}"
@@ -271,3 +365,94 @@ class VectorIndexManager:
                 "fields": [],
             }
 
+    def get_index_health(self, redis_client: Any = None, refresh: bool = False) -> dict[str, Any]:
+        """
+        Return the index status, verifying it only when the cached state is stale.
+
+        Args:
+            redis_client: Client to verify with (default: the connection manager's).
+            refresh: Skip the cache and issue FT.INFO.
+
+        Returns:
+            The ``verify_memory_index`` status dictionary.
+        """
+        if not refresh:
+            cached = self.peek_index_health()
+            if cached is not None:
+                return cached
+
+        from orka.utils.bootstrap_memory_index import verify_memory_index
+
+        client = redis_client if redis_client is not None else self.conn_mgr.get_client()
+        health = verify_memory_index(client, self.index_name)
+        with self._health_lock:
+            self.stats["health_checks"] += 1
+        self._store_index_health(health)
+        self._start_health_refresh()
+        return health
+
+    def peek_index_health(self) -> dict[str, Any] | None:
+        """Return the cached index status if it is still fresh, without touching Redis."""
+        with self._health_lock:
+            if (
+                self._health is not None
+                and time.monotonic() - self._health_checked_at < self.health_ttl
+            ):
+                self.stats["cache_hits"] += 1
+                return self._health
+        return None
+
+    def invalidate_index_health(self) -> None:
+        """Drop the cached index state, e.g. after a search hit a missing index."""
+        with self._health_lock:
+            if self._health is not None:
+                self.stats["invalidations"] += 1
+            self._health = None
+
+    def get_index_stats(self) -> dict[str, Any]:
+        """Return health cache and rebuild counters for this index."""
+        with self._health_lock:
+            return {**self.stats, "cached": self._health is not None, "ttl_seconds": self.health_ttl}
+
+    def stop_health_refresh(self) -> None:
+        """Stop the background index health refresh."""
+        self._refresh_stop.set()
+        thread = self._refresh_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._refresh_thread = None
+
+    def _store_index_health(self, health: Any) -> None:
+        # Only a usable index is cached; a missing one is re-checked on the next search
+        usable = (
+            isinstance(health, dict)
+            and health.get("exists") is True
+            and health.get("vector_field_exists") is True
+        )
+        with self._health_lock:
+            self._health = health if usable and self.health_ttl > 0 else None
+            self._health_checked_at = time.monotonic()
+
+    def _record_rebuild(self, reason: str, success: bool) -> None:
+        with self._health_lock:
+            self.stats["rebuilds" if success else "rebuild_failures"] += 1
+            self.stats["last_rebuild_at"] = time.time()
+            self.stats["last_rebuild_reason"] = reason
+        logger.info(f"Memory index {self.index_name} rebuild ({reason}): {'ok' if success else 'failed'}")
+
+    def _start_health_refresh(self) -> None:
+        if self.health_ttl <= 0 or self._refresh_thread is not None or self._refresh_stop.is_set():
+            return
+        with self._health_lock:
+            if self._refresh_thread is not None:
+                return
+            # The thread holds only a weak reference, so an abandoned manager can
+            # still be collected; its finalizer wakes the thread to exit.
+            self._refresh_thread = threading.Thread(
+                target=_refresh_health_loop,
+                args=(weakref.ref(self), self._refresh_stop, self.health_ttl / 2, self.index_name),
+                name="orka-index-health",
+                daemon=True,
+            )
+            weakref.finalize(self, self._refresh_stop.set)
+        self._refresh_thread.start()
@@ -31,7 +31,11 @@ from orka.memory.redisstack.connection_manager import ConnectionManager
 from orka.memory.redisstack.crud_mixin import MemoryCRUDMixin
 from orka.memory.redisstack.decay_mixin import MemoryDecayMixin
 from orka.memory.redisstack.embedding_mixin import EmbeddingMixin
-from orka.memory.redisstack.logging_mixin import OrchestrationLoggingMixin
+from orka.memory.redisstack.logging_mixin import (
+    DEFAULT_LOG_EMBEDDING_POLICY,
+    LOG_EMBEDDING_MODES,
+    OrchestrationLoggingMixin,
+)
 from orka.memory.redisstack.metrics_mixin import MetricsMixin
 from orka.memory.redisstack.redis_interface_mixin import RedisInterfaceMixin
 from orka.memory.redisstack.search_mixin import MemorySearchMixin
@@ -81,9 +85,14 @@ class RedisStackMemoryLogger(
         enable_hnsw: bool = True,
         vector_params: dict[str, Any] | None = None,
         format_params: dict[str, Any] | None = None,
+        log_embedding: dict[str, Any] | None = None,
         **kwargs: Any,
     ):
-        """Initialize the RedisStack memory logger with modular components."""
+        """Initialize the RedisStack memory logger with modular components.
+
+        ``log_embedding`` selects which orchestration logs are embedded, see
+        ``OrchestrationLoggingMixin`` (default: only stored memories).
+        """
         effective_decay_config = memory_decay_config or decay_config
 
         super().__init__(
@@ -103,6 +112,13 @@ class RedisStackMemoryLogger(
         self.debug_keep_previous_outputs = debug_keep_previous_outputs
         self.memory_decay_config: dict[str, Any] | None = effective_decay_config
 
+        self.log_embedding_policy: dict[str, Any] = {**DEFAULT_LOG_EMBEDDING_POLICY, **(log_embedding or {})}
+        if self.log_embedding_policy["mode"] not in LOG_EMBEDDING_MODES:
+            logger.warning(
+                f"Unknown log embedding mode '{self.log_embedding_policy['mode']}', using 'tiered'"
+            )
+            self.log_embedding_policy["mode"] = "tiered"
+
         # Initialize connection manager (composition)
         self._conn_mgr = ConnectionManager(
             redis_url=redis_url,
@@ -153,6 +169,10 @@ class RedisStackMemoryLogger(
         """Get a thread-safe Redis client using the connection pool."""
         return self._conn_mgr.get_thread_safe_client()
 
+    def _get_async_client(self):
+        """Get a ``redis.asyncio`` client for the running event loop."""
+        return self._conn_mgr.get_async_client()
+
     @property
     def redis(self):
         """Backward compatibility property for redis client access."""
@@ -171,11 +191,12 @@ class RedisStackMemoryLogger(
     # ==========================================================================
 
     def _ensure_index(self) -> None:
-        """Ensure the enhanced memory index exists."""
+        """Ensure the enhanced memory index and the sorted-set listing index exist."""
         vector_dim = 384
         if self.embedder and hasattr(self.embedder, "embedding_dim"):
             vector_dim = self.embedder.embedding_dim
         self._index_mgr.ensure_index(vector_dim=vector_dim)
+        self.ensure_listing_index()
 
     def ensure_index(self) -> bool:
         """Ensure the enhanced memory index exists - for factory compatibility."""
@@ -200,78 +221,93 @@ class RedisStackMemoryLogger(
         memory_type: str = "short_term",
         expiry_hours: float | None = None,
         content_vector: Any | None = None,
+        embed: bool = True,
     ) -> str:
-        """Store memory with vector embedding for enhanced search."""
+        """Store memory with vector embedding for enhanced search.
+
+        With ``embed=False`` (and no ``content_vector``) the entry is stored as a plain
+        hash without a vector, skipping the embedding cost entirely.
+        """
         try:
-            memory_id = str(uuid.uuid4()).replace("-", "")
-            memory_key = f"orka_memory:{memory_id}"
-            current_time_ms = int(time.time() * 1000)
-            metadata = metadata or {}
+            client = self._get_thread_safe_client()
+            memory_key, mapping, metadata, current_time_ms, orka_expire_time = (
+                self._build_memory_record(
+                    content,
+                    node_id,
+                    trace_id,
+                    metadata,
+                    importance_score,
+                    memory_type,
+                    expiry_hours,
+                    content_vector,
+                    embed,
+                )
+            )
 
-            orka_expire_time = None
-            if expiry_hours is not None:
-                orka_expire_time = current_time_ms + int(expiry_hours * 3600 * 1000)
+            client.hset(memory_key, mapping=mapping)
 
-            client = self._get_thread_safe_client()
+            if orka_expire_time:
+                client.expire(
+                    memory_key, self._memory_ttl_seconds(orka_expire_time, current_time_ms)
+                )
 
-            try:
-                content_str: str = str(content) if not isinstance(content, str) else content
-                content = content_str
-                json.dumps(metadata)
-            except Exception as serialize_error:
-                logger.error(f"Serialization error: {serialize_error}")
-                metadata = {
-                    "error": "serialization_failed",
-                    "original_error": str(serialize_error),
-                    "node_id": node_id,
-                    "trace_id": trace_id,
-                    "log_type": "memory",
-                }
-                content = str(content)
-
-            formatted_content = self._format_content(content)
-
-            memory_data: dict[str, Any] = {
-                "content": formatted_content,
-                "node_id": node_id,
-                "trace_id": trace_id,
-                "timestamp": str(current_time_ms),
-                "importance_score": str(importance_score),
-                "memory_type": memory_type,
-                "metadata": json.dumps(metadata),
-            }
+            self._index_memory(client, memory_key, current_time_ms, metadata, orka_expire_time)
+
+            return memory_key
+
+        except Exception as e:
+            logger.error(f"Failed to store memory: {e}")
+            raise
+
+    async def alog_memory(
+        self,
+        content: str,
+        node_id: str,
+        trace_id: str,
+        metadata: dict[str, Any] | None = None,
+        importance_score: float = 1.0,
+        memory_type: str = "short_term",
+        expiry_hours: float | None = None,
+        content_vector: Any | None = None,
+        embed: bool = True,
+    ) -> str:
+        """Async variant of ``log_memory`` for use inside a running event loop.
+
+        The embedding is awaited from the real embedder (instead of the hash
+        fallback the sync path uses under a running loop). The hash, its TTL and the
+        listing index entries are written in one ``redis.asyncio`` pipeline, so the
+        event loop is never blocked.
+        """
+        if content_vector is None and self.embedder and embed:
+            content_str = str(content) if not isinstance(content, str) else content
+            content_vector = await self._get_embedding_async(content_str)
+            # Never fall back to the blocking embedder on the event loop
+            embed = False
 
-            if orka_expire_time is not None:
-                memory_data["orka_expire_time"] = str(orka_expire_time)
-
-            if content_vector is not None:
-                try:
-                    if hasattr(content_vector, "tobytes"):
-                        memory_data["content_vector"] = content_vector.astype("float32").tobytes()  # type: ignore[attr-defined]
-                    elif isinstance(content_vector, (bytes, bytearray)):
-                        memory_data["content_vector"] = bytes(content_vector)
-                except Exception as e:
-                    logger.warning(f"Failed to use provided content vector: {e}")
-            elif self.embedder:
-                try:
-                    embedding = self._get_embedding_sync(content)
-                    if embedding is not None:
-                        memory_data["content_vector"] = embedding.tobytes()
-                except Exception as e:
-                    error_msg = str(e) if str(e) else type(e).__name__
-                    logger.warning(f"Failed to generate embedding: {error_msg}")
-
-            client.hset(
-                memory_key,
-                mapping={
-                    k: str(v) if not isinstance(v, (bytes, int, float)) else v
-                    for k, v in memory_data.items()
-                },
+        try:
+            client = self._get_async_client()
+            memory_key, mapping, metadata, current_time_ms, orka_expire_time = (
+                self._build_memory_record(
+                    content,
+                    node_id,
+                    trace_id,
+                    metadata,
+                    importance_score,
+                    memory_type,
+                    expiry_hours,
+                    content_vector,
+                    embed,
+                )
             )
 
+            pipe = client.pipeline(transaction=False)
+            pipe.hset(memory_key, mapping=mapping)
             if orka_expire_time:
-                ttl_seconds = max(1, int((orka_expire_time - current_time_ms) / 1000))
-                client.expire(memory_key, ttl_seconds)
+                pipe.expire(
+                    memory_key, self._memory_ttl_seconds(orka_expire_time, current_time_ms)
+                )
+            self._queue_index_memory(pipe, memory_key, current_time_ms, metadata, orka_expire_time)
+            await pipe.execute()
 
             return memory_key
 
@@ -279,85 +315,103 @@ class RedisStackMemoryLogger(
             logger.error(f"Failed to store memory: {e}")
             raise
 
-    # ==========================================================================
-    # Abstract Method Implementations (for ABC compliance)
-    # ==========================================================================
-
-    def cleanup_expired_memories(self, dry_run: bool = False) -> dict[str, Any]:
-        """Clean up expired memories using connection pool."""
-        cleaned = 0
-        total_checked = 0
-        errors: list[str] = []
+    def _build_memory_record(
+        self,
+        content: Any,
+        node_id: str,
+        trace_id: str,
+        metadata: dict[str, Any] | None,
+        importance_score: float,
+        memory_type: str,
+        expiry_hours: float | None,
+        content_vector: Any | None,
+        embed: bool,
+    ) -> tuple[str, dict[str, Any], dict[str, Any], int, int | None]:
+        """
+        Prepare a memory hash for writing.
+
+        Returns:
+            tuple: Key, hash mapping, effective metadata, creation time and
+            ``orka_expire_time`` (both in ms; the latter None without expiry).
+        """
+        memory_id = str(uuid.uuid4()).replace("-", "")
+        memory_key = f"orka_memory:{memory_id}"
+        current_time_ms = int(time.time() * 1000)
+        metadata = metadata or {}
+
+        orka_expire_time = None
+        if expiry_hours is not None:
+            orka_expire_time = current_time_ms + int(expiry_hours * 3600 * 1000)
 
         try:
-            if not hasattr(self, "_connection_pool") or self._connection_pool is None:
-                return {
-                    "cleaned": 0,
-                    "total_checked": 0,
-                    "expired_found": 0,
-                    "dry_run": dry_run,
-                    "cleanup_type": "redisstack_not_ready",
-                    "errors": ["Connection pool not yet initialized"],
-                }
+            content_str: str = str(content) if not isinstance(content, str) else content
+            content = content_str
+            json.dumps(metadata)
+        except Exception as serialize_error:
+            logger.error(f"Serialization error: {serialize_error}")
+            metadata = {
+                "error": "serialization_failed",
+                "original_error": str(serialize_error),
+                "node_id": node_id,
+                "trace_id": trace_id,
+                "log_type": "memory",
+            }
+            content = str(content)
+
+        formatted_content = self._format_content(content)
+
+        from orka.utils.bootstrap_memory_index import NO_NAMESPACE_TAG
 
+        memory_data: dict[str, Any] = {
+            "content": formatted_content,
+            "node_id": node_id,
+            "trace_id": trace_id,
+            "timestamp": str(current_time_ms),
+            "importance_score": str(importance_score),
+            "memory_type": memory_type,
+            "metadata": json.dumps(metadata),
+            # Top-level copies of metadata fields so searches can pre-filter on them
+            "log_type": "memory" if self._is_stored_memory(metadata) else "log",
+            "namespace": metadata.get("namespace") or NO_NAMESPACE_TAG,
+        }
+
+        if orka_expire_time is not None:
+            memory_data["orka_expire_time"] = str(orka_expire_time)
+
+        if content_vector is not None:
             try:
-                client = self._get_thread_safe_client()
+                if hasattr(content_vector, "tobytes"):
+                    memory_data["content_vector"] = content_vector.astype("float32").tobytes()  # type: ignore[attr-defined]
+                elif isinstance(content_vector, (bytes, bytearray)):
+                    memory_data["content_vector"] = bytes(content_vector)
             except Exception as e:
-                return {
-                    "cleaned": 0,
-                    "total_checked": 0,
-                    "expired_found": 0,
-                    "dry_run": dry_run,
-                    "cleanup_type": "redisstack_connection_failed",
-                    "errors": [f"Connection failed: {e}"],
-                }
-
-            pattern = "orka_memory:*"
-            keys = client.keys(pattern)
-            total_checked = len(keys)
-
-            expired_keys = []
-            for key in keys:
-                try:
-                    memory_data = client.hgetall(key)
-                    if self._is_expired(memory_data):
-                        expired_keys.append(key)
-                except Exception as e:
-                    errors.append(f"Error checking {key}: {e}")
-
-            if not dry_run and expired_keys:
-                batch_size = 100
-                for i in range(0, len(expired_keys), batch_size):
-                    batch = expired_keys[i : i + batch_size]
-                    try:
-                        deleted_count = client.delete(*batch)
-                        cleaned += deleted_count
-                    except Exception as e:
-                        errors.append(f"Batch deletion error: {e}")
-
-            result = {
-                "cleaned": cleaned,
-                "total_checked": total_checked,
-                "expired_found": len(expired_keys),
-                "dry_run": dry_run,
-                "cleanup_type": "redisstack",
-                "errors": errors,
-            }
+                logger.warning(f"Failed to use provided content vector: {e}")
+        elif self.embedder and embed:
+            try:
+                embedding = self._get_embedding_sync(content)
+                if embedding is not None:
+                    memory_data["content_vector"] = embedding.tobytes()
+            except Exception as e:
+                error_msg = str(e) if str(e) else type(e).__name__
+                logger.warning(f"Failed to generate embedding: {error_msg}")
 
-            if cleaned > 0:
-                logger.info(f"Cleanup completed: {cleaned} expired memories removed")
+        mapping = {
+            k: str(v) if not isinstance(v, (bytes, int, float)) else v
+            for k, v in memory_data.items()
+        }
+        return memory_key, mapping, metadata, current_time_ms, orka_expire_time
 
-            return result
+    @staticmethod
+    def _memory_ttl_seconds(orka_expire_time: int, current_time_ms: int) -> int:
+        return max(1, int((orka_expire_time - current_time_ms) / 1000))
 
-        except Exception as e:
-            logger.error(f"Error during memory cleanup: {e}")
-            return {
-                "error": str(e),
-                "cleaned": 0,
-                "total_checked": total_checked,
-                "cleanup_type": "redisstack_failed",
-                "errors": errors + [str(e)],
-            }
+    # ==========================================================================
+    # Abstract Method Implementations (for ABC compliance)
+    # ==========================================================================
+
+    def cleanup_expired_memories(self, dry_run: bool = False) -> dict[str, Any]:
+        """Clean up expired memories - delegates to MemoryDecayMixin."""
+        return MemoryDecayMixin.cleanup_expired_memories(self, dry_run)
 
     # ==========================================================================
     # Mixin Method Delegations (for ABC compliance)
@@ -423,6 +477,14 @@ class RedisStackMemoryLogger(
     def scan(self, cursor: int = 0, match: str | None = None, count: int = 10):
         return RedisInterfaceMixin.scan(self, cursor, match, count)
 
+    def write_batch(
+        self,
+        hashes: dict[str, dict[str, Any]] | None = None,
+        sets: dict[str, list[str]] | None = None,
+        values: dict[str, Any] | None = None,
+    ) -> None:
+        RedisInterfaceMixin.write_batch(self, hashes, sets, values)
+
     # ==========================================================================
     # Resource Cleanup
     # ==========================================================================
@@ -431,6 +493,8 @@ class RedisStackMemoryLogger(
         """Clean up resources."""
         try:
             self.stop_decay_scheduler()
+            if hasattr(self, "_index_mgr"):
+                self._index_mgr.stop_health_refresh()
             if hasattr(self, "redis_client") and self.redis_client is not None:
                 self.redis_client.close()
             if hasattr(self, "_conn_mgr"):
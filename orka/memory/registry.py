@@ -0,0 +1,226 @@
+# OrKa: Orchestrator Kit Agents
+# by Marco Somma
+#
+# This file is part of OrKa – https://github.com/marcosomma/orka-reasoning
+#
+# Licensed under the Apache License, Version 2.0 (Apache 2.0).
+#
+# Full license: https://www.apache.org/licenses/LICENSE-2.0
+#
+# Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
+
+"""
+Memory Backend Registry
+=======================
+
+Process-level owner of memory backends. Creating a backend opens a connection pool,
+verifies (or creates) the vector index and starts the decay scheduler, so doing it
+for every run dominates latency when one worker serves many runs.
+
+Orchestrators look their backend up in the registry instead (``get_backend``): the
+first lookup for a configuration creates it and later ones reuse it. Every run then
+holds a :class:`MemoryLease` from start to finish, and the lease is returned exactly
+once, when the run's trace is written or, if the run fails first, when it unwinds.
+Backends are closed exactly once, by ``close_all()`` - registered with ``atexit`` and
+called from the API server's shutdown hook.
+
+Backends that were not obtained from the registry keep the previous behavior and are
+closed when their owner's run ends (see ``release_memory_backend``).
+
+Set ``ORKA_PERSISTENT_MEMORY=false`` to create a fresh backend per orchestrator.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class _Lease:
+    __slots__ = ("backend", "leases", "acquired", "created_at")
+
+    def __init__(self, backend: Any) -> None:
+        self.backend = backend
+        self.leases = 0
+        self.acquired = 0
+        self.created_at = time.time()
+
+
+class MemoryBackendRegistry:
+    """Thread-safe cache of long-lived memory backends keyed by their configuration."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._entries: dict[tuple[Any, str], _Lease] = {}
+        self._keys_by_backend: dict[int, tuple[Any, str]] = {}
+        self._stats = {"created": 0, "reused": 0, "leased": 0, "released": 0, "closed": 0}
+
+    @staticmethod
+    def _make_key(factory: Callable[..., Any], kwargs: dict[str, Any]) -> tuple[Any, str]:
+        return factory, json.dumps(kwargs, sort_keys=True, default=repr)
+
+    def get_backend(self, factory: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        Return the backend built by ``factory(**kwargs)``, creating it on first use.
+
+        No lease is taken; runs take their own (see :class:`MemoryLease`).
+
+        Args:
+            factory: Callable that creates the backend (e.g. ``create_memory_logger``)
+            **kwargs: Backend configuration; identical configurations share a backend
+
+        Returns:
+            The shared backend instance
+        """
+        key = self._make_key(factory, kwargs)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Lease(factory(**kwargs))
+                self._entries[key] = entry
+                self._keys_by_backend[id(entry.backend)] = key
+                self._stats["created"] += 1
+            else:
+                self._stats["reused"] += 1
+            return entry.backend
+
+    def acquire(self, factory: Callable[..., Any], **kwargs: Any) -> Any:
+        """Like ``get_backend``, but also take a lease on the backend."""
+        with self._lock:
+            backend = self.get_backend(factory, **kwargs)
+            entry = self._entries[self._keys_by_backend[id(backend)]]
+            entry.leases += 1
+            entry.acquired += 1
+            self._stats["leased"] += 1
+            return backend
+
+    def is_managed(self, backend: Any) -> bool:
+        """Whether ``backend`` is owned by this registry."""
+        with self._lock:
+            return id(backend) in self._keys_by_backend
+
+    def retain(self, backend: Any) -> bool:
+        """
+        Take a lease on an already managed backend.
+
+        Returns:
+            True if the backend is managed by the registry.
+        """
+        with self._lock:
+            key = self._keys_by_backend.get(id(backend))
+            if key is None:
+                return False
+            entry = self._entries[key]
+            entry.leases += 1
+            entry.acquired += 1
+            self._stats["leased"] += 1
+            return True
+
+    def release(self, backend: Any) -> bool:
+        """
+        Return a lease without closing the backend.
+
+        Returns:
+            True if the backend is managed by the registry.
+        """
+        with self._lock:
+            key = self._keys_by_backend.get(id(backend))
+            if key is None:
+                return False
+            entry = self._entries[key]
+            if entry.leases == 0:
+                logger.warning("Memory backend released more often than it was leased")
+                return True
+            entry.leases -= 1
+            self._stats["released"] += 1
+            return True
+
+    def close_all(self) -> int:
+        """Close every registered backend once. Returns the number closed."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._keys_by_backend.clear()
+
+        closed = 0
+        for entry in entries:
+            try:
+                if hasattr(entry.backend, "close"):
+                    entry.backend.close()
+                closed += 1
+            except Exception as e:
+                logger.warning(f"Failed to close memory backend: {e}")
+        self._stats["closed"] += closed
+        return closed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return registry counters and the active lease count per backend."""
+        with self._lock:
+            return {
+                **self._stats,
+                "backends": len(self._entries),
+                "active_leases": sum(entry.leases for entry in self._entries.values()),
+            }
+
+
+_registry: MemoryBackendRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_memory_registry() -> MemoryBackendRegistry:
+    """Return the process-wide registry, creating it (and its exit hook) on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MemoryBackendRegistry()
+                atexit.register(_registry.close_all)
+    return _registry
+
+
+def persistent_memory_enabled() -> bool:
+    """Whether orchestrators should lease backends from the registry (``ORKA_PERSISTENT_MEMORY``)."""
+    return os.getenv("ORKA_PERSISTENT_MEMORY", "true").lower() not in ("0", "false", "no")
+
+
+class MemoryLease:
+    """
+    One run's hold on a memory backend.
+
+    Managed backends get a registry lease for the lifetime of the lease object.
+    Unmanaged backends are closed on release, but only when ``owns_backend`` is set
+    (a backend handed over by a parent run stays open). ``release`` is idempotent.
+    """
+
+    def __init__(self, backend: Any, owns_backend: bool = True) -> None:
+        self.backend = backend
+        self._managed = get_memory_registry().retain(backend)
+        self._owns_backend = owns_backend
+        self._released = False
+        self._lock = threading.Lock()
+
+    def release(self) -> None:
+        """Return the registry lease, or close an owned unmanaged backend."""
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        if self._managed:
+            get_memory_registry().release(self.backend)
+        elif self._owns_backend:
+            release_memory_backend(self.backend)
+
+
+def release_memory_backend(backend: Any) -> None:
+    """End a run's use of ``backend``: return the lease, or close it if unmanaged."""
+    if backend is None:
+        return
+    if _registry is not None and _registry.release(backend):
+        return
+    if hasattr(backend, "close"):
+        backend.close()
@@ -0,0 +1,248 @@
+# OrKa: Orchestrator Kit Agents
+# by Marco Somma
+#
+# This file is part of OrKa – https://github.com/marcosomma/orka-reasoning
+#
+# Licensed under the Apache License, Version 2.0 (Apache 2.0).
+#
+# Full license: https://www.apache.org/licenses/LICENSE-2.0
+#
+# Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
+
+"""
+Write-Behind Stream Writer
+==========================
+
+Background sink for Redis stream telemetry. Callers enqueue ``XADD`` entries and
+return immediately; a daemon thread drains the bounded queue, serializes the
+fields marked as JSON and writes whole batches through a single
+non-transactional Redis pipeline. Callers sanitize (and thereby copy) values
+before submitting them, so the flusher never reads objects a caller can still
+mutate.
+
+Guarantees and limits:
+
+- **Backpressure**: the queue is bounded (``max_queue_size``). When it is full,
+  ``submit`` waits up to ``block_timeout`` seconds and then drops the entry.
+  Both events are counted (``overflows`` / ``dropped``).
+- **Flush on close**: ``close()`` (also registered with ``atexit``) drains the
+  queue before the thread stops, so entries accepted by ``submit`` are written
+  unless Redis itself fails.
+- **Ordering**: entries are written in submission order by a single thread.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+import weakref
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL = 0.05
+
+
+def _close_writer(ref: "weakref.ReferenceType[WriteBehindStreamWriter]") -> None:
+    writer = ref()
+    if writer is not None:
+        writer.close()
+
+
+class WriteBehindStreamWriter:
+    """
+    Bounded, batching write-behind queue for Redis stream entries.
+
+    Args:
+        client: Redis client used to create pipelines
+        max_queue_size: Maximum number of queued entries
+        batch_size: Maximum number of XADDs per pipeline execution
+        flush_interval: Seconds the flusher waits for more entries before writing
+        block_timeout: Seconds ``submit`` may block on a full queue before dropping
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        block_timeout: float = 0.0,
+    ) -> None:
+        self.client = client
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.block_timeout = max(0.0, float(block_timeout))
+        self._queue: "queue.Queue[tuple[str, dict[str, Any], tuple[str, ...]]]" = queue.Queue(
+            maxsize=max(1, int(max_queue_size)),
+        )
+        self._pending = 0
+        self._pending_cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._closed = False
+        # Counters are bumped from both producer threads and the flusher
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, int] = {
+            "submitted": 0,
+            "written": 0,
+            "dropped": 0,
+            "overflows": 0,
+            "failed": 0,
+            "batches": 0,
+            "flush_errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def submit(self, stream_key: str, fields: dict[str, Any], json_fields: tuple[str, ...] = ()) -> bool:
+        """
+        Enqueue one XADD without waiting for Redis.
+
+        Values of ``json_fields`` are JSON-serialized by the flusher thread, so
+        callers must hand over values they will not mutate afterwards. Fields
+        whose value is None are omitted from the entry.
+
+        Returns:
+            True if the entry was queued, False if it was dropped.
+        """
+        if self._closed:
+            self._count(dropped=1)
+            return False
+
+        item = (stream_key, fields, json_fields)
+        self._ensure_thread()
+        with self._pending_cond:
+            self._pending += 1
+        try:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self._count(overflows=1)
+                if self.block_timeout <= 0:
+                    raise
+                self._queue.put(item, timeout=self.block_timeout)
+        except queue.Full:
+            self._count(dropped=1)
+            self._done(1)
+            logger.warning(f"Write-behind queue full, dropped entry for stream {stream_key}")
+            return False
+
+        self._count(submitted=1)
+        return True
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """
+        Wait until every queued entry has been written (or failed).
+
+        Returns:
+            True if the queue drained within ``timeout``.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._pending_cond:
+            while self._pending > 0:
+                if self._thread is None or not self._thread.is_alive():
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._pending_cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Flush pending entries and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self.flush(timeout)
+            self._stop.set()
+            self._thread.join(timeout)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return write-behind counters and the current queue depth."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        stats["max_queue_size"] = self._queue.maxsize
+        return stats
+
+    # ------------------------------------------------------------------
+    # Flusher side
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="orka-stream-writer", daemon=True)
+                thread.start()
+                self._thread = thread
+                atexit.register(_close_writer, weakref.ref(self))
+
+    def _count(self, **deltas: int) -> None:
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                self._stats[name] += delta
+
+    def _done(self, count: int) -> None:
+        with self._pending_cond:
+            self._pending -= count
+            if self._pending <= 0:
+                self._pending_cond.notify_all()
+
+    def _run(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                first = self._queue.get(timeout=self.flush_interval or 0.05)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._write_batch(batch)
+            self._done(len(batch))
+
+    def _write_batch(self, batch: list[tuple[str, dict[str, Any], tuple[str, ...]]]) -> None:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for stream_key, fields, json_fields in batch:
+                pipe.xadd(stream_key, self._serialize_fields(fields, json_fields))
+            pipe.execute()
+            self._count(written=len(batch), batches=1)
+        except Exception as e:
+            self._count(flush_errors=1, failed=len(batch))
+            logger.error(f"Write-behind flush of {len(batch)} stream entries failed: {e!s}")
+
+    def _serialize_fields(self, fields: dict[str, Any], json_fields: tuple[str, ...]) -> dict[str, Any]:
+        serialized: dict[str, Any] = {}
+        for key, value in fields.items():
+            if value is None:
+                continue
+            if key not in json_fields:
+                serialized[key] = value
+                continue
+            try:
+                serialized[key] = json.dumps(value)
+            except Exception as e:
+                logger.error(f"Failed to serialize field {key}: {e!s}")
+                serialized[key] = json.dumps({"error": f"Serialization error: {e!s}"})
+        return serialized
@@ -13,6 +13,13 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
+from ..fork_group_manager import (
+    fork_agent_to_group_key,
+    fork_group_mapping_key,
+    get_fork_completion_registry,
+    run_id_from,
+)
+from ..memory.base_logger import write_batch
 from ..memory.redisstack_logger import RedisStackMemoryLogger
 from .base_node import BaseNode
 
@@ -100,52 +107,64 @@ class ForkNode(BaseNode):
         orchestrator.fork_manager.create_group(fork_group_id, all_flat_agents)
         logger.debug(f"- Created fork group {fork_group_id} with agents {all_flat_agents}")
 
+        # Mapping keys are scoped to this run so concurrent runs of the same
+        # workflow do not resolve each other's fork groups.
+        run_id = run_id_from(context)
+
+        # In-process completion tracking lets a JoinNode in this process merge without
+        # polling Redis; the Redis state below is kept for durability.
+        get_fork_completion_registry().open(
+            fork_group_id, all_flat_agents, run_id=run_id, node_id=self.node_id
+        )
+
         state_key = None
         if self.memory_logger is not None:
-            # Store fork group mapping and agent list using backend-agnostic methods
-            self.memory_logger.hset(f"fork_group_mapping:{self.node_id}", "group_id", fork_group_id)
-            self.memory_logger.sadd(f"fork_group:{fork_group_id}", *all_flat_agents)
-
-            # Store initial state for join node
             state_key = f"waitfor:{fork_group_id}:inputs"
+            group_key = f"fork_group_results:{fork_group_id}"
+            agent_to_group: Dict[str, Any] = {}
+            join_state: Dict[str, Any] = {}
+            agent_results: Dict[str, Any] = {}
+
             for agent_id in all_flat_agents:
                 # Allow consumers (ResponseProcessor) to cheaply resolve the fork group
                 # for an agent without scanning all fork_group_results tables.
-                try:
-                    self.memory_logger.hset("fork_agent_to_group", agent_id, fork_group_id)
-                except Exception:
-                    logger.debug("Failed to store fork_agent_to_group mapping for %s", agent_id)
+                agent_to_group[agent_id] = fork_group_id
 
                 # Initialize empty result for each agent with proper structure
-                initial_result = {
-                    "response": "",
-                    "confidence": "0.0",
-                    "internal_reasoning": "",
-                    "_metrics": {},
-                    "formatted_prompt": "",
-                    "memories": [],
-                    "query": "",
-                    "backend": "",
-                    "search_type": "",
-                    "num_results": 0,
-                    "status": "pending",
-                    "fork_group": fork_group_id,
-                    "agent_id": agent_id,
-                }
-
-                # Store in Redis hash for join node
-                self.memory_logger.hset(state_key, agent_id, json.dumps(initial_result))
-                logger.debug(f"- Initialized state for agent {agent_id}")
-
-                # Store in Redis key for direct access
-                agent_key = f"agent_result:{fork_group_id}:{agent_id}"
-                self.memory_logger.set(agent_key, json.dumps(initial_result))
-                logger.debug(f"- Stored initial result for agent {agent_id}")
-
-                # Store in Redis hash for group tracking
-                group_key = f"fork_group_results:{fork_group_id}"
-                self.memory_logger.hset(group_key, agent_id, json.dumps(initial_result))
-                logger.debug(f"- Stored initial result in group for agent {agent_id}")
+                initial_result = json.dumps(
+                    {
+                        "response": "",
+                        "confidence": "0.0",
+                        "internal_reasoning": "",
+                        "_metrics": {},
+                        "formatted_prompt": "",
+                        "memories": [],
+                        "query": "",
+                        "backend": "",
+                        "search_type": "",
+                        "num_results": 0,
+                        "status": "pending",
+                        "fork_group": fork_group_id,
+                        "agent_id": agent_id,
+                    }
+                )
+                join_state[agent_id] = initial_result
+                agent_results[f"agent_result:{fork_group_id}:{agent_id}"] = initial_result
+
+            # Group mapping, member set, join state, group results and direct agent
+            # keys are written together (one MULTI/EXEC on Redis backends).
+            write_batch(
+                self.memory_logger,
+                hashes={
+                    fork_group_mapping_key(self.node_id, run_id): {"group_id": fork_group_id},
+                    fork_agent_to_group_key(run_id): agent_to_group,
+                    state_key: join_state,
+                    group_key: dict(join_state),
+                },
+                sets={f"fork_group:{fork_group_id}": list(all_flat_agents)},
+                values=agent_results,
+            )
+            logger.debug(f"- Initialized fork state for agents {all_flat_agents}")
 
         # Return fork status with group info
         return {
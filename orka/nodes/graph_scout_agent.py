@@ -292,6 +292,10 @@ class GraphScoutAgent(BaseNode):
         self.budget_controller: Optional[BudgetController] = None
         self.decision_engine: Optional[DecisionEngine] = None
 
+        # Brain used for brain-assisted decisions, kept so its recall caches survive
+        self._brain: Optional[Any] = None
+        self._brain_memory: Optional[Any] = None
+
         logger.info(f"GraphScout '{node_id}' initialized with config: {self.config}")
 
     async def initialize(self) -> None:
@@ -498,6 +502,16 @@ class GraphScoutAgent(BaseNode):
 
         return str(question.strip())
 
+    def _ensure_brain(self, memory: Any) -> Any:
+        """Return this agent's Brain, building a new one only when the memory backend changes."""
+        if self._brain is None or self._brain_memory is not memory:
+            from ..brain.brain import Brain
+            from ..brain.embedding import default_brain_embedder
+
+            self._brain = Brain(memory=memory, embedder=default_brain_embedder())
+            self._brain_memory = memory
+        return self._brain
+
     async def _apply_brain_insights(
         self,
         candidates: List[Dict[str, Any]],
@@ -506,15 +520,13 @@ class GraphScoutAgent(BaseNode):
     ) -> List[Dict[str, Any]]:
         """Apply Brain skill recall to boost or penalize candidate paths."""
         try:
-            from ..brain.brain import Brain
-            from ..brain.embedding import default_brain_embedder
             from ..brain.skill import SkillType
 
             memory = context.get("memory")
             if memory is None:
                 return candidates
 
-            brain = Brain(memory=memory, embedder=default_brain_embedder())
+            brain = self._ensure_brain(memory)
             recalled = await brain.recall(
                 context={"task": question},
                 skill_types=[
@@ -14,6 +14,13 @@ import logging
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional
 
+from ..fork_group_manager import (
+    fork_group_mapping_key,
+    get_fork_completion_registry,
+    run_id_from,
+    run_scoped_key,
+)
+from ..memory.base_logger import write_batch
 from ..memory.redisstack_logger import RedisStackMemoryLogger
 from .base_node import BaseNode
 
@@ -38,6 +45,8 @@ class JoinNode(BaseNode):
         self.memory_logger = memory_logger
         self.group_id = kwargs.get("group")
         self.max_retries = kwargs.get("max_retries", 30)
+        # Upper bound for awaiting fork branches that are still running in this process
+        self.wait_timeout = kwargs.get("wait_timeout")
         self.output_key = f"{self.node_id}:output"
         self._retry_key = f"{self.node_id}:join_retry_count"
 
@@ -52,12 +61,33 @@ class JoinNode(BaseNode):
         fork_group_id = input_data.get("fork_group_id")
         logger.info(f"[LINK] JOIN - Fork group ID from input: {fork_group_id}")
 
+        # Mapping and retry keys are namespaced by run so concurrent runs stay apart
+        run_id = run_id_from(input_data)
+
+        # Forks executed in this process complete from the in-process registry: merge the
+        # recorded results (awaiting branches still running) without polling Redis.
+        completions = get_fork_completion_registry()
+        local_group_id = fork_group_id or (
+            completions.group_for_node(self.group_id, run_id) if self.group_id else None
+        )
+        if local_group_id and completions.tracks(local_group_id):
+            results = await completions.wait(local_group_id, timeout=self.wait_timeout)
+            if results is not None:
+                completions.discard(local_group_id)
+                logger.info(f"[LINK] JOIN - Fork group {local_group_id} completed in-process")
+                return self._complete(
+                    list(results),
+                    f"fork_group_results:{local_group_id}",
+                    input_data=input_data,
+                    results=results,
+                )
+
         # Track whether we recovered the group using an explicit mapping
         mapping_used = False
         if not fork_group_id and self.group_id:
             # Prefer explicit mapping written by ForkNode (avoids stale fork_group:* keys from prior runs)
+            mapping_key = fork_group_mapping_key(self.group_id, run_id)
             try:
-                mapping_key = f"fork_group_mapping:{self.group_id}"
                 mapped = self.memory_logger.hget(mapping_key, "group_id")
                 if mapped:
                     fork_group_id = mapped.decode() if isinstance(mapped, bytes) else mapped
@@ -67,7 +97,7 @@ class JoinNode(BaseNode):
                     )
             except Exception as e:
                 logger.debug(
-                    f"Join node '{self.node_id}': error reading mapping key fork_group_mapping:{self.group_id}: {e}"
+                    f"Join node '{self.node_id}': error reading mapping key {mapping_key}: {e}"
                 )
 
         if not fork_group_id and self.group_id:
@@ -110,12 +140,13 @@ class JoinNode(BaseNode):
         state_key = f"waitfor:{fork_group_id}:inputs"
 
         # Get or increment retry count using backend-agnostic hash operations
-        retry_count_str = self.memory_logger.hget("join_retry_counts", self._retry_key)
+        retry_counts_key = run_scoped_key("join_retry_counts", run_id)
+        retry_count_str = self.memory_logger.hget(retry_counts_key, self._retry_key)
         if retry_count_str is None:
             retry_count = 3
         else:
             retry_count = int(retry_count_str) + 1
-        self.memory_logger.hset("join_retry_counts", self._retry_key, str(retry_count))
+        self.memory_logger.hset(retry_counts_key, self._retry_key, str(retry_count))
 
         logger.info(f"[LINK] JOIN - Retry count: {retry_count}/{self.max_retries}")
 
@@ -255,7 +286,7 @@ class JoinNode(BaseNode):
         # Check if all forked agents have completed
         if not pending:
             logger.info(f"[LINK] JOIN - All agents completed! Proceeding to merge results.")
-            self.memory_logger.hdel("join_retry_counts", self._retry_key)
+            self.memory_logger.hdel(retry_counts_key, self._retry_key)
             # Merge from the stable results hash if available; otherwise merge from join state.
             if group_results_key and fork_targets:
                 return self._complete(fork_targets, group_results_key, input_data=input_data)
@@ -264,7 +295,7 @@ class JoinNode(BaseNode):
         # Check for max retries
         if retry_count >= self.max_retries:
             logger.error(f"[LINK] JOIN - TIMEOUT! Max retries reached.")
-            self.memory_logger.hdel("join_retry_counts", self._retry_key)
+            self.memory_logger.hdel(retry_counts_key, self._retry_key)
             logger.error(
                 f"[ORKA][NODE][JOIN][TIMEOUT] Join node '{self.node_id}' timed out after {self.max_retries} retries. "
                 f"Fork group: {fork_group_id}. "
@@ -291,31 +322,39 @@ class JoinNode(BaseNode):
             "max_retries": self.max_retries,
         }
 
-    def _complete(self, fork_targets, state_key, input_data: Any = None):
+    def _complete(self, fork_targets, state_key, input_data: Any = None, results=None):
         """
         Complete the join operation by merging all fork results.
 
         Args:
             fork_targets (list): List of agent IDs to collect results from
             state_key (str): Redis key where results are stored
+            results (dict, optional): Agent results recorded in-process; when given,
+                nothing is read back from Redis
 
         Returns:
             dict: Merged results from all agents
         """
         logger.info(f"[LINK] JOIN COMPLETE - Starting merge for {len(fork_targets)} agents")
 
-        # Get all results from Redis
         merged = {}
+        agent_result_keys = {}
+        group_results = {}
         for agent_id in fork_targets:
             try:
-                # Get result from Redis
-                result_str = self.memory_logger.hget(state_key, agent_id)
-                if result_str:
-                    # Parse result JSON
-                    try:
-                        result = json.loads(result_str)
-                    except (json.JSONDecodeError, TypeError):
-                        result = result_str
+                if results is not None:
+                    result = results.get(agent_id)
+                else:
+                    # Get result from Redis
+                    result_str = self.memory_logger.hget(state_key, agent_id)
+                    result = None
+                    if result_str:
+                        # Parse result JSON
+                        try:
+                            result = json.loads(result_str)
+                        except (json.JSONDecodeError, TypeError):
+                            result = result_str
+                if result is not None:
                     # Store result in merged dict
                     if isinstance(result, dict):
                         if "result" in result:
@@ -339,16 +378,11 @@ class JoinNode(BaseNode):
 
                     logger.debug(f"- Merged result for agent {agent_id}")
 
-                    # Store the result in Redis key for direct access
+                    # Direct agent_result key and group tracking hash, written below
                     fork_group_id = result.get("fork_group", "unknown")
-                    agent_key = f"agent_result:{fork_group_id}:{agent_id}"
-                    self.memory_logger.set(agent_key, json.dumps(merged[agent_id], default=json_serializer))
-                    logger.debug(f"- Stored result for agent {agent_id}")
-
-                    # Store in Redis hash for group tracking
-                    group_key = f"fork_group_results:{fork_group_id}"
-                    self.memory_logger.hset(group_key, agent_id, json.dumps(merged[agent_id], default=json_serializer))
-                    logger.debug(f"- Stored result in group for agent {agent_id}")
+                    serialized = json.dumps(merged[agent_id], default=json_serializer)
+                    agent_result_keys[f"agent_result:{fork_group_id}:{agent_id}"] = serialized
+                    group_results.setdefault(f"fork_group_results:{fork_group_id}", {})[agent_id] = serialized
                 else:
                     logger.warning(
                         f"[ORKA][NODE][JOIN][WARNING] No result found for agent '{agent_id}' in state key '{state_key}'"
@@ -360,9 +394,6 @@ class JoinNode(BaseNode):
                 # Add error result to show something went wrong
                 merged[agent_id] = {"error": str(e), "error_type": type(e).__name__}
 
-        # Store output using hash operations
-        self.memory_logger.hset("join_outputs", self.output_key, json.dumps(merged, default=json_serializer))
-
         # Clean up state using hash operations.
         # IMPORTANT: Do not delete fork_group_results:<id> because it is used as the stable
         # results table for joins and diagnostics. Only delete legacy transient join state.
@@ -380,33 +411,23 @@ class JoinNode(BaseNode):
         logger.info(f"[LINK] JOIN COMPLETE - Result keys: {list(result.keys())}")
         logger.info(f"[LINK] JOIN COMPLETE - Status: {result['status']}")
 
-        # Store the final result in Redis
+        # Per-agent results, the join output and the final result (as a key and in the
+        # join_results hash) are stored together, in one round trip on Redis backends.
         join_key = f"join_result:{self.node_id}"
-        self.memory_logger.set(join_key, json.dumps(result, default=json_serializer))
-        logger.debug(f"- Stored final join result: {join_key}")
-        # Log join_key info at info level for easier runtime visibility
-        try:
-            stored_join = self.memory_logger.get(join_key)
-            join_len = len(stored_join) if stored_join else 0
-            logger.info(f"[LINK] JOIN COMPLETE - join_key='{join_key}', bytes={join_len}")
-        except Exception as e:
-            logger.warning(f"[LINK] JOIN COMPLETE - could not read back join_key '{join_key}': {e}")
-
-        # Store in Redis hash for group tracking
         group_key = f"join_results:{self.node_id}"
-        self.memory_logger.hset(group_key, "result", json.dumps(result, default=json_serializer))
-        logger.debug(f"- Stored final result in group")
-
-        # Additional info log to help debug missing join_results entries
-        try:
-            stored = self.memory_logger.hget(group_key, "result")
-            stored_val = stored.decode() if isinstance(stored, bytes) else stored
-            stored_len = len(stored_val) if stored_val else 0
-            logger.info(f"[LINK] JOIN COMPLETE - group_key='{group_key}', result_len={stored_len}, join_key='{join_key}'")
-            sample = stored_val[:400] if stored_val else ""
-            logger.info(f"[LINK] JOIN COMPLETE - sample result (truncated): {sample}")
-        except Exception as e:
-            logger.warning(f"[LINK] JOIN COMPLETE - unable to read back stored group result: {e}")
+        final_result = json.dumps(result, default=json_serializer)
+        write_batch(
+            self.memory_logger,
+            hashes={
+                **group_results,
+                "join_outputs": {self.output_key: json.dumps(merged, default=json_serializer)},
+                group_key: {"result": final_result},
+            },
+            values={**agent_result_keys, join_key: final_result},
+        )
+        logger.info(
+            f"[LINK] JOIN COMPLETE - join_key='{join_key}', group_key='{group_key}', bytes={len(final_result)}"
+        )
 
         # Also create an indexed memory entry so template helpers and FT.SEARCH can find the join result
         try:
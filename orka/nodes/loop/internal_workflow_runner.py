@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import tempfile
@@ -19,6 +20,8 @@ import yaml
 
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, cast
+
+from ...memory.registry import get_memory_registry, release_memory_backend
 logger = logging.getLogger(__name__)
 
 
@@ -44,7 +47,8 @@ def compile_internal_workflow_config(ctx: InternalWorkflowRunContext) -> dict[st
 
     # GraphScout visibility: merge parent agents with internal workflow agents
     if ctx.parent_agents:
-        internal_agents = original_workflow.get("agents", [])
+        # Copy so the LoopNode's own internal workflow definition is not mutated
+        internal_agents = list(original_workflow.get("agents", []))
         internal_agent_ids = {a["id"] for a in internal_agents if isinstance(a, dict) and "id" in a}
         for parent_agent in ctx.parent_agents:
             if isinstance(parent_agent, dict) and parent_agent.get("id") not in internal_agent_ids:
@@ -96,6 +100,53 @@ def build_loop_workflow_input(
     }
 
 
+def workflow_fingerprint(workflow_config: dict[str, Any]) -> str:
+    """Stable identity of a compiled workflow config, used to detect changes."""
+    return json.dumps(workflow_config, sort_keys=True, default=repr)
+
+
+class CompiledSubWorkflow:
+    """A LoopNode's internal workflow, built once and reused for every iteration.
+
+    Replaces the per-iteration temp YAML + fresh ``Orchestrator``: runs go through a
+    :class:`~orka.orchestrator.workflow_cache.CompiledWorkflow` built from the config
+    dict on the parent's memory backend, with the parent's agent instances for agents
+    the internal workflow does not define itself.
+    """
+
+    def __init__(
+        self,
+        workflow_config: dict[str, Any],
+        *,
+        memory_logger: Any = None,
+        shared_agents: Optional[Dict[str, Any]] = None,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        self.workflow_config = workflow_config
+        self.memory_logger = memory_logger
+        self.shared_agents = shared_agents or {}
+        self.fingerprint = fingerprint or workflow_fingerprint(workflow_config)
+        self._workflow: Any = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return self._workflow.get_stats() if self._workflow is not None else {}
+
+    async def run(self, workflow_input: dict[str, Any]) -> list[Any]:
+        """Execute one iteration of the workflow and return its logs."""
+        if self._workflow is None:
+            # Lazy import: orka.orchestrator imports the nodes package (and this module)
+            from ...orchestrator.workflow_cache import CompiledWorkflow
+
+            self._workflow = CompiledWorkflow(
+                self.workflow_config,
+                memory=self.memory_logger,
+                shared_agents=self.shared_agents,
+            )
+        logs = await self._workflow.run(workflow_input, return_logs=True)
+        return cast(list[Any], logs)
+
+
 async def run_internal_workflow_with_temp_yaml(
     *,
     workflow_config: dict[str, Any],
@@ -104,8 +155,8 @@ async def run_internal_workflow_with_temp_yaml(
 ) -> list[Any]:
     """Execute an internal workflow via temp YAML and return logs.
 
-    This is intentionally close to the current LoopNode implementation, but
-    extracted so LoopNode can become a thin coordinator.
+    Legacy path that builds a fresh orchestrator per call; LoopNode now uses
+    :class:`CompiledSubWorkflow`.
     """
 
     with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
@@ -121,12 +172,16 @@ async def run_internal_workflow_with_temp_yaml(
         orchestrator = Orchestrator(temp_file)
 
         if memory_logger is not None:
-            if hasattr(orchestrator.memory, "close"):
+            # Shared registry backends need nothing; one created just for this
+            # orchestrator is closed before it is replaced by the parent's.
+            if not get_memory_registry().is_managed(orchestrator.memory):
                 try:
-                    orchestrator.memory.close()
+                    release_memory_backend(orchestrator.memory)
                 except Exception as e:
                     logger.debug("Failed to close orphaned memory logger: %s", e)
 
+            # The sub-run takes its own lease; the parent's backend is never closed by it.
+            orchestrator._owns_memory = False
             orchestrator.memory = memory_logger
             orchestrator.fork_manager.redis = memory_logger.redis
 
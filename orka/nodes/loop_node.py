@@ -27,10 +27,11 @@ from .loop.boolean_extraction import extract_boolean_from_text, is_valid_boolean
 from .loop.config import build_loop_node_config
 from .loop.metadata import build_dynamic_metadata
 from .loop.internal_workflow_runner import (
+    CompiledSubWorkflow,
     InternalWorkflowRunContext,
     build_loop_workflow_input,
     compile_internal_workflow_config,
-    run_internal_workflow_with_temp_yaml,
+    workflow_fingerprint,
 )
 from .loop.log_result_extractor import extract_agent_results_from_logs
 from .loop.past_loop_builder import create_past_loop_object
@@ -176,6 +177,7 @@ class LoopNode(BaseNode):
         # [DEBUG] GraphScout Fix: Extract parent orchestrator's agents for internal workflow
         if "orchestrator" in payload and hasattr(payload["orchestrator"], "agent_cfgs"):
             self._parent_agents = payload["orchestrator"].agent_cfgs
+            self._parent_agent_instances = getattr(payload["orchestrator"], "agents", None)
             logger.debug(
                 f"LoopNode: Captured {len(self._parent_agents)} parent agents for GraphScout"
             )
@@ -244,11 +246,7 @@ class LoopNode(BaseNode):
         )
 
         try:
-            logs = await run_internal_workflow_with_temp_yaml(
-                workflow_config=workflow_config,
-                workflow_input=workflow_input,
-                memory_logger=self.memory_logger,
-            )
+            logs = await self._get_compiled_workflow(workflow_config).run(workflow_input)
 
             agents_results, executed_agents, extraction_stats = extract_agent_results_from_logs(logs)
             logger.debug("Agents that actually executed: %s", executed_agents)
@@ -272,6 +270,34 @@ class LoopNode(BaseNode):
             logger.error("Failed to execute internal workflow: %s", e)
             return None
 
+    def _get_compiled_workflow(self, workflow_config: Dict[str, Any]) -> CompiledSubWorkflow:
+        """Return the compiled internal workflow, rebuilding it only when its config changed."""
+        fingerprint = workflow_fingerprint(workflow_config)
+        compiled = getattr(self, "_compiled_workflow", None)
+        if (
+            compiled is None
+            or compiled.fingerprint != fingerprint
+            or compiled.memory_logger is not self.memory_logger
+        ):
+            # Share parent agent instances the internal workflow does not define itself
+            internal_ids = {
+                a.get("id") for a in self.internal_workflow.get("agents", []) if isinstance(a, dict)
+            }
+            parent_instances = getattr(self, "_parent_agent_instances", None) or {}
+            shared_agents = {
+                agent_id: agent
+                for agent_id, agent in parent_instances.items()
+                if agent_id not in internal_ids
+            }
+            compiled = CompiledSubWorkflow(
+                workflow_config,
+                memory_logger=self.memory_logger,
+                shared_agents=shared_agents,
+                fingerprint=fingerprint,
+            )
+            self._compiled_workflow = compiled
+        return compiled
+
     def _sync_score_extractor(self) -> None:
         # Tests (and callers) sometimes mutate these fields after __init__.
         # Keep the extracted score component in sync with the LoopNode instance.
@@ -9,6 +9,8 @@
 #
 # Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
 
+import asyncio
+import inspect
 import logging
 import re
 from typing import Any, Optional
@@ -179,7 +181,7 @@ class MemoryReaderNode(
             precomputed_vec = None
 
         # Primary search (pass precomputed vector when available)
-        memories = self.memory_logger.search_memories(
+        memories = await self._memory_search(
             query=query,
             num_results=self.limit,
             trace_id=context.get("trace_id"),
@@ -193,7 +195,7 @@ class MemoryReaderNode(
 
         # Fallback search if no results
         if len(memories) == 0 and query.strip():
-            memories = self._fallback_key_term_search(query, context)
+            memories = await self._fallback_key_term_search(query, context)
 
         logger.info(f"SEARCH RESULTS: Found {len(memories)} memories")
         self._log_memory_results(memories)
@@ -201,10 +203,45 @@ class MemoryReaderNode(
         # Filter to stored memories only
         return self._filter_stored_memories(memories)
 
-    def _fallback_key_term_search(
+    async def _memory_search(
+        self, suppress_errors: bool = False, **kwargs: Any
+    ) -> list[dict[str, Any]]:
+        """Run a backend search without blocking the event loop.
+
+        Uses the backend's native ``asearch_memories`` when it has one, otherwise runs
+        ``search_memories`` in a worker thread. With ``suppress_errors`` a failed
+        search is logged and counts as no results.
+        """
+        asearch = getattr(self.memory_logger, "asearch_memories", None)
+        if inspect.iscoroutinefunction(asearch):
+            try:
+                return await asearch(**kwargs)
+            except Exception as e:
+                if not suppress_errors:
+                    raise
+                logger.warning(f"Memory search failed: {e}")
+                return []
+
+        def search() -> list[dict[str, Any]]:
+            # Errors are handled in the worker so nothing is left pending on the loop
+            try:
+                return self.memory_logger.search_memories(**kwargs)
+            except Exception as e:
+                if not suppress_errors:
+                    raise
+                logger.warning(f"Memory search failed: {e}")
+                return []
+
+        return await asyncio.to_thread(search)
+
+    async def _fallback_key_term_search(
         self, query: str, context: dict[str, Any]
     ) -> list[dict[str, Any]]:
-        """Fallback search using key terms from query."""
+        """Fallback search using key terms from query.
+
+        The key terms are searched concurrently; the first non-empty result wins and
+        the remaining searches are cancelled.
+        """
         key_terms = re.findall(r"\b(?:\d+|\w{3,})\b", query.lower())
         stopwords = {
             "the", "and", "for", "are", "but", "not", "you", "all",
@@ -213,9 +250,10 @@ class MemoryReaderNode(
         }
         key_terms = [term for term in key_terms if term not in stopwords]
 
-        for term in key_terms[:3]:
+        async def search_term(term: str) -> tuple[str, list[dict[str, Any]]]:
             logger.info(f"FALLBACK SEARCH: Trying key term '{term}'")
-            fallback_memories = self.memory_logger.search_memories(
+            fallback_memories = await self._memory_search(
+                suppress_errors=True,
                 query=term,
                 num_results=self.limit,
                 trace_id=context.get("trace_id"),
@@ -225,11 +263,20 @@ class MemoryReaderNode(
                 log_type="memory",
                 namespace=self.namespace,
             )
-            if fallback_memories:
-                logger.info(
-                    f"FALLBACK SUCCESS: Found {len(fallback_memories)} memories with term '{term}'"
-                )
-                return fallback_memories
+            return term, fallback_memories
+
+        tasks = [asyncio.create_task(search_term(term)) for term in key_terms[:3]]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                term, fallback_memories = await next_done
+                if fallback_memories:
+                    logger.info(
+                        f"FALLBACK SUCCESS: Found {len(fallback_memories)} memories with term '{term}'"
+                    )
+                    return fallback_memories
+        finally:
+            for task in tasks:
+                task.cancel()
 
         return []
 
@@ -9,6 +9,8 @@
 #
 # Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
 
+import asyncio
+import inspect
 import logging
 from typing import Any
 import traceback
@@ -185,23 +187,16 @@ class MemoryWriterNode(BaseNode):
             }
 
             assert self.memory_logger is not None, "Memory logger not initialized"
-            memory_key = self.memory_logger.log_memory(
+            importance_score = self._calculate_importance_score(memory_content, merged_metadata)
+            memory_type = self._classify_memory_type(merged_metadata, importance_score)
+            memory_key = await self._store_memory(
                 content=memory_content,
                 node_id=self.node_id,
                 trace_id=session_id,
                 metadata=final_metadata,
-                importance_score=self._calculate_importance_score(memory_content, merged_metadata),
-                memory_type=self._classify_memory_type(
-                    merged_metadata,
-                    self._calculate_importance_score(memory_content, merged_metadata),
-                ),
-                expiry_hours=self._get_expiry_hours(
-                    self._classify_memory_type(
-                        merged_metadata,
-                        self._calculate_importance_score(memory_content, merged_metadata),
-                    ),
-                    self._calculate_importance_score(memory_content, merged_metadata),
-                ),
+                importance_score=importance_score,
+                memory_type=memory_type,
+                expiry_hours=self._get_expiry_hours(memory_type, importance_score),
             )
 
             return {
@@ -219,6 +214,14 @@ class MemoryWriterNode(BaseNode):
             logger.error(f"Error writing to memory: {e}")
             return {"status": "error", "error": str(e)}
 
+    async def _store_memory(self, **kwargs: Any) -> str:
+        """Write through the backend's native ``alog_memory`` when it has one, otherwise
+        run ``log_memory`` in a worker thread so the event loop is not blocked."""
+        alog_memory = getattr(self.memory_logger, "alog_memory", None)
+        if inspect.iscoroutinefunction(alog_memory):
+            return await alog_memory(**kwargs)
+        return await asyncio.to_thread(self.memory_logger.log_memory, **kwargs)
+
     def _merge_metadata(self, context: dict[str, Any]) -> dict[str, Any]:
         """Merge metadata from YAML config, context, and guardian outputs."""
         try:
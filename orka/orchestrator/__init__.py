@@ -98,6 +98,8 @@ Benefits of Modular Design
     Existing code continues to work without modification
 """
 
+from typing import Any, Dict, Optional
+
 from .agent_factory import AGENT_TYPES, AgentFactory
 from .base import OrchestratorBase
 from .error_handling import ErrorHandler
@@ -123,20 +125,31 @@ class Orchestrator(
     while maintaining the same public interface.
     """
 
-    def __init__(self, config_path: str) -> None:
+    def __init__(
+        self,
+        config_path: str | Dict[str, Any],
+        memory: Any = None,
+        shared_agents: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """
         Initialize the Orchestrator with a YAML config file.
         Loads orchestrator and agent configs, sets up memory and fork management.
+
+        ``config_path`` may also be an already parsed config dict. ``memory`` and
+        ``shared_agents`` let a parent orchestrator hand over its memory backend and
+        agent instances (used by LoopNode sub-workflows).
         """
         # Initialize all parent classes
-        ExecutionEngine.__init__(self, config_path)
-        OrchestratorBase.__init__(self, config_path)
+        base_kwargs: Dict[str, Any] = {"memory": memory} if memory is not None else {}
+        ExecutionEngine.__init__(self, config_path, **base_kwargs)
+        OrchestratorBase.__init__(self, config_path, **base_kwargs)
         AgentFactory.__init__(self, self.orchestrator_cfg, self.agent_cfgs, self.memory)
         ErrorHandler.__init__(self)
         MetricsCollector.__init__(self)
 
         # Initialize agents using the agent factory
-        self.agents = self._init_agents()  # Dict of agent_id -> agent instance
+        # Dict of agent_id -> agent instance
+        self.agents = self._init_agents(shared_agents) if shared_agents else self._init_agents()
 
 
 __all__ = [
@@ -17,7 +17,7 @@ Factory for creating and initializing agents and nodes based on configuration.
 """
 
 import logging
-from typing import Any, Dict, List, Type, Union, cast
+from typing import Any, Dict, List, Optional, Type, Union, cast
 
 from ..agents import (
     agents,
@@ -44,6 +44,7 @@ from ..nodes.memory_reader_node import MemoryReaderNode
 from ..nodes.memory_writer_node import MemoryWriterNode
 from ..nodes.rag_node import RAGNode
 from ..tools.search_tools import DuckDuckGoTool
+from .execution.agent_runner import resolve_call_spec
 
 logger = logging.getLogger(__name__)
 
@@ -117,10 +118,13 @@ class AgentFactory:
         self.agent_cfgs = agent_cfgs
         self.memory = memory
 
-    def _init_agents(self) -> Dict[str, Any]:
+    def _init_agents(self, shared_agents: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Instantiate all agents/nodes as defined in the YAML config.
         Returns a dict mapping agent IDs to their instances.
+
+        Agents whose ID is in ``shared_agents`` reuse that instance instead of
+        being instantiated again (used by loop sub-workflows).
         """
         logger.debug(self.orchestrator_cfg)
         logger.debug(self.agent_cfgs)
@@ -485,7 +489,16 @@ class AgentFactory:
                 return agent_cls(agent_id=agent_id, prompt=prompt, **clean_cfg)  # type: ignore [call-arg]
 
         for cfg in self.agent_cfgs:
+            if shared_agents and cfg["id"] in shared_agents:
+                instances[cfg["id"]] = shared_agents[cfg["id"]]
+                continue
             agent = init_single_agent(cfg)
+            # Resolve the calling convention once instead of on every step
+            if callable(getattr(agent, "run", None)):
+                try:
+                    resolve_call_spec(agent, cfg.get("max_concurrency"))
+                except (TypeError, ValueError) as e:
+                    logger.debug(f"Could not resolve call spec for '{cfg['id']}': {e}")
             instances[cfg["id"]] = agent
 
         return instances
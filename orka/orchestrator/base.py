@@ -42,12 +42,13 @@ Core Responsibilities
 import logging
 import os
 from typing import Any, cast
-from uuid import uuid4
 
 from ..fork_group_manager import ForkGroupManager
 from ..loader import YAMLLoader
 from ..memory.redisstack_logger import RedisStackMemoryLogger
+from ..memory.registry import get_memory_registry, persistent_memory_enabled
 from ..memory_logger import create_memory_logger
+from .run_context import RunStateAttribute, current_run_context
 
 logger = logging.getLogger(__name__)
 
@@ -75,9 +76,21 @@ class OrchestratorBase:
         run_id (str): Unique identifier for this orchestration run
         step_index (int): Current step counter for traceability
         error_telemetry (dict): Comprehensive error tracking and metrics
+
+    ``queue``, ``run_id``, ``step_index`` and ``error_telemetry`` are per-run state:
+    they resolve to the :class:`~orka.orchestrator.run_context.RunContext` of the
+    run active in the calling task, so concurrent runs do not see each other's.
     """
 
-    def __init__(self, config_path: str) -> None:
+    # Per-run state, stored on the active RunContext (see orka.orchestrator.run_context)
+    queue = RunStateAttribute()
+    run_id = RunStateAttribute()
+    step_index = RunStateAttribute()
+    error_telemetry = RunStateAttribute()
+    _previous_outputs_index = RunStateAttribute("previous_outputs_index")
+    _memory_lease = RunStateAttribute("memory_lease")
+
+    def __init__(self, config_path: str | dict[str, Any], memory: Any = None) -> None:
         """
         Initialize the Orchestrator with a YAML config file.
 
@@ -85,13 +98,21 @@ class OrchestratorBase:
         memory backend selection, fork management, and error tracking systems.
 
         Args:
-            config_path (str): Path to the YAML configuration file
+            config_path (str | dict): Path to the YAML configuration file, or an
+                already parsed configuration dict
+            memory: Existing memory backend to use instead of creating one (e.g. the
+                parent's backend for a loop sub-workflow)
 
         Environment Variables:
             ORKA_MEMORY_BACKEND: Memory backend type ('redis' or 'redisstack', default: 'redisstack')
             ORKA_DEBUG_KEEP_PREVIOUS_OUTPUTS: Keep previous outputs for debugging ('true'/'false')
             REDIS_URL: Redis connection URL (default: 'redis://localhost:6380/0')
         """
+        # ExecutionEngine.__init__ reaches this through super() and Orchestrator calls it
+        # again explicitly; load the config and lease memory only once.
+        if getattr(self, "_base_initialized", False):
+            return
+
         self.loader = YAMLLoader(config_path)
         self.loader.validate()
 
@@ -120,8 +141,10 @@ class OrchestratorBase:
         # Get memory preset from orchestrator config
         memory_preset = self.orchestrator_cfg.get("memory_preset")
 
-        # Always use RedisStack backend
-        self.memory = create_memory_logger(
+        # Always use RedisStack backend. Backends come from the process-level registry
+        # so consecutive runs with the same configuration share one backend; each run
+        # holds its own lease (see ExecutionEngine.run).
+        memory_kwargs: dict[str, Any] = dict(
             backend="redisstack",
             redis_url=memory_config.get("redis_url")
             or os.getenv("REDIS_URL", "redis://localhost:6380/0"),
@@ -134,7 +157,16 @@ class OrchestratorBase:
                 "ef_construction": 200,
                 "ef_runtime": 10,
             },
+            log_embedding=memory_config.get("log_embedding"),
         )
+        # Only a backend created for this orchestrator is closed when its runs end
+        self._owns_memory = memory is None
+        if memory is not None:
+            self.memory = memory
+        elif persistent_memory_enabled():
+            self.memory = get_memory_registry().get_backend(create_memory_logger, **memory_kwargs)
+        else:
+            self.memory = create_memory_logger(**memory_kwargs)
         # For Redis, use the existing Redis-based fork manager
         self.memory = cast(
             RedisStackMemoryLogger, self.memory
@@ -146,20 +178,12 @@ class OrchestratorBase:
         # Initial agent execution queue, reordered to honor agent-level depends_on
         # (stable: unchanged when dependencies don't require a reorder).
         self.queue = ordered_initial_queue(self.orchestrator_cfg["agents"][:], self.agent_cfgs)
-        self.run_id = str(uuid4())  # Unique run/session ID
-        self.step_index = 0  # Step counter for traceability
-
-        # Error tracking and telemetry
-        self.error_telemetry = {
-            "errors": [],  # List of all errors encountered
-            "retry_counters": {},  # Per-agent retry counts
-            "partial_successes": [],  # Agents that succeeded after retries
-            "silent_degradations": [],  # JSON parsing failures that fell back to raw text
-            "status_codes": {},  # HTTP status codes for API calls
-            "execution_status": "running",  # overall status: running, completed, failed, partial
-            "critical_failures": [],  # Failures that stopped execution
-            "recovery_actions": [],  # Actions taken to recover from errors
-        }
+        self.reset_run_state()
+        self._base_initialized = True
+
+    def reset_run_state(self) -> None:
+        """Start a fresh run: new run ID, step counter and error telemetry."""
+        current_run_context(self).reset()
 
     def enqueue_fork(self, agent_ids: list[str], fork_group_id: str) -> None:
         """
@@ -18,6 +18,8 @@ from .context_manager import ContextManager
 from .response_extractor import ResponseExtractor
 from .trace_builder import TraceBuilder
 from .memory_router import MemoryRouter
+from .previous_outputs import PreviousOutputsIndex
+from .trace_writer import StreamingTraceWriter, wait_for_pending_traces
 
 __all__ = [
     "json_serializer",
@@ -28,4 +30,7 @@ __all__ = [
     "ResponseExtractor",
     "TraceBuilder",
     "MemoryRouter",
+    "PreviousOutputsIndex",
+    "StreamingTraceWriter",
+    "wait_for_pending_traces",
 ]
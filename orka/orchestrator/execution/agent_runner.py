@@ -10,14 +10,207 @@
 # Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
 
 import asyncio
+import contextvars
 import inspect
 import logging
+import os
+import threading
+import weakref
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from time import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Attribute under which the resolved calling convention is stored on agents
+CALL_SPEC_ATTR = "_orka_call_spec"
+
+
+@dataclass
+class AgentCallSpec:
+    """Calling convention of an agent's ``run`` method, resolved once per agent.
+
+    ``max_concurrency`` optionally bounds how many calls of a synchronous agent
+    may occupy the shared executor at the same time (``None`` means unbounded).
+    Async agents enforce their own limit through ``ConcurrencyManager``.
+    """
+
+    run_func: Any
+    needs_orchestrator: bool
+    is_async: bool
+    signature: str = ""
+    max_concurrency: Optional[int] = None
+    _semaphores: "weakref.WeakKeyDictionary[Any, asyncio.Semaphore]" = field(
+        default_factory=weakref.WeakKeyDictionary, repr=False
+    )
+
+    def matches(self, run_method: Any) -> bool:
+        return getattr(run_method, "__func__", run_method) is self.run_func
+
+    def semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Return the concurrency limiter for the running event loop, if any."""
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            sem = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = sem
+        return sem
+
+
+def resolve_call_spec(agent: Any, max_concurrency: Optional[int] = None) -> AgentCallSpec:
+    """Inspect ``agent.run`` and store the resulting call spec on the agent."""
+    run_method = agent.run
+    sig = inspect.signature(run_method)
+    spec = AgentCallSpec(
+        run_func=getattr(run_method, "__func__", run_method),
+        needs_orchestrator=len(sig.parameters) > 1,
+        is_async=inspect.iscoroutinefunction(run_method),
+        signature=str(sig),
+        max_concurrency=max_concurrency if max_concurrency and max_concurrency > 0 else None,
+    )
+    try:
+        setattr(agent, CALL_SPEC_ATTR, spec)
+    except Exception:
+        # Agents that refuse new attributes are simply re-inspected on each call
+        pass
+    return spec
+
+
+def get_call_spec(agent: Any) -> AgentCallSpec:
+    """Return the agent's cached call spec, re-resolving it if ``run`` was replaced."""
+    spec = getattr(agent, CALL_SPEC_ATTR, None)
+    if isinstance(spec, AgentCallSpec) and spec.matches(agent.run):
+        return spec
+    max_concurrency = spec.max_concurrency if isinstance(spec, AgentCallSpec) else None
+    return resolve_call_spec(agent, max_concurrency)
+
+
+class SyncAgentExecutor:
+    """Bounded thread pool shared by all synchronous agents, with queue metrics."""
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="orka-agent")
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "queued": 0,
+            "active": 0,
+            "max_queue_depth": 0,
+        }
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._stats["submitted"] += 1
+            self._stats["queued"] += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._stats["queued"])
+
+        def call() -> Any:
+            with self._lock:
+                self._stats["queued"] -= 1
+                self._stats["active"] += 1
+            try:
+                return fn(*args)
+            except Exception:
+                with self._lock:
+                    self._stats["failed"] += 1
+                raise
+            finally:
+                with self._lock:
+                    self._stats["active"] -= 1
+                    self._stats["completed"] += 1
+
+        # Carry the caller's context so sync agents see the active run's state
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(self._pool, context.run, call)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "max_workers": self.max_workers}
+
+
+_sync_executor: Optional[SyncAgentExecutor] = None
+_sync_executor_lock = threading.Lock()
+
+
+def get_sync_agent_executor() -> SyncAgentExecutor:
+    """
+    Return the process-wide executor for synchronous agents.
+
+    The worker count defaults to ``min(32, cpu_count + 4)`` and can be set with
+    ``ORKA_AGENT_WORKERS``.
+    """
+    global _sync_executor
+    if _sync_executor is None:
+        with _sync_executor_lock:
+            if _sync_executor is None:
+                default_workers = min(32, (os.cpu_count() or 1) + 4)
+                try:
+                    workers = int(os.getenv("ORKA_AGENT_WORKERS", str(default_workers)))
+                except ValueError:
+                    logger.warning("Invalid ORKA_AGENT_WORKERS; using default")
+                    workers = default_workers
+                _sync_executor = SyncAgentExecutor(max(1, workers))
+    return _sync_executor
+
+
+@dataclass
+class PreparedInvocation:
+    """Payload and rendered prompt for one agent step.
+
+    Built once by ``AgentRunner.prepare_invocation`` and passed down to
+    ``run_agent_async`` so the prompt template is rendered a single time per step.
+    ``render_count`` counts every ``render_template`` call made while the step runs.
+    """
+
+    agent_id: str
+    payload: Dict[str, Any]
+    agent_prompt: Optional[str] = None
+    template_error: Optional[str] = None
+    render_count: int = 0
+    render_ms: float = 0.0
+
+    @property
+    def formatted_prompt(self) -> Optional[str]:
+        return self.payload.get("formatted_prompt")
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return the template diagnostics recorded in traces."""
+        return {
+            "has_prompt": self.agent_prompt is not None,
+            "render_count": self.render_count,
+            "render_ms": round(self.render_ms, 3),
+            "template_error": self.template_error,
+        }
+
+
+# Invocation of the agent step running in the current task, if any
+_active_invocation: "contextvars.ContextVar[Optional[PreparedInvocation]]" = contextvars.ContextVar(
+    "orka_active_invocation", default=None
+)
+
+
+def count_template_render() -> None:
+    """Count one prompt render against the agent step running in this task, if any."""
+    prepared = _active_invocation.get()
+    if prepared is not None:
+        prepared.render_count += 1
+
+
+@contextmanager
+def _invocation_scope(prepared: PreparedInvocation) -> Iterator[PreparedInvocation]:
+    token = _active_invocation.set(prepared)
+    try:
+        yield prepared
+    finally:
+        _active_invocation.reset(token)
+
 
 class AgentRunner:
     """AgentRunner executes individual agents and branches.
@@ -30,14 +223,23 @@ class AgentRunner:
     def __init__(self, orchestrator):
         self.orchestrator = orchestrator
 
-    async def run_agent_async(
+    def _run_invocations(self) -> Dict[str, PreparedInvocation]:
+        from orka.orchestrator.run_context import current_run_context
+
+        return current_run_context(self.orchestrator).invocations
+
+    def take_invocation(self, agent_id: str) -> Optional[PreparedInvocation]:
+        """Remove and return the agent's latest invocation in the active run."""
+        return self._run_invocations().pop(agent_id, None)
+
+    def prepare_invocation(
         self,
         agent_id: str,
         input_data: Any,
         previous_outputs: Dict[str, Any],
         full_payload: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[str, Any]:
-        """Run a single agent asynchronously, returning (agent_id, result)."""
+    ) -> PreparedInvocation:
+        """Build the agent payload and render its prompt once for this step."""
         agent = self.orchestrator.agents[agent_id]
 
         payload = {"input": input_data, "previous_outputs": previous_outputs}
@@ -71,36 +273,68 @@ class AgentRunner:
                 str(agent.llm_agent.prompt) if not isinstance(agent.llm_agent.prompt, str) else agent.llm_agent.prompt
             )
 
+        prepared = PreparedInvocation(agent_id=agent_id, payload=payload, agent_prompt=agent_prompt)
         if agent_prompt:
+            start = time()
             try:
-                formatted_prompt = self.orchestrator.render_template(agent_prompt, payload)
+                with _invocation_scope(prepared):
+                    formatted_prompt = self.orchestrator.render_template(agent_prompt, payload)
                 payload["formatted_prompt"] = formatted_prompt
+                logger.debug(f"Template rendered for '{agent_id}' - length: {len(formatted_prompt)}")
             except Exception as e:
                 logger.error(f"Failed to render prompt for agent '{agent_id}': {e}")
                 payload["formatted_prompt"] = agent_prompt if agent_prompt else ""
                 payload["template_error"] = str(e)
+                prepared.template_error = str(e)
+            prepared.render_ms = (time() - start) * 1000
+
+        return prepared
+
+    async def run_agent_async(
+        self,
+        agent_id: str,
+        input_data: Any,
+        previous_outputs: Dict[str, Any],
+        full_payload: Optional[Dict[str, Any]] = None,
+        prepared: Optional[PreparedInvocation] = None,
+    ) -> Tuple[str, Any]:
+        """Run a single agent asynchronously, returning (agent_id, result).
+
+        When ``prepared`` is given its payload and rendered prompt are used as-is,
+        so the prompt is not rendered a second time.
+        """
+        agent = self.orchestrator.agents[agent_id]
+
+        if prepared is None or prepared.agent_id != agent_id:
+            prepared = self.prepare_invocation(agent_id, input_data, previous_outputs, full_payload)
+        self._run_invocations()[agent_id] = prepared
+        payload = prepared.payload
 
         run_method = agent.run
-        sig = inspect.signature(run_method)
-        needs_orchestrator = len(sig.parameters) > 1
-        is_async = inspect.iscoroutinefunction(run_method)
+        spec = get_call_spec(agent)
+        needs_orchestrator = spec.needs_orchestrator
+        is_async = spec.is_async
 
-        logger.debug(f"- Agent '{agent_id}' run method signature: {sig}")
+        logger.debug(f"- Agent '{agent_id}' run method signature: {spec.signature}")
         logger.debug(f"- Agent '{agent_id}' needs_orchestrator: {needs_orchestrator}")
         logger.debug(f"- Agent '{agent_id}' is_async: {is_async}")
 
         try:
-            if needs_orchestrator:
-                context_with_orchestrator = {**payload, "orchestrator": self.orchestrator}
-                result = run_method(context_with_orchestrator)
-                if is_async or asyncio.iscoroutine(result):
-                    result = await result
-            elif is_async:
-                result = await run_method(payload)
-            else:
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor() as pool:
-                    result = await loop.run_in_executor(pool, run_method, payload)
+            with _invocation_scope(prepared):
+                if needs_orchestrator:
+                    context_with_orchestrator = {**payload, "orchestrator": self.orchestrator}
+                    result = run_method(context_with_orchestrator)
+                    if is_async or asyncio.iscoroutine(result):
+                        result = await result
+                elif is_async:
+                    result = await run_method(payload)
+                else:
+                    semaphore = spec.semaphore()
+                    if semaphore is None:
+                        result = await get_sync_agent_executor().run(run_method, payload)
+                    else:
+                        async with semaphore:
+                            result = await get_sync_agent_executor().run(run_method, payload)
 
             return agent_id, result
 
@@ -16,6 +16,8 @@ Handles GraphScout agent decisions and converts them into queue mutations.
 import logging
 from typing import Any, Dict, List
 
+from .previous_outputs import previous_outputs_for
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,7 +66,7 @@ class GraphScoutHandler:
 
                 # If engine has a selector, use it to pick the best
                 if hasattr(engine, "_select_best_candidate_from_shortlist"):
-                    best = engine._select_best_candidate_from_shortlist(shortlist, input_data.get("input", ""), engine.build_previous_outputs(logs))
+                    best = engine._select_best_candidate_from_shortlist(shortlist, input_data.get("input", ""), previous_outputs_for(engine, logs))
                     node_id = best.get("node_id") if isinstance(best, dict) else None
                     if node_id:
                         self._insert_targets([node_id])
@@ -16,6 +16,9 @@ import traceback
 from datetime import datetime
 from typing import Any, Dict, List
 
+from ...fork_group_manager import get_fork_completion_registry
+from ...memory.base_logger import write_batch
+from .agent_runner import PreparedInvocation
 from .utils import sanitize_for_json, json_serializer
 
 logger = logging.getLogger(__name__)
@@ -54,6 +57,10 @@ class ParallelExecutor:
 
         logger.debug(f"- Executing {len(branches)} branches: {branches}")
 
+        # Branches of this group are executing here until the finally below; an
+        # in-process JoinNode awaits them instead of polling Redis.
+        completions = get_fork_completion_registry()
+        completions.begin(fork_group_id)
         try:
             # Prefer the orchestrator-level _run_branch_with_retry when available so tests can
             # monkeypatch ExecutionEngine._run_branch_with_retry. Fall back to the agent_runner
@@ -79,6 +86,8 @@ class ParallelExecutor:
 
             result_logs: List[Dict[str, Any]] = []
             updated_previous_outputs = enhanced_previous_outputs.copy()
+            join_state: Dict[str, Any] = {}
+            agent_result_keys: Dict[str, Any] = {}
 
             for i, branch_result in enumerate(branch_results):
                 if isinstance(branch_result, BaseException):
@@ -121,32 +130,12 @@ class ParallelExecutor:
                     # Sanitize result
                     sanitized_result = sanitize_for_json(result)
 
-                    # Store result in join state for JoinNode
-                    join_state_key = f"waitfor:{fork_group_id}:inputs"
-                    # Use json dumps to emulate original behavior
-                    if hasattr(self.orchestrator, "memory"):
-                        try:
-                            self.orchestrator.memory.hset(
-                                join_state_key, agent_id, json.dumps(sanitized_result, default=json_serializer)
-                            )
-                            # Also update the fork group results hash so JoinNode sees the
-                            # final agent payload (otherwise the initial placeholder from
-                            # ForkNode may remain and the join will merge empty values).
-                            try:
-                                group_key = f"fork_group_results:{fork_group_id}"
-                                self.orchestrator.memory.hset(
-                                    group_key, agent_id, json.dumps(sanitized_result, default=json_serializer)
-                                )
-                            except Exception:
-                                logger.debug("Failed to update fork group results for %s in %s", agent_id, fork_group_id)
-                            # Also store a direct agent_result key for backwards compat
-                            try:
-                                agent_key = f"agent_result:{fork_group_id}:{agent_id}"
-                                self.orchestrator.memory.set(agent_key, json.dumps(sanitized_result, default=json_serializer))
-                            except Exception:
-                                logger.debug("Failed to set agent_result key for %s in %s", agent_id, fork_group_id)
-                        except Exception:
-                            logger.debug("Memory hset not available or failed during parallel execution")
+                    # Record for an in-process JoinNode, and queue the durable join state
+                    # writes (join inputs, group results, direct agent_result key).
+                    completions.record(fork_group_id, agent_id, sanitized_result)
+                    serialized = json.dumps(sanitized_result, default=json_serializer)
+                    join_state[agent_id] = serialized
+                    agent_result_keys[f"agent_result:{fork_group_id}:{agent_id}"] = serialized
 
                     # Defensive logging: detect missing or low-confidence results from branch agents
                     try:
@@ -176,6 +165,15 @@ class ParallelExecutor:
                             for var in ["loop_number", "past_loops_metadata"]:
                                 if var in input_data:
                                     payload_context[var] = input_data[var]
+                        # Reuse the prompt rendered for this step instead of rendering it again
+                        agent_runner = getattr(self.orchestrator, "_agent_runner", None)
+                        prepared = (
+                            agent_runner.take_invocation(agent_id)
+                            if agent_runner is not None and hasattr(agent_runner, "take_invocation")
+                            else None
+                        )
+                        if isinstance(prepared, PreparedInvocation) and prepared.formatted_prompt:
+                            payload_context["formatted_prompt"] = prepared.formatted_prompt
                         # Use ExecutionEngine helper to add prompt if missing
                         try:
                             self.orchestrator._add_prompt_to_payload(agent, payload_data, payload_context)
@@ -232,6 +230,21 @@ class ParallelExecutor:
 
                     updated_previous_outputs[agent_id] = sanitized_result
 
+            if join_state and hasattr(self.orchestrator, "memory"):
+                # The ForkNode placeholders are replaced in one round trip for the group
+                # (otherwise JoinNode may merge the empty initial values).
+                try:
+                    write_batch(
+                        self.orchestrator.memory,
+                        hashes={
+                            f"waitfor:{fork_group_id}:inputs": join_state,
+                            f"fork_group_results:{fork_group_id}": dict(join_state),
+                        },
+                        values=agent_result_keys,
+                    )
+                except Exception:
+                    logger.debug("Failed to store join state for fork group %s", fork_group_id)
+
             if not any(not isinstance(r, BaseException) for r in branch_results):
                 logger.error(f"All {len(branch_results)} branches failed in fork group {fork_group_id}. Creating fallback empty result.")
                 fallback_result = {
@@ -260,3 +273,5 @@ class ParallelExecutor:
         except Exception as e:
             logger.error(f"Parallel execution failed: {e}")
             raise
+        finally:
+            completions.end(fork_group_id)
@@ -0,0 +1,114 @@
+# OrKa: Orchestrator Kit Agents
+# by Marco Somma
+#
+# This file is part of OrKa – https://github.com/marcosomma/orka-reasoning
+#
+# Licensed under the Apache License, Version 2.0 (Apache 2.0).
+#
+# Full license: https://www.apache.org/licenses/LICENSE-2.0
+#
+# Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
+
+"""
+Incremental previous-outputs index.
+
+``MetricsCollector.build_previous_outputs`` walks the whole log list on every call,
+which makes long runs (loops, fork fan-outs) quadratic in the number of steps. The
+``PreviousOutputsIndex`` keeps the folded view alive for the duration of a run and
+only folds log entries that were appended since the last lookup.
+
+Snapshots are copy-on-write: ``view()`` hands out the live dictionary and marks it
+as shared; the next time a new log entry has to be folded in, the index copies the
+dictionary first. Every consumer within a step therefore sees the same consistent
+view without a per-call copy, and a snapshot never changes after it was handed out.
+Consumers must treat the returned mapping as read-only (copy before mutating),
+which is what the executors and loop runners already do.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from ..metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+MergeFn = Callable[[Dict[str, Any], Dict[str, Any]], None]
+
+
+class PreviousOutputsIndex:
+    """Incrementally maintained ``previous_outputs`` view over a run's log list.
+
+    Entries are folded lazily, in order, the first time a view covering them is
+    requested. This keeps the behavior identical to a full rebuild even when the
+    payload of the most recent entry is still being completed by the response
+    processor after it was appended.
+    """
+
+    def __init__(self, merge_fn: Optional[MergeFn] = None) -> None:
+        self._merge_fn: MergeFn = merge_fn or MetricsCollector.merge_log_into_outputs
+        self._outputs: Dict[str, Any] = {}
+        self._shared = False
+        self._logs_id: Optional[int] = None
+        self._consumed = 0
+        self.stats: Dict[str, int] = {"folded": 0, "rebuilds": 0, "copies": 0}
+
+    def view(self, logs: List[Dict[str, Any]], upto: Optional[int] = None) -> Dict[str, Any]:
+        """Return the previous-outputs view for ``logs[:upto]``.
+
+        Args:
+            logs: The run's (append-only) log list.
+            upto: Optional exclusive end index. Negative values behave like slicing.
+
+        Returns:
+            A read-only snapshot of the folded outputs.
+        """
+        total = len(logs)
+        if upto is None:
+            end = total
+        elif upto < 0:
+            end = max(total + upto, 0)
+        else:
+            end = min(upto, total)
+
+        if self._logs_id != id(logs) or end < self._consumed:
+            # Different list, or history was rewritten: start from scratch.
+            if self._logs_id is not None:
+                self.stats["rebuilds"] += 1
+            self._logs_id = id(logs)
+            self._outputs = {}
+            self._shared = False
+            self._consumed = 0
+
+        if end > self._consumed:
+            if self._shared:
+                self._outputs = dict(self._outputs)
+                self._shared = False
+                self.stats["copies"] += 1
+            for position in range(self._consumed, end):
+                self._merge_fn(self._outputs, logs[position])
+                self._consumed = position + 1
+                self.stats["folded"] += 1
+
+        self._shared = True
+        return self._outputs
+
+    def reset(self) -> None:
+        """Forget all folded entries (e.g. at the start of a new run)."""
+        self._outputs = {}
+        self._shared = False
+        self._logs_id = None
+        self._consumed = 0
+
+
+def previous_outputs_for(engine: Any, logs: List[Dict[str, Any]], upto: Optional[int] = None) -> Dict[str, Any]:
+    """Resolve ``previous_outputs`` for ``logs[:upto]`` through the engine's index when present.
+
+    Falls back to ``engine.build_previous_outputs`` for engines (and test doubles)
+    that do not carry a ``PreviousOutputsIndex``.
+    """
+    index = getattr(engine, "_previous_outputs_index", None)
+    if isinstance(index, PreviousOutputsIndex):
+        return index.view(logs, upto)
+    if hasattr(engine, "build_previous_outputs"):
+        return engine.build_previous_outputs(logs if upto is None else logs[:upto])
+    return {}
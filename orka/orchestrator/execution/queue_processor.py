@@ -12,7 +12,6 @@
 import asyncio
 import json
 import logging
-import os
 from datetime import UTC, datetime
 from time import time
 from typing import Any, Dict, List, Optional
@@ -20,6 +19,10 @@ from typing import Any, Dict, List, Optional
 from ...contracts import OrkaResponse
 from ...response_builder import ResponseBuilder
 from ...response_builder import OrkaResponse as _OrkaResponse
+from ..metrics import MetricsCollector
+from .agent_runner import PreparedInvocation
+from .previous_outputs import PreviousOutputsIndex, previous_outputs_for
+from .trace_writer import finalize_trace, get_trace_mode, open_stream_trace, schedule_trace_finalization
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,13 @@ class QueueProcessor:
             engine.step_index = 0
             start_time = time()
 
+            # Fold logs into previous_outputs incrementally instead of rebuilding per lookup
+            if isinstance(engine, MetricsCollector):
+                engine._previous_outputs_index = PreviousOutputsIndex()
+
+            trace_mode = get_trace_mode()
+            trace_stream = self._open_trace_stream(trace_mode, input_data)
+
             # Ensure engine.queue exists
             if not hasattr(engine, "queue"):
                 engine.queue = []
@@ -71,6 +81,9 @@ class QueueProcessor:
 
             # Main loop
             while engine.queue:
+                if trace_stream is not None:
+                    trace_stream.write_new_logs(logs)
+
                 agent_id = engine.queue.pop(0)
                 agent = engine.agents.get(agent_id)
                 engine.step_index += 1
@@ -82,7 +95,7 @@ class QueueProcessor:
                     "payload": {},
                     "step": engine.step_index,
                     "run_id": engine.run_id,
-                    "previous_outputs": engine.build_previous_outputs(logs) if hasattr(engine, "build_previous_outputs") else {},
+                    "previous_outputs": previous_outputs_for(engine, logs),
                 }
 
                 # Run agent and capture result(s) with retry semantics for None/waiting
@@ -98,7 +111,7 @@ class QueueProcessor:
                     while attempts <= max_attempts:
                         attempts += 1
                         agent_id_ret, agent_result = await engine._run_agent_async(
-                            agent_id, input_data, engine.build_previous_outputs(logs), full_payload=full_payload
+                            agent_id, input_data, previous_outputs_for(engine, logs), full_payload=full_payload
                         )
 
                         # If agent returned None tuple -> retry
@@ -172,6 +185,9 @@ class QueueProcessor:
                         logger.error(f"Failed to normalize result for agent {agent_id_ret}: {e}")
                         payload_out.update({"result": None, "status": "error", "error": str(e)})
 
+                    # Record how the prompt was rendered for this step (expected: once)
+                    self._attach_template_diagnostics(agent_id_ret, payload_out)
+
                     # Handle router and fork nodes specially
                     agent_type = (getattr(agent, "type", None) or getattr(agent, "__class__", type(agent)).__name__).lower() if agent is not None else ""
 
@@ -222,7 +238,7 @@ class QueueProcessor:
                                     payload_out,
                                     step=engine.step_index,
                                     run_id=engine.run_id,
-                                    previous_outputs=engine.build_previous_outputs(logs[:-1]),
+                                    previous_outputs=previous_outputs_for(engine, logs, -1),
                                 )
                     except Exception as e:
                         logger.error(f"Response processing failed for {agent_id_ret}: {e}")
@@ -231,23 +247,8 @@ class QueueProcessor:
                     logger.error(f"Error executing agent {agent_id}: {agent_error}")
                     continue
 
-            # End of queue
-            meta_report = engine._generate_meta_report(logs) if hasattr(engine, "_generate_meta_report") else {}
-
-            # Save enhanced trace
-            log_dir = os.getenv("ORKA_LOG_DIR", "logs")
-            os.makedirs(log_dir, exist_ok=True)
-            log_path = os.path.join(log_dir, f"orka_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-
-            enhanced_trace = engine._build_enhanced_trace(logs, meta_report) if hasattr(engine, "_build_enhanced_trace") else {"logs": logs}
-            if hasattr(engine, "memory") and hasattr(engine.memory, "save_enhanced_trace"):
-                engine.memory.save_enhanced_trace(log_path, enhanced_trace)
-
-            try:
-                if hasattr(engine.memory, "close"):
-                    engine.memory.close()
-            except Exception as e:
-                logger.warning(f"Warning: Failed to cleanly close memory backend: {e!s}")
+            # End of queue: write the trace off the response path
+            self._finish_trace(logs, trace_mode, trace_stream)
 
             if return_logs:
                 return logs
@@ -258,3 +259,32 @@ class QueueProcessor:
         except Exception as e:
             logger.error(f"Unexpected error in QueueProcessor: {e}")
             raise
+
+    def _open_trace_stream(self, trace_mode: str, input_data: Any) -> Optional[Any]:
+        """Open the streaming trace file, or return None to fall back to a deferred trace."""
+        if trace_mode != "stream":
+            return None
+        try:
+            return open_stream_trace(self.engine.run_id, input_data)
+        except Exception as e:
+            logger.warning(f"Streaming trace unavailable, falling back to deferred trace: {e}")
+            return None
+
+    def _attach_template_diagnostics(self, agent_id: str, payload_out: Dict[str, Any]) -> None:
+        """Copy the render diagnostics of the agent's last prepared invocation into its log payload."""
+        agent_runner = getattr(self.engine, "_agent_runner", None)
+        if agent_runner is None or not hasattr(agent_runner, "take_invocation"):
+            return
+        prepared = agent_runner.take_invocation(agent_id)
+        if isinstance(prepared, PreparedInvocation):
+            payload_out["template_diagnostics"] = prepared.diagnostics()
+
+    def _finish_trace(self, logs: List[Dict[str, Any]], trace_mode: str, trace_stream: Optional[Any]) -> None:
+        """Write the run's trace. The trace writer takes over the run's memory lease
+        and returns it once the trace is written."""
+        engine = self.engine
+        lease, engine._memory_lease = getattr(engine, "_memory_lease", None), None
+        if trace_mode == "sync":
+            finalize_trace(engine, logs, lease=lease)
+        else:
+            schedule_trace_finalization(engine, logs, trace_stream, lease)
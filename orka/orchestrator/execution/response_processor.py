@@ -13,6 +13,10 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
+from ...fork_group_manager import fork_agent_to_group_key, get_fork_completion_registry
+from ...memory.base_logger import write_batch
+from .previous_outputs import previous_outputs_for
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,7 +78,7 @@ class ResponseProcessor:
                             payload_out.copy(),
                             step=step_index,
                             run_id=engine.run_id,
-                            previous_outputs=engine.build_previous_outputs(logs[:-1]) if hasattr(engine, "build_previous_outputs") else {},
+                            previous_outputs=previous_outputs_for(engine, logs, -1),
                         )
                     except Exception as e:
                         logger.warning(f"Warning: memory.log failed for fork node {agent_id}: {e}")
@@ -88,7 +92,7 @@ class ResponseProcessor:
                 if forked_agents and fork_mode == "parallel":
                     try:
                         fork_logs = await engine.run_parallel_agents(
-                            forked_agents, fork_group_id, input_data, engine.build_previous_outputs(logs)
+                            forked_agents, fork_group_id, input_data, previous_outputs_for(engine, logs)
                         )
                         logs.extend(fork_logs)
                     except Exception as e:
@@ -117,7 +121,7 @@ class ResponseProcessor:
                         payload_out,
                         step=step_index,
                         run_id=engine.run_id,
-                        previous_outputs=engine.build_previous_outputs(logs[:-1]) if hasattr(engine, "build_previous_outputs") else {},
+                        previous_outputs=previous_outputs_for(engine, logs, -1),
                     )
                 except Exception as e:
                     logger.warning(f"Warning: memory.log failed for {agent_id_ret}: {e}")
@@ -136,14 +140,19 @@ class ResponseProcessor:
             # - Try to find fork_group via the join state hash (created by ForkNode)
             # - Mark agent done and enqueue the next agent in sequence if present
             if hasattr(engine, "memory") and hasattr(engine, "fork_manager"):
-                # Resolve fork group for this agent; fail silently on any memory access errors
-                try:
-                    mapped = engine.memory.hget("fork_agent_to_group", agent_id_ret)
-                    fork_group = (
-                        mapped.decode() if isinstance(mapped, (bytes, bytearray)) else mapped
-                    )
-                except Exception:
-                    fork_group = None
+                # Resolve fork group for this agent: the in-process registry first, then
+                # the mapping written by ForkNode; fail silently on memory access errors.
+                run_id = engine.run_id if isinstance(getattr(engine, "run_id", None), str) else None
+                completions = get_fork_completion_registry()
+                fork_group = completions.group_for(agent_id_ret, run_id)
+                if not fork_group:
+                    try:
+                        mapped = engine.memory.hget(fork_agent_to_group_key(run_id), agent_id_ret)
+                        fork_group = (
+                            mapped.decode() if isinstance(mapped, (bytes, bytearray)) else mapped
+                        )
+                    except Exception:
+                        fork_group = None
 
                 if fork_group:
                     try:
@@ -155,25 +164,20 @@ class ResponseProcessor:
                             fork_group,
                         )
 
-                    # update group results table for join node
-                    try:
-                        group_key = f"fork_group_results:{fork_group}"
-                        engine.memory.hset(
-                            group_key, agent_id_ret, json.dumps(payload_out, default=str)
-                        )
-                    except Exception:
-                        logger.debug(
-                            "Failed to update fork group results for %s in %s",
-                            agent_id_ret,
-                            fork_group,
-                        )
+                    completions.record(fork_group, agent_id_ret, payload_out)
 
-                    # Also update the join state key so JoinNode will read the final
-                    # payload instead of the initial placeholder created by ForkNode.
+                    # Update the group results table and the join state so JoinNode reads
+                    # the final payload instead of the ForkNode placeholder, plus a direct
+                    # agent_result key for backwards compatibility; one round trip.
                     try:
-                        state_key = f"waitfor:{fork_group}:inputs"
-                        engine.memory.hset(
-                            state_key, agent_id_ret, json.dumps(payload_out, default=str)
+                        serialized = json.dumps(payload_out, default=str)
+                        write_batch(
+                            engine.memory,
+                            hashes={
+                                f"fork_group_results:{fork_group}": {agent_id_ret: serialized},
+                                f"waitfor:{fork_group}:inputs": {agent_id_ret: serialized},
+                            },
+                            values={f"agent_result:{fork_group}:{agent_id_ret}": serialized},
                         )
                     except Exception:
                         logger.debug(
@@ -182,17 +186,6 @@ class ResponseProcessor:
                             fork_group,
                         )
 
-                    # Set a direct agent_result key for backwards compatibility
-                    try:
-                        fork_agent_key = f"agent_result:{fork_group}:{agent_id_ret}"
-                        engine.memory.set(fork_agent_key, json.dumps(payload_out, default=str))
-                    except Exception:
-                        logger.debug(
-                            "Failed to set agent_result key for %s in %s",
-                            agent_id_ret,
-                            fork_group,
-                        )
-
                     # enqueue next agent in sequence if any
                     try:
                         next_agent = engine.fork_manager.next_in_sequence(fork_group, agent_id_ret)
@@ -0,0 +1,191 @@
+# OrKa: Orchestrator Kit Agents
+# by Marco Somma
+#
+# This file is part of OrKa – https://github.com/marcosomma/orka-reasoning
+#
+# Licensed under the Apache License, Version 2.0 (Apache 2.0).
+#
+# Full license: https://www.apache.org/licenses/LICENSE-2.0
+#
+# Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
+
+"""
+Run trace output.
+
+Building the enhanced trace (meta report, template resolution, blob deduplication)
+and serializing it is the most expensive part of finishing a run, and none of it is
+needed to answer the caller. ``ORKA_TRACE_MODE`` selects how traces are produced:
+
+- ``deferred`` (default): the response is returned first; the enhanced JSON trace is
+  built, saved and the run's memory lease returned in a worker thread.
+- ``sync``: legacy behavior, the trace is written before the run returns.
+- ``stream``: per-step records are appended to an NDJSON file as the run progresses,
+  followed by a ``run_end`` record with the meta report. No enhanced trace is built,
+  so the whole trace is never held in memory at once.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import uuid
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional, Set, TextIO
+
+from ...memory.registry import MemoryLease, release_memory_backend
+
+logger = logging.getLogger(__name__)
+
+TRACE_MODES = ("deferred", "sync", "stream")
+
+# Keeps background finalization tasks referenced until they complete
+_pending_trace_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def get_trace_mode() -> str:
+    """Return the configured trace mode (``ORKA_TRACE_MODE``)."""
+    mode = os.getenv("ORKA_TRACE_MODE", "deferred").lower()
+    if mode not in TRACE_MODES:
+        logger.warning(f"Unknown ORKA_TRACE_MODE '{mode}', using 'deferred'")
+        return "deferred"
+    return mode
+
+
+def new_trace_path(extension: str = "json", run_id: Any = None) -> str:
+    """Return a trace file path inside ``ORKA_LOG_DIR`` that is unique to the run.
+
+    The timestamp only has one-second resolution, so the run ID (or a random
+    suffix without one) keeps concurrent runs from sharing a file.
+    """
+    log_dir = os.getenv("ORKA_LOG_DIR", "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    suffix = re.sub(r"[^A-Za-z0-9_-]", "", str(run_id or "")) or uuid.uuid4().hex
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(log_dir, f"orka_trace_{timestamp}_{suffix}.{extension}")
+
+
+class StreamingTraceWriter:
+    """Append-only NDJSON trace: one JSON record per line, flushed as it is written.
+
+    Step records mirror the run's log entries minus ``previous_outputs``, which is
+    derivable from the preceding steps and would make the file quadratic in size.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: Optional[TextIO] = open(path, "a", encoding="utf-8")
+        self._written_logs = 0
+        self.records = 0
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append a single record."""
+        if self._file is None:
+            return
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+        self.records += 1
+
+    def write_new_logs(self, logs: List[Dict[str, Any]]) -> None:
+        """Append a ``step`` record for every log entry added since the last call."""
+        for entry in logs[self._written_logs :]:
+            record = {"record_type": "step"}
+            record.update((k, v) for k, v in entry.items() if k != "previous_outputs")
+            self.write(record)
+        self._written_logs = len(logs)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def open_stream_trace(run_id: Any, input_data: Any) -> StreamingTraceWriter:
+    """Create the NDJSON trace for a run and write its ``run_start`` record."""
+    writer = StreamingTraceWriter(new_trace_path("ndjson", run_id))
+    writer.write(
+        {
+            "record_type": "run_start",
+            "run_id": run_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "input": input_data,
+        }
+    )
+    return writer
+
+
+def finalize_trace(
+    engine: Any,
+    logs: List[Dict[str, Any]],
+    writer: Optional[StreamingTraceWriter] = None,
+    lease: Optional[MemoryLease] = None,
+) -> None:
+    """Write the run's trace and release the run's memory lease.
+
+    With a streaming writer only the remaining steps and a ``run_end`` record are
+    appended; otherwise the enhanced trace is built and saved through the memory
+    backend. Without a lease (a queue run outside ``Orchestrator.run``) the backend
+    itself is released. Errors are logged, never raised.
+    """
+    run_id = getattr(engine, "run_id", None)
+    try:
+        meta_report = engine._generate_meta_report(logs) if hasattr(engine, "_generate_meta_report") else {}
+
+        if writer is not None:
+            writer.write_new_logs(logs)
+            writer.write(
+                {
+                    "record_type": "run_end",
+                    "run_id": run_id,
+                    "timestamp": datetime.now(UTC).isoformat(),
+                    "meta_report": meta_report,
+                }
+            )
+            writer.close()
+        else:
+            log_path = new_trace_path(run_id=run_id)
+            enhanced_trace = (
+                engine._build_enhanced_trace(logs, meta_report)
+                if hasattr(engine, "_build_enhanced_trace")
+                else {"logs": logs}
+            )
+            if hasattr(engine, "memory") and hasattr(engine.memory, "save_enhanced_trace"):
+                engine.memory.save_enhanced_trace(log_path, enhanced_trace)
+    except Exception as e:
+        logger.error(f"Failed to write trace for run {run_id}: {e}")
+
+    try:
+        if lease is not None:
+            lease.release()
+        elif hasattr(engine, "memory"):
+            release_memory_backend(engine.memory)
+    except Exception as e:
+        logger.warning(f"Warning: Failed to cleanly close memory backend: {e!s}")
+
+
+def schedule_trace_finalization(
+    engine: Any,
+    logs: List[Dict[str, Any]],
+    writer: Optional[StreamingTraceWriter] = None,
+    lease: Optional[MemoryLease] = None,
+) -> "asyncio.Task[None]":
+    """Run ``finalize_trace`` in a worker thread without blocking the caller.
+
+    The log list is copied so entries appended by a later run are not picked up.
+    """
+    task = asyncio.ensure_future(asyncio.to_thread(finalize_trace, engine, list(logs), writer, lease))
+    _pending_trace_tasks.add(task)
+    task.add_done_callback(_pending_trace_tasks.discard)
+    return task
+
+
+async def wait_for_pending_traces(timeout: Optional[float] = None) -> bool:
+    """Wait for background trace finalization started in this process.
+
+    Returns:
+        True if every pending trace finished within ``timeout``.
+    """
+    if not _pending_trace_tasks:
+        return True
+    _, pending = await asyncio.wait(set(_pending_trace_tasks), timeout=timeout)
+    return not pending
@@ -163,7 +163,10 @@ from time import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypeVar, cast
 from ..contracts import OrkaResponse
 from ..response_builder import ResponseBuilder
+from ..memory.base_logger import run_event_buffer
+from ..memory.registry import MemoryLease
 from .base import OrchestratorBase
+from .run_context import RunContext, run_scope
 from .execution.utils import json_serializer, sanitize_for_json
 from .execution.context_manager import ContextManager
 from .execution.parallel_executor import ParallelExecutor
@@ -270,35 +273,51 @@ class ExecutionEngine(
         # Initialize ResponseProcessor to handle post-normalization processing (logging/storage/forks)
         self._response_processor = __import__("orka.orchestrator.execution.response_processor", fromlist=["ResponseProcessor"]).ResponseProcessor(self)
 
-    async def run(self: "ExecutionEngine", input_data: Any, return_logs: bool = False) -> Any:
+    async def run(
+        self: "ExecutionEngine",
+        input_data: Any,
+        return_logs: bool = False,
+        run_context: Optional[RunContext] = None,
+    ) -> Any:
         """
         Execute the orchestrator with the given input data.
 
         Args:
             input_data: The input data for the orchestrator
             return_logs: If True, return full logs; if False, return final response (default: False)
+            run_context: Per-run state to execute with. By default an idle orchestrator
+                runs on its own state and a concurrent run gets a fresh context.
 
         Returns:
             Either the logs array or the final response based on return_logs parameter
         """
         logs: List[Any] = []
-        try:
-            result = await self._run_with_comprehensive_error_handling(
-                input_data,
-                logs,
-                return_logs,
-            )
-            return result
-        except Exception as e:
-            self._record_error(
-                "orchestrator_execution",
-                "main",
-                f"Orchestrator execution failed: {e}",
-                e,
-                recovery_action="fail",
-            )
-            logger.critical(f"[ORKA-CRITICAL] Orchestrator execution failed: {e}")
-            raise
+        with run_scope(self, run_context) as context, run_event_buffer():
+            # The run holds a memory lease until its trace is written; if it fails
+            # before handing the lease to the trace writer, it is returned below.
+            context.memory_lease = MemoryLease(self.memory, owns_backend=getattr(self, "_owns_memory", True))
+            try:
+                result = await self._run_with_comprehensive_error_handling(
+                    input_data,
+                    logs,
+                    return_logs,
+                )
+                return result
+            except Exception as e:
+                self._record_error(
+                    "orchestrator_execution",
+                    "main",
+                    f"Orchestrator execution failed: {e}",
+                    e,
+                    recovery_action="fail",
+                )
+                logger.critical(f"[ORKA-CRITICAL] Orchestrator execution failed: {e}")
+                raise
+            finally:
+                context.invocations.clear()
+                lease, context.memory_lease = context.memory_lease, None
+                if lease is not None:
+                    lease.release()
 
     async def _run_with_comprehensive_error_handling(
         self: "ExecutionEngine",
@@ -328,70 +347,22 @@ class ExecutionEngine(
     ) -> Tuple[str, Any]:
         """
         Run a single agent asynchronously.
-        """
-        agent = self.agents[agent_id]
-
-        # Create a complete payload with all necessary context
-        payload = {
-            "input": input_data,
-            "previous_outputs": previous_outputs,
-        }
 
-        # Pass orchestrator-level structured output defaults to agents when configured
-        try:
-            so_defaults = self.orchestrator_cfg.get("structured_output_defaults")
-            if isinstance(so_defaults, dict) and so_defaults:
-                payload["structured_output_defaults"] = so_defaults
-        except Exception:
-            # Non-fatal: simply skip if orchestrator config not available
-            pass
-
-        # Include orchestrator context from full_payload if available
-        if full_payload and "orchestrator" in full_payload:
-            payload["orchestrator"] = full_payload["orchestrator"]
-            logger.debug(f"- Agent '{agent_id}' inherited orchestrator context from full_payload")
-
-        # Add loop context if available
-        if isinstance(input_data, dict):
-            if "loop_number" in input_data:
-                payload["loop_number"] = input_data["loop_number"]
-            if "past_loops_metadata" in input_data:
-                payload["past_loops_metadata"] = input_data["past_loops_metadata"]
-
-        # Render prompt before running agent if agent has a prompt
-        # Also check for ValidationAndStructuringAgent which stores prompt in llm_agent
-        agent_prompt = None
-        if hasattr(agent, "prompt") and agent.prompt:
-            # Ensure agent_prompt is a string, not a dict
-            agent_prompt = str(agent.prompt) if not isinstance(agent.prompt, str) else agent.prompt
-        elif (
-            hasattr(agent, "llm_agent")
-            and hasattr(agent.llm_agent, "prompt")
-            and agent.llm_agent.prompt
-        ):
-            # Ensure agent_prompt is a string, not a dict
-            agent_prompt = (
-                str(agent.llm_agent.prompt)
-                if not isinstance(agent.llm_agent.prompt, str)
-                else agent.llm_agent.prompt
-            )
-
-        if agent_prompt:
-            try:
-                # Use simplified template rendering
-                formatted_prompt = self.render_template(agent_prompt, payload)
-                payload["formatted_prompt"] = formatted_prompt
-
-                # Log successful rendering
-                logger.info(f"Template rendered for '{agent_id}' - length: {len(formatted_prompt)}")
-                logger.debug(f"- Rendered preview: {formatted_prompt[:200]}...")
-            except Exception as e:
-                logger.error(f"Failed to render prompt for agent '{agent_id}': {e}")
-                payload["formatted_prompt"] = agent_prompt if agent_prompt else ""
-                payload["template_error"] = str(e)
+        The payload is built and the prompt rendered once into a prepared
+        invocation, which AgentRunner then executes without re-rendering.
+        """
+        prepared = self._agent_runner.prepare_invocation(
+            agent_id, input_data, previous_outputs, full_payload
+        )
+        if prepared.agent_prompt and not prepared.template_error:
+            formatted_prompt = prepared.formatted_prompt or ""
+            logger.info(f"Template rendered for '{agent_id}' - length: {len(formatted_prompt)}")
+            logger.debug(f"- Rendered preview: {formatted_prompt[:200]}...")
 
         # Delegate execution to AgentRunner
-        return await self._agent_runner.run_agent_async(agent_id, input_data, previous_outputs, full_payload)
+        return await self._agent_runner.run_agent_async(
+            agent_id, input_data, previous_outputs, full_payload, prepared=prepared
+        )
 
     async def _run_branch_with_retry(
         self: "ExecutionEngine",
@@ -16,11 +16,20 @@ Graph API Interface
 Provides runtime access to the orchestrator's graph structure and state.
 This module enables GraphScout to inspect the workflow graph and understand
 available paths and constraints.
+
+A :class:`GraphState` has two layers. The static layer (:class:`StaticGraphLayer`:
+node descriptors, edges and their index) only depends on the orchestrator's agents
+and configuration, so :class:`GraphAPI` builds it once per orchestrator and reuses
+it until the workflow changes or :meth:`GraphAPI.invalidate` is called. The dynamic
+overlay (current node, visited nodes, runtime state, budgets, constraints) is
+cheap and recomputed on every call.
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set
+import weakref
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -54,17 +63,114 @@ class EdgeDescriptor:
             self.metadata = {}
 
 
+class GraphIndex:
+    """
+    Adjacency and node-type lookups for a fixed set of nodes and edges.
+
+    Built once per graph so neighbour, edge and join lookups are dictionary hits
+    instead of scans over ``edges``. ``fingerprint`` identifies the graph structure
+    (node ids, types and capabilities plus edge endpoints) and is stable across
+    rebuilt :class:`GraphState` snapshots of the same workflow, which makes it a
+    suitable key for structural caches such as enumerated candidate paths.
+    """
+
+    def __init__(
+        self, nodes: Mapping[str, NodeDescriptor], edges: Sequence[EdgeDescriptor]
+    ) -> None:
+        self.outgoing: Dict[str, List[EdgeDescriptor]] = {}
+        self.incoming: Dict[str, List[EdgeDescriptor]] = {}
+        self.edges_by_pair: Dict[Tuple[str, str], List[EdgeDescriptor]] = {}
+        for edge in edges:
+            self.outgoing.setdefault(edge.src, []).append(edge)
+            self.incoming.setdefault(edge.dst, []).append(edge)
+            self.edges_by_pair.setdefault((edge.src, edge.dst), []).append(edge)
+
+        self.nodes_by_type: Dict[str, List[str]] = {}
+        self.join_nodes: Set[str] = set()
+        for node_id, node in nodes.items():
+            self.nodes_by_type.setdefault(node.type, []).append(node_id)
+            if node.metadata and node.metadata.get("type") == "join":
+                self.join_nodes.add(node_id)
+
+        self.has_conditions = any(edge.condition for edge in edges)
+        self.fingerprint: Hashable = (
+            tuple(
+                (
+                    node_id,
+                    str(node.type),
+                    tuple(node.capabilities) if isinstance(node.capabilities, (list, tuple)) else (),
+                )
+                for node_id, node in nodes.items()
+            ),
+            tuple((edge.src, edge.dst) for edge in edges),
+        )
+        self.signature = self.signature_of(nodes, edges)
+
+    @staticmethod
+    def signature_of(nodes: Mapping[str, NodeDescriptor], edges: Sequence[EdgeDescriptor]) -> Tuple:
+        """Cheap identity check used to notice when a state's nodes or edges changed."""
+        return (id(nodes), len(nodes), id(edges), len(edges))
+
+    def successors(self, node_id: str) -> List[str]:
+        """Destination node IDs of edges leaving ``node_id``, in edge order."""
+        return [edge.dst for edge in self.outgoing.get(node_id, [])]
+
+    def predecessors(self, node_id: str) -> List[str]:
+        """Source node IDs of edges entering ``node_id``, in edge order."""
+        return [edge.src for edge in self.incoming.get(node_id, [])]
+
+    def edges_between(self, src: str, dst: str) -> List[EdgeDescriptor]:
+        """All edges from ``src`` to ``dst``."""
+        return self.edges_by_pair.get((src, dst), [])
+
+
+@dataclass(frozen=True)
+class StaticGraphLayer:
+    """Read-only workflow structure shared by every GraphState of one orchestrator."""
+
+    nodes: Mapping[str, NodeDescriptor]
+    edges: Tuple[EdgeDescriptor, ...]
+    index: GraphIndex
+    signature: Hashable
+
+    @classmethod
+    def build(
+        cls,
+        nodes: Dict[str, NodeDescriptor],
+        edges: List[EdgeDescriptor],
+        signature: Hashable = None,
+    ) -> "StaticGraphLayer":
+        frozen_nodes = MappingProxyType(dict(nodes))
+        frozen_edges = tuple(edges)
+        return cls(
+            nodes=frozen_nodes,
+            edges=frozen_edges,
+            index=GraphIndex(frozen_nodes, frozen_edges),
+            signature=signature,
+        )
+
+
 @dataclass
 class GraphState:
     """Complete graph state for path discovery."""
 
-    nodes: Dict[str, NodeDescriptor]
-    edges: List[EdgeDescriptor]
+    nodes: Mapping[str, NodeDescriptor]
+    edges: Sequence[EdgeDescriptor]
     current_node: str
     visited_nodes: Set[str]
     runtime_state: Dict[str, Any]
     budgets: Dict[str, Any]
     constraints: Dict[str, Any]
+    _index: Optional[GraphIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def index(self) -> GraphIndex:
+        """Adjacency/type index for ``nodes`` and ``edges``, rebuilt if either changed."""
+        index = self._index
+        if index is None or index.signature != GraphIndex.signature_of(self.nodes, self.edges):
+            index = GraphIndex(self.nodes, self.edges)
+            self._index = index
+        return index
 
 
 class GraphAPI:
@@ -77,7 +183,11 @@ class GraphAPI:
 
     def __init__(self):
         """Initialize Graph API interface."""
-        self.cache: Dict[str, Any] = {}
+        # Static graph layer per orchestrator; entries go away with their orchestrator
+        self.cache: "weakref.WeakKeyDictionary[Any, StaticGraphLayer]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.stats = {"static_hits": 0, "static_builds": 0, "invalidations": 0}
         logger.debug("GraphAPI initialized")
 
     async def get_graph_state(self, orchestrator: Any, run_id: str) -> GraphState:
@@ -92,11 +202,10 @@ class GraphAPI:
             Complete graph state with nodes, edges, and runtime information
         """
         try:
-            # Extract nodes from orchestrator
-            nodes = await self._extract_nodes(orchestrator)
-
-            # Build edges from orchestrator configuration
-            edges = await self._build_edges(orchestrator)
+            # Static layer: node descriptors, edges and their index
+            static = await self.get_static_layer(orchestrator)
+            nodes = static.nodes
+            edges = static.edges
 
             # Determine current position
             current_node = await self._get_current_node(orchestrator, run_id)
@@ -122,6 +231,7 @@ class GraphAPI:
                 budgets=budgets,
                 constraints=constraints,
             )
+            graph_state._index = static.index
 
             logger.debug(
                 f"Graph state extracted: {len(nodes)} nodes, {len(edges)} edges, "
@@ -134,6 +244,64 @@ class GraphAPI:
             logger.error(f"Failed to extract graph state: {e}")
             raise
 
+    async def get_static_layer(self, orchestrator: Any) -> StaticGraphLayer:
+        """
+        Return the static graph layer for ``orchestrator``, building it if needed.
+
+        The cached layer is rebuilt when the orchestrator's agents or agent
+        configuration change. Orchestrators that cannot be fingerprinted or weakly
+        referenced get a fresh layer on every call.
+        """
+        signature = self._static_signature(orchestrator)
+        if signature is not None:
+            try:
+                static = self.cache.get(orchestrator)
+            except TypeError:
+                static = None
+            if static is not None:
+                if static.signature == signature:
+                    self.stats["static_hits"] += 1
+                    return static
+                logger.debug("Workflow structure changed, rebuilding static graph layer")
+
+        nodes = await self._extract_nodes(orchestrator)
+        edges = await self._build_edges(orchestrator)
+        static = StaticGraphLayer.build(nodes, edges, signature)
+        self.stats["static_builds"] += 1
+
+        if signature is not None:
+            try:
+                self.cache[orchestrator] = static
+            except TypeError:
+                logger.debug("Orchestrator is not weak-referenceable; static graph layer not cached")
+        return static
+
+    def invalidate(self, orchestrator: Any = None) -> None:
+        """Drop the cached static layer of ``orchestrator``, or of every orchestrator."""
+        if orchestrator is None:
+            self.cache.clear()
+        else:
+            try:
+                self.cache.pop(orchestrator, None)
+            except TypeError:
+                return
+        self.stats["invalidations"] += 1
+
+    def _static_signature(self, orchestrator: Any) -> Optional[Hashable]:
+        """Identify the orchestrator's agents and routing config; ``None`` if unknown."""
+        try:
+            agents = getattr(orchestrator, "agents", {})
+            config = getattr(orchestrator, "orchestrator_cfg", {})
+            if not isinstance(agents, dict) or not isinstance(config, dict):
+                return None
+            return (
+                tuple((agent_id, id(agent)) for agent_id, agent in agents.items()),
+                str(config.get("strategy", "sequential")),
+                tuple(str(agent_id) for agent_id in config.get("agents", [])),
+            )
+        except Exception:
+            return None
+
     async def _extract_nodes(self, orchestrator: Any) -> Dict[str, NodeDescriptor]:
         """Extract node descriptors from orchestrator."""
         nodes = {}
@@ -16,15 +16,28 @@ Graph Introspection Module
 Discovers and analyzes available paths in the workflow graph.
 This module implements intelligent path discovery with cycle detection,
 constraint checking, and bounded exploration.
+
+Neighbour, edge and join lookups go through the graph's
+:class:`~orka.orchestrator.graph_api.GraphIndex`. Multi-hop candidate paths depend
+only on the workflow structure, so they are enumerated once per (graph, start node,
+depth) and memoized; each discovery then only filters them against the run's
+visited nodes and edge conditions.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Set, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
 
 from .graph_api import EdgeDescriptor, GraphState, NodeDescriptor
 
 logger = logging.getLogger(__name__)
 
+# A structural path and the (src, dst) hops whose edge conditions must hold at runtime
+StructuralPath = Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+
+PATH_CACHE_SIZE = 256
+
 
 class GraphIntrospector:
     """
@@ -47,6 +60,11 @@ class GraphIntrospector:
         _max_candidates = getattr(config, "max_candidates", 50)
         self.max_candidates = _max_candidates if isinstance(_max_candidates, int) else 50
 
+        # Structural candidate paths keyed by (graph fingerprint, start node, depth, mode)
+        self._path_cache: "OrderedDict[Hashable, List[StructuralPath]]" = OrderedDict()
+        self._path_cache_lock = threading.Lock()
+        self.path_cache_stats = {"hits": 0, "misses": 0}
+
         logger.debug(
             f"GraphIntrospector initialized with max_depth={self.max_depth}, "
             f"max_candidates={self.max_candidates}"
@@ -385,11 +403,12 @@ class GraphIntrospector:
         neighbors = []
 
         try:
-            logger.debug(
-                f"Looking for neighbors of '{current_node}' in {len(graph_state.edges)} edges"
-            )
-            logger.debug(f"Available nodes: {list(graph_state.nodes.keys())}")
-            logger.debug(f"Edges: {[(e.src, e.dst) for e in graph_state.edges]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Looking for neighbors of '{current_node}' in {len(graph_state.edges)} edges"
+                )
+                logger.debug(f"Available nodes: {list(graph_state.nodes.keys())}")
+                logger.debug(f"Edges: {[(e.src, e.dst) for e in graph_state.edges]}")
 
             # SPECIAL CASE: If current node is GraphScout OR this is a GraphScout-initiated discovery,
             # it can route to ANY available agent. This enables pool agents to chain properly.
@@ -473,7 +492,7 @@ class GraphIntrospector:
 
             # NORMAL CASE: Follow sequential edges for non-GraphScout agents
             # Find outgoing edges from current node
-            for edge in graph_state.edges:
+            for edge in graph_state.index.outgoing.get(current_node, []):
                 logger.debug(f"Checking edge: {edge.src} -> {edge.dst}")
                 if edge.src == current_node:
                     target_node = edge.dst
@@ -652,13 +671,8 @@ class GraphIntrospector:
                     continue
 
                 # Explore paths starting from this node
-                paths = await self._explore_from_node(
-                    graph_state,
-                    start_node,
-                    visited | {start_node},
-                    [start_node],
-                    1,
-                    is_graphscout_discovery,
+                paths = self._candidate_paths_from(
+                    graph_state, start_node, visited, is_graphscout_discovery
                 )
 
                 for path in paths:
@@ -774,15 +788,138 @@ class GraphIntrospector:
             logger.error(f"Node exploration failed: {e}")
             return [current_path]
 
+    def _candidate_paths_from(
+        self,
+        graph_state: GraphState,
+        start_node: str,
+        visited: Set[str],
+        is_graphscout_discovery: bool = False,
+    ) -> List[List[str]]:
+        """
+        Multi-hop paths from ``start_node``, equivalent to ``_explore_from_node``.
+
+        The structural enumeration is memoized per graph; only the run-dependent
+        pruning (visited nodes and edge conditions) is evaluated here. A path is
+        dropped when any hop after the start was already visited or when no edge
+        of a guarded hop currently satisfies its condition, which is exactly what
+        the recursive exploration prunes. Like the recursive version, a start node
+        without eligible neighbours yields the single-node path.
+        """
+        try:
+            structural_paths = self._structural_paths(
+                graph_state, start_node, is_graphscout_discovery
+            )
+            index = graph_state.index
+            paths = []
+            for path, guarded_hops in structural_paths:
+                if any(node_id in visited for node_id in path[1:]):
+                    continue
+                if guarded_hops and not all(
+                    any(
+                        self._check_edge_condition(edge, graph_state)
+                        for edge in index.edges_between(src, dst)
+                    )
+                    for src, dst in guarded_hops
+                ):
+                    continue
+                paths.append(list(path))
+
+            return paths or [[start_node]]
+
+        except Exception as e:
+            logger.error(f"Candidate path lookup failed: {e}")
+            return [[start_node]]
+
+    def _structural_paths(
+        self, graph_state: GraphState, start_node: str, is_graphscout_discovery: bool
+    ) -> List[StructuralPath]:
+        """Return the memoized structural paths from ``start_node``, enumerating on a miss."""
+        index = graph_state.index
+        key = (index.fingerprint, start_node, self.max_depth, is_graphscout_discovery)
+        with self._path_cache_lock:
+            cached = self._path_cache.get(key)
+            if cached is not None:
+                self._path_cache.move_to_end(key)
+                self.path_cache_stats["hits"] += 1
+                return cached
+
+        paths: List[StructuralPath] = []
+        self._enumerate_structural_paths(
+            graph_state, start_node, (start_node,), (), 1, is_graphscout_discovery, paths
+        )
+        logger.debug(
+            f"Enumerated {len(paths)} structural paths from {start_node} "
+            f"(max_depth={self.max_depth})"
+        )
+
+        with self._path_cache_lock:
+            self.path_cache_stats["misses"] += 1
+            self._path_cache[key] = paths
+            while len(self._path_cache) > PATH_CACHE_SIZE:
+                self._path_cache.popitem(last=False)
+        return paths
+
+    def _enumerate_structural_paths(
+        self,
+        graph_state: GraphState,
+        current_node: str,
+        current_path: Tuple[str, ...],
+        guarded_hops: Tuple[Tuple[str, str], ...],
+        depth: int,
+        is_graphscout_discovery: bool,
+        paths: List[StructuralPath],
+    ) -> None:
+        """Depth-first enumeration mirroring ``_explore_from_node`` without runtime pruning."""
+        if depth >= self.max_depth:
+            return
+
+        if is_graphscout_discovery or self._is_graphscout_node(graph_state, current_node):
+            # Universal routing has no edges, hence no conditions to re-check later
+            neighbors = [
+                (neighbor, guarded_hops)
+                for neighbor in self._get_eligible_neighbors(
+                    graph_state, current_node, set(current_path), is_graphscout_discovery=True
+                )
+            ]
+        else:
+            conditional = graph_state.index.has_conditions
+            neighbors = [
+                (neighbor, guarded_hops + ((current_node, neighbor),) if conditional else guarded_hops)
+                for neighbor in self._get_graph_neighbors(
+                    graph_state, current_node, set(current_path), check_conditions=False
+                )
+            ]
+
+        for neighbor, neighbor_hops in neighbors:
+            new_path = current_path + (neighbor,)
+            paths.append((new_path, neighbor_hops))
+
+            if is_graphscout_discovery and self._is_response_builder_node(graph_state, neighbor):
+                continue
+
+            self._enumerate_structural_paths(
+                graph_state,
+                neighbor,
+                new_path,
+                neighbor_hops,
+                depth + 1,
+                is_graphscout_discovery,
+                paths,
+            )
+
     def _get_graph_neighbors(
-        self, graph_state: GraphState, current_node: str, visited: Set[str]
+        self,
+        graph_state: GraphState,
+        current_node: str,
+        visited: Set[str],
+        check_conditions: bool = True,
     ) -> List[str]:
         """Get neighbors following actual graph edges (not GraphScout universal routing)."""
         neighbors = []
 
         try:
             # Find outgoing edges from current node
-            for edge in graph_state.edges:
+            for edge in graph_state.index.outgoing.get(current_node, []):
                 if edge.src == current_node:
                     target_node = edge.dst
 
@@ -805,7 +942,9 @@ class GraphIntrospector:
                             continue
 
                     # Check edge conditions
-                    if self._check_edge_condition(edge, graph_state):
+                    if not check_conditions or self._check_edge_condition(edge, graph_state):
+                        if not check_conditions and target_node in neighbors:
+                            continue
                         neighbors.append(target_node)
 
             return neighbors
@@ -984,13 +1123,7 @@ class GraphIntrospector:
                 dst = path[i + 1]
 
                 # Find edge between nodes
-                edge_found = False
-                for edge in graph_state.edges:
-                    if edge.src == src and edge.dst == dst:
-                        edge_found = True
-                        break
-
-                if not edge_found:
+                if not graph_state.index.edges_between(src, dst):
                     logger.debug(f"Path infeasible: no edge from {src} to {dst}")
                     return False
 
@@ -1008,19 +1141,16 @@ class GraphIntrospector:
                 return True
 
             nodes = graph_state.nodes
-            edges = graph_state.edges
+            index = graph_state.index
             visited = graph_state.visited_nodes
 
-            # Build edge lookup for efficiency
-            incoming_edges: Dict[str, List[str]] = {}
-            for edge in edges:
-                if edge.dst not in incoming_edges:
-                    incoming_edges[edge.dst] = []
-                incoming_edges[edge.dst].append(edge.src)
+            # Only join nodes carry requirements
+            if index.join_nodes.isdisjoint(path):
+                return True
 
             # Check each node in path for join requirements
             for node_id in path:
-                if node_id not in nodes:
+                if node_id not in nodes or node_id not in index.join_nodes:
                     continue
 
                 node = nodes[node_id]
@@ -1063,9 +1193,10 @@ class GraphIntrospector:
 
                     # Check minimum inputs from incoming edges
                     min_inputs = join_config.get("min_inputs", 1)
-                    potential_inputs = len(incoming_edges.get(node_id, []))
+                    incoming_sources = index.predecessors(node_id)
+                    potential_inputs = len(incoming_sources)
                     available_inputs = sum(
-                        1 for src in incoming_edges.get(node_id, []) if src in visited or src in path
+                        1 for src in incoming_sources if src in visited or src in path
                     )
 
                     if available_inputs < min_inputs and potential_inputs >= min_inputs:
@@ -1091,8 +1222,7 @@ class GraphIntrospector:
     def _has_parallel_paths_to_join(self, join_node_id: str, graph_state: GraphState) -> bool:
         """Check if there are parallel paths that could satisfy a join."""
         # Check if multiple paths converge on this join
-        incoming = [e for e in graph_state.edges if e.dst == join_node_id]
-        return len(incoming) > 1
+        return len(graph_state.index.incoming.get(join_node_id, [])) > 1
 
     def _check_resource_constraints(
         self, candidate: Dict[str, Any], graph_state: GraphState
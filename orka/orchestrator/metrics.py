@@ -34,7 +34,11 @@ class MetricsCollector:
 
     def _extract_llm_metrics(self, agent: Any, result: Any) -> Dict[str, Any] | None:
         """
-        Extract LLM metrics from agent result or agent state.
+        Extract LLM metrics from the agent's result.
+
+        Metrics are only taken from the call's own result: agent instances are
+        shared between concurrent runs, so state stored on them may belong to
+        another run.
 
         Args:
             agent: The agent instance
@@ -48,11 +52,6 @@ class MetricsCollector:
             metrics: Dict[str, Any] = result["_metrics"]
             return metrics
 
-        # Check if agent has stored metrics (for binary/classification agents)
-        if hasattr(agent, "_last_metrics") and agent._last_metrics:
-            agent_metrics: Dict[str, Any] = agent._last_metrics
-            return agent_metrics
-
         return None
 
     def _get_runtime_environment(self) -> Dict[str, Any]:
@@ -311,50 +310,59 @@ class MetricsCollector:
         """
         outputs: Dict[str, Any] = {}
         for log in logs:
-            agent_id = log["agent_id"]
-            payload = log.get("payload", {})
-
-            # Case: LoopNode output (has past_loops/loops_completed alongside result)
-            if "result" in payload and "past_loops" in payload:
-                outputs[agent_id] = {
-                    "response": payload.get("response", payload["result"]),
-                    "result": payload["result"],
-                    "past_loops": payload.get("past_loops", []),
-                    "loops_completed": payload.get("loops_completed"),
-                    "final_score": payload.get("final_score"),
-                    "threshold_met": payload.get("threshold_met"),
-                    "confidence": payload.get("confidence", 0.0),
-                    "internal_reasoning": payload.get("internal_reasoning", ""),
-                }
-
-            # Case: regular agent output (includes all structured fields)
-            elif "result" in payload:
-                outputs[agent_id] = payload["result"]
-
-                # Case: JoinNode with merged dict
-                if isinstance(payload["result"], dict):
-                    merged = payload["result"].get("merged")
-                    if isinstance(merged, dict):
-                        outputs.update(merged)
-
-            # Case: Current run agent responses (only when no "result" key)
-            elif "response" in payload:
-                outputs[agent_id] = {
-                    "response": payload["response"],
-                    "confidence": payload.get("confidence", "0.0"),
-                    "internal_reasoning": payload.get("internal_reasoning", ""),
-                    "_metrics": payload.get("_metrics", {}),
-                    "formatted_prompt": payload.get("formatted_prompt", ""),
-                }
-
-            # Case: Memory agent responses (only when no "result" or "response" key)
-            elif "memories" in payload:
-                outputs[agent_id] = {
-                    "memories": payload["memories"],
-                    "query": payload.get("query", ""),
-                    "backend": payload.get("backend", ""),
-                    "search_type": payload.get("search_type", ""),
-                    "num_results": payload.get("num_results", 0),
-                }
-
+            MetricsCollector.merge_log_into_outputs(outputs, log)
         return outputs
+
+    @staticmethod
+    def merge_log_into_outputs(outputs: Dict[str, Any], log: Dict[str, Any]) -> None:
+        """
+        Fold a single execution log entry into a previous-outputs dictionary.
+
+        This is the per-entry step of ``build_previous_outputs`` and is shared with
+        ``PreviousOutputsIndex`` so both produce identical views.
+        """
+        agent_id = log["agent_id"]
+        payload = log.get("payload", {})
+
+        # Case: LoopNode output (has past_loops/loops_completed alongside result)
+        if "result" in payload and "past_loops" in payload:
+            outputs[agent_id] = {
+                "response": payload.get("response", payload["result"]),
+                "result": payload["result"],
+                "past_loops": payload.get("past_loops", []),
+                "loops_completed": payload.get("loops_completed"),
+                "final_score": payload.get("final_score"),
+                "threshold_met": payload.get("threshold_met"),
+                "confidence": payload.get("confidence", 0.0),
+                "internal_reasoning": payload.get("internal_reasoning", ""),
+            }
+
+        # Case: regular agent output (includes all structured fields)
+        elif "result" in payload:
+            outputs[agent_id] = payload["result"]
+
+            # Case: JoinNode with merged dict
+            if isinstance(payload["result"], dict):
+                merged = payload["result"].get("merged")
+                if isinstance(merged, dict):
+                    outputs.update(merged)
+
+        # Case: Current run agent responses (only when no "result" key)
+        elif "response" in payload:
+            outputs[agent_id] = {
+                "response": payload["response"],
+                "confidence": payload.get("confidence", "0.0"),
+                "internal_reasoning": payload.get("internal_reasoning", ""),
+                "_metrics": payload.get("_metrics", {}),
+                "formatted_prompt": payload.get("formatted_prompt", ""),
+            }
+
+        # Case: Memory agent responses (only when no "result" or "response" key)
+        elif "memories" in payload:
+            outputs[agent_id] = {
+                "memories": payload["memories"],
+                "query": payload.get("query", ""),
+                "backend": payload.get("backend", ""),
+                "search_type": payload.get("search_type", ""),
+                "num_results": payload.get("num_results", 0),
+            }
@@ -20,15 +20,49 @@ Supports two modes:
 2. **Boolean Mode**: Deterministic pass/fail criteria with audit trails
 
 Combines LLM evaluation, heuristics, historical priors, and budget considerations.
+
+Domain overlap uses embeddings of the workflow's node descriptions. Those are
+embedded once per workflow into a row-normalized matrix; each scoring round embeds
+the question once and gets every candidate's similarity from a single
+matrix-vector product.
 """
 
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Semantic similarity of each candidate node to the question of the scoring round
+# in progress, so per-candidate heuristics can look it up instead of embedding.
+_round_similarities: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "orka_path_scoring_similarities", default=None
+)
+
+# Workflows whose node embedding matrices are kept per scorer
+NODE_EMBEDDING_CACHE_SIZE = 16
+
+
+def _unit_rows(embedder: Any, node_ids: List[str]) -> Any:
+    """Embed the nodes' descriptions as a float32 matrix of unit-length (or zero) rows."""
+    import numpy as np
+
+    matrix = np.asarray(
+        embedder.embed_batch([_node_text(node_id) for node_id in node_ids]),
+        dtype=np.float32,
+    )
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def _node_text(node_id: str) -> str:
+    """Description embedded for a node."""
+    return node_id.replace("_", " ").replace("-", " ")
+
 
 class PathScorer:
     """
@@ -101,6 +135,10 @@ class PathScorer:
         # Initialize LLM evaluator (placeholder for now)
         self.llm_evaluator = None
 
+        # Node embedding matrices keyed by the workflow's node IDs: (row index, matrix)
+        self._node_embeddings: Dict[Tuple[str, ...], Tuple[Dict[str, int], Any]] = {}
+        self._node_embeddings_lock = threading.Lock()
+
         logger.debug(f"PathScorer initialized with weights: {self.score_weights}")
 
     async def score_candidates(
@@ -134,10 +172,19 @@ class PathScorer:
         try:
             scored_candidates = []
 
-            # Score each candidate
-            for candidate in candidates:
-                score_components = await self._score_candidate(candidate, question, context)
+            # One question embedding and one matrix product for the whole round
+            token = _round_similarities.set(
+                self._compute_semantic_similarities(candidates, question, context)
+            )
+            try:
+                all_components = await asyncio.gather(
+                    *(self._score_candidate(candidate, question, context) for candidate in candidates)
+                )
+            finally:
+                _round_similarities.reset(token)
 
+            # Score each candidate
+            for candidate, score_components in zip(candidates, all_components):
                 # Calculate final weighted score
                 final_score = self._calculate_final_score(score_components)
 
@@ -250,12 +297,20 @@ class PathScorer:
             else:
                 logger.info(f"[...] SCORING single-hop path: {path[0] if path else 'unknown'}")
 
-            # Normal scoring for all paths
-            components["llm"] = await self._score_llm_relevance(candidate, question, context)
-            components["heuristics"] = await self._score_heuristics(candidate, question, context)
-            components["prior"] = await self._score_priors(candidate, question, context)
-            components["cost"] = await self._score_cost(candidate, context)
-            components["latency"] = await self._score_latency(candidate, context)
+            # Normal scoring for all paths; the components are independent
+            (
+                components["llm"],
+                components["heuristics"],
+                components["prior"],
+                components["cost"],
+                components["latency"],
+            ) = await asyncio.gather(
+                self._score_llm_relevance(candidate, question, context),
+                self._score_heuristics(candidate, question, context),
+                self._score_priors(candidate, question, context),
+                self._score_cost(candidate, context),
+                self._score_latency(candidate, context),
+            )
 
             # Optional compliance component (weighted only if configured)
             # Computes 1.0 when compliant, 0.0 when violating required agent policy
@@ -607,6 +662,11 @@ class PathScorer:
         try:
             node_id = candidate["node_id"]
 
+            # Precomputed for the current scoring round
+            round_similarities = _round_similarities.get()
+            if round_similarities is not None and node_id in round_similarities:
+                return round_similarities[node_id]
+
             # Try semantic similarity first (if embedder available)
             if self._has_embedder():
                 semantic_score = self._compute_semantic_similarity(node_id, question)
@@ -637,6 +697,99 @@ class PathScorer:
         except Exception:
             return False
 
+    def _compute_semantic_similarities(
+        self, candidates: List[Dict[str, Any]], question: str, context: Dict[str, Any]
+    ) -> Optional[Dict[str, float]]:
+        """
+        Semantic similarity of every candidate node to ``question`` in one pass.
+
+        Returns ``None`` when no embedder is available, so domain overlap falls
+        back to keyword matching exactly as before.
+        """
+        try:
+            node_ids = [c["node_id"] for c in candidates if isinstance(c.get("node_id"), str)]
+            if not node_ids or not self._has_embedder():
+                return None
+
+            import numpy as np
+
+            from orka.utils.embedder import get_embedder
+
+            embedder = get_embedder()
+            rows, matrix = self._get_node_embeddings(embedder, node_ids, context)
+
+            question_embedding = embedder.embed(question)
+            if question_embedding is None:
+                return None
+            question_vector = np.asarray(question_embedding, dtype=np.float32).ravel()
+            question_norm = np.linalg.norm(question_vector)
+            if question_norm == 0 or question_vector.shape[0] != matrix.shape[1]:
+                return {node_id: 0.5 for node_id in node_ids}
+
+            # Rows are unit length (or zero); cosine is a plain dot product
+            similarities = matrix @ (question_vector / question_norm)
+            normalized = np.clip((similarities + 1) / 2, 0.0, 1.0)
+            row_norms = np.linalg.norm(matrix, axis=1)
+
+            return {
+                node_id: float(normalized[rows[node_id]]) if row_norms[rows[node_id]] > 0 else 0.5
+                for node_id in node_ids
+            }
+
+        except ImportError:
+            logger.debug("NumPy not available for semantic similarity computation")
+            return None
+        except Exception as e:
+            logger.debug(f"Batched semantic similarity computation failed: {e}")
+            return None
+
+    def _get_node_embeddings(
+        self, embedder: Any, node_ids: List[str], context: Dict[str, Any]
+    ) -> Tuple[Dict[str, int], Any]:
+        """Return (row index, unit-row matrix) of node embeddings for this workflow."""
+        import numpy as np
+
+        orchestrator = context.get("orchestrator")
+        agents = getattr(orchestrator, "agents", None)
+        rows, matrix = self._get_workflow_embeddings(
+            embedder, list(agents) if isinstance(agents, dict) else []
+        )
+
+        # Candidates outside the workflow are embedded on their own, so they
+        # neither invalidate nor multiply the cached workflow matrices
+        extra = [node_id for node_id in dict.fromkeys(node_ids) if node_id not in rows]
+        if not extra:
+            return rows, matrix
+        extra_rows = {node_id: len(rows) + row for row, node_id in enumerate(extra)}
+        extra_matrix = _unit_rows(embedder, extra)
+        if not rows:
+            return extra_rows, extra_matrix
+        return {**rows, **extra_rows}, np.vstack([matrix, extra_matrix])
+
+    def _get_workflow_embeddings(
+        self, embedder: Any, workflow_nodes: List[str]
+    ) -> Tuple[Dict[str, int], Any]:
+        """Cached (row index, unit-row matrix) for the workflow's own agents."""
+        import numpy as np
+
+        key = tuple(workflow_nodes)
+        if not key:
+            return {}, np.zeros((0, 0), dtype=np.float32)
+
+        with self._node_embeddings_lock:
+            cached = self._node_embeddings.get(key)
+        if cached is not None:
+            return cached
+
+        entry = ({node_id: row for row, node_id in enumerate(workflow_nodes)}, _unit_rows(embedder, workflow_nodes))
+
+        with self._node_embeddings_lock:
+            self._node_embeddings[key] = entry
+            while len(self._node_embeddings) > NODE_EMBEDDING_CACHE_SIZE:
+                self._node_embeddings.pop(next(iter(self._node_embeddings)))
+        logger.debug(f"Embedded {len(workflow_nodes)} node descriptions for path scoring")
+        return entry
+
     def _compute_semantic_similarity(
         self, node_id: str, question: str
     ) -> Optional[float]:
@@ -649,7 +802,7 @@ class PathScorer:
                 return None
 
             # Build node description from ID and metadata
-            node_text = node_id.replace("_", " ").replace("-", " ")
+            node_text = _node_text(node_id)
 
             # Get embeddings
             node_embedding = embedder.embed(node_text)
@@ -23,6 +23,7 @@ from .loop_helpers import create_loop_helpers
 from .agent_helpers import create_agent_helpers
 from .memory_helpers import create_memory_helpers
 from .utility_helpers import create_utility_helpers
+from .template_cache import CompiledTemplateCache, get_template_cache
 
 __all__ = [
     "TemplateSafeObject",
@@ -33,5 +34,7 @@ __all__ = [
     "create_agent_helpers",
     "create_memory_helpers",
     "create_utility_helpers",
+    "CompiledTemplateCache",
+    "get_template_cache",
 ]
 
@@ -0,0 +1,149 @@
+# OrKa: Orchestrator Kit Agents
+# by Marco Somma
+#
+# This file is part of OrKa – https://github.com/marcosomma/orka-reasoning
+#
+# Licensed under the Apache License, Version 2.0 (Apache 2.0).
+#
+# Full license: https://www.apache.org/licenses/LICENSE-2.0
+#
+# Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
+
+"""
+Compiled Template Cache
+=======================
+
+Process-wide cache of compiled Jinja2 templates for prompt rendering.
+
+Agent prompts are static, so parsing and compiling them on every step is wasted
+work. All templates are compiled once by a single shared ``Environment`` that only
+carries the static filters and globals. Payload-dependent helpers (the functions
+built from the current payload) are passed in the render context instead of being
+installed as globals, which keeps the shared environment safe to use from
+concurrent runs. Render-context values take precedence over globals, so helper and
+payload names shadow static globals exactly as before.
+
+Set ``ORKA_TEMPLATE_CACHE_SIZE`` to bound the number of cached templates.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .template_safe_object import unwrap_template_safe
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATE_CACHE_SIZE = 512
+
+
+def _safe_str(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _get_input_field(input_obj: Any, field: str, default: Any = None) -> Any:
+    if isinstance(input_obj, dict):
+        return input_obj.get(field, default)
+    return default
+
+
+def _tojson(value: Any) -> str:
+    return json.dumps(unwrap_template_safe(value), ensure_ascii=False, default=str)
+
+
+def create_shared_environment() -> Any:
+    """Build the Jinja2 environment with the static OrKa filters and globals."""
+    from jinja2 import Environment
+
+    env = Environment()
+    env.filters["tojson"] = _tojson
+
+    try:
+        from ..template_helpers import register_template_helpers
+
+        register_template_helpers(env)
+    except Exception as e:
+        logger.warning(f"Failed to register custom template helpers: {e}")
+
+    env.globals["get_input_field"] = _get_input_field
+    env.globals["safe_str"] = _safe_str
+    return env
+
+
+class CompiledTemplateCache:
+    """LRU cache of compiled templates keyed by their source string."""
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        if max_size is None:
+            max_size = int(os.getenv("ORKA_TEMPLATE_CACHE_SIZE", str(DEFAULT_TEMPLATE_CACHE_SIZE)))
+        self.max_size = max(1, max_size)
+        self._env: Any = None
+        self._templates: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @property
+    def environment(self) -> Any:
+        """The shared environment, created on first use."""
+        if self._env is None:
+            with self._lock:
+                if self._env is None:
+                    self._env = create_shared_environment()
+        return self._env
+
+    def get_template(self, source: str) -> Any:
+        """
+        Return the compiled template for ``source``, compiling it on a miss.
+
+        Compilation errors propagate and are not cached.
+        """
+        with self._lock:
+            template = self._templates.get(source)
+            if template is not None:
+                self._templates.move_to_end(source)
+                self._stats["hits"] += 1
+                return template
+
+        template = self.environment.from_string(source)
+
+        with self._lock:
+            self._stats["misses"] += 1
+            self._templates[source] = template
+            self._templates.move_to_end(source)
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+                self._stats["evictions"] += 1
+        return template
+
+    def clear(self) -> None:
+        """Drop all compiled templates (statistics are kept)."""
+        with self._lock:
+            self._templates.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, hit rate and current size."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._templates),
+                "max_size": self.max_size,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
+
+_template_cache: Optional[CompiledTemplateCache] = None
+_template_cache_lock = threading.Lock()
+
+
+def get_template_cache() -> CompiledTemplateCache:
+    """Return the process-wide compiled template cache."""
+    global _template_cache
+    if _template_cache is None:
+        with _template_cache_lock:
+            if _template_cache is None:
+                _template_cache = CompiledTemplateCache()
+    return _template_cache
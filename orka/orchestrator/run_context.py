@@ -0,0 +1,143 @@
+# OrKa: Orchestrator Kit Agents
+# by Marco Somma
+#
+# This file is part of OrKa – https://github.com/marcosomma/orka-reasoning
+#
+# Licensed under the Apache License, Version 2.0 (Apache 2.0).
+#
+# Full license: https://www.apache.org/licenses/LICENSE-2.0
+#
+# Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
+
+"""
+Per-Run Execution Context
+=========================
+
+Everything that changes while a workflow executes (the agent queue, step counter,
+run ID, error telemetry, the previous-outputs index, the memory lease and the
+prepared agent invocations) lives in a :class:`RunContext` rather than on the orchestrator itself. The orchestrator
+exposes these names as :class:`RunStateAttribute` descriptors that resolve to the
+run currently active for that orchestrator, so one compiled orchestrator can serve
+several concurrent ``run()`` calls.
+
+The active runs are tracked in a :class:`contextvars.ContextVar`. asyncio tasks and
+``asyncio.to_thread`` copy the current context, so agents, parallel branches and the
+deferred trace writer started by a run all see that run's state. Outside a run (or
+for the first run on an otherwise idle orchestrator) the orchestrator's default
+context is used, which keeps the attributes behaving like plain instance state.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+from uuid import uuid4
+
+_DEFAULT_CONTEXT_ATTR = "_default_run_context"
+_default_context_lock = threading.Lock()
+
+
+def new_error_telemetry() -> Dict[str, Any]:
+    """Return an empty error telemetry record for a run."""
+    return {
+        "errors": [],  # List of all errors encountered
+        "retry_counters": {},  # Per-agent retry counts
+        "partial_successes": [],  # Agents that succeeded after retries
+        "silent_degradations": [],  # JSON parsing failures that fell back to raw text
+        "status_codes": {},  # HTTP status codes for API calls
+        "execution_status": "running",  # overall status: running, completed, failed, partial
+        "critical_failures": [],  # Failures that stopped execution
+        "recovery_actions": [],  # Actions taken to recover from errors
+    }
+
+
+@dataclass
+class RunContext:
+    """Mutable state of a single orchestrator run."""
+
+    run_id: str = field(default_factory=lambda: str(uuid4()))
+    queue: List[str] = field(default_factory=list)
+    step_index: int = 0
+    error_telemetry: Dict[str, Any] = field(default_factory=new_error_telemetry)
+    previous_outputs_index: Any = None
+    memory_lease: Any = None
+    invocations: Dict[str, Any] = field(default_factory=dict, repr=False)
+    active: bool = field(default=False, repr=False)
+
+    def reset(self) -> None:
+        """Start a fresh run: new run ID, step counter and error telemetry."""
+        self.run_id = str(uuid4())
+        self.step_index = 0
+        self.error_telemetry = new_error_telemetry()
+        self.previous_outputs_index = None
+        self.invocations.clear()
+
+
+_active_runs: ContextVar[Mapping[int, RunContext]] = ContextVar(
+    "orka_active_runs", default=MappingProxyType({})
+)
+
+
+def default_run_context(engine: Any) -> RunContext:
+    """Return the context used for ``engine`` when no run is active for it."""
+    context = engine.__dict__.get(_DEFAULT_CONTEXT_ATTR)
+    if context is None:
+        with _default_context_lock:
+            context = engine.__dict__.get(_DEFAULT_CONTEXT_ATTR)
+            if context is None:
+                context = RunContext()
+                engine.__dict__[_DEFAULT_CONTEXT_ATTR] = context
+    return context
+
+
+def current_run_context(engine: Any) -> RunContext:
+    """Return the run context ``engine`` state resolves to in the current task."""
+    context = _active_runs.get().get(id(engine))
+    return context if context is not None else default_run_context(engine)
+
+
+@contextmanager
+def run_scope(engine: Any, run_context: Optional[RunContext] = None) -> Iterator[RunContext]:
+    """Activate a run context for ``engine`` for the duration of one run.
+
+    Without an explicit ``run_context`` the engine's default context is used when it
+    is idle, so a lone run leaves its state readable on the orchestrator afterwards;
+    a run that starts while another one is in flight gets a fresh context.
+    """
+    if run_context is None:
+        default = default_run_context(engine)
+        with _default_context_lock:
+            if not default.active:
+                default.active = True
+                run_context = default
+        if run_context is None:
+            run_context = RunContext()
+    run_context.active = True
+
+    token = _active_runs.set(MappingProxyType({**_active_runs.get(), id(engine): run_context}))
+    try:
+        yield run_context
+    finally:
+        _active_runs.reset(token)
+        run_context.active = False
+
+
+class RunStateAttribute:
+    """Descriptor that stores an orchestrator attribute on the active :class:`RunContext`."""
+
+    def __init__(self, field_name: str = "") -> None:
+        self.field_name = field_name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if not self.field_name:
+            self.field_name = name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(current_run_context(obj), self.field_name)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        setattr(current_run_context(obj), self.field_name, value)
@@ -26,7 +26,6 @@ This class has been refactored into smaller modules in the prompt_rendering/ pac
 - utility_helpers: General utility template helper functions
 """
 
-import json
 import logging
 import re
 from typing import Any, Dict
@@ -38,19 +37,14 @@ from .prompt_rendering.loop_helpers import create_loop_helpers
 from .prompt_rendering.agent_helpers import create_agent_helpers
 from .prompt_rendering.memory_helpers import create_memory_helpers
 from .prompt_rendering.utility_helpers import create_utility_helpers, normalize_bool
-
-try:
-    from .template_helpers import register_template_helpers
-
-    TEMPLATE_HELPERS_AVAILABLE = True
-except ImportError:
-    TEMPLATE_HELPERS_AVAILABLE = False
-    logging.getLogger(__name__).warning(
-        "template_helpers not available, custom filters disabled"
-    )
+from .prompt_rendering.template_cache import get_template_cache
+from .execution.agent_runner import count_template_render
 
 logger = logging.getLogger(__name__)
 
+_UNRESOLVED_VAR_RE = re.compile(r"\{\{\s*[^}]+\s*\}\}")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class SimplifiedPromptRenderer(PayloadEnhancerMixin):
     """
@@ -82,6 +76,11 @@ class SimplifiedPromptRenderer(PayloadEnhancerMixin):
         """Backward compatibility wrapper for unwrap_template_safe."""
         return unwrap_template_safe(value)
 
+    @staticmethod
+    def get_template_cache_stats() -> Dict[str, Any]:
+        """Return hit/miss statistics of the shared compiled-template cache."""
+        return get_template_cache().get_stats()
+
     @staticmethod
     def normalize_bool(value) -> bool:
         """Normalize a value to boolean with support for complex agent responses."""
@@ -104,51 +103,27 @@ class SimplifiedPromptRenderer(PayloadEnhancerMixin):
             )
 
         try:
-            from jinja2 import Environment, TemplateError
+            # Compiled once per template source with the shared environment
+            jinja_template = get_template_cache().get_template(template_str)
 
             # Enhance payload for template rendering
             enhanced_payload = self._enhance_payload_for_templates(payload)
 
-            # Create Jinja2 environment with custom filters
-            env = Environment()
-            env.filters["tojson"] = lambda v: json.dumps(
-                unwrap_template_safe(v),
-                ensure_ascii=False,
-                default=str,
-            )
-
-            # Register custom template helpers if available
-            if TEMPLATE_HELPERS_AVAILABLE:
-                try:
-                    register_template_helpers(env)
-                    logger.debug("Custom template helpers registered successfully")
-                except Exception as e:
-                    logger.warning(f"Failed to register custom template helpers: {e}")
-
-            # Register helper functions
-            helper_functions = self._get_template_helper_functions(enhanced_payload)
-            env.globals.update(helper_functions)
-            env.globals["get_input_field"] = SimplifiedPromptRenderer.get_input_field
-            env.globals["safe_str"] = lambda v: "" if v is None else str(v)
-
-            logger.debug(
-                f"Registered {len(helper_functions)+1} internal helper functions"
-            )
-
-            # Create and render template
-            jinja_template = env.from_string(template_str)
-            rendered = jinja_template.render(**enhanced_payload)
+            # Payload-bound helpers go into the render context; payload values
+            # shadow helpers, which shadow the environment's static globals.
+            context = self._get_template_helper_functions(enhanced_payload)
+            context.update(enhanced_payload)
+            rendered = jinja_template.render(context)
 
             # Replace unresolved variables with empty strings
-            unresolved_pattern = r"\{\{\s*[^}]+\s*\}\}"
-            unresolved_vars = re.findall(unresolved_pattern, rendered)
-
-            if unresolved_vars:
-                logger.debug(
-                    f"Replacing {len(unresolved_vars)} unresolved variables"
-                )
-                rendered = re.sub(unresolved_pattern, "", rendered)
-                rendered = re.sub(r"\s+", " ", rendered).strip()
+            if "{{" in rendered:
+                unresolved_vars = _UNRESOLVED_VAR_RE.findall(rendered)
+                if unresolved_vars:
+                    logger.debug(
+                        f"Replacing {len(unresolved_vars)} unresolved variables"
+                    )
+                    rendered = _UNRESOLVED_VAR_RE.sub("", rendered)
+                    rendered = _WHITESPACE_RE.sub(" ", rendered).strip()
 
             logger.debug(f"Successfully rendered template (length: {len(rendered)})")
             return rendered
@@ -163,8 +138,8 @@ class SimplifiedPromptRenderer(PayloadEnhancerMixin):
                 return self._simple_string_replacement(template_str, payload)
 
             logger.error(f"Unexpected error during template rendering: {e}")
-            fallback_rendered = re.sub(r"\{\{\s*[^}]+\s*\}\}", "", template_str)
-            fallback_rendered = re.sub(r"\s+", " ", fallback_rendered).strip()
+            fallback_rendered = _UNRESOLVED_VAR_RE.sub("", template_str)
+            fallback_rendered = _WHITESPACE_RE.sub(" ", fallback_rendered).strip()
             logger.warning(f"Using fallback rendering: '{fallback_rendered}'")
             return fallback_rendered
 
@@ -172,8 +147,10 @@ class SimplifiedPromptRenderer(PayloadEnhancerMixin):
         """
         Render a template with OrkaResponse-enhanced variables.
 
-        This is an alias for render_prompt to maintain compatibility.
+        This is an alias for render_prompt to maintain compatibility. Each call is
+        counted against the agent step running in the current task, if any.
         """
+        count_template_render()
         result = self.render_prompt(template, payload)
         return str(result) if result is not None else ""
 
@@ -258,13 +235,6 @@ class SimplifiedPromptRenderer(PayloadEnhancerMixin):
                 except Exception:
                     payload_out["formatted_prompt"] = agent.prompt
 
-        if hasattr(agent, "_last_response") and agent._last_response:
-            payload_out["response"] = agent._last_response
-        if hasattr(agent, "_last_confidence") and agent._last_confidence:
-            payload_out["confidence"] = agent._last_confidence
-        if hasattr(agent, "_last_internal_reasoning") and agent._last_internal_reasoning:
-            payload_out["internal_reasoning"] = agent._last_internal_reasoning
-
     def _render_agent_prompt(self, agent, payload):
         """Render agent's prompt and add formatted_prompt to payload."""
         if hasattr(agent, "prompt") and agent.prompt:
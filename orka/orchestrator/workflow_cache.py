@@ -0,0 +1,214 @@
+# OrKa: Orchestrator Kit Agents
+# by Marco Somma
+#
+# This file is part of OrKa – https://github.com/marcosomma/orka-reasoning
+#
+# Licensed under the Apache License, Version 2.0 (Apache 2.0).
+#
+# Full license: https://www.apache.org/licenses/LICENSE-2.0
+#
+# Attribution would be appreciated: OrKa by Marco Somma – https://github.com/marcosomma/orka-reasoning
+
+"""
+Compiled Workflow Cache
+=======================
+
+Building an :class:`~orka.orchestrator.Orchestrator` parses and validates the YAML,
+leases a memory backend and instantiates every agent. For workflows that are run
+over and over (the same YAML posted to ``/api/run``, a LoopNode's internal workflow)
+that work only needs to happen once.
+
+:class:`CompiledWorkflow` holds a parsed configuration and the orchestrator built
+from it. Every run executes on that one orchestrator with its own
+:class:`~orka.orchestrator.run_context.RunContext` (queue, step counter, run ID,
+error telemetry), so any number of runs can be in flight at the same time.
+
+Memory leases follow the per-run contract of :mod:`orka.memory.registry`: the shared
+orchestrator holds no lease while idle and every run holds its own until its trace
+is written. Backends that are not managed by the registry
+(``ORKA_PERSISTENT_MEMORY=false``) are closed by their run, so such workflows get a
+fresh orchestrator per run instead.
+
+:class:`WorkflowCache` maps the SHA-256 of a YAML document to its compiled
+workflow with LRU eviction. Its size is set with ``ORKA_WORKFLOW_CACHE_SIZE``;
+``ORKA_WORKFLOW_CACHE=false`` turns it off.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import yaml
+
+from ..memory.registry import get_memory_registry, persistent_memory_enabled
+from .run_context import RunContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKFLOW_CACHE_SIZE = 32
+
+
+class CompiledWorkflow:
+    """A parsed workflow configuration plus the orchestrator shared by its runs."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        *,
+        memory: Any = None,
+        shared_agents: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.config = config
+        self.memory = memory
+        self.shared_agents = shared_agents or {}
+        self._orchestrator: Any = None
+        self._lock = threading.Lock()
+        self.stats = {"built": 0, "runs": 0, "reused": 0, "in_flight": 0, "max_in_flight": 0}
+
+    def _build(self) -> Any:
+        # Lazy import to avoid circular import at package import time:
+        # orka.orchestrator -> agent_factory -> orka.nodes -> LoopNode -> this module
+        from orka.orchestrator import Orchestrator
+
+        kwargs: Dict[str, Any] = {}
+        if self.memory is not None:
+            kwargs["memory"] = self.memory
+        if self.shared_agents:
+            kwargs["shared_agents"] = self.shared_agents
+        orchestrator = Orchestrator(self.config, **kwargs)
+
+        if not hasattr(orchestrator, "render_template"):
+            from .simplified_prompt_rendering import SimplifiedPromptRenderer
+
+            SimplifiedPromptRenderer.__init__(orchestrator)
+
+        with self._lock:
+            self.stats["built"] += 1
+        return orchestrator
+
+    def _is_shareable(self, orchestrator: Any) -> bool:
+        memory = getattr(orchestrator, "memory", None)
+        return memory is self.memory or get_memory_registry().is_managed(memory)
+
+    def _get_orchestrator(self) -> Any:
+        with self._lock:
+            if self._orchestrator is not None:
+                self.stats["reused"] += 1
+                return self._orchestrator
+
+        orchestrator = self._build()
+        if not self._is_shareable(orchestrator):
+            # The run closes its own unmanaged backend; do not hand it out again
+            return orchestrator
+        with self._lock:
+            if self._orchestrator is None:
+                self._orchestrator = orchestrator
+            return self._orchestrator
+
+    async def run(self, input_data: Any, return_logs: bool = True) -> Any:
+        """Execute the workflow once; safe to call concurrently."""
+        orchestrator = self._get_orchestrator()
+        with self._lock:
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+        try:
+            result = await orchestrator.run(input_data, return_logs=return_logs, run_context=RunContext())
+            with self._lock:
+                self.stats["runs"] += 1
+            return result
+        finally:
+            with self._lock:
+                self.stats["in_flight"] -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats)
+
+
+def workflow_key(yaml_text: str) -> str:
+    """Content hash identifying a workflow YAML document."""
+    return hashlib.sha256(yaml_text.encode("utf-8")).hexdigest()
+
+
+class WorkflowCache:
+    """LRU cache of compiled workflows keyed by the hash of their YAML text."""
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        if max_size is None:
+            max_size = int(os.getenv("ORKA_WORKFLOW_CACHE_SIZE", str(DEFAULT_WORKFLOW_CACHE_SIZE)))
+        self.max_size = max(1, max_size)
+        self._workflows: "OrderedDict[str, CompiledWorkflow]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get_workflow(self, yaml_text: str) -> CompiledWorkflow:
+        """
+        Return the compiled workflow for ``yaml_text``, parsing it on a miss.
+
+        Parse errors propagate and are not cached. Validation happens when the
+        first orchestrator is built.
+        """
+        key = workflow_key(yaml_text)
+        with self._lock:
+            compiled = self._workflows.get(key)
+            if compiled is not None:
+                self._workflows.move_to_end(key)
+                self._stats["hits"] += 1
+                return compiled
+
+        config = yaml.safe_load(yaml_text)
+        if not isinstance(config, dict):
+            raise ValueError("Workflow YAML must be a mapping")
+        compiled = CompiledWorkflow(config)
+
+        with self._lock:
+            self._stats["misses"] += 1
+            existing = self._workflows.get(key)
+            if existing is not None:
+                return existing
+            self._workflows[key] = compiled
+            while len(self._workflows) > self.max_size:
+                self._workflows.popitem(last=False)
+                self._stats["evictions"] += 1
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._workflows.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, hit rate and current size."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._workflows),
+                "max_size": self.max_size,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
+
+def workflow_cache_enabled() -> bool:
+    """Whether repeated workflows reuse compiled orchestrators (``ORKA_WORKFLOW_CACHE``).
+
+    Requires persistent memory: without the registry every run closes its backend.
+    """
+    enabled = os.getenv("ORKA_WORKFLOW_CACHE", "true").lower() not in ("0", "false", "no")
+    return enabled and persistent_memory_enabled()
+
+
+_workflow_cache: Optional[WorkflowCache] = None
+_workflow_cache_lock = threading.Lock()
+
+
+def get_workflow_cache() -> WorkflowCache:
+    """Return the process-wide compiled workflow cache."""
+    global _workflow_cache
+    if _workflow_cache is None:
+        with _workflow_cache_lock:
+            if _workflow_cache is None:
+                _workflow_cache = WorkflowCache()
+    return _workflow_cache
@@ -22,6 +22,8 @@ import traceback
 from datetime import datetime, timezone
 from typing import Any, Dict, List, TypedDict
 
+from .memory.base_logger import run_event_buffer
+
 logger = logging.getLogger(__name__)
 
 
@@ -212,6 +214,7 @@ class OrkaErrorHandler:
         Always returns a JSON report, even on failure, for debugging purposes.
         """
         logs = []
+        run_events: list = []
 
         # Store original run method
         original_run = self.orchestrator.run
@@ -220,8 +223,9 @@ class OrkaErrorHandler:
             # Monkey patch to capture logs and add error handling to individual agents
             self._patch_orchestrator_for_error_tracking()
 
-            # Run the orchestrator normally
-            result = await original_run(input_data)
+            # Run the orchestrator normally, keeping its events for the error report
+            with run_event_buffer() as run_events:
+                result = await original_run(input_data)
 
             # Check if any errors occurred during execution
             if self.error_telemetry["errors"]:
@@ -264,24 +268,11 @@ class OrkaErrorHandler:
 
             logger.info(f"[CRASH] [ORKA-CRITICAL] Orchestrator failed: {critical_error}")
 
-            # Try to get partial logs if possible
-            try:
-                if hasattr(self.orchestrator, "memory") and hasattr(
-                    self.orchestrator.memory,
-                    "memory",
-                ):
-                    logs = self.orchestrator.memory.memory[-50:]  # Get last 50 entries
-            except Exception:
-                logs = []
+            # Partial logs of this run; the run already returned its memory lease
+            logs = run_events[-50:]
 
             error_report_path = self.save_comprehensive_error_report(logs, critical_error)
 
-            # Try to cleanup memory backend
-            try:
-                self.orchestrator.memory.close()
-            except Exception as cleanup_error:
-                logger.info(f"[WARN]️ Failed to cleanup memory backend: {cleanup_error}")
-
             # Return error report for debugging instead of raising
             return {
                 "status": "critical_failure",
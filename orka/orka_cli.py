@@ -23,7 +23,13 @@ import tomllib
 import os
 from typing import Any, Dict
 
-from orka.cli.core import deep_sanitize_result, run_cli, run_cli_entrypoint, sanitize_for_console
+from orka.cli.core import (
+    deep_sanitize_result,
+    finish_with_traces,
+    run_cli,
+    run_cli_entrypoint,
+    sanitize_for_console,
+)
 from orka.streaming.event_bus import EventBus
 from orka.streaming.prompt_composer import PromptComposer
 from orka.streaming.runtime import RefreshConfig, StreamingOrchestrator
@@ -262,11 +268,13 @@ def main(argv: list[str] | None = None) -> int:
             if hasattr(args, "json_input") and args.json_input and isinstance(args.input, (dict, list)):
                 try:
                     raw_result = asyncio.run(
-                        run_cli_entrypoint(
-                            args.config,
-                            args.input,
-                            log_to_file=args.log_to_file,
-                            verbose=args.verbose,
+                        finish_with_traces(
+                            run_cli_entrypoint(
+                                args.config,
+                                args.input,
+                                log_to_file=args.log_to_file,
+                                verbose=args.verbose,
+                            )
                         )
                     )
                     raw_result = deep_sanitize_result(raw_result)
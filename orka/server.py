@@ -253,6 +253,7 @@ import logging
 import os
 import pprint
 import tempfile
+from contextlib import asynccontextmanager
 from typing import Any
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -270,13 +271,33 @@ try:
 except Exception:  # pragma: no cover
     aioredis = None  # type: ignore
 
+from orka.fork_group_manager import get_fork_completion_registry
+from orka.memory.redisstack.vector_index_manager import get_index_health_stats
+from orka.memory.registry import get_memory_registry
 from orka.orchestrator import Orchestrator
+from orka.orchestrator.execution.agent_runner import get_sync_agent_executor
+from orka.orchestrator.execution.trace_writer import wait_for_pending_traces
+from orka.orchestrator.workflow_cache import get_workflow_cache, workflow_cache_enabled
 from orka.startup.banner import get_version as _get_orka_version
 
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    # Memory backends are shared across requests (see orka.memory.registry) and are
+    # closed once, when the server shuts down, after the deferred traces that still
+    # write through them.
+    yield
+    if not await wait_for_pending_traces(timeout=float(os.getenv("ORKA_TRACE_SHUTDOWN_TIMEOUT", "30"))):
+        logger.warning("Shutting down with trace finalization still pending")
+    closed = get_memory_registry().close_all()
+    logger.info("Closed %d shared memory backend(s)", closed)
+
+
 app = FastAPI(
     title="OrKa AI Orchestration API",
     description="[START] High-performance API gateway for AI workflow orchestration",
     version="1.0.0",
+    lifespan=_lifespan,
 )
 logger = logging.getLogger(__name__)
 
@@ -538,6 +559,11 @@ async def api_health() -> JSONResponse:
             "version": {"orka": ver},
             "system": system_info,
             "memory": mem,
+            "memory_registry": get_memory_registry().get_stats(),
+            "memory_index": get_index_health_stats(),
+            "agent_executor": get_sync_agent_executor().get_stats(),
+            "workflow_cache": get_workflow_cache().get_stats(),
+            "fork_completions": get_fork_completion_registry().get_stats(),
         }
 
         return JSONResponse(content=payload, status_code=200 if status != "critical" else 503)
@@ -594,16 +620,21 @@ async def run_execution(request: Request):
             len(yaml_config),
         )
 
-        # Create a temporary file path with UTF-8 encoding
-        tmp_fd, tmp_path = tempfile.mkstemp(suffix=".yml")
-        os.close(tmp_fd)  # Close the file descriptor
+        if workflow_cache_enabled():
+            # Identical YAML reuses the parsed config, agents and warm memory backend
+            workflow = get_workflow_cache().get_workflow(yaml_config)
+            result = await workflow.run(input_text, return_logs=True)
+        else:
+            # Create a temporary file path with UTF-8 encoding
+            tmp_fd, tmp_path = tempfile.mkstemp(suffix=".yml")
+            os.close(tmp_fd)  # Close the file descriptor
 
-        # Write with explicit UTF-8 encoding
-        with open(tmp_path, "w", encoding="utf-8") as tmp:
-            tmp.write(yaml_config)
+            # Write with explicit UTF-8 encoding
+            with open(tmp_path, "w", encoding="utf-8") as tmp:
+                tmp.write(yaml_config)
 
-        orchestrator = Orchestrator(tmp_path)
-        result = await orchestrator.run(input_text, return_logs=True)
+            orchestrator = Orchestrator(tmp_path)
+            result = await orchestrator.run(input_text, return_logs=True)
 
         # Sanitize the result data for JSON serialization
         sanitized_result = sanitize_for_json(result)
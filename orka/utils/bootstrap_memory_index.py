@@ -52,6 +52,8 @@ async def initialize_memory():
 
 import asyncio
 import logging
+import math
+import re
 from typing import Any, cast
 
 import numpy as np
@@ -59,7 +61,7 @@ import redis
 
 # Handle different Redis versions and search field imports
 try:
-    from redis.commands.search.field import NumericField, TextField, VectorField
+    from redis.commands.search.field import NumericField, TagField, TextField, VectorField
     from redis.commands.search.indexDefinition import IndexDefinition, IndexType
     from redis.commands.search.query import Query
 
@@ -71,6 +73,7 @@ except ImportError:
         from redisearch import IndexType  # type: ignore[no-redef]
         from redisearch import NumericField  # type: ignore[no-redef]
         from redisearch import Query  # type: ignore[no-redef]
+        from redisearch import TagField  # type: ignore[no-redef]
         from redisearch import TextField  # type: ignore[no-redef]
 
         VECTOR_SEARCH_AVAILABLE = False
@@ -85,6 +88,10 @@ except ImportError:
             def __init__(self, *args: Any, **kwargs: Any) -> None:
                 pass
 
+        class TagField:  # type: ignore[no-redef]
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                pass
+
         class TextField:  # type: ignore[no-redef]
             def __init__(self, *args: Any, **kwargs: Any) -> None:
                 pass
@@ -108,6 +115,128 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Tag value written for memories stored without a namespace, so a namespace
+# pre-filter can still match them (RediSearch does not index empty tags).
+NO_NAMESPACE_TAG = "__none__"
+
+# Matches documents written before ``log_type`` was stored as its own hash field.
+_LEGACY_DOC_FILTER = "-@log_type:{memory | log}"
+
+
+# Hash fields returned with each vector search hit
+MEMORY_RETURN_FIELDS = (
+    "content",
+    "node_id",
+    "trace_id",
+    "timestamp",
+    "importance_score",
+    "memory_type",
+    "metadata",
+    "orka_expire_time",
+)
+
+
+def memory_filter_fields() -> list[Any]:
+    """
+    Tag and numeric attributes used to pre-filter KNN queries.
+
+    ``node_id`` and ``trace_id`` are already indexed as text, so their exact-match
+    tags are exposed under ``*_tag`` aliases.
+    """
+    return [
+        TagField("trace_id", as_name="trace_id_tag"),
+        TagField("node_id", as_name="node_id_tag"),
+        TagField("memory_type"),
+        TagField("log_type"),
+        TagField("namespace"),
+        NumericField("importance_score"),
+    ]
+
+
+def _filter_field_name(field: Any) -> str | None:
+    name = getattr(field, "as_name", None) or getattr(field, "name", None)
+    if isinstance(name, bytes):
+        name = name.decode("utf-8")
+    return name if isinstance(name, str) else None
+
+
+def _add_missing_filter_fields(
+    redis_client: redis.Redis, index_name: str, existing_fields: Any
+) -> None:
+    """Add filter attributes to an index created before they were part of the schema."""
+    if not isinstance(existing_fields, dict):
+        return
+    for field in memory_filter_fields():
+        name = _filter_field_name(field)
+        if not name or name in existing_fields:
+            continue
+        try:
+            redis_client.ft(index_name).alter_schema_add([field])
+            logger.info(f"Added filter field '{name}' to index '{index_name}'")
+        except Exception as e:
+            logger.debug(f"Could not add filter field '{name}' to index '{index_name}': {e}")
+
+
+def is_missing_index_error(error: BaseException) -> bool:
+    """Whether a RediSearch error means the queried index does not exist."""
+    message = str(error).lower()
+    return "unknown index name" in message or "no such index" in message
+
+
+def escape_tag_value(value: Any) -> str:
+    """Escape a value for use inside a RediSearch ``{...}`` tag filter."""
+    return re.sub(r"([^A-Za-z0-9_])", r"\\\1", str(value))
+
+
+def build_memory_filter(
+    index_fields: Any,
+    trace_id: str | None = None,
+    node_id: str | None = None,
+    memory_type: str | None = None,
+    min_importance: float | None = None,
+    log_type: str | None = None,
+    namespace: str | None = None,
+) -> tuple[str | None, set[str]]:
+    """
+    Build an FT.SEARCH pre-filter for the memory search filters the index supports.
+
+    Args:
+        index_fields: Attribute names of the index (``verify_memory_index()["fields"]``)
+
+    Returns:
+        tuple: The filter expression (None when nothing can be pushed down) and the
+        names of the filters it applies. Documents written before ``log_type`` and
+        ``namespace`` were stored as hash fields pass those two clauses, so callers
+        should keep checking them on the results.
+    """
+    fields = index_fields if isinstance(index_fields, (dict, list, set, tuple)) else ()
+    clauses: list[str] = []
+    applied: set[str] = set()
+
+    for name, attribute, value in (
+        ("trace_id", "trace_id_tag", trace_id),
+        ("node_id", "node_id_tag", node_id),
+        ("memory_type", "memory_type", memory_type),
+    ):
+        if value and attribute in fields:
+            clauses.append(f"@{attribute}:{{{escape_tag_value(value)}}}")
+            applied.add(name)
+
+    if min_importance and "importance_score" in fields:
+        clauses.append(f"@importance_score:[{float(min_importance)} +inf]")
+        applied.add("min_importance")
+
+    if "log_type" in fields:
+        if log_type in ("memory", "log"):
+            clauses.append(f"(@log_type:{{{log_type}}} | {_LEGACY_DOC_FILTER})")
+            applied.add("log_type")
+        if namespace and "namespace" in fields:
+            tags = f"{escape_tag_value(namespace)} | {NO_NAMESPACE_TAG}"
+            clauses.append(f"(@namespace:{{{tags}}} | {_LEGACY_DOC_FILTER})")
+            applied.add("namespace")
+
+    return (" ".join(clauses) or None), applied
+
 
 def ensure_memory_index(redis_client: redis.Redis, index_name: str = "memory_entries") -> bool:
     try:
@@ -223,6 +352,7 @@ def ensure_enhanced_memory_index(
                     logger.info(
                         f"Enhanced memory index '{index_name}' already exists with vector field"
                     )
+                    _add_missing_filter_fields(redis_client, index_name, index_info["fields"])
                     return True
 
             # If we get here, either the index doesn't exist or we're recreating it
@@ -239,6 +369,7 @@ def ensure_enhanced_memory_index(
                     TextField("node_id", sortable=True),
                     TextField("trace_id", sortable=True),
                     NumericField("orka_expire_time", sortable=True),
+                    *memory_filter_fields(),
                     VectorField(
                         vector_field_name,
                         "HNSW",
@@ -266,6 +397,7 @@ def ensure_enhanced_memory_index(
                         TextField("node_id", sortable=True),
                         TextField("trace_id", sortable=True),
                         NumericField("orka_expire_time", sortable=True),
+                        *memory_filter_fields(),
                         VectorField(
                             vector_field_name,
                             "HNSW",
@@ -299,6 +431,69 @@ def ensure_enhanced_memory_index(
     return index_created
 
 
+def _knn_query_string(num_results: int, filter_expression: str | None) -> str:
+    # Construct the vector search query using correct RedisStack syntax
+    prefilter = f"({filter_expression})" if filter_expression else "*"
+    return f"{prefilter}=>[KNN {num_results} @content_vector $query_vector AS vector_score]"
+
+
+def _knn_query(base_query: str, num_results: int) -> Any:
+    return (
+        Query(base_query)
+        .sort_by("vector_score")
+        .paging(0, num_results)
+        .return_fields(*MEMORY_RETURN_FIELDS, "vector_score")
+        .dialect(2)
+    )
+
+
+def _knn_result(doc: Any) -> dict[str, Any]:
+    """Convert a KNN search document into a result with a [0, 1] similarity score."""
+    # Safely extract and validate the similarity score
+    # Redis returns the score with the alias we defined in the search query
+    # Try multiple possible field names for the score
+    raw_score = None
+    for score_field in ["vector_score", "__vector_score", "score", "similarity"]:
+        if hasattr(doc, score_field):
+            raw_score = getattr(doc, score_field)
+            logger.debug(
+                f"Found score field '{score_field}' with value: {raw_score}",
+            )
+            break
+
+    if raw_score is None:
+        # If no score field found, log available fields for debugging
+        available_fields = [attr for attr in dir(doc) if not attr.startswith("_")]
+        logger.debug(f"- No score field found. Available fields: {available_fields}")
+        raw_score = 0.0
+
+    try:
+        score = float(raw_score)
+        if math.isnan(score) or math.isinf(score):
+            score = 0.0
+        # This maps distance [0, 2] to similarity [1, 0]
+        if score < 0:
+            score = 1.0  # Treat negative as perfect similarity
+        elif score > 2:
+            score = 0.0  # Treat > 2 as no similarity
+
+        # Ensure final score is in [0, 1] range
+        score = max(0.0, min(1.0, score))
+        logger.debug(f"- Converted cosine distance {raw_score} -> similarity {score}")
+    except (ValueError, TypeError) as e:
+        logger.debug(f"- Error converting score {raw_score}: {e}")
+        score = 0.0
+
+    return {
+        "content": getattr(doc, "content", ""),
+        "node_id": getattr(doc, "node_id", ""),
+        "trace_id": getattr(doc, "trace_id", ""),
+        "score": score,
+        "key": doc.id,
+        "fields": {name: getattr(doc, name) for name in MEMORY_RETURN_FIELDS if hasattr(doc, name)},
+    }
+
+
 def hybrid_vector_search(
     redis_client,
     query_text: str,
@@ -307,10 +502,19 @@ def hybrid_vector_search(
     index_name: str = "orka_enhanced_memory",
     trace_id: str | None = None,
     format_params: dict[str, Any] | None = None,
+    filter_expression: str | None = None,
 ) -> list[dict[str, Any]]:
     """
     Perform hybrid vector search using RedisStack.
     Combines semantic vector search with text search and filtering.
+
+    ``filter_expression`` (see ``build_memory_filter``) restricts the KNN candidates
+    inside FT.SEARCH. Each result carries the stored hash fields under ``fields`` so
+    callers do not need to fetch the documents again.
+
+    Raises:
+        redis.ResponseError: If the index does not exist, so callers holding a cached
+            index status can rebuild instead of silently getting no results.
     """
     results = []
 
@@ -325,8 +529,7 @@ def hybrid_vector_search(
             logger.error("Query vector must be a numpy array")
             return []
 
-        # Construct the vector search query using correct RedisStack syntax
-        base_query = f"*=>[KNN {num_results} @content_vector $query_vector AS vector_score]"
+        base_query = _knn_query_string(num_results, filter_expression)
 
         logger.debug(f"- Vector search query: {base_query}")
         logger.debug(f"- Vector bytes length: {len(vector_bytes)}")
@@ -337,11 +540,7 @@ def hybrid_vector_search(
         # Execute the search with proper parameters
         try:
             search_results = redis_client.ft(index_name).search(
-                Query(base_query)
-                .sort_by("vector_score")
-                .paging(0, num_results)
-                .return_fields("content", "node_id", "trace_id", "vector_score")
-                .dialect(2),
+                _knn_query(base_query, num_results),
                 query_params={"query_vector": vector_bytes},
             )
 
@@ -350,60 +549,14 @@ def hybrid_vector_search(
             # Process results
             for doc in search_results.docs:
                 try:
-                    # Safely extract and validate the similarity score
-                    # Redis returns the score with the alias we defined in the search query
-                    # Try multiple possible field names for the score
-                    raw_score = None
-                    for score_field in ["vector_score", "__vector_score", "score", "similarity"]:
-                        if hasattr(doc, score_field):
-                            raw_score = getattr(doc, score_field)
-                            logger.debug(
-                                f"Found score field '{score_field}' with value: {raw_score}",
-                            )
-                            break
-
-                    if raw_score is None:
-                        # If no score field found, log available fields for debugging
-                        available_fields = [attr for attr in dir(doc) if not attr.startswith("_")]
-                        logger.debug(
-                            f"- No score field found. Available fields: {available_fields}"
-                        )
-                        raw_score = 0.0
-
-                    try:
-                        score = float(raw_score)
-                        import math
-
-                        if math.isnan(score) or math.isinf(score):
-                            score = 0.0
-                        # This maps distance [0, 2] to similarity [1, 0]
-                        if score < 0:
-                            score = 1.0  # Treat negative as perfect similarity
-                        elif score > 2:
-                            score = 0.0  # Treat > 2 as no similarity
-
-                        # Ensure final score is in [0, 1] range
-                        score = max(0.0, min(1.0, score))
-                        logger.debug(
-                            f"- Converted cosine distance {raw_score} -> similarity {score}"
-                        )
-                    except (ValueError, TypeError) as e:
-                        logger.debug(f"- Error converting score {raw_score}: {e}")
-                        score = 0.0
-
-                    result = {
-                        "content": getattr(doc, "content", ""),
-                        "node_id": getattr(doc, "node_id", ""),
-                        "trace_id": getattr(doc, "trace_id", ""),
-                        "score": score,
-                        "key": doc.id,
-                    }
-                    results.append(result)
+                    results.append(_knn_result(doc))
                 except Exception as e:
                     # logger.warning(f"Error processing search result: {e}")
                     continue
 
         except Exception as search_error:
+            if is_missing_index_error(search_error):
+                raise
             logger.error(f"Vector search failed: {search_error}")
             logger.error(f"Search query was: {base_query}")
             logger.error(f"Vector bytes length: {len(vector_bytes)}")
@@ -435,6 +588,8 @@ def hybrid_vector_search(
                 logger.error(f"Fallback query was: {basic_query}")
 
     except Exception as e:
+        if is_missing_index_error(e):
+            raise
         logger.error(f"Hybrid vector search failed: {e}")
         logger.debug(
             f"Query details - text: {query_text}, vector shape: {query_vector.shape if hasattr(query_vector, 'shape') else 'No shape'}",
@@ -448,6 +603,38 @@ def hybrid_vector_search(
     return results
 
 
+async def ahybrid_vector_search(
+    redis_client: Any,
+    query_vector: np.ndarray,
+    num_results: int = 5,
+    index_name: str = "orka_enhanced_memory",
+    trace_id: str | None = None,
+    filter_expression: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    ``hybrid_vector_search`` for a ``redis.asyncio`` client.
+
+    Only the KNN query is run; errors propagate so the caller can choose its own
+    fallback.
+    """
+    vector_bytes = query_vector.astype(np.float32).tobytes()
+    search_results = await redis_client.ft(index_name).search(
+        _knn_query(_knn_query_string(num_results, filter_expression), num_results),
+        query_params={"query_vector": vector_bytes},
+    )
+
+    results = []
+    for doc in search_results.docs:
+        try:
+            results.append(_knn_result(doc))
+        except Exception:
+            continue
+
+    if trace_id and results:
+        results = [r for r in results if r.get("trace_id") == trace_id]
+    return results
+
+
 def verify_memory_index(
     redis_client,
     index_name: str = "orka_enhanced_memory",
@@ -29,8 +29,9 @@ Key features:
 - Async-friendly embedding interface
 - Singleton pattern for efficient resource use
 - Fallback mechanisms for reliability
-- Deterministic pseudo-random embeddings when models unavailable
+- Deterministic feature-hashing embeddings when models unavailable
 - Utility functions for embedding storage and retrieval
+- Micro-batching of concurrent ``encode`` calls, executed off the event loop
 
 The module supports several embedding models from the sentence-transformers library,
 with automatic dimension detection and handling. When primary models are unavailable,
@@ -57,12 +58,15 @@ async def process_text(text):
 ```
 """
 
+import asyncio
 import hashlib
 import logging
 import logging as std_logging
 import os
-import random
-from typing import Any, Optional, Union, cast
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from collections import OrderedDict
 
 import numpy as np
@@ -85,6 +89,129 @@ EMBEDDING_DIMENSIONS = {
 }
 
 
+# Micro-batching defaults for AsyncEmbedder.encode
+DEFAULT_EMBED_BATCH_SIZE = 32
+DEFAULT_EMBED_BATCH_LATENCY_MS = 5.0
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, str(default)))
+        return value if value > 0 else default
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid {name}; using default {default}")
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, str(default)))
+        return value if value >= 0 else default
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid {name}; using default {default}")
+        return default
+
+
+_embed_executor: Optional[ThreadPoolExecutor] = None
+_embed_executor_lock = threading.Lock()
+
+
+def get_embedding_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide worker pool used for model inference.
+
+    A single worker keeps model calls serialized (sentence-transformers models are
+    not guaranteed to be thread-safe) while keeping them off the event loop thread.
+    The worker count can be raised with ``ORKA_EMBED_WORKERS``.
+    """
+    global _embed_executor
+    if _embed_executor is None:
+        with _embed_executor_lock:
+            if _embed_executor is None:
+                _embed_executor = ThreadPoolExecutor(
+                    max_workers=_env_int("ORKA_EMBED_WORKERS", 1),
+                    thread_name_prefix="orka-embed",
+                )
+    return _embed_executor
+
+
+# Fallback encoder features: lower-cased words (runs of ``\\w`` characters) plus
+# down-weighted character trigrams of "#word#". All features of a text are hashed
+# in a fixed number of vectorized NumPy passes over its code points.
+_FALLBACK_TRIGRAM_WEIGHT = 0.5
+# ASCII byte -> lower-cased code point, or 0 for non-word characters
+_ASCII_WORD_CODES = np.array(
+    [ord(chr(c).lower()) if chr(c).isalnum() or chr(c) == "_" else 0 for c in range(128)],
+    dtype=np.uint32,
+)
+_TRIGRAM_KEYS = tuple(np.uint32(k) for k in (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D))
+# Odd base of the polynomial hash that combines a word's trigrams by position
+_WORD_KEY = np.uint32(0x27D4EB2F)
+_MIX_KEY = np.uint32(0x85EBCA6B)
+
+
+def _word_codes(text: str) -> np.ndarray:
+    """Lower-cased code points of ``text`` with non-``\\w`` characters set to 0."""
+    if text.isascii():
+        return _ASCII_WORD_CODES[np.frombuffer(text.encode("ascii"), dtype=np.uint8)]
+
+    codes = np.frombuffer(text.lower().encode("utf-32-le"), dtype=np.uint32)
+    # Code points past the table clip to DEL, which is not a word character
+    chars = np.take(_ASCII_WORD_CODES, codes, mode="clip")
+    non_ascii = np.flatnonzero(codes >= 128)
+    values, inverse = np.unique(codes[non_ascii], return_inverse=True)
+    word_values = np.array([c if chr(c).isalnum() else 0 for c in values.tolist()], dtype=np.uint32)
+    chars[non_ascii] = word_values[inverse]
+    return chars
+
+
+def _hashed_features(text: str, dim: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the signed ``(slots, weights)`` of the words and character trigrams of ``text``.
+
+    Each word character yields the trigram centred on it (word boundaries count
+    as a "#" pad). A word's hash is a polynomial over its trigram hashes: the
+    trigram at position ``p`` is weighted by ``_WORD_KEY ** (p + 1)``, so
+    anagrams such as "form" and "from" get different hashes.
+    """
+    # 32-bit arithmetic wraps; non-word characters (0) act as the "#" pad
+    chars = _word_codes(text)
+    is_word = chars != 0
+    trigrams = chars * _TRIGRAM_KEYS[1]
+    trigrams[1:] += chars[:-1] * _TRIGRAM_KEYS[0]
+    trigrams[:-1] += chars[1:] * _TRIGRAM_KEYS[2]
+
+    word_chars = np.flatnonzero(is_word)
+    if not len(word_chars):
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+    # Position of each word character within its word
+    new_word = np.ones(len(word_chars), dtype=bool)
+    new_word[1:] = word_chars[1:] != word_chars[:-1] + 1
+    word_starts = np.flatnonzero(new_word)
+    word_lengths = np.diff(np.append(word_starts, len(word_chars)))
+    positions = np.arange(len(word_chars)) - np.repeat(word_starts, word_lengths)
+    powers = np.cumprod(np.full(int(positions.max()) + 1, _WORD_KEY, dtype=np.uint32), dtype=np.uint32)
+    word_trigrams = trigrams[word_chars]
+    words = np.add.reduceat(word_trigrams * powers[positions], word_starts, dtype=np.uint32)
+
+    # One xor-shift-multiply round to spread the raw hashes over all bits
+    hashes = np.concatenate((words, word_trigrams))
+    hashes ^= hashes >> np.uint32(16)
+    hashes *= _MIX_KEY
+    hashes ^= hashes >> np.uint32(13)
+
+    # Slot from the high 16 bits (multiply-shift range reduction), sign from bit 15
+    slots = ((hashes >> np.uint32(16)).astype(np.uint64) * np.uint64(dim)) >> np.uint64(16)
+    weights = np.where(hashes & np.uint32(1 << 15), np.float32(1.0), np.float32(-1.0))
+    weights[len(words):] *= _FALLBACK_TRIGRAM_WEIGHT
+    return slots.astype(np.intp), weights
+
+
+def _seeded_vector(text: str, dim: int) -> np.ndarray:
+    """Deterministic pseudo-random vector for texts without word features."""
+    seed = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+    return np.random.default_rng(seed).uniform(-1.0, 1.0, dim).astype(np.float32)
+
+
 def _ensure_numpy_array(data: Any) -> np.ndarray:
     """Convert any array-like data to a numpy array."""
     if isinstance(data, np.ndarray):
@@ -100,6 +227,134 @@ def _ensure_numpy_array(data: Any) -> np.ndarray:
     return np.zeros(DEFAULT_EMBEDDING_DIM, dtype=np.float32)
 
 
+class EmbeddingBatcher:
+    """
+    Collects concurrent encode requests and resolves them with one batched model call.
+
+    Requests submitted from the same event loop within ``max_latency_ms`` of each
+    other (or until ``max_batch_size`` requests are pending) are encoded together
+    with a single ``encode_batch([...])`` call executed in the shared embedding
+    executor, so the event loop never blocks on model inference.
+
+    Args:
+        encode_batch: Callable taking a list of texts and returning one vector per text
+        max_batch_size: Maximum number of texts per model call
+        max_latency_ms: How long the first request of a batch may wait for company
+        executor: Executor used for model calls (defaults to the shared embedding pool)
+    """
+
+    def __init__(
+        self,
+        encode_batch: Any,
+        max_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        max_latency_ms: float = DEFAULT_EMBED_BATCH_LATENCY_MS,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        self._encode_batch = encode_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_latency_ms = max(0.0, float(max_latency_ms))
+        self._executor = executor
+        # Pending requests and flush timers are tracked per event loop
+        self._pending: Dict[asyncio.AbstractEventLoop, List[Tuple[str, asyncio.Future, float]]] = {}
+        self._timers: Dict[asyncio.AbstractEventLoop, asyncio.Handle] = {}
+        self._tasks: "set[asyncio.Task]" = set()
+        self._stats: Dict[str, float] = {
+            "requests": 0,
+            "batches": 0,
+            "batched_texts": 0,
+            "errors": 0,
+            "total_queue_wait_ms": 0.0,
+            "max_queue_wait_ms": 0.0,
+        }
+
+    async def submit(self, text: str) -> np.ndarray:
+        """Queue ``text`` for the next batch and wait for its vector."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        pending = self._pending.setdefault(loop, [])
+        pending.append((text, future, time.perf_counter()))
+        self._stats["requests"] += 1
+
+        if len(pending) >= self.max_batch_size:
+            self._cancel_timer(loop)
+            self._schedule_flush(loop)
+        elif loop not in self._timers:
+            self._timers[loop] = loop.call_later(self.max_latency_ms / 1000.0, self._schedule_flush, loop)
+
+        return await future
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._flush(loop))
+        # Keep a reference so the flush task is not garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _cancel_timer(self, loop: asyncio.AbstractEventLoop) -> None:
+        handle = self._timers.pop(loop, None)
+        if handle is not None:
+            handle.cancel()
+
+    async def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timers.pop(loop, None)
+        pending = self._pending.get(loop, [])
+        batch, rest = pending[: self.max_batch_size], pending[self.max_batch_size :]
+        if rest:
+            self._pending[loop] = rest
+            self._timers[loop] = loop.call_soon(self._schedule_flush, loop)
+        else:
+            self._pending.pop(loop, None)
+
+        batch = [item for item in batch if not item[1].done()]
+        if not batch:
+            return
+
+        started = time.perf_counter()
+        for _, _, enqueued_at in batch:
+            wait_ms = (started - enqueued_at) * 1000.0
+            self._stats["total_queue_wait_ms"] += wait_ms
+            self._stats["max_queue_wait_ms"] = max(self._stats["max_queue_wait_ms"], wait_ms)
+
+        # Identical concurrent texts are encoded once
+        unique_texts = list(dict.fromkeys(text for text, _, _ in batch))
+        self._stats["batches"] += 1
+        self._stats["batched_texts"] += len(unique_texts)
+
+        try:
+            executor = self._executor or get_embedding_executor()
+            vectors = await loop.run_in_executor(executor, self._encode_batch, unique_texts)
+            by_text = dict(zip(unique_texts, vectors))
+            if len(by_text) != len(unique_texts):
+                raise ValueError(f"Expected {len(unique_texts)} embeddings, got {len(by_text)}")
+        except Exception as e:
+            self._stats["errors"] += 1
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, future, _ in batch:
+            if not future.done():
+                future.set_result(by_text[text])
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Return batching metrics.
+
+        ``avg_batch_fill`` is the mean fraction of ``max_batch_size`` used per model
+        call; ``avg_queue_wait_ms`` is the mean time a request waited before its
+        batch was dispatched.
+        """
+        stats = dict(self._stats)
+        batches = stats["batches"]
+        requests = stats["requests"]
+        stats["max_batch_size"] = self.max_batch_size
+        stats["max_latency_ms"] = self.max_latency_ms
+        stats["avg_batch_size"] = stats["batched_texts"] / batches if batches else 0.0
+        stats["avg_batch_fill"] = stats["avg_batch_size"] / self.max_batch_size if batches else 0.0
+        stats["avg_queue_wait_ms"] = stats["total_queue_wait_ms"] / requests if requests else 0.0
+        return stats
+
+
 class AsyncEmbedder:
     """
     Async wrapper for SentenceTransformer with robust fallback mechanisms.
@@ -110,7 +365,7 @@ class AsyncEmbedder:
 
     Key features:
     - Lazy loading of embedding models to reduce startup time
-    - Graceful fallback to deterministic pseudo-random embeddings when models fail
+    - Graceful fallback to deterministic feature-hashing embeddings when models fail
     - Consistent embedding dimensions regardless of model availability
     - Automatic model file detection to prevent unnecessary downloads
 
@@ -119,9 +374,15 @@ class AsyncEmbedder:
         model: The SentenceTransformer model instance or None if loading failed
         model_loaded (bool): Whether the model was successfully loaded
         embedding_dim (int): Dimension of the embedding vectors produced
+        batcher (EmbeddingBatcher): Micro-batcher used by ``encode`` for model calls
     """
 
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        max_batch_size: Optional[int] = None,
+        max_batch_latency_ms: Optional[float] = None,
+    ) -> None:
         self.model_name = model_name
         self.model: Optional[SentenceTransformer] = None
         self.model_loaded = False
@@ -137,6 +398,17 @@ class AsyncEmbedder:
         self._cache_max_entries = 4096
         self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
 
+        # Concurrent encode() calls are coalesced into batched model calls
+        self.batcher = EmbeddingBatcher(
+            self._encode_batch_with_model,
+            max_batch_size=max_batch_size or _env_int("ORKA_EMBED_BATCH_SIZE", DEFAULT_EMBED_BATCH_SIZE),
+            max_latency_ms=(
+                max_batch_latency_ms
+                if max_batch_latency_ms is not None
+                else _env_float("ORKA_EMBED_BATCH_LATENCY_MS", DEFAULT_EMBED_BATCH_LATENCY_MS)
+            ),
+        )
+
         # Try to load the model
         self._load_model()
 
@@ -240,7 +512,7 @@ class AsyncEmbedder:
         Note:
             The method has a three-tier fallback system:
             1. Try using the primary model if loaded
-            2. Fall back to deterministic hash-based pseudo-random encoding if model fails
+            2. Fall back to deterministic feature-hashing encoding if model fails
             3. Last resort: return a zero vector if all else fails
 
         Example:
@@ -259,19 +531,17 @@ class AsyncEmbedder:
         if cached is not None:
             return cached
 
-        # Try using the primary model
+        # Try using the primary model (batched with concurrent callers, run off-loop)
         if self.model_loaded and self.model is not None:
             try:
-                # Get the embedding and ensure it's a numpy array
-                result = self.model.encode(text)
-                vec = _ensure_numpy_array(result)
+                vec = await self.batcher.submit(text)
                 self._cache_put(text, vec)
                 return vec
             except Exception as e:
                 logger.error(f"Error encoding text with model: {str(e)}. Using fallback.")
 
         # If we get here, we need to use the fallback
-        logger.warning("Using fallback pseudo-random encoding based on text hash")
+        logger.warning("Using fallback feature-hashing encoding")
         vec = self._fallback_encode(text)
         self._cache_put(text, vec)
         return vec
@@ -307,7 +577,7 @@ class AsyncEmbedder:
             except Exception as e:
                 logger.error(f"Error embedding text with model: {str(e)}. Using fallback.")
 
-        logger.warning("Using fallback pseudo-random embedding based on text hash")
+        logger.warning("Using fallback feature-hashing embedding")
         vec = self._fallback_encode(text)
         self._cache_put(text, vec)
         return vec
@@ -316,13 +586,25 @@ class AsyncEmbedder:
     def encode_sync(self, text: str) -> np.ndarray:
         return self.embed(text)
 
+    def _encode_batch_with_model(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Encode several texts with a single model call.
+
+        Runs in the embedding executor; the result has exactly one vector per text.
+        """
+        if self.model is None:
+            raise RuntimeError("Embedding model is not loaded")
+        result = np.asarray(self.model.encode(texts), dtype=np.float32)
+        if result.ndim == 1:
+            result = result.reshape(1, -1)
+        return [_ensure_numpy_array(row) for row in result]
+
     def _fallback_encode(self, text: str) -> np.ndarray:
         """
-        Generate a deterministic pseudo-random embedding based on text hash.
+        Generate a deterministic feature-hashing embedding for a single text.
 
         This method creates embeddings when the primary model is unavailable.
-        It uses a hash-based approach to generate deterministic vectors, ensuring
-        that identical text inputs produce deterministic fallback embeddings when model-based embeddings are not available.
+        See ``_fallback_encode_batch`` for how vectors are built.
 
         Args:
             text (str): The text to encode
@@ -331,33 +613,93 @@ class AsyncEmbedder:
             np.ndarray: A normalized embedding vector of shape (embedding_dim,)
 
         Note:
-            The generated embeddings are deterministic but don't have the semantic
-            properties of true model-based embeddings. They are suitable for basic
-            storage and retrieval but not for advanced semantic operations.
+            The generated embeddings are deterministic and only lexically
+            "semantic" (texts sharing words land close together). They are
+            suitable for basic storage and retrieval but not for advanced
+            semantic operations.
         """
-        try:
-            # Create a deterministic hash of the text
-            text_hash = hashlib.md5(text.encode("utf-8")).hexdigest()
+        return cast(np.ndarray, self._fallback_encode_batch([text])[0])
 
-            # Set random seed based on text hash for deterministic output
-            random.seed(text_hash)
+    def _fallback_encode_batch(self, texts: list[str]) -> np.ndarray:
+        """
+        Generate deterministic fallback embeddings for many texts in one vectorized pass.
 
-            # Generate a random embedding vector
-            vec = np.array(
-                [random.uniform(-1, 1) for _ in range(self.embedding_dim)],
-                dtype=np.float32,
-            )
+        Each text is turned into a bag of hashed features (lower-cased word
+        unigrams plus down-weighted character trigrams). The features of a text
+        are hashed to signed slots in a few vectorized passes over its code
+        points and accumulated with ``np.bincount``. Texts with no word
+        characters get a vector drawn from a NumPy ``Generator`` seeded by the text
+        hash. Python's global ``random`` state is never touched.
 
-            # Normalize to unit length for cosine similarity
-            norm = np.linalg.norm(vec)
-            if norm > 0:
-                vec = vec / norm
+        Args:
+            texts: Texts to encode
 
-            return vec
+        Returns:
+            np.ndarray: Array of shape (len(texts), embedding_dim) with unit-length rows
+        """
+        dim = self.embedding_dim
+        out = np.zeros((len(texts), dim), dtype=np.float32)
+        try:
+            for row, text in enumerate(texts):
+                slots, weights = _hashed_features(text or "", dim)
+                if not len(slots):
+                    if text:
+                        out[row] = _seeded_vector(text, dim)
+                    continue
+                out[row] = np.bincount(slots, weights=weights, minlength=dim)
+
+            # Normalize to unit length for cosine similarity
+            norms = np.linalg.norm(out, axis=1, keepdims=True)
+            np.divide(out, norms, out=out, where=norms > 0)
+            return out
         except Exception as e:
             logger.error(f"Error in fallback encoding: {str(e)}. Using zeros vector.")
             # Last resort - return zeros
-            return np.zeros(self.embedding_dim, dtype=np.float32)
+            return np.zeros((len(texts), dim), dtype=np.float32)
+
+    def embed_batch(self, texts: list[str]) -> np.ndarray:
+        """
+        Synchronously embed many texts at once.
+
+        Cached vectors are reused; the remaining texts are encoded with one model
+        call, or with one vectorized fallback pass when no model is loaded.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            np.ndarray: Array of shape (len(texts), embedding_dim)
+        """
+        out = np.zeros((len(texts), self.embedding_dim), dtype=np.float32)
+        missing: dict[str, list[int]] = {}
+        for row, text in enumerate(texts):
+            if not text:
+                continue
+            cached = self._cache_get(text)
+            if cached is not None and cached.shape[0] == self.embedding_dim:
+                out[row] = cached
+            else:
+                missing.setdefault(text, []).append(row)
+
+        if not missing:
+            return out
+
+        unique_texts = list(missing)
+        vectors: Optional[list[np.ndarray]] = None
+        if self.model_loaded and self.model is not None:
+            try:
+                vectors = self._encode_batch_with_model(unique_texts)
+            except Exception as e:
+                logger.error(f"Error batch-embedding texts with model: {str(e)}. Using fallback.")
+        if vectors is None:
+            vectors = list(self._fallback_encode_batch(unique_texts))
+
+        for text, vec in zip(unique_texts, vectors):
+            self._cache_put(text, vec)
+            cached = self._cache_get(text)
+            for row in missing[text]:
+                out[row] = cached if cached is not None else vec
+        return out
 
     # --- simple LRU cache helpers ---
     def _cache_get(self, key: str) -> Optional[np.ndarray]:
@@ -73,8 +73,11 @@ class _FakeForkManager:
 class _FakeOrchestrator:
     """Minimal stub that matches what LoopNode expects from Orchestrator."""
 
-    def __init__(self, config_path: str):
-        cfg = yaml.safe_load(Path(config_path).read_text(encoding="utf-8"))
+    def __init__(self, config_path: Any, memory: Any = None, shared_agents: Any = None):
+        if isinstance(config_path, dict):
+            cfg = config_path
+        else:
+            cfg = yaml.safe_load(Path(config_path).read_text(encoding="utf-8"))
         self.orchestrator_cfg = cfg.get("orchestrator", {}) if isinstance(cfg, dict) else {}
         self.memory = _FakeMemory()
         self.fork_manager = _FakeForkManager()
@@ -135,6 +135,9 @@ async def test_openai_binary_agent_run(mock_openai_client):
     result = await agent._run_impl(ctx)
     
     assert result["response"] is True
+    # Per-call details travel in the result, never on the shared agent instance
+    assert result["_metrics"]["tokens"] == 11
+    assert not any(hasattr(agent, attr) for attr in ("_last_metrics", "_last_response", "_last_confidence"))
 
 @pytest.mark.asyncio
 async def test_openai_classification_agent_run(mock_openai_client):
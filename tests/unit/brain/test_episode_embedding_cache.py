@@ -80,3 +80,86 @@ def test_delete_removes_cached_vector(fake_memory):
     assert store._load_embedding(eid) is not None
     store.delete_episode(eid)
     assert store._load_embedding(eid) is None
+
+
+class MgetMemory:
+    """Wraps the fake memory, adding MGET and counting point reads."""
+
+    def __init__(self, memory) -> None:
+        self._memory = memory
+        self.gets = 0
+        self.mgets: list[int] = []
+
+    def __getattr__(self, name):
+        return getattr(self._memory, name)
+
+    def get(self, key):
+        self.gets += 1
+        return self._memory.get(key)
+
+    def mget(self, keys):
+        self.mgets.append(len(keys))
+        return [self._memory.get(key) for key in keys]
+
+
+def test_recall_batches_loads_and_reuses_the_cached_matrix(fake_memory):
+    emb = CountingEmbedder()
+    EpisodeStore(memory=fake_memory, embedder=emb).save_episode(_ep("alpha one"))
+    EpisodeStore(memory=fake_memory, embedder=emb).save_episode(_ep("beta two"))
+
+    memory = MgetMemory(fake_memory)
+    store = EpisodeStore(memory=memory, embedder=emb)
+
+    store.semantic_search("alpha query", top_k=2)
+    assert memory.mgets == [2, 2], "episodes and vectors should load in one MGET each"
+    assert memory.gets == 0
+
+    store.semantic_search("beta query", top_k=2)
+    assert memory.mgets == [2, 2], "an unchanged candidate list must not touch Redis again"
+
+
+def test_recall_index_follows_writes_and_deletes(fake_memory):
+    emb = CountingEmbedder()
+    store = EpisodeStore(memory=fake_memory, embedder=emb)
+    alpha_id = store.save_episode(_ep("alpha doc"))
+    store.save_episode(_ep("gamma doc"))
+    assert "alpha" in store.semantic_search("alpha query", top_k=1)[0][0].outcome_summary
+
+    # Written by another process: picked up on the next recall
+    EpisodeStore(memory=fake_memory, embedder=CountingEmbedder()).save_episode(_ep("beta doc"))
+    assert "beta" in store.semantic_search("beta query", top_k=1)[0][0].outcome_summary
+
+    store.delete_episode(alpha_id)
+    results = store.semantic_search("alpha query", top_k=3)
+    assert len(results) == 2
+    assert all("alpha" not in ep.outcome_summary for ep, _ in results)
+
+
+def test_matrix_top_k_matches_brute_force(fake_memory):
+    rng = np.random.default_rng(7)
+    vectors = {f"episode {i}": rng.normal(size=8).astype(np.float32) for i in range(60)}
+
+    class TableEmbedder:
+        def encode(self, text):
+            return vectors.get(text, vectors["episode 0"] + 0.1)
+
+    store = EpisodeStore(memory=fake_memory, embedder=TableEmbedder())
+    episodes = {}
+    for text in vectors:
+        ep = Episode(task_input=text, task_domain="general", outcome_summary=text)
+        ep.to_embedding_text = lambda text=text: text  # type: ignore[method-assign]
+        store.save_episode(ep)
+        episodes[ep.id] = text
+
+    query = vectors["episode 0"] + 0.1
+    expected = sorted(
+        (
+            (float(np.dot(query, v) / (np.linalg.norm(query) * np.linalg.norm(v))) + 1) / 2
+            for v in vectors.values()
+        ),
+        reverse=True,
+    )[:5]
+
+    results = store.semantic_search("query", top_k=5)
+    assert [round(score, 5) for _, score in results] == [round(score, 5) for score in expected]
+    assert results[0][0].outcome_summary == "episode 0"
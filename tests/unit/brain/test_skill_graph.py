@@ -312,3 +312,31 @@ class TestSkillGraphTTL:
         key, ttl = self.memory.expire.call_args[0]
         assert key == f"orka:brain:skill:{skill.id}"
         assert ttl > 0
+
+
+class TestSkillGraphVectors:
+    def setup_method(self):
+        import numpy as np
+
+        self.memory = FakeMemory()
+
+        class Embedder:
+            def encode(self, text):
+                return np.full(3, float(len(text)), dtype=np.float32)
+
+        self.graph = SkillGraph(memory=self.memory, embedder=Embedder())
+
+    def test_vector_stored_at_save_and_removed_on_delete(self):
+        skill = _make_skill("Vec")
+        self.graph.save_skill(skill)
+        [vec] = self.graph.load_skill_vectors([skill])
+        assert vec is not None and vec.shape == (3,)
+
+        self.graph.delete_skill(skill.id)
+        assert self.graph.load_skill_vectors([skill]) == [None]
+
+    def test_vector_for_changed_text_is_not_reused(self):
+        skill = _make_skill("Vec")
+        self.graph.save_skill(skill)
+        skill.description = "A different description"
+        assert self.graph.load_skill_vectors([skill]) == [None]
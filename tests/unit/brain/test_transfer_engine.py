@@ -339,3 +339,77 @@ class TestSkillTransferEngine:
             assert candidate.combined_score == 0.0
             assert candidate.adaptations == {}
             assert "Filtered" in candidate.reasoning
+
+
+class CountingEmbedder:
+    """Deterministic embedder recording every text it encodes."""
+
+    def __init__(self):
+        self.texts: list[str] = []
+
+    def encode(self, text: str):
+        import numpy as np
+
+        self.texts.append(text)
+        t = text.lower()
+        return np.array(
+            [float("report" in t), float("email" in t), float("code" in t), 0.1], dtype=np.float32
+        )
+
+
+class TestSkillTransferEmbeddingCache:
+    def setup_method(self):
+        self.memory = FakeMemory()
+        self.embedder = CountingEmbedder()
+        self.graph = SkillGraph(memory=self.memory, embedder=self.embedder)
+        self.engine = SkillTransferEngine(
+            skill_graph=self.graph,
+            context_analyzer=ContextAnalyzer(),
+            embedder=self.embedder,
+        )
+        self.report = _make_skill("Report", ["summarization"], ["synthesis"])
+        self.report.description = "Write a quarterly report"
+        self.email = _make_skill("Email", ["generation"], ["synthesis"])
+        self.email.description = "Draft an email reply"
+        self.graph.save_skill(self.report)
+        self.graph.save_skill(self.email)
+
+    def test_skills_are_embedded_at_save_and_target_once_per_call(self):
+        assert self.embedder.texts == ["Write a quarterly report", "Draft an email reply"]
+
+        candidates = self.engine.find_transferable_skills({"task": "write a report"}, min_score=0.0)
+        assert len(self.embedder.texts) == 3, "only the target should be encoded"
+        assert candidates[0].skill.name == "Report"
+        by_name = {c.skill.name: c.semantic_score for c in candidates}
+        assert by_name["Report"] > by_name["Email"]
+
+        self.engine.find_transferable_skills({"task": "answer an email"}, min_score=0.0)
+        assert len(self.embedder.texts) == 4
+
+    def test_resaving_unchanged_skill_does_not_re_embed(self):
+        self.report.confidence = 0.9
+        self.graph.save_skill(self.report)
+        assert len(self.embedder.texts) == 2
+
+    def test_matrix_follows_skill_text_changes(self):
+        self.engine.find_transferable_skills({"task": "write code"}, min_score=0.0)
+        matrix = self.engine._skill_matrix
+
+        self.email.description = "Review code changes"
+        self.graph.save_skill(self.email)
+        assert self.embedder.texts[-1] == "Review code changes"
+
+        candidates = self.engine.find_transferable_skills({"task": "write code"}, min_score=0.0)
+        assert self.engine._skill_matrix is not matrix
+        assert candidates[0].skill.name == "Email"
+
+    def test_vectors_are_backfilled_for_skills_saved_without_embedder(self):
+        legacy = _make_skill("Legacy", ["summarization"], ["synthesis"])
+        legacy.description = "Summarize code"
+        SkillGraph(memory=self.memory).save_skill(legacy)
+        assert self.graph.load_skill_vectors([legacy]) == [None]
+
+        self.engine.find_transferable_skills({"task": "explain code"}, min_score=0.0)
+
+        assert "Summarize code" in self.embedder.texts
+        assert self.graph.load_skill_vectors([legacy])[0] is not None
@@ -123,3 +123,23 @@ class TestRunCliReturnCodes:
             mock_run.return_value = None
             exit_code = run_cli(["run", "fake.yml", "test"])
             assert exit_code == 1
+
+
+@pytest.mark.asyncio
+async def test_finish_with_traces_waits_for_deferred_trace():
+    import asyncio
+
+    from orka.cli.core import finish_with_traces
+    from orka.orchestrator.execution import trace_writer
+
+    written = []
+
+    async def run():
+        task = asyncio.ensure_future(asyncio.sleep(0.01, result=None))
+        task.add_done_callback(lambda _: written.append(True))
+        trace_writer._pending_trace_tasks.add(task)
+        task.add_done_callback(trace_writer._pending_trace_tasks.discard)
+        return "done"
+
+    assert await finish_with_traces(run()) == "done"
+    assert written == [True]
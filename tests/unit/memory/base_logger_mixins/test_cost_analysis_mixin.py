@@ -17,7 +17,7 @@ class ConcreteCostAnalysis(CostAnalysisMixin):
         self._blob_store = {}
         self._blob_threshold = 200
 
-    def _deduplicate_dict_content(self, data):
+    def _deduplicate_dict_content(self, data, blob_store=None):
         return data
 
     def save_to_file(self, file_path):
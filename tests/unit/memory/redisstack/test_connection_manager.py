@@ -243,3 +243,39 @@ class TestConnectionManagerPoolCreation:
 
         assert mgr.connection_pool == mock_pool
 
+
+    @pytest.mark.asyncio
+    async def test_async_client_pool_is_reused_within_a_loop(self, monkeypatch):
+        """get_async_client should create one asyncio pool per event loop."""
+        from orka.memory.redisstack import connection_manager as cm_mod
+        from orka.memory.redisstack.connection_manager import ConnectionManager
+
+        monkeypatch.setattr(
+            ConnectionManager, "_create_connection_pool", lambda self: _make_mock_pool()
+        )
+        async_pool = MagicMock()
+        with patch.object(
+            cm_mod.aioredis.ConnectionPool, "from_url", return_value=async_pool
+        ) as mock_from_url, patch.object(cm_mod.aioredis, "Redis") as mock_redis:
+            mgr = ConnectionManager(redis_url="redis://test:6379/0", max_connections=50)
+            mgr.get_async_client()
+            mgr.get_async_client()
+
+        mock_from_url.assert_called_once()
+        assert mock_from_url.call_args[1]["max_connections"] == 50
+        assert [c.kwargs["connection_pool"] for c in mock_redis.call_args_list] == [
+            async_pool,
+            async_pool,
+        ]
+
+    def test_async_client_requires_running_loop(self, monkeypatch):
+        """get_async_client is only usable from a coroutine."""
+        from orka.memory.redisstack.connection_manager import ConnectionManager
+
+        monkeypatch.setattr(
+            ConnectionManager, "_create_connection_pool", lambda self: _make_mock_pool()
+        )
+        mgr = ConnectionManager(redis_url="redis://test:6379/0")
+
+        with pytest.raises(RuntimeError):
+            mgr.get_async_client()
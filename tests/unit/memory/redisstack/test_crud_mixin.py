@@ -220,3 +220,99 @@ class TestMemoryCRUDMixinSafeGet:
 
         assert result == "default"
 
+
+
+def _memory_hash(content, timestamp, metadata=b"{}"):
+    return {
+        b"content": content,
+        b"node_id": b"agent_1",
+        b"trace_id": b"trace",
+        b"importance_score": b"0.5",
+        b"memory_type": b"short_term",
+        b"timestamp": timestamp,
+        b"metadata": metadata,
+    }
+
+
+class TestMemoryCRUDMixinListingIndex:
+    """Tests for the sorted-set listing index."""
+
+    def test_tail_reads_one_pipelined_page_and_prunes_missing_keys(self):
+        logger = MockCRUDLogger()
+        client = logger.mock_client
+        client.get.return_value = b"1"
+        client.zrevrange.return_value = [b"orka_memory:b", b"orka_memory:gone", b"orka_memory:a"]
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = [_memory_hash(b"newer", b"2000"), {}, _memory_hash(b"older", b"1000")]
+
+        result = logger.tail(count=2)
+
+        assert [m["content"] for m in result] == ["newer", "older"]
+        client.zrevrange.assert_called_once_with("orka_memory_idx:by_time", 0, 99)
+        client.keys.assert_not_called()
+        client.hgetall.assert_not_called()
+        pipe.zrem.assert_any_call("orka_memory_idx:by_time", b"orka_memory:gone")
+
+    def test_recent_stored_memories_use_stored_index(self):
+        logger = MockCRUDLogger()
+        client = logger.mock_client
+        client.get.return_value = b"1"
+        client.zrevrange.return_value = [b"orka_memory:a"]
+        client.pipeline.return_value.execute.return_value = [
+            _memory_hash(b"stored", b"1000", json.dumps({"log_type": "memory"}).encode()),
+        ]
+
+        result = logger.get_recent_stored_memories(count=1)
+
+        assert [m["content"] for m in result] == ["stored"]
+        client.zrevrange.assert_called_once_with("orka_memory_idx:stored", 0, 99)
+
+    def test_ensure_listing_index_backfills_existing_memories(self):
+        logger = MockCRUDLogger()
+        client = logger.mock_client
+        client.get.return_value = None
+        client.scan_iter.return_value = iter([b"orka_memory:a", b"orka_memory:b"])
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = [
+            [b"1000", json.dumps({"category": "stored"}).encode(), b"5000"],
+            [None, None, None],  # vanished between SCAN and HMGET
+        ]
+
+        assert logger.ensure_listing_index() is True
+
+        pipe.zadd.assert_any_call("orka_memory_idx:by_time", {b"orka_memory:a": 1000})
+        pipe.zadd.assert_any_call("orka_memory_idx:stored", {b"orka_memory:a": 1000})
+        pipe.zadd.assert_any_call("orka_memory_idx:by_expiry", {b"orka_memory:a": 5000})
+        assert pipe.zadd.call_count == 3
+        client.set.assert_any_call("orka_memory_idx:ready", "1")
+        client.set.assert_any_call("orka_memory_idx:reconciled", "1", ex=3600)
+
+    def test_reconcile_indexes_unindexed_writes_and_drops_dangling_members(self, monkeypatch):
+        monkeypatch.delenv("ORKA_MEMORY_INDEX_RECONCILE_INTERVAL", raising=False)
+        logger = MockCRUDLogger()
+        client = logger.mock_client
+        client.get.return_value = b"1"
+        client.set.return_value = True
+        client.scan_iter.return_value = iter([b"orka_memory:legacy"])
+        client.zscan_iter.return_value = iter([(b"orka_memory:legacy", 1000), (b"orka_memory:gone", 900)])
+        pipe = client.pipeline.return_value
+        pipe.execute.side_effect = [
+            [[b"1000", b"{}", None]],  # HMGET of the hash written without the index
+            [1],  # ZADD
+            [1, 0],  # EXISTS per index member
+            [0, 0, 0],  # ZREM per index key
+        ]
+
+        assert logger.ensure_listing_index() is True
+
+        client.set.assert_called_once_with("orka_memory_idx:reconciled", "1", ex=3600, nx=True)
+        pipe.zadd.assert_called_once_with("orka_memory_idx:by_time", {b"orka_memory:legacy": 1000})
+        pipe.zrem.assert_any_call("orka_memory_idx:by_time", b"orka_memory:gone")
+
+    def test_reconcile_skips_when_recent_pass_holds_the_marker(self):
+        logger = MockCRUDLogger()
+        client = logger.mock_client
+        client.set.return_value = None
+
+        assert logger.reconcile_listing_index() == 0
+        client.scan_iter.assert_not_called()
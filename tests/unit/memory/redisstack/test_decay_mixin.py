@@ -287,3 +287,25 @@ class TestDecayMixinCleanup:
         assert result["cleanup_type"] == "redisstack_not_ready"
         assert result["cleaned"] == 0
 
+
+    def test_cleanup_uses_expiry_index_when_ready(self):
+        """cleanup_expired_memories should only touch keys due in the expiry index."""
+        from orka.memory.redisstack.crud_mixin import MemoryCRUDMixin
+        from orka.memory.redisstack.decay_mixin import MemoryDecayMixin
+
+        class TestHost(MockDecayHost, MemoryDecayMixin, MemoryCRUDMixin):
+            pass
+
+        host = TestHost()
+        host._mock_client.get = MagicMock(return_value=b"1")
+        host._mock_client.zrangebyscore = MagicMock(return_value=[b"orka_memory:1", b"orka_memory:2"])
+        pipe = host._mock_client.pipeline.return_value
+        pipe.execute.return_value = [1, 2, 2, 2]
+
+        result = host.cleanup_expired_memories(dry_run=False)
+
+        assert result["expired_found"] == 2
+        assert result["cleaned"] == 1
+        pipe.delete.assert_called_once_with(b"orka_memory:1", b"orka_memory:2")
+        pipe.zrem.assert_any_call("orka_memory_idx:by_expiry", b"orka_memory:1", b"orka_memory:2")
+        host._mock_client.keys.assert_not_called()
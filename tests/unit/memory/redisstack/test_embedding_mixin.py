@@ -138,3 +138,57 @@ class TestEmbeddingMixinGetEmbedding:
         assert result.shape == (384,)
         assert np.all(result == 0)
 
+
+
+class TestEmbeddingMixinGetEmbeddingAsync:
+    """Tests for _get_embedding_async method."""
+
+    @pytest.mark.asyncio
+    async def test_awaits_async_encoder_inside_running_loop(self):
+        logger = MockEmbeddingLogger()
+        mock_embedder = MagicMock()
+        embedding = np.array([0.1, 0.2, 0.3])
+
+        async def mock_encode(text):
+            return embedding
+
+        mock_embedder.encode = mock_encode
+        logger.embedder = mock_embedder
+
+        result = await logger._get_embedding_async("test text")
+
+        np.testing.assert_array_almost_equal(result, embedding)
+        mock_embedder._fallback_encode.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_runs_sync_encoder_in_thread(self):
+        logger = MockEmbeddingLogger()
+        mock_embedder = MagicMock()
+        mock_embedder.encode.return_value = [1.0, 0.0]
+        logger.embedder = mock_embedder
+
+        result = await logger._get_embedding_async("test text")
+
+        assert result.dtype == np.float32
+        mock_embedder.encode.assert_called_once_with("test text")
+
+    @pytest.mark.asyncio
+    async def test_error_returns_zeros(self):
+        logger = MockEmbeddingLogger()
+        mock_embedder = MagicMock()
+        mock_embedder.embedding_dim = 8
+
+        async def mock_encode(text):
+            raise RuntimeError("boom")
+
+        mock_embedder.encode = mock_encode
+        logger.embedder = mock_embedder
+
+        result = await logger._get_embedding_async("test text")
+
+        assert result.shape == (8,)
+        assert np.all(result == 0)
+
+    @pytest.mark.asyncio
+    async def test_no_embedder_returns_none(self):
+        assert await MockEmbeddingLogger()._get_embedding_async("x") is None
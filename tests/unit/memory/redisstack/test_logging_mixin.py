@@ -213,3 +213,38 @@ class TestLoggingMixinMemoryType:
 
         assert mem_type == "short_term"
 
+
+
+class TestLoggingMixinEmbeddingPolicy:
+    """Tests for tiered embedding of orchestration logs."""
+
+    def test_tiered_mode_embeds_only_stored_memories(self):
+        logger = MockLoggingLogger()
+
+        logger.log(agent_id="agent_1", event_type="agent.end", payload={"result": "x"})
+        logger.log(agent_id="agent_1", event_type="agent.end", payload={"result": "x"}, log_type="memory")
+
+        assert [c["embed"] for c in logger.log_memory_calls] == [False, True]
+
+    def test_per_agent_overrides_win_over_mode(self):
+        logger = MockLoggingLogger()
+        logger.log_embedding_policy = {"mode": "none", "agents": {"agent_1": True}}
+
+        logger.log(agent_id="agent_1", event_type="agent.end", payload={"result": "x"})
+        logger.log(agent_id="agent_2", event_type="agent.end", payload={"result": "x"}, log_type="memory")
+        logger.log(
+            agent_id="agent_3",
+            event_type="agent.end",
+            payload={"result": "x"},
+            agent_decay_config={"embed": True},
+        )
+
+        assert [c["embed"] for c in logger.log_memory_calls] == [True, False, True]
+
+    def test_all_mode_embeds_telemetry(self):
+        logger = MockLoggingLogger()
+        logger.log_embedding_policy = {"mode": "all"}
+
+        logger.log(agent_id="agent_1", event_type="agent.end", payload={"result": "x"})
+
+        assert logger.log_memory_calls[0]["embed"] is True
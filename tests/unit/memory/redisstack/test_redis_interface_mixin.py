@@ -152,3 +152,24 @@ class TestRedisInterfaceScan:
 
         iface.mock_client.scan.assert_called_once_with(cursor=0, match=None, count=None)
 
+
+
+class TestRedisInterfaceWriteBatch:
+    """Tests for pipelined batch writes."""
+
+    def test_write_batch_uses_one_transaction(self):
+        iface = MockRedisInterface()
+        pipe = iface.mock_client.pipeline.return_value
+
+        iface.write_batch(
+            hashes={"h1": {"a": "1", "b": "2"}, "empty": {}},
+            sets={"s1": ["a", "b"]},
+            values={"k1": "v1"},
+        )
+
+        iface.mock_client.pipeline.assert_called_once_with(transaction=True)
+        pipe.hset.assert_called_once_with("h1", mapping={"a": "1", "b": "2"})
+        pipe.sadd.assert_called_once_with("s1", "a", "b")
+        pipe.set.assert_called_once_with("k1", "v1")
+        pipe.execute.assert_called_once()
+        iface.mock_client.hset.assert_not_called()
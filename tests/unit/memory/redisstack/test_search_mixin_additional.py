@@ -103,6 +103,122 @@ class TestVectorSearchFlow:
         assert 0.0 <= r["similarity_score"] <= 1.0
         assert host._ensure_index_called is False
 
+    def test_filters_are_pushed_into_the_knn_query(self, host_cls, monkeypatch):
+        host = host_cls()
+        fields = {name: "TAG" for name in ("trace_id_tag", "node_id_tag", "memory_type", "log_type", "namespace")}
+        fields["importance_score"] = "NUMERIC"
+        monkeypatch.setattr(
+            "orka.utils.bootstrap_memory_index.verify_memory_index",
+            lambda *args, **kwargs: {"exists": True, "vector_field_exists": True, "num_docs": 2, "fields": fields},
+        )
+        hit_fields = {
+            "content": "hello",
+            "node_id": "n1",
+            "trace_id": "t1",
+            "importance_score": "0.9",
+            "memory_type": "short",
+            "timestamp": "1",
+            "metadata": json.dumps({"log_type": "memory", "namespace": "ns"}),
+        }
+        calls = []
+
+        def search(**kwargs):
+            calls.append(kwargs)
+            return [{"key": f"orka_memory:{i}", "score": 0.9, "fields": hit_fields} for i in range(kwargs["num_results"])]
+
+        monkeypatch.setattr("orka.utils.bootstrap_memory_index.hybrid_vector_search", search)
+        host._mock_client.hgetall = MagicMock(side_effect=AssertionError("hits carry their fields"))
+
+        results = host.search_memories(
+            "hello", num_results=2, trace_id="t1", node_id="n1", min_importance=0.5, namespace="ns"
+        )
+
+        assert len(results) == 2
+        assert len(calls) == 1
+        assert calls[0]["num_results"] == 2
+        assert "@node_id_tag:{n1}" in calls[0]["filter_expression"]
+        assert "@importance_score:[0.5 +inf]" in calls[0]["filter_expression"]
+
+    def test_knn_window_widens_when_post_filtering_leaves_page_short(self, host_cls, monkeypatch):
+        host = host_cls()
+        monkeypatch.setattr(
+            "orka.utils.bootstrap_memory_index.verify_memory_index",
+            lambda *args, **kwargs: {"exists": True, "vector_field_exists": True, "num_docs": 50, "fields": {}},
+        )
+
+        def hit(i):
+            return {
+                "content": f"m{i}",
+                "node_id": "n1" if i % 10 == 9 else "other",
+                "metadata": json.dumps({"log_type": "memory"}),
+            }
+
+        windows = []
+
+        def search(**kwargs):
+            windows.append(kwargs["num_results"])
+            return [
+                {"key": f"orka_memory:{i}", "score": 0.5, "fields": hit(i)}
+                for i in range(min(kwargs["num_results"], 50))
+            ]
+
+        monkeypatch.setattr("orka.utils.bootstrap_memory_index.hybrid_vector_search", search)
+
+        results = host.search_memories("hello", num_results=3, node_id="n1")
+
+        assert windows == [12, 48]
+        assert [r["content"] for r in results] == ["m9", "m19", "m29"]
+
+    def test_missing_index_during_search_invalidates_cached_status(self, host_cls, monkeypatch):
+        import redis
+
+        host = host_cls()
+        host._index_mgr = MagicMock()
+        host._index_mgr.get_index_health.return_value = {"exists": True, "vector_field_exists": True, "num_docs": 1}
+
+        def search(**kwargs):
+            raise redis.ResponseError("orka_enhanced_memory: no such index")
+
+        monkeypatch.setattr("orka.utils.bootstrap_memory_index.hybrid_vector_search", search)
+        monkeypatch.setattr(host, "_fallback_text_search", lambda *args, **kwargs: [{"content": "fb"}])
+
+        assert host.search_memories("hello") == [{"content": "fb"}]
+        host._index_mgr.get_index_health.assert_called_once()
+        host._index_mgr.invalidate_index_health.assert_called_once()
+        assert host._ensure_index_called is True
+
+    @pytest.mark.asyncio
+    async def test_asearch_uses_async_client_when_index_status_is_cached(self, host_cls, monkeypatch):
+        host = host_cls()
+        host._index_mgr = MagicMock()
+        host._index_mgr.peek_index_health.return_value = {"exists": True, "vector_field_exists": True, "num_docs": 1}
+        host._expiry_info = lambda memory_data, current_time_ms, redis_ttl: {"ttl_seconds": redis_ttl}
+        host._mock_client.hgetall = MagicMock(side_effect=AssertionError("blocking client used"))
+
+        pipe = MagicMock()
+        pipe_results = [[{b"content": b"from pipeline", b"metadata": json.dumps({"log_type": "memory"}).encode()}], [30]]
+
+        async def execute(**kwargs):
+            return pipe_results.pop(0)
+
+        pipe.execute = execute
+        async_client = MagicMock()
+        async_client.pipeline.return_value = pipe
+        host._get_async_client = lambda: async_client
+
+        async def asearch(redis_client, query_vector, **kwargs):
+            assert redis_client is async_client
+            return [{"key": "orka_memory:1", "score": 0.8}]
+
+        monkeypatch.setattr("orka.utils.bootstrap_memory_index.ahybrid_vector_search", asearch)
+
+        results = await host.asearch_memories("hello", num_results=1, query_vector=np.ones(4))
+
+        assert [r["content"] for r in results] == ["from pipeline"]
+        assert results[0]["ttl_seconds"] == 30
+        pipe.hgetall.assert_called_once_with("orka_memory:1")
+        host._index_mgr.get_index_health.assert_not_called()
+
     def test_vector_search_index_missing_then_fallback(self, host_cls, monkeypatch):
         host = host_cls()
 
@@ -217,3 +217,96 @@ class TestVectorIndexManagerVerify:
         assert result["exists"] is False
         assert "error" in result
 
+
+
+HEALTHY_INDEX = {
+    "exists": True,
+    "vector_field_exists": True,
+    "content_field_exists": True,
+    "fields": {"content": "TEXT", "content_vector": "VECTOR"},
+    "num_docs": 3,
+}
+
+
+class TestVectorIndexManagerHealthCache:
+    """Tests for the cached index health used by searches."""
+
+    def test_health_is_verified_once_within_ttl(self, monkeypatch):
+        """get_index_health should serve repeated calls from the cache."""
+        from orka.memory.redisstack.vector_index_manager import VectorIndexManager
+
+        monkeypatch.setenv("ORKA_INDEX_HEALTH_TTL", "60")
+        mgr = VectorIndexManager(_make_mock_conn_mgr())
+        monkeypatch.setattr(mgr, "_start_health_refresh", lambda: None)
+        mock_verify = MagicMock(return_value=HEALTHY_INDEX)
+
+        with patch("orka.utils.bootstrap_memory_index.verify_memory_index", mock_verify):
+            for _ in range(5):
+                assert mgr.get_index_health() == HEALTHY_INDEX
+            mgr.invalidate_index_health()
+            mgr.get_index_health()
+
+        assert mock_verify.call_count == 2
+        stats = mgr.get_index_stats()
+        assert stats["cache_hits"] == 4
+        assert stats["invalidations"] == 1
+
+    def test_missing_index_is_not_cached(self, monkeypatch):
+        """A missing index should be re-checked on the next call."""
+        from orka.memory.redisstack.vector_index_manager import VectorIndexManager
+
+        mgr = VectorIndexManager(_make_mock_conn_mgr())
+        monkeypatch.setattr(mgr, "_start_health_refresh", lambda: None)
+        mock_verify = MagicMock(return_value={"exists": False, "vector_field_exists": False})
+
+        with patch("orka.utils.bootstrap_memory_index.verify_memory_index", mock_verify):
+            mgr.get_index_health()
+            mgr.get_index_health()
+
+        assert mock_verify.call_count == 2
+
+    def test_rebuild_of_missing_index_is_recorded_and_cached(self, monkeypatch):
+        """ensure_index should count a rebuild and seed the health cache."""
+        from orka.memory.redisstack.vector_index_manager import VectorIndexManager, get_index_health_stats
+
+        mgr = VectorIndexManager(_make_mock_conn_mgr())
+        monkeypatch.setattr(mgr, "_start_health_refresh", lambda: None)
+        mock_verify = MagicMock(side_effect=[{"exists": False, "fields": {}}, HEALTHY_INDEX])
+
+        with patch(
+            "orka.utils.bootstrap_memory_index.ensure_enhanced_memory_index",
+            MagicMock(return_value=True),
+        ), patch("orka.utils.bootstrap_memory_index.verify_memory_index", mock_verify):
+            assert mgr.ensure_index() is True
+            assert mgr.get_index_health() == HEALTHY_INDEX
+
+        stats = mgr.get_index_stats()
+        assert stats["rebuilds"] == 1
+        assert stats["last_rebuild_reason"] == "missing"
+        assert mock_verify.call_count == 2
+        assert get_index_health_stats()["rebuilds"] >= 1
+
+    def test_refresh_thread_does_not_keep_manager_alive(self, monkeypatch):
+        """An abandoned manager should be collected and its refresh thread should exit."""
+        import gc
+        import weakref
+
+        from orka.memory.redisstack.vector_index_manager import VectorIndexManager
+
+        monkeypatch.setenv("ORKA_INDEX_HEALTH_TTL", "60")
+        mgr = VectorIndexManager(_make_mock_conn_mgr())
+        with patch(
+            "orka.utils.bootstrap_memory_index.verify_memory_index",
+            MagicMock(return_value=HEALTHY_INDEX),
+        ):
+            mgr.get_index_health()
+        thread = mgr._refresh_thread
+        assert thread is not None and thread.is_alive()
+
+        mgr_ref = weakref.ref(mgr)
+        del mgr
+        gc.collect()
+
+        assert mgr_ref() is None
+        thread.join(timeout=5)
+        assert not thread.is_alive()
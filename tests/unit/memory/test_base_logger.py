@@ -790,6 +790,21 @@ class TestBaseMemoryLogger:
         assert "ref" in deduplicated_data["events"][0]["payload"]
         assert deduplicated_data["_metadata"]["stats"]["deduplicated_blobs"] == 0
 
+    def test_apply_deduplication_keeps_blobs_local_to_the_trace(self):
+        logger_instance = ConcreteMemoryLogger()
+        logger_instance._blob_threshold = 10
+        logger_instance._blob_store = {"live": {"x": 1}}
+        enhanced_data = {"agent_executions": [
+            {"agent_id": "test", "event_type": "write", "payload": {"data": "a" * 20}}
+        ]}
+
+        deduplicated_data = logger_instance._apply_deduplication_to_enhanced_trace(enhanced_data)
+
+        # The backend's own store is never swapped out or written to
+        assert logger_instance._blob_store == {"live": {"x": 1}}
+        assert "live" not in deduplicated_data["blob_store"]
+        assert deduplicated_data["_metadata"]["total_blobs_stored"] == 1
+
     def test_extract_cost_analysis_empty(self):
         logger_instance = ConcreteMemoryLogger()
         cost_analysis = logger_instance._extract_cost_analysis({}, [])
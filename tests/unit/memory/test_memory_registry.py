@@ -0,0 +1,142 @@
+"""Unit tests for orka.memory.registry."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from orka.memory import registry as registry_module
+from orka.memory.base_logger import BaseMemoryLogger
+from orka.memory.registry import MemoryBackendRegistry, MemoryLease, release_memory_backend
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Backend:
+    def __init__(self, **config):
+        self.config = config
+        self.memory = []
+        self._blob_store = {}
+        self.closed = 0
+
+    def close(self):
+        self.closed += 1
+
+
+class TestMemoryBackendRegistry:
+    def test_acquire_reuses_backend_for_same_config(self):
+        registry = MemoryBackendRegistry()
+        factory = MagicMock(side_effect=lambda **kw: _Backend(**kw))
+
+        first = registry.acquire(factory, redis_url="redis://a", decay_config={"enabled": True})
+        second = registry.acquire(factory, decay_config={"enabled": True}, redis_url="redis://a")
+        other = registry.acquire(factory, redis_url="redis://b", decay_config={"enabled": True})
+
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
+        stats = registry.get_stats()
+        assert stats["created"] == 2
+        assert stats["reused"] == 1
+        assert stats["active_leases"] == 3
+
+    def test_release_returns_lease_without_closing(self):
+        registry = MemoryBackendRegistry()
+        backend = registry.acquire(_Backend, redis_url="redis://a")
+        registry.acquire(_Backend, redis_url="redis://a")
+
+        assert registry.release(backend) is True
+        assert registry.release(backend) is True
+        assert backend.closed == 0
+        assert registry.is_managed(backend)
+        assert registry.get_stats()["active_leases"] == 0
+
+    def test_extra_release_does_not_hide_unbalanced_leases(self, caplog):
+        registry = MemoryBackendRegistry()
+        backend = registry.get_backend(_Backend)
+
+        assert registry.get_stats()["active_leases"] == 0
+        assert registry.release(backend) is True
+        assert "released more often" in caplog.text
+        assert registry.get_stats()["released"] == 0
+
+    def test_retain_adds_lease_for_handed_over_backend(self):
+        registry = MemoryBackendRegistry()
+        backend = registry.acquire(_Backend)
+
+        assert registry.retain(backend) is True
+        assert registry.retain(_Backend()) is False
+        assert registry.get_stats()["active_leases"] == 2
+
+    def test_close_all_closes_each_backend_once(self):
+        registry = MemoryBackendRegistry()
+        a = registry.acquire(_Backend, redis_url="redis://a")
+        b = registry.acquire(_Backend, redis_url="redis://b")
+        registry.acquire(_Backend, redis_url="redis://a")
+
+        assert registry.close_all() == 2
+        assert registry.close_all() == 0
+        assert (a.closed, b.closed) == (1, 1)
+        assert not registry.is_managed(a)
+        assert registry.get_stats()["closed"] == 2
+
+
+def test_release_memory_backend_closes_unmanaged_backends(monkeypatch):
+    registry = MemoryBackendRegistry()
+    monkeypatch.setattr(registry_module, "_registry", registry)
+
+    managed = registry.acquire(_Backend)
+    unmanaged = _Backend()
+
+    release_memory_backend(managed)
+    release_memory_backend(unmanaged)
+    release_memory_backend(None)
+
+    assert managed.closed == 0
+    assert unmanaged.closed == 1
+
+
+def test_memory_lease_pairs_one_lease_per_run(monkeypatch):
+    registry = MemoryBackendRegistry()
+    monkeypatch.setattr(registry_module, "_registry", registry)
+    managed = registry.get_backend(_Backend)
+    handed_over = _Backend()
+    owned = _Backend()
+
+    lease = MemoryLease(managed)
+    assert registry.get_stats()["active_leases"] == 1
+    lease.release()
+    lease.release()
+    assert registry.get_stats()["active_leases"] == 0
+
+    MemoryLease(handed_over, owns_backend=False).release()
+    MemoryLease(owned).release()
+    assert (managed.closed, handed_over.closed, owned.closed) == (0, 0, 1)
+
+
+def test_run_event_buffer_keeps_events_per_run():
+    from orka.memory.base_logger import run_event_buffer
+
+    class _Logger:
+        memory = BaseMemoryLogger.memory
+
+    backend = _Logger()
+    backend.memory = []
+    with run_event_buffer() as events:
+        backend.memory.append({"agent_id": "a"})
+        with run_event_buffer() as nested:
+            assert nested is events
+    assert events == [{"agent_id": "a"}]
+    assert backend.memory == []
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, True), ("true", True), ("false", False), ("0", False)],
+)
+def test_persistent_memory_enabled(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("ORKA_PERSISTENT_MEMORY", raising=False)
+    else:
+        monkeypatch.setenv("ORKA_PERSISTENT_MEMORY", value)
+
+    assert registry_module.persistent_memory_enabled() is expected
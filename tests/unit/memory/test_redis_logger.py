@@ -15,7 +15,7 @@ def test_redis_memory_logger_init_and_log(monkeypatch):
 
     from orka.memory.redis_logger import RedisMemoryLogger
 
-    logger = RedisMemoryLogger(redis_url="redis://test:6379/0")
+    logger = RedisMemoryLogger(redis_url="redis://test:6379/0", write_behind=False)
 
     # client was installed
     assert logger.client is mock_client
@@ -51,7 +51,7 @@ def test_redis_logger_initialization(mock_redis_client):
     assert logger.client is mock_redis_client
 
 def test_redis_logger_log(mock_redis_client):
-    logger = RedisMemoryLogger()
+    logger = RedisMemoryLogger(write_behind=False)
     payload = {"data": "test"}
     logger.log("agent1", "test_event", payload, step=1, run_id="run1")
     
@@ -96,7 +96,11 @@ def test_cleanup_expired_memories(mock_redis_client):
     now = datetime.now(timezone.utc)
     future_time = now + timedelta(hours=1)
     
-    mock_redis_client.keys.return_value = [b"orka:memory"]
+    mock_redis_client.scan_iter.side_effect = lambda **kwargs: iter([b"orka:memory"])
+    mock_redis_client.hget.return_value = None
+    mock_redis_client.hkeys.return_value = [b"orka:memory"]
+    mock_redis_client.zrangebyscore.return_value = []
+    mock_redis_client.zcard.return_value = 0
     mock_redis_client.xrange.return_value = [
         (b'123-0', {b'orka_expire_time': b'2000-01-01T00:00:00+00:00'}), # expired
         (b'124-0', {b'orka_expire_time': future_time.isoformat().encode()}) # not expired
@@ -104,7 +108,15 @@ def test_cleanup_expired_memories(mock_redis_client):
     
     result = logger.cleanup_expired_memories()
     
-    mock_redis_client.xdel.assert_called_once_with(b"orka:memory", b'123-0')
+    # Expired head of the stream is trimmed server-side; the survivor is scheduled
+    mock_redis_client.xtrim.assert_called_once_with("orka:memory", minid="123-1", approximate=False)
+    mock_redis_client.zadd.assert_called_once_with(
+        "orka:cleanup:schedule:orka:memory", {"124-0": future_time.timestamp()}
+    )
+    # The cursor moves past every entry read
+    mock_redis_client.hset.assert_called_once_with(
+        "orka:cleanup:watermarks", "orka:memory", '{"cursor": "124-0", "pinned": null}'
+    )
     assert result["deleted_count"] == 1
 
 def test_get_memory_stats(mock_redis_client):
@@ -124,3 +136,207 @@ def test_get_memory_stats(mock_redis_client):
     assert stats["entries_by_memory_type"]["long_term"] == 1
     assert stats["entries_by_category"]["log"] == 1
     assert stats["entries_by_category"]["stored"] == 1
+
+
+def test_redis_logger_write_behind_pipelines_entries(mock_redis_client):
+    pipe = mock_redis_client.pipeline.return_value
+    logger = RedisMemoryLogger(write_behind=True, write_behind_config={"flush_interval": 0.01})
+
+    for step in range(3):
+        logger.log("agent1", "test_event", {"data": step}, step=step, run_id="run1")
+    assert logger.flush(timeout=2.0)
+
+    # Nothing went through the blocking per-call XADD path
+    mock_redis_client.xadd.assert_not_called()
+    assert pipe.xadd.call_count == 3
+    stream_key, fields = pipe.xadd.call_args_list[0].args
+    assert stream_key == "orka:memory"
+    assert fields["payload"] == '{"data": 0}'
+    assert "previous_outputs" not in fields
+
+    stats = logger.get_write_behind_stats()
+    assert stats["written"] == 3
+    assert stats["dropped"] == 0
+    logger.close()
+
+
+def test_redis_logger_write_behind_is_opt_in(mock_redis_client, monkeypatch):
+    monkeypatch.delenv("ORKA_LOG_WRITE_BEHIND", raising=False)
+    assert RedisMemoryLogger()._stream_writer is None
+
+    monkeypatch.setenv("ORKA_LOG_WRITE_BEHIND", "true")
+    logger = RedisMemoryLogger()
+    assert logger._stream_writer is not None
+    logger.close()
+
+
+def test_redis_logger_write_behind_snapshots_on_caller_thread(mock_redis_client):
+    pipe = mock_redis_client.pipeline.return_value
+    logger = RedisMemoryLogger(write_behind=True, write_behind_config={"flush_interval": 0.5})
+
+    payload = {"blob": b"\x00", "items": [1]}
+    previous = {"a": {"x": 1}}
+    logger.log("agent1", "test_event", payload, previous_outputs=previous)
+    # Mutations after log() returns must not reach the queued entry or the trace
+    payload["items"].append(2)
+    previous["a"]["x"] = 2
+    assert logger.flush(timeout=2.0)
+
+    fields = pipe.xadd.call_args.args[1]
+    assert '"__type": "bytes"' in fields["payload"]
+    assert '"items": [1]' in fields["payload"]
+    assert fields["previous_outputs"] == '{"a": {"x": 1}}'
+    assert logger.memory[-1]["payload"]["blob"]["__type"] == "bytes"
+    assert logger.memory[-1]["previous_outputs"] == {"a": {"x": 1}}
+    logger.close()
+
+
+def test_write_behind_writer_drops_when_queue_is_full():
+    from orka.memory.stream_writer import WriteBehindStreamWriter
+
+    client = MagicMock()
+    writer = WriteBehindStreamWriter(client, max_queue_size=1)
+    # Pretend the flusher is busy so the queue cannot drain
+    writer._thread = MagicMock()
+    writer._queue.put_nowait(("s", {}, ()))
+
+    assert writer.submit("s", {"a": "1"}) is False
+    stats = writer.get_stats()
+    assert stats["overflows"] == 1
+    assert stats["dropped"] == 1
+
+
+def test_write_behind_close_flushes_pending_entries():
+    from orka.memory.stream_writer import WriteBehindStreamWriter
+
+    client = MagicMock()
+    writer = WriteBehindStreamWriter(client, flush_interval=0.5)
+    writer.submit("s", {"payload": {"x": 1}}, ("payload",))
+    writer.close()
+
+    client.pipeline.return_value.xadd.assert_called_once_with("s", {"payload": '{"x": 1}'})
+    assert writer.submit("s", {}) is False
+
+
+
+def _cleanup_client(mock_redis_client, state=None, due=()):
+    import json
+
+    mock_redis_client.scan_iter.side_effect = lambda **kwargs: iter([b"orka:memory"])
+    mock_redis_client.hget.return_value = json.dumps(state).encode() if state else None
+    mock_redis_client.hkeys.return_value = [b"orka:memory"]
+    mock_redis_client.zrangebyscore.return_value = list(due)
+    mock_redis_client.zcard.return_value = 0
+    return mock_redis_client.pipeline.return_value
+
+
+def test_cleanup_reads_only_entries_after_the_cursor(mock_redis_client):
+    import json
+
+    _cleanup_client(mock_redis_client, state={"cursor": "5-0", "pinned": "2-0"})
+    live = datetime.now(timezone.utc) + timedelta(hours=1)
+    mock_redis_client.xrange.return_value = [
+        (b"6-0", {b"orka_expire_time": b"2000-01-01T00:00:00+00:00"}),
+        (b"7-0", {b"orka_expire_time": live.isoformat().encode()}),
+        (b"8-0", {b"orka_expire_time": b"2000-01-01T00:00:00+00:00"}),
+    ]
+    logger = RedisMemoryLogger(decay_config={"enabled": True, "cleanup_batch_size": 10})
+
+    result = logger.cleanup_expired_memories()
+
+    # Only entries after the cursor are read, in bounded chunks
+    mock_redis_client.xrange.assert_called_once_with("orka:memory", min="5-1", max="+", count=10)
+    # A never-expiring entry precedes them, so nothing is trimmed
+    mock_redis_client.xtrim.assert_not_called()
+    mock_redis_client.xdel.assert_called_once_with("orka:memory", "6-0", "8-0")
+    # The live entry is scheduled by expire time and the cursor moves past it
+    mock_redis_client.zadd.assert_called_once_with("orka:cleanup:schedule:orka:memory", {"7-0": live.timestamp()})
+    state = json.loads(mock_redis_client.hset.call_args.args[2])
+    assert state == {"cursor": "8-0", "pinned": "2-0"}
+    assert result["deleted_count"] == 2
+    assert result["total_entries_checked"] == 3
+
+
+def test_cleanup_deletes_due_scheduled_entries(mock_redis_client):
+    _cleanup_client(mock_redis_client, state={"cursor": "9-0", "pinned": None}, due=[(b"3-0", 946684800.0)])
+    mock_redis_client.xrange.return_value = []
+    logger = RedisMemoryLogger(decay_config={"enabled": True})
+
+    result = logger.cleanup_expired_memories()
+
+    mock_redis_client.xdel.assert_called_once_with("orka:memory", "3-0")
+    mock_redis_client.zrem.assert_called_once_with("orka:cleanup:schedule:orka:memory", "3-0")
+    assert result["deleted_entries"] == [
+        {"stream": "orka:memory", "entry_id": "3-0", "expire_time": "2000-01-01T00:00:00+00:00"}
+    ]
+    # Nothing new was read, so the state is left as is
+    mock_redis_client.hset.assert_not_called()
+
+
+def test_cleanup_trims_new_head_once_schedule_is_empty(mock_redis_client):
+    _cleanup_client(mock_redis_client, state={"cursor": "5-0", "pinned": None})
+    mock_redis_client.xrange.return_value = [
+        (b"6-0", {b"orka_expire_time": b"2000-01-01T00:00:00+00:00"}),
+    ]
+    logger = RedisMemoryLogger(decay_config={"enabled": True})
+
+    logger.cleanup_expired_memories()
+
+    mock_redis_client.xtrim.assert_called_once_with("orka:memory", minid="6-1", approximate=False)
+
+    # A surviving scheduled entry keeps the head out of XTRIM range
+    mock_redis_client.reset_mock()
+    _cleanup_client(mock_redis_client, state={"cursor": "5-0", "pinned": None})
+    mock_redis_client.zcard.return_value = 1
+    logger.cleanup_expired_memories()
+
+    mock_redis_client.xtrim.assert_not_called()
+    mock_redis_client.xdel.assert_called_once_with("orka:memory", "6-0")
+
+
+def test_cleanup_drops_watermarks_of_vanished_streams(mock_redis_client):
+    pipe = _cleanup_client(mock_redis_client)
+    mock_redis_client.xrange.return_value = []
+    mock_redis_client.hkeys.return_value = [b"orka:memory", b"orka:memory:old:s", b"other:stream"]
+    pipe.execute.return_value = [0, 1]
+    logger = RedisMemoryLogger(decay_config={"enabled": True})
+
+    logger.cleanup_expired_memories()
+
+    pipe.exists.assert_any_call("orka:memory:old:s")
+    mock_redis_client.hdel.assert_called_once_with("orka:cleanup:watermarks", "orka:memory:old:s")
+    mock_redis_client.delete.assert_called_once_with("orka:cleanup:schedule:orka:memory:old:s")
+
+
+def test_cleanup_falls_back_to_xdel_without_xtrim_minid(mock_redis_client):
+    import redis
+
+    _cleanup_client(mock_redis_client)
+    mock_redis_client.xrange.return_value = [
+        (b"1-0", {b"orka_expire_time": b"2000-01-01T00:00:00+00:00"}),
+    ]
+    mock_redis_client.xtrim.side_effect = redis.ResponseError("syntax error")
+    logger = RedisMemoryLogger(decay_config={"enabled": True})
+
+    result = logger.cleanup_expired_memories()
+
+    mock_redis_client.xdel.assert_called_once_with("orka:memory", "1-0")
+    assert result["deleted_count"] == 1
+    assert result["trimmed_count"] == 0
+
+
+def test_cleanup_dry_run_does_not_delete_or_move_watermark(mock_redis_client):
+    _cleanup_client(mock_redis_client)
+    mock_redis_client.xrange.return_value = [
+        (b"1-0", {b"orka_expire_time": b"2000-01-01T00:00:00+00:00"}),
+    ]
+    logger = RedisMemoryLogger(decay_config={"enabled": True})
+
+    result = logger.cleanup_expired_memories(dry_run=True)
+
+    assert result["deleted_count"] == 1
+    mock_redis_client.xtrim.assert_not_called()
+    mock_redis_client.xdel.assert_not_called()
+    mock_redis_client.zadd.assert_not_called()
+    mock_redis_client.hset.assert_not_called()
+    mock_redis_client.hdel.assert_not_called()
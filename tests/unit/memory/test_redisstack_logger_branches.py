@@ -183,3 +183,26 @@ def test_close_and_del(monkeypatch):
     monkeypatch.setattr(logger, "cleanup_connections", lambda: closed.__setitem__("cleanup", True))
     logger.__del__()
     assert closed["cleanup"] is True
+
+
+def test_log_memory_without_embedding_stores_plain_hash(monkeypatch):
+    logger = make_logger(monkeypatch)
+    client = MagicMock()
+    monkeypatch.setattr(logger, "_get_thread_safe_client", lambda: client)
+    logger.embedder = object()
+    embed_calls = []
+    monkeypatch.setattr(logger, "_get_embedding_sync", lambda c: embed_calls.append(c))
+
+    logger.log_memory("telemetry", node_id="n", trace_id="t", embed=False)
+
+    assert embed_calls == []
+    assert "content_vector" not in client.hset.call_args.kwargs["mapping"]
+
+
+def test_unknown_log_embedding_mode_falls_back_to_tiered(monkeypatch):
+    import orka.memory.redisstack_logger as rs_mod
+
+    monkeypatch.setattr(rs_mod.ConnectionPool, "from_url", lambda *a, **k: MagicMock())
+    logger = RedisStackMemoryLogger(redis_url="redis://fake:6379/0", log_embedding={"mode": "sometimes"})
+
+    assert logger.log_embedding_policy == {"mode": "tiered", "agents": {}}
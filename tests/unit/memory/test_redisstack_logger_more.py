@@ -190,3 +190,82 @@ def test_log_memory_and_delete(monkeypatch):
     logger.clear_all_memories()
     # since our mock delete returns 1, ensure the underlying client.delete was invoked
     assert mock_client.delete.called
+
+
+@pytest.mark.asyncio
+async def test_alog_memory_uses_real_embedding_inside_event_loop(monkeypatch):
+    import numpy as np
+
+    import orka.memory.redisstack_logger as rs_mod
+    from orka.memory.redisstack_logger import RedisStackMemoryLogger
+
+    monkeypatch.setattr(rs_mod.ConnectionPool, "from_url", lambda *a, **k: object())
+    mock_client = make_mock_client()
+    monkeypatch.setattr(rs_mod.redis, "Redis", lambda *a, **k: mock_client)
+
+    import orka.utils.bootstrap_memory_index as bm
+    monkeypatch.setattr(bm, "ensure_enhanced_memory_index", lambda *a, **k: True)
+
+    real_vector = np.ones(4, dtype=np.float32)
+    embedder = MagicMock(embedding_dim=4)
+
+    async def encode(text):
+        return real_vector
+
+    embedder.encode = encode
+    embedder._fallback_encode.return_value = np.zeros(4, dtype=np.float32)
+
+    logger = RedisStackMemoryLogger(redis_url="redis://test:6379/0", embedder=embedder)
+
+    pipe = MagicMock()
+
+    async def execute():
+        return []
+
+    pipe.execute = execute
+    async_client = MagicMock()
+    async_client.pipeline.return_value = pipe
+    monkeypatch.setattr(RedisStackMemoryLogger, "_get_async_client", lambda self: async_client)
+
+    key = await logger.alog_memory(
+        "content", "node1", "trace1", metadata={"log_type": "memory"}, expiry_hours=1
+    )
+
+    assert key.startswith("orka_memory:")
+    stored = pipe.hset.call_args.kwargs["mapping"]
+    assert stored["content_vector"] == real_vector.tobytes()
+    assert stored["log_type"] == "memory"
+    pipe.expire.assert_called_once()
+    # The write never touches the blocking client
+    mock_client.hset.assert_not_called()
+    embedder._fallback_encode.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_asearch_memories_embeds_query_before_searching(monkeypatch):
+    import numpy as np
+
+    from orka.memory.redisstack_logger import RedisStackMemoryLogger
+
+    logger = RedisStackMemoryLogger(redis_url="redis://test:6379/0", embedder=None)
+    logger.embedder = MagicMock(embedding_dim=3)
+    query_vector = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+
+    async def encode(text):
+        return query_vector
+
+    logger.embedder.encode = encode
+    captured = {}
+
+    def fake_search(*args):
+        captured["args"] = args
+        return [{"content": "hit"}]
+
+    monkeypatch.setattr(logger, "search_memories", fake_search)
+
+    results = await logger.asearch_memories("find me", num_results=3, namespace="ns")
+
+    assert results == [{"content": "hit"}]
+    assert captured["args"][1] == 3
+    assert captured["args"][7] == "ns"
+    np.testing.assert_array_equal(captured["args"][8], query_vector)
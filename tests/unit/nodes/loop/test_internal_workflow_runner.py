@@ -0,0 +1,69 @@
+from typing import Any
+
+import pytest
+
+from orka.nodes.loop.internal_workflow_runner import (
+    CompiledSubWorkflow,
+    InternalWorkflowRunContext,
+    compile_internal_workflow_config,
+)
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_auto_mock]
+
+
+class _FakeOrchestrator:
+    instances: list["_FakeOrchestrator"] = []
+
+    def __init__(self, config: Any, memory: Any = None, shared_agents: Any = None):
+        self.config = config
+        self.memory = memory
+        self.shared_agents = shared_agents
+        self.render_template = lambda *args, **kwargs: ""  # noqa: E731
+        self.inputs: list[Any] = []
+        self.run_contexts: list[Any] = []
+        _FakeOrchestrator.instances.append(self)
+
+    async def run(self, workflow_input: Any, return_logs: bool = True, run_context: Any = None):
+        self.inputs.append(workflow_input)
+        self.run_contexts.append(run_context)
+        return [{"agent_id": "a", "payload": {"result": workflow_input["loop_number"]}}]
+
+
+@pytest.mark.asyncio
+async def test_compiled_sub_workflow_builds_once_and_isolates_run_state(monkeypatch):
+    import orka.orchestrator as orchestrator_module
+
+    _FakeOrchestrator.instances = []
+    monkeypatch.setattr(orchestrator_module, "Orchestrator", _FakeOrchestrator)
+
+    shared = {"parent_agent": object()}
+    compiled = CompiledSubWorkflow({"orchestrator": {}, "agents": []}, shared_agents=shared)
+
+    for loop_number in (1, 2, 3):
+        logs = await compiled.run({"loop_number": loop_number})
+        assert logs[0]["payload"]["result"] == loop_number
+
+    assert len(_FakeOrchestrator.instances) == 1
+    orchestrator = _FakeOrchestrator.instances[0]
+    assert orchestrator.shared_agents is shared
+    assert len({id(context) for context in orchestrator.run_contexts}) == 3
+    assert compiled.stats["built"] == 1
+    assert compiled.stats["runs"] == 3
+    assert compiled.stats["reused"] == 2
+
+
+def test_compile_does_not_mutate_internal_workflow():
+    internal = {"agents": [{"id": "inner", "type": "openai-answer"}]}
+    ctx = InternalWorkflowRunContext(
+        node_id="loop",
+        internal_workflow=internal,
+        past_loops_metadata_templates={},
+        scoring_context="",
+        parent_agents=[{"id": "outer", "type": "openai-answer"}],
+    )
+
+    config = compile_internal_workflow_config(ctx)
+
+    assert [a["id"] for a in config["agents"]] == ["inner", "outer"]
+    assert [a["id"] for a in internal["agents"]] == ["inner"]
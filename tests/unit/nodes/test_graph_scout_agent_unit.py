@@ -175,3 +175,14 @@ def test_build_trace_dict_structure():
     )
     assert trace["decision"]["type"] == "commit_next"
     assert trace["scoring"]["scored_candidates"] == 1
+
+
+def test_brain_is_reused_across_decisions(monkeypatch):
+    monkeypatch.setattr("orka.brain.embedding.default_brain_embedder", lambda: None)
+    a = GraphScoutAgent("gs", prompt="", queue=[])
+    memory, other_memory = object(), object()
+
+    brain = a._ensure_brain(memory)
+
+    assert a._ensure_brain(memory) is brain
+    assert a._ensure_brain(other_memory) is not brain
@@ -908,3 +908,32 @@ class TestJoinNode:
         assert result["status"] == "waiting"
         assert "agent2" in result["pending"]
 
+
+    @pytest.mark.asyncio
+    async def test_run_impl_completes_from_in_process_registry(self):
+        """A fork tracked in-process is merged without polling Redis."""
+        from orka.fork_group_manager import get_fork_completion_registry
+
+        registry = get_fork_completion_registry()
+        registry.open("inproc_group_1", ["agent1", "agent2"], run_id="run_1", node_id="inproc_fork")
+        registry.record("inproc_group_1", "agent1", {"response": "r1", "fork_group": "inproc_group_1"})
+        registry.record("inproc_group_1", "agent2", {"result": "r2", "fork_group": "inproc_group_1"})
+
+        mock_memory = Mock()
+        node = JoinNode(
+            node_id="join_node",
+            prompt="Test",
+            queue=[],
+            memory_logger=mock_memory,
+            group="inproc_fork",
+        )
+
+        result = await node._run_impl({"run_id": "run_1"})
+
+        assert result["status"] == "done"
+        assert result["merged"]["agent1"]["response"] == "r1"
+        assert result["merged"]["agent2"] == "r2"
+        mock_memory.hget.assert_not_called()
+        mock_memory.hkeys.assert_not_called()
+        mock_memory.scan.assert_not_called()
+        assert not registry.tracks("inproc_group_1")
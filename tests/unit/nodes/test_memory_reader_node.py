@@ -1071,3 +1071,40 @@ class TestMemoryReaderNode:
         # Should not have duplicates
         assert len(variations) == len(set(variations))
 
+
+    @pytest.mark.asyncio
+    async def test_fallback_terms_are_searched_concurrently(self):
+        """Fallback key terms run in parallel and the first non-empty result wins."""
+        import asyncio
+
+        started = []
+        release = asyncio.Event()
+
+        async def asearch_memories(query, **kwargs):
+            started.append(query)
+            if query == "quantum":
+                # Only answers once every term search is in flight
+                await release.wait()
+                return [{"content": "quantum memory", "metadata": {"log_type": "memory"}}]
+            if len(started) == 3:
+                release.set()
+            if query == "physics":
+                await asyncio.sleep(10)
+            return []
+
+        mock_memory = Mock()
+        mock_memory.asearch_memories = asearch_memories
+        node = MemoryReaderNode(
+            node_id="memory_reader",
+            prompt="Test",
+            queue=[],
+            memory_logger=mock_memory,
+        )
+
+        memories = await asyncio.wait_for(
+            node._fallback_key_term_search("quantum entanglement physics", {}), timeout=5
+        )
+
+        assert sorted(started) == ["entanglement", "physics", "quantum"]
+        assert memories == [{"content": "quantum memory", "metadata": {"log_type": "memory"}}]
+        mock_memory.search_memories.assert_not_called()
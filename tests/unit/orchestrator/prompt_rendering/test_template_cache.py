@@ -0,0 +1,79 @@
+# OrKa: Orchestrator Kit Agents
+# Copyright © 2025 Marco Somma
+#
+# This file is part of OrKa – https://github.com/marcosomma/orka-reasoning
+
+"""Tests for the compiled template cache."""
+
+import pytest
+
+from orka.orchestrator.prompt_rendering.template_cache import (
+    CompiledTemplateCache,
+    get_template_cache,
+)
+from orka.orchestrator.simplified_prompt_rendering import SimplifiedPromptRenderer
+
+
+class TestCompiledTemplateCache:
+    """Tests for CompiledTemplateCache."""
+
+    def test_compiles_once_per_source(self):
+        """Test repeated lookups return the same compiled template."""
+        cache = CompiledTemplateCache(max_size=4)
+        first = cache.get_template("Hello {{ name }}")
+        second = cache.get_template("Hello {{ name }}")
+        assert first is second
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        """Test the least recently used template is evicted."""
+        cache = CompiledTemplateCache(max_size=2)
+        cache.get_template("a")
+        cache.get_template("b")
+        cache.get_template("a")
+        cache.get_template("c")
+        stats = cache.get_stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        cache.get_template("a")
+        assert cache.get_stats()["hits"] == 2
+
+    def test_syntax_error_not_cached(self):
+        """Test templates that fail to compile are not stored."""
+        from jinja2 import TemplateSyntaxError
+
+        cache = CompiledTemplateCache()
+        with pytest.raises(TemplateSyntaxError):
+            cache.get_template("{% if %}")
+        assert cache.get_stats()["size"] == 0
+
+    def test_static_globals_and_context_shadowing(self):
+        """Test static globals are available and render context shadows them."""
+        cache = CompiledTemplateCache()
+        template = cache.get_template("{{ safe_str(value) }}|{{ value | tojson }}")
+        assert template.render({"value": None}) == "|null"
+        shadowed = cache.get_template("{{ safe_str(1) }}")
+        assert shadowed.render({"safe_str": lambda v: "custom"}) == "custom"
+
+
+class TestRendererUsesCache:
+    """Tests for SimplifiedPromptRenderer integration."""
+
+    def test_render_hits_shared_cache(self):
+        """Test rendering the same prompt twice reuses the compiled template."""
+        renderer = SimplifiedPromptRenderer()
+        template = "Question: {{ input }} (cache test)"
+        before = get_template_cache().get_stats()["hits"]
+        assert renderer.render_prompt(template, {"input": "one"}) == "Question: one (cache test)"
+        assert renderer.render_prompt(template, {"input": "two"}) == "Question: two (cache test)"
+        assert SimplifiedPromptRenderer.get_template_cache_stats()["hits"] >= before + 1
+
+    def test_helpers_bound_per_render(self):
+        """Test payload-bound helpers see the payload of the current render."""
+        renderer = SimplifiedPromptRenderer()
+        template = "{{ get_input() }}"
+        assert renderer.render_prompt(template, {"input": "first"}) == "first"
+        assert renderer.render_prompt(template, {"input": "second"}) == "second"
@@ -63,3 +63,123 @@ def test_agent_runner_event_loop():
     # Use asyncio.run which creates and manages its own event loop to avoid
     # interacting with test-suite event loop lifecycle.
     asyncio.run(_run_all())
+
+
+class CountingOrch(DummyOrch):
+    def __init__(self):
+        super().__init__()
+        self.renders = 0
+
+    def render_template(self, prompt, payload):
+        ar.count_template_render()
+        self.renders += 1
+        return f"rendered:{prompt}"
+
+
+class PromptAgent:
+    prompt = "Hello {{ input }}"
+
+    def run(self, payload):
+        return {"formatted_prompt": payload.get("formatted_prompt")}
+
+
+def test_prepared_invocation_renders_prompt_once():
+    orch = CountingOrch()
+    orch.agents["p"] = PromptAgent()
+    runner = AgentRunner(orch)
+
+    prepared = runner.prepare_invocation("p", "x", {})
+    assert prepared.formatted_prompt == "rendered:Hello {{ input }}"
+
+    _, res = asyncio.run(runner.run_agent_async("p", "x", {}, prepared=prepared))
+    assert res["formatted_prompt"] == "rendered:Hello {{ input }}"
+    assert orch.renders == 1
+    diagnostics = runner.take_invocation("p").diagnostics()
+    assert diagnostics["render_count"] == 1
+    assert diagnostics["template_error"] is None
+    assert runner.take_invocation("p") is None
+
+    # Without a prepared invocation the runner prepares one itself
+    asyncio.run(runner.run_agent_async("p", "x", {}))
+    assert orch.renders == 2
+
+
+class RerenderingAgent(PromptAgent):
+    def __init__(self, orch):
+        self.orch = orch
+
+    def run(self, payload):
+        return {"formatted_prompt": self.orch.render_template(self.prompt, payload)}
+
+
+def test_render_count_includes_renders_made_during_the_step():
+    orch = CountingOrch()
+    orch.agents["p"] = RerenderingAgent(orch)
+    runner = AgentRunner(orch)
+
+    asyncio.run(runner.run_agent_async("p", "x", {}))
+
+    assert runner.take_invocation("p").render_count == 2
+    # Renders outside of a step are not attributed to any invocation
+    orch.render_template("Hello", {})
+    assert orch.renders == 3
+
+
+def test_invocations_are_kept_per_run():
+    from orka.orchestrator.run_context import RunContext, run_scope
+
+    orch = CountingOrch()
+    orch.agents["p"] = PromptAgent()
+    runner = AgentRunner(orch)
+    first, second = RunContext(), RunContext()
+
+    async def run_in(context, text):
+        with run_scope(orch, context):
+            await runner.run_agent_async("p", text, {})
+
+    async def run_both():
+        await asyncio.gather(run_in(first, "a"), run_in(second, "b"))
+
+    asyncio.run(run_both())
+
+    assert first.invocations["p"].payload["input"] == "a"
+    assert second.invocations["p"].payload["input"] == "b"
+    assert runner.take_invocation("p") is None
+
+
+def test_call_spec_is_cached_and_sync_agents_use_shared_executor():
+    orch = DummyOrch()
+    agent = SyncAgent()
+    orch.agents["sync"] = agent
+    runner = AgentRunner(orch)
+
+    spec = ar.resolve_call_spec(agent, max_concurrency=1)
+    assert spec.is_async is False
+    assert spec.needs_orchestrator is False
+    assert ar.get_call_spec(agent) is spec
+
+    executor = ar.get_sync_agent_executor()
+    before = executor.get_stats()["completed"]
+
+    async def run_two():
+        return await asyncio.gather(
+            runner.run_agent_async("sync", {"x": 1}, {}),
+            runner.run_agent_async("sync", {"x": 2}, {}),
+        )
+
+    results = asyncio.run(run_two())
+    assert [aid for aid, _ in results] == ["sync", "sync"]
+    stats = executor.get_stats()
+    assert stats["completed"] == before + 2
+    assert stats["queued"] == 0 and stats["active"] == 0
+
+
+def test_call_spec_re_resolved_when_run_replaced():
+    agent = SyncAgent()
+    ar.resolve_call_spec(agent)
+
+    async def new_run(payload):
+        return payload
+
+    agent.run = new_run
+    assert ar.get_call_spec(agent).is_async is True
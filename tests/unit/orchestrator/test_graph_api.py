@@ -90,6 +90,49 @@ class TestGraphState:
         assert len(state.edges) == 1
         assert state.current_node == "node1"
 
+    def test_graph_state_index(self):
+        """Test GraphState adjacency and node-type index."""
+        nodes = {
+            node_id: NodeDescriptor(
+                id=node_id,
+                type=node_type,
+                prompt_summary="Test",
+                capabilities=[],
+                contract={},
+                cost_model={},
+                safety_tags=[],
+                metadata=metadata,
+            )
+            for node_id, node_type, metadata in [
+                ("node1", "LocalLLMAgent", {}),
+                ("node2", "LocalLLMAgent", {}),
+                ("join1", "JoinNode", {"type": "join"}),
+            ]
+        }
+        edges = [
+            EdgeDescriptor(src="node1", dst="join1"),
+            EdgeDescriptor(src="node2", dst="join1"),
+            EdgeDescriptor(src="node1", dst="node2"),
+        ]
+        state = GraphState(
+            nodes=nodes,
+            edges=edges,
+            current_node="node1",
+            visited_nodes=set(),
+            runtime_state={},
+            budgets={},
+            constraints={},
+        )
+
+        index = state.index
+        assert index.successors("node1") == ["join1", "node2"]
+        assert index.predecessors("join1") == ["node1", "node2"]
+        assert index.edges_between("node1", "node2") == [edges[2]]
+        assert index.edges_between("node2", "node1") == []
+        assert index.nodes_by_type["LocalLLMAgent"] == ["node1", "node2"]
+        assert index.join_nodes == {"join1"}
+        assert state.index is index
+
 
 class TestGraphAPI:
     """Test suite for GraphAPI class."""
@@ -128,6 +171,62 @@ class TestGraphAPI:
         assert isinstance(state, GraphState)
         assert "agent1" in state.nodes
 
+    def create_static_orchestrator(self):
+        """Helper to create an orchestrator with a fixed workflow."""
+        orchestrator = Mock()
+        orchestrator.agents = {
+            "agent1": Mock(type="local_llm", prompt="First"),
+            "agent2": Mock(type="local_llm", prompt="Second"),
+        }
+        orchestrator.orchestrator_cfg = {"agents": ["agent1", "agent2"]}
+        orchestrator.step_index = 0
+        orchestrator.queue = ["agent1"]
+        orchestrator.previous_outputs = {}
+        orchestrator.execution_history = []
+        orchestrator.memory = None
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_get_graph_state_reuses_static_layer(self):
+        """Nodes, edges and index are built once; the dynamic overlay is per call."""
+        api = GraphAPI()
+        orchestrator = self.create_static_orchestrator()
+
+        first = await api.get_graph_state(orchestrator, "run1")
+        orchestrator.queue = ["agent2"]
+        orchestrator.previous_outputs = {"agent1": {}}
+        second = await api.get_graph_state(orchestrator, "run1")
+
+        assert second.nodes is first.nodes
+        assert second.edges is first.edges
+        assert second.index is first.index
+        assert second.current_node == "agent2"
+        assert second.visited_nodes == {"agent1"}
+        assert api.stats["static_builds"] == 1
+        assert api.stats["static_hits"] == 1
+        with pytest.raises(TypeError):
+            second.nodes["agent3"] = first.nodes["agent1"]
+
+    @pytest.mark.asyncio
+    async def test_static_layer_rebuilds_when_workflow_changes(self):
+        """A changed agent set or an explicit invalidation rebuilds the static layer."""
+        api = GraphAPI()
+        orchestrator = self.create_static_orchestrator()
+
+        first = await api.get_static_layer(orchestrator)
+        orchestrator.agents["agent3"] = Mock(type="local_llm", prompt="Third")
+        orchestrator.orchestrator_cfg["agents"].append("agent3")
+        second = await api.get_static_layer(orchestrator)
+
+        assert second is not first
+        assert "agent3" in second.nodes
+        assert second.index.successors("agent2") == ["agent3"]
+
+        api.invalidate(orchestrator)
+        third = await api.get_static_layer(orchestrator)
+        assert third is not second
+        assert api.stats["static_builds"] == 3
+
     @pytest.mark.asyncio
     async def test_extract_nodes(self):
         """Test _extract_nodes method."""
@@ -456,4 +456,70 @@ class TestSemanticSimilarity:
 
         # Should return None when no embedder
         # (actual behavior depends on embedder availability)
-        assert result is None or isinstance(result, float)
\ No newline at end of file
+        assert result is None or isinstance(result, float)
+    def create_fake_embedder(self):
+        """Helper to create a deterministic embedder that counts its calls."""
+        import numpy as np
+
+        vectors = {
+            "search agent": [1.0, 0.0, 0.0],
+            "analysis agent": [0.0, 1.0, 0.0],
+            "writer": [0.6, 0.8, 0.0],
+            "find it": [1.0, 0.0, 0.0],
+        }
+        embedder = Mock()
+        embedder.embed = Mock(side_effect=lambda text: np.asarray(vectors[text]))
+        embedder.embed_batch = Mock(
+            side_effect=lambda texts: np.asarray([vectors[text] for text in texts])
+        )
+        return embedder
+
+    @pytest.mark.asyncio
+    async def test_semantic_scores_use_precomputed_node_matrix(self):
+        """Node descriptions are embedded once per workflow, the question once per round."""
+        scorer = PathScorer(self.create_mock_config())
+        embedder = self.create_fake_embedder()
+        orchestrator = Mock()
+        orchestrator.agents = {"search_agent": Mock(), "analysis_agent": Mock(), "writer": Mock()}
+        context = {"orchestrator": orchestrator}
+
+        with patch("orka.utils.embedder.get_embedder", return_value=embedder):
+            for _ in range(2):
+                candidates = [
+                    {"node_id": "search_agent", "path": ["search_agent"]},
+                    {"node_id": "analysis_agent", "path": ["analysis_agent"]},
+                ]
+                similarities = scorer._compute_semantic_similarities(
+                    candidates, "find it", context
+                )
+                await scorer.score_candidates(candidates, "find it", context)
+
+            single = scorer._compute_semantic_similarity("writer", "find it")
+
+        assert embedder.embed_batch.call_count == 1
+        assert similarities == {"search_agent": 1.0, "analysis_agent": 0.5}
+        assert single == pytest.approx(0.8)
+
+    def test_candidates_outside_the_workflow_are_embedded_alone(self):
+        """Unknown candidates don't re-embed the workflow or add cache entries."""
+        scorer = PathScorer(self.create_mock_config())
+        embedder = self.create_fake_embedder()
+        orchestrator = Mock()
+        orchestrator.agents = {"search_agent": Mock(), "analysis_agent": Mock()}
+        context = {"orchestrator": orchestrator}
+
+        with patch("orka.utils.embedder.get_embedder", return_value=embedder):
+            scorer._compute_semantic_similarities(
+                [{"node_id": "search_agent"}], "find it", context
+            )
+            similarities = scorer._compute_semantic_similarities(
+                [{"node_id": "search_agent"}, {"node_id": "writer"}], "find it", context
+            )
+
+        assert [call.args[0] for call in embedder.embed_batch.call_args_list] == [
+            ["search agent", "analysis agent"],
+            ["writer"],
+        ]
+        assert list(scorer._node_embeddings) == [("search_agent", "analysis_agent")]
+        assert similarities["search_agent"] == 1.0
+        assert similarities["writer"] == pytest.approx(0.8)
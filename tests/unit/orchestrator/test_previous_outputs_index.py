@@ -0,0 +1,84 @@
+# Tests for PreviousOutputsIndex
+
+from types import SimpleNamespace
+
+import pytest
+
+from orka.orchestrator.execution.previous_outputs import PreviousOutputsIndex, previous_outputs_for
+from orka.orchestrator.metrics import MetricsCollector
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def _logs():
+    return [
+        {"agent_id": "a1", "payload": {"result": "plain"}},
+        {"agent_id": "join", "payload": {"result": {"merged": {"k": "v"}}}},
+        {"agent_id": "llm", "payload": {"response": "hello", "confidence": "0.9"}},
+        {"agent_id": "mem", "payload": {"memories": ["m1"], "query": "q"}},
+    ]
+
+
+def test_index_matches_full_rebuild_while_logs_grow():
+    logs = []
+    index = PreviousOutputsIndex()
+    for entry in _logs():
+        logs.append(entry)
+        assert index.view(logs, -1) == MetricsCollector.build_previous_outputs(logs[:-1])
+        assert index.view(logs) == MetricsCollector.build_previous_outputs(logs)
+
+    # Each entry is folded exactly once
+    assert index.stats["folded"] == len(logs)
+
+
+def test_index_snapshots_are_copy_on_write():
+    logs = _logs()[:1]
+    index = PreviousOutputsIndex()
+
+    first = index.view(logs)
+    assert index.view(logs) is first  # no new entries, same snapshot
+
+    logs.append({"agent_id": "a2", "payload": {"result": "second"}})
+    second = index.view(logs)
+
+    assert second is not first
+    assert "a2" not in first
+    assert second["a2"] == "second"
+    assert index.stats["copies"] == 1
+
+
+def test_index_folds_lazily_so_late_payload_updates_are_seen():
+    logs = [{"agent_id": "a1", "payload": {"result": "x"}}]
+    index = PreviousOutputsIndex()
+    index.view(logs)
+
+    entry = {"agent_id": "mem", "payload": {"memories": []}}
+    logs.append(entry)
+    # Memory logging looks at everything but the current entry
+    assert "mem" not in index.view(logs, -1)
+
+    # The response processor completes the payload after appending it
+    entry["payload"]["response"] = ""
+    assert index.view(logs) == MetricsCollector.build_previous_outputs(logs)
+
+
+def test_index_rebuilds_for_a_different_log_list():
+    index = PreviousOutputsIndex()
+    index.view(_logs())
+
+    other = [{"agent_id": "b", "payload": {"result": 1}}]
+    assert index.view(other) == {"b": 1}
+    assert index.stats["rebuilds"] == 1
+
+
+def test_previous_outputs_for_falls_back_to_engine_builder():
+    engine = SimpleNamespace(build_previous_outputs=lambda logs: {"count": len(logs)})
+    logs = _logs()
+
+    assert previous_outputs_for(engine, logs) == {"count": 4}
+    assert previous_outputs_for(engine, logs, -1) == {"count": 3}
+    assert previous_outputs_for(SimpleNamespace(), logs) == {}
+
+    engine._previous_outputs_index = PreviousOutputsIndex()
+    assert previous_outputs_for(engine, logs)["a1"] == "plain"
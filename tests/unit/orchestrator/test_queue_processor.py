@@ -8,6 +8,7 @@ from typing import Any, Dict, List
 import pytest
 
 from orka.orchestrator.execution.queue_processor import QueueProcessor
+from orka.orchestrator.execution.trace_writer import wait_for_pending_traces
 
 
 class DummyAgent:
@@ -107,7 +108,8 @@ async def test_queue_processor_happy_path_and_trace_save(tmp_path, monkeypatch):
     # Steps equals number of appended logs; handled by response processor so remains 0
     assert out == {"final": True, "steps": 0}
     assert len(logs) == 0 or isinstance(logs, list)  # handled by response processor
-    # Enhanced trace saved and memory closed
+    # Enhanced trace is saved and memory closed in the background
+    assert await wait_for_pending_traces(timeout=5)
     assert len(eng.memory.saved) == 1
     assert eng.memory.closed is True
 
@@ -216,3 +218,56 @@ async def test_queue_processor_agent_error_caught():
 
     out = await qp.run_queue({}, logs)
     assert out["final"] is True
+
+
+@pytest.mark.asyncio
+async def test_queue_processor_sync_trace_mode_saves_before_returning(tmp_path, monkeypatch):
+    monkeypatch.setenv("ORKA_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("ORKA_TRACE_MODE", "sync")
+    eng = DummyEngine()
+
+    await QueueProcessor(eng).run_queue({}, [])
+
+    assert len(eng.memory.saved) == 1
+    assert eng.memory.closed is True
+
+
+@pytest.mark.asyncio
+async def test_queue_processor_stream_trace_mode_writes_ndjson(tmp_path, monkeypatch):
+    import json
+
+    monkeypatch.setenv("ORKA_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("ORKA_TRACE_MODE", "stream")
+    eng = DummyEngine()
+    eng.orchestrator_cfg = {"agents": ["a1", "a2"]}
+
+    class AppendingProcessor(DummyResponseProcessor):
+        async def process(self, agent_id, agent_id_ret, agent_result, payload_out, agent, input_data, logs, log_entry, step_index):
+            log_entry["payload"] = payload_out
+            logs.append(log_entry)
+            return True
+
+    eng._response_processor = AppendingProcessor()
+
+    await QueueProcessor(eng).run_queue({"x": 1}, [])
+    assert await wait_for_pending_traces(timeout=5)
+
+    (trace_file,) = tmp_path.glob("orka_trace_*.ndjson")
+    records = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert [r["record_type"] for r in records] == ["run_start", "step", "step", "run_end"]
+    assert [r["agent_id"] for r in records[1:3]] == ["a1", "a2"]
+    assert "previous_outputs" not in records[1]
+    assert records[-1]["meta_report"] == {"steps": 2}
+    # No enhanced trace is built in stream mode
+    assert eng.memory.saved == []
+    assert eng.memory.closed is True
+
+
+def test_trace_paths_of_runs_started_in_the_same_second_differ(tmp_path, monkeypatch):
+    from orka.orchestrator.execution.trace_writer import new_trace_path
+
+    monkeypatch.setenv("ORKA_LOG_DIR", str(tmp_path))
+
+    assert new_trace_path(run_id="run-a") != new_trace_path(run_id="run-b")
+    assert new_trace_path() != new_trace_path()
+    assert new_trace_path("ndjson", "../run-a").endswith("_run-a.ndjson")
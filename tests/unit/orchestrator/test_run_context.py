@@ -0,0 +1,84 @@
+"""Tests for per-run execution context isolation."""
+
+import asyncio
+
+import pytest
+
+from orka.orchestrator.run_context import RunContext, RunStateAttribute, current_run_context, run_scope
+
+
+class _Engine:
+    queue = RunStateAttribute()
+    run_id = RunStateAttribute()
+    step_index = RunStateAttribute()
+
+
+class TestRunContext:
+    def test_attributes_behave_like_instance_state_outside_a_run(self):
+        engine = _Engine()
+        engine.run_id = "r1"
+        engine.queue = ["a"]
+
+        assert engine.run_id == "r1"
+        assert engine.queue == ["a"]
+        assert current_run_context(engine).run_id == "r1"
+        assert _Engine().run_id != "r1"
+
+    def test_lone_run_uses_default_context(self):
+        engine = _Engine()
+        engine.run_id = "before"
+        with run_scope(engine) as context:
+            engine.step_index = 3
+        assert context is current_run_context(engine)
+        assert engine.step_index == 3
+        assert engine.run_id == "before"
+
+    def test_explicit_context_does_not_touch_default(self):
+        engine = _Engine()
+        engine.step_index = 1
+        with run_scope(engine, RunContext(run_id="explicit")):
+            engine.step_index = 9
+            assert engine.run_id == "explicit"
+        assert engine.step_index == 1
+
+    def test_reset_starts_a_new_run(self):
+        context = RunContext(step_index=4)
+        context.error_telemetry["errors"].append("boom")
+        old_run_id = context.run_id
+        context.reset()
+        assert context.run_id != old_run_id
+        assert context.step_index == 0
+        assert context.error_telemetry["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_are_isolated(self):
+        engine = _Engine()
+
+        async def run(name: str, steps: int):
+            with run_scope(engine):
+                engine.queue = [f"{name}-{i}" for i in range(steps)]
+                seen = []
+                while engine.queue:
+                    seen.append(engine.queue.pop(0))
+                    engine.step_index += 1
+                    await asyncio.sleep(0)
+                return engine.run_id, engine.step_index, seen
+
+        results = await asyncio.gather(run("a", 3), run("b", 5), run("c", 2))
+
+        assert len({run_id for run_id, _, _ in results}) == 3
+        assert [steps for _, steps, _ in results] == [3, 5, 2]
+        assert results[1][2] == [f"b-{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_child_tasks_and_threads_see_the_run(self):
+        engine = _Engine()
+
+        async def read_run_id():
+            return engine.run_id
+
+        with run_scope(engine, RunContext(run_id="outer")):
+            from_task = await asyncio.create_task(read_run_id())
+            from_thread = await asyncio.to_thread(lambda: engine.run_id)
+        assert from_task == "outer"
+        assert from_thread == "outer"
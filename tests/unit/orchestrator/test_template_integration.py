@@ -163,7 +163,7 @@ class TestTemplateHelpersIntegration:
 
     def test_fallback_when_helpers_unavailable(self):
         """Test graceful degradation when template helpers fail to load."""
-        # This test verifies the TEMPLATE_HELPERS_AVAILABLE flag works
+        # Helpers are registered on the shared template environment
         renderer = SimplifiedPromptRenderer()
         
         # Even if helpers fail, basic rendering should work
@@ -0,0 +1,87 @@
+"""Tests for the compiled workflow cache."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from orka.orchestrator.workflow_cache import CompiledWorkflow, WorkflowCache
+
+YAML_A = "orchestrator:\n  id: a\n  agents: []\nagents: []\n"
+YAML_B = "orchestrator:\n  id: b\n  agents: []\nagents: []\n"
+
+
+class _FakeOrchestrator:
+    built = 0
+
+    def __init__(self, config: Any, **kwargs: Any):
+        _FakeOrchestrator.built += 1
+        self.config = config
+        self.memory = None
+        self.render_template = lambda *args, **kw: ""  # noqa: E731
+
+    async def run(self, input_data: Any, return_logs: bool = False, run_context: Any = None):
+        await asyncio.sleep(0)
+        return [
+            {
+                "input": input_data,
+                "orchestrator": self.config["orchestrator"]["id"],
+                "run_id": run_context.run_id,
+            }
+        ]
+
+
+class TestWorkflowCache:
+    def test_hits_misses_and_lru_eviction(self):
+        cache = WorkflowCache(max_size=1)
+        first = cache.get_workflow(YAML_A)
+        assert cache.get_workflow(YAML_A) is first
+        cache.get_workflow(YAML_B)
+        assert cache.get_workflow(YAML_A) is not first
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+        assert stats["evictions"] == 2
+        assert stats["size"] == 1
+
+    def test_rejects_non_mapping_yaml(self):
+        cache = WorkflowCache()
+        with pytest.raises(ValueError):
+            cache.get_workflow("- just\n- a list\n")
+        assert cache.get_stats()["size"] == 0
+
+
+class TestCompiledWorkflow:
+    @pytest.mark.asyncio
+    async def test_reuses_orchestrator_across_runs(self, monkeypatch):
+        import orka.orchestrator as orchestrator_module
+
+        monkeypatch.setattr(orchestrator_module, "Orchestrator", _FakeOrchestrator)
+        _FakeOrchestrator.built = 0
+
+        workflow = CompiledWorkflow({"orchestrator": {"id": "a"}, "agents": []})
+        for i in range(3):
+            logs = await workflow.run(f"input-{i}", return_logs=True)
+            assert logs[0]["input"] == f"input-{i}"
+
+        assert _FakeOrchestrator.built == 1
+        stats = workflow.get_stats()
+        assert stats["runs"] == 3
+        assert stats["reused"] == 2
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_share_one_orchestrator(self, monkeypatch):
+        import orka.orchestrator as orchestrator_module
+
+        monkeypatch.setattr(orchestrator_module, "Orchestrator", _FakeOrchestrator)
+        _FakeOrchestrator.built = 0
+
+        workflow = CompiledWorkflow({"orchestrator": {"id": "a"}, "agents": []})
+        await workflow.run("warm-up")
+        results = await asyncio.gather(*(workflow.run(f"input-{i}") for i in range(5)))
+
+        assert _FakeOrchestrator.built == 1
+        assert len({logs[0]["run_id"] for logs in results}) == 5
+        assert workflow.get_stats()["max_in_flight"] == 5
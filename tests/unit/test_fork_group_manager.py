@@ -1,10 +1,18 @@
 """Unit tests for orka.fork_group_manager."""
 
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
-from orka.fork_group_manager import ForkGroupManager, SimpleForkGroupManager
+from orka.fork_group_manager import (
+    ForkCompletionRegistry,
+    ForkGroupManager,
+    SimpleForkGroupManager,
+    fork_agent_to_group_key,
+    fork_group_mapping_key,
+    run_id_from,
+)
 
 # Mark all tests in this class to skip auto-mocking since we need specific mocks
 pytestmark = [pytest.mark.unit, pytest.mark.no_auto_mock]
@@ -255,3 +263,85 @@ class TestSimpleForkGroupManager:
         assert "group1" not in manager._groups
         assert "group1" not in manager._branch_sequences
 
+
+class TestRunScopedKeys:
+    """Fork coordination keys are namespaced per run."""
+
+    def test_keys_without_run_id_are_unchanged(self):
+        assert fork_group_mapping_key("fork_1") == "fork_group_mapping:fork_1"
+        assert fork_agent_to_group_key() == "fork_agent_to_group"
+
+    def test_keys_with_run_id_are_scoped(self):
+        assert fork_group_mapping_key("fork_1", "r1") == "run:r1:fork_group_mapping:fork_1"
+        assert fork_agent_to_group_key("r1") != fork_agent_to_group_key("r2")
+
+    def test_run_id_from_context(self):
+        orchestrator = Mock()
+        orchestrator.run_id = "from-orchestrator"
+        assert run_id_from({"run_id": "explicit", "orchestrator": orchestrator}) == "explicit"
+        assert run_id_from({"orchestrator": orchestrator}) == "from-orchestrator"
+        assert run_id_from({"orchestrator": Mock()}) is None
+        assert run_id_from({}) is None
+
+    def test_group_ids_are_unique_within_a_second(self):
+        manager = SimpleForkGroupManager()
+        assert manager.generate_group_id("base") != manager.generate_group_id("base")
+
+
+class TestForkCompletionRegistry:
+    """In-process fork completion tracking."""
+
+    def test_record_completes_group(self):
+        registry = ForkCompletionRegistry()
+        registry.open("g1", ["a", "b"], run_id="r1", node_id="fork")
+
+        assert registry.group_for("a", "r1") == "g1"
+        assert registry.group_for("a", "r2") is None
+        assert registry.group_for_node("fork", "r1") == "g1"
+        assert registry.record("g1", "a", {"response": "A"}) is False
+        assert registry.completed_results("g1") is None
+        assert registry.record("g1", "b", {"response": "B"}) is True
+        assert registry.completed_results("g1") == {"a": {"response": "A"}, "b": {"response": "B"}}
+
+        registry.discard("g1")
+        assert not registry.tracks("g1")
+        assert registry.group_for("a", "r1") is None
+        assert registry.group_for_node("fork", "r1") is None
+
+    def test_oldest_groups_are_evicted(self):
+        registry = ForkCompletionRegistry(max_groups=2)
+        for group_id in ("g1", "g2", "g3"):
+            registry.open(group_id, ["a"])
+        assert not registry.tracks("g1")
+        assert registry.tracks("g3")
+        assert registry.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_when_running_branches_finish(self):
+        registry = ForkCompletionRegistry()
+        registry.open("g1", ["a", "b"])
+        registry.begin("g1")
+
+        async def branches():
+            await asyncio.sleep(0)
+            registry.record("g1", "a", 1)
+            await asyncio.sleep(0)
+            registry.record("g1", "b", 2)
+            registry.end("g1")
+
+        task = asyncio.create_task(branches())
+        results = await registry.wait("g1", timeout=1.0)
+        await task
+
+        assert results == {"a": 1, "b": 2}
+        assert registry.get_stats()["joined_in_process"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_falls_back_when_group_cannot_complete_here(self):
+        registry = ForkCompletionRegistry()
+        registry.open("g1", ["a", "b"])
+        registry.record("g1", "a", 1)
+
+        assert await registry.wait("g1", timeout=1.0) is None
+        assert await registry.wait("unknown") is None
+        assert registry.get_stats()["fallbacks"] == 1
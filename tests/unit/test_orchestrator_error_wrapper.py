@@ -220,7 +220,8 @@ class TestOrkaErrorHandler:
                 assert result["error_report_path"] == "critical_report.json"
                 assert error_handler.error_telemetry["execution_status"] == "failed"
                 mock_logger.info.assert_any_call("[CRASH] [ORKA-CRITICAL] Orchestrator failed: Orchestrator crashed")
-                mock_orchestrator.memory.close.assert_called_once()
+                # The failed run returns its own memory lease; the wrapper must not close
+                mock_orchestrator.memory.close.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("orka.orchestrator_error_wrapper.OrkaErrorHandler._patch_orchestrator_for_error_tracking", MagicMock())
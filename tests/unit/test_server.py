@@ -99,6 +99,11 @@ class TestSanitizeForJson:
 
 
 class TestRunExecution:
+    @pytest.fixture(autouse=True)
+    def disable_workflow_cache(self, monkeypatch):
+        # These tests cover the uncached temp-file path
+        monkeypatch.setenv("ORKA_WORKFLOW_CACHE", "false")
+
     @pytest.fixture
     def mock_orchestrator_instance(self):
         mock_orch = AsyncMock(spec=Orchestrator)
@@ -237,6 +242,36 @@ agents:
         mock_logger.error.assert_called_once()
         assert "Error creating JSONResponse: Sanitization failed" in mock_logger.error.call_args[0][0]
 
+class TestRunExecutionWorkflowCache:
+    @pytest.fixture
+    def mock_request(self):
+        request = MagicMock(spec=Request)
+        payload = {"input": "test input", "yaml_config": "orchestrator:\n  id: o\nagents: []\n"}
+        request.body = AsyncMock(return_value=json.dumps(payload).encode("utf-8"))
+        request.headers = {}
+        return request
+
+    @pytest.mark.asyncio
+    @patch("orka.server.Orchestrator")
+    @patch("orka.server.get_workflow_cache")
+    async def test_run_execution_uses_compiled_workflow(self, mock_get_cache, MockOrchestrator, mock_request, monkeypatch):
+        monkeypatch.setenv("ORKA_WORKFLOW_CACHE", "true")
+        monkeypatch.setenv("ORKA_PERSISTENT_MEMORY", "true")
+        workflow = MagicMock()
+        workflow.run = AsyncMock(return_value=[{"agent": "output"}])
+        mock_get_cache.return_value.get_workflow.return_value = workflow
+
+        response = await run_execution(mock_request)
+
+        mock_get_cache.return_value.get_workflow.assert_called_once_with(
+            "orchestrator:\n  id: o\nagents: []\n"
+        )
+        workflow.run.assert_awaited_once_with("test input", return_logs=True)
+        MockOrchestrator.assert_not_called()
+        assert response.status_code == 200
+        assert json.loads(response.body)["execution_log"] == [{"agent": "output"}]
+
+
 @patch("uvicorn.run")
 @patch("sys.exit")
 def test_server_startup_with_env_port(mock_exit, mock_run):
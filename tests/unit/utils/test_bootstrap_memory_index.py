@@ -185,6 +185,82 @@ class TestHybridVectorSearch:
         assert len(out) == 1
         assert out[0]["content"] == "E"
 
+    def test_filter_expression_prefilters_knn_and_returns_fields(self):
+        client = DummyRedisClient()
+        ft = client.ft("orka_enhanced_memory")
+        ft._search_results = DummySearchResults([
+            DummyDoc("1", content="A", node_id="n1", trace_id="t1", metadata="{}", vector_score=0.2),
+        ])
+        queries = []
+
+        def search(query, **kwargs):
+            queries.append(query.query_string())
+            return ft._search_results
+
+        ft.search = search  # type: ignore[assignment]
+        vec = np.ones(4, dtype=np.float32)
+
+        out = bmi.hybrid_vector_search(
+            client, "q", vec, num_results=3, filter_expression="@node_id_tag:{n1}"
+        )
+        assert queries[0].startswith("(@node_id_tag:{n1})=>[KNN 3 ")
+        assert out[0]["fields"] == {"content": "A", "node_id": "n1", "trace_id": "t1", "metadata": "{}"}
+
+
+class TestBuildMemoryFilter:
+    FIELDS = {
+        "trace_id_tag": "TAG",
+        "node_id_tag": "TAG",
+        "memory_type": "TAG",
+        "log_type": "TAG",
+        "namespace": "TAG",
+        "importance_score": "NUMERIC",
+    }
+
+    def test_pushes_down_all_filters(self):
+        expression, applied = bmi.build_memory_filter(
+            self.FIELDS,
+            trace_id="run-1",
+            node_id="reader",
+            memory_type="short_term",
+            min_importance=0.5,
+            log_type="memory",
+            namespace="user.docs",
+        )
+        assert "@trace_id_tag:{run\\-1}" in expression
+        assert "@node_id_tag:{reader}" in expression
+        assert "@importance_score:[0.5 +inf]" in expression
+        assert "(@log_type:{memory} | -@log_type:{memory | log})" in expression
+        assert f"@namespace:{{user\\.docs | {bmi.NO_NAMESPACE_TAG}}}" in expression
+        assert applied == {"trace_id", "node_id", "memory_type", "min_importance", "log_type", "namespace"}
+
+    def test_only_pushes_down_indexed_fields(self):
+        expression, applied = bmi.build_memory_filter(
+            {"content": "TEXT", "node_id": "TEXT"}, node_id="reader", log_type="memory"
+        )
+        assert expression is None
+        assert applied == set()
+
+        expression, applied = bmi.build_memory_filter(None, trace_id="t")
+        assert expression is None
+
+    def test_existing_index_gains_missing_filter_fields(self, monkeypatch):
+        client = DummyRedisClient()
+        added = []
+        client.ft("eidx").alter_schema_add = lambda fields: added.extend(fields)  # type: ignore[attr-defined]
+        monkeypatch.setattr(bmi, "VECTOR_SEARCH_AVAILABLE", True)
+        monkeypatch.setattr(
+            bmi,
+            "verify_memory_index",
+            lambda c, n: {
+                "exists": True,
+                "vector_field_exists": True,
+                "fields": {"content_vector": "VECTOR", "trace_id_tag": "TAG"},
+            },
+        )
+        assert bmi.ensure_enhanced_memory_index(client, "eidx") is True
+        assert len(added) == len(bmi.memory_filter_fields()) - 1
+
 
 class TestVerifyMemoryIndex:
     def test_verify_parses_attributes_and_handles_errors(self):
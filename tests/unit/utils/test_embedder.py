@@ -5,7 +5,9 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from orka.utils.embedder import AsyncEmbedder, _ensure_numpy_array, to_bytes
+import asyncio
+
+from orka.utils.embedder import AsyncEmbedder, EmbeddingBatcher, _ensure_numpy_array, to_bytes
 
 # Mark all tests in this class to skip auto-mocking since we need specific mocks
 pytestmark = [pytest.mark.unit, pytest.mark.no_auto_mock]
@@ -111,6 +113,182 @@ class TestAsyncEmbedder:
             assert np.array_equal(result1, result2)
 
 
+class TestFallbackEncoder:
+    """Test suite for the vectorized feature-hashing fallback."""
+
+    def _embedder(self):
+        with patch('orka.utils.embedder.SentenceTransformer') as MockST:
+            MockST.return_value.get_sentence_embedding_dimension.return_value = 384
+            embedder = AsyncEmbedder()
+        embedder.model = None
+        embedder.model_loaded = False
+        return embedder
+
+    def test_fallback_does_not_touch_global_random_state(self):
+        """The fallback encoder must not reseed Python's global RNG."""
+        import random
+
+        embedder = self._embedder()
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+        embedder._fallback_encode("some text")
+        assert random.random() == expected
+
+    def test_shared_tokens_give_nearby_vectors(self):
+        """Texts that share words are closer than unrelated texts."""
+        embedder = self._embedder()
+        a, b, c = embedder._fallback_encode_batch(
+            ["redis memory search", "memory search in redis", "banana smoothie recipe"]
+        )
+
+        assert float(a @ b) > float(a @ c)
+
+    def test_batch_matches_single_and_is_normalized(self):
+        """Batch encoding gives the same vectors as one-by-one encoding."""
+        embedder = self._embedder()
+        texts = ["alpha beta", "gamma", "!!!", ""]
+        batch = embedder._fallback_encode_batch(texts)
+
+        assert batch.shape == (4, embedder.embedding_dim)
+        for text, row in zip(texts, batch):
+            assert np.allclose(row, embedder._fallback_encode(text))
+        assert np.allclose(np.linalg.norm(batch[:3], axis=1), 1.0)
+        assert not batch[3].any()
+
+    @staticmethod
+    def _reference_features(text, dim):
+        """Feature-by-feature Python version of ``_hashed_features``."""
+        from orka.utils import embedder as emb
+
+        mask = 0xFFFFFFFF
+        k0, k1, k2 = (int(k) for k in emb._TRIGRAM_KEYS)
+        codes = [ord(c) if c.isalnum() or c == "_" else 0 for c in text.lower()]
+        n = len(codes)
+        trigrams = {}
+        for i, code in enumerate(codes):
+            if code:
+                prev = codes[i - 1] if i > 0 else 0
+                nxt = codes[i + 1] if i + 1 < n else 0
+                trigrams[i] = (prev * k0 + code * k1 + nxt * k2) & mask
+
+        words, i = [], 0
+        while i < n:
+            if not codes[i]:
+                i += 1
+                continue
+            h, j = 0, i
+            while j < n and codes[j]:
+                h = (h + trigrams[j] * pow(int(emb._WORD_KEY), j - i + 1, 1 << 32)) & mask
+                j += 1
+            words.append(h)
+            i = j
+
+        slots, weights = [], []
+        for index, h in enumerate(words + [trigrams[i] for i in sorted(trigrams)]):
+            h ^= h >> 16
+            h = (h * int(emb._MIX_KEY)) & mask
+            h ^= h >> 13
+            slots.append(((h >> 16) * dim) >> 16)
+            sign = 1.0 if h & (1 << 15) else -1.0
+            weights.append(sign if index < len(words) else sign * 0.5)
+        return slots, weights
+
+    def test_vectorized_features_match_reference(self):
+        """The NumPy passes hash every word and trigram like the per-feature loop."""
+        from orka.utils.embedder import _hashed_features
+
+        text = " ".join(f"Token{i % 97} café naïve_{i % 13}" for i in range(250))
+        slots, weights = _hashed_features(text, 384)
+        expected_slots, expected_weights = self._reference_features(text, 384)
+
+        assert slots.tolist() == expected_slots
+        assert weights.tolist() == expected_weights
+
+    def test_anagrams_get_different_word_slots(self):
+        """A word's hash depends on the order of its characters."""
+        from orka.utils.embedder import _hashed_features
+
+        for first, second in [("form", "from"), ("united", "untied"), ("salt", "slat")]:
+            # The first feature of a single-word text is the word itself
+            assert _hashed_features(first, 1 << 16)[0][0] != _hashed_features(second, 1 << 16)[0][0]
+
+    def test_embed_batch_uses_cache_and_fallback(self):
+        """embed_batch fills cache misses in one pass and reuses cached vectors."""
+        embedder = self._embedder()
+        first = embedder.embed_batch(["one", "two", "one"])
+        assert np.allclose(first[0], first[2])
+        assert np.allclose(first[1], embedder.embed("two"))
+
+
+class TestEmbeddingBatcher:
+    """Test suite for EmbeddingBatcher micro-batching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        """Concurrent submits are resolved by a single batched call."""
+        calls = []
+
+        def encode_batch(texts):
+            calls.append(list(texts))
+            return [np.full(3, float(len(t)), dtype=np.float32) for t in texts]
+
+        batcher = EmbeddingBatcher(encode_batch, max_batch_size=8, max_latency_ms=20)
+        results = await asyncio.gather(*(batcher.submit(t) for t in ["a", "bb", "ccc", "a"]))
+
+        assert calls == [["a", "bb", "ccc"]]  # duplicate text encoded once
+        assert [r[0] for r in results] == [1.0, 2.0, 3.0, 1.0]
+        stats = batcher.get_stats()
+        assert stats["batches"] == 1
+        assert stats["requests"] == 4
+        assert stats["avg_batch_fill"] == pytest.approx(3 / 8)
+        assert stats["avg_queue_wait_ms"] >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_full_batch_dispatches_without_waiting(self):
+        """Reaching max_batch_size splits requests into several model calls."""
+        calls = []
+
+        def encode_batch(texts):
+            calls.append(len(texts))
+            return [np.zeros(2, dtype=np.float32) for _ in texts]
+
+        batcher = EmbeddingBatcher(encode_batch, max_batch_size=2, max_latency_ms=10_000)
+        await asyncio.wait_for(asyncio.gather(*(batcher.submit(str(i)) for i in range(5))), timeout=5)
+
+        assert sum(calls) == 5
+        assert max(calls) <= 2
+
+    @pytest.mark.asyncio
+    async def test_batch_errors_propagate_to_every_waiter(self):
+        """A failing model call rejects all futures of the batch."""
+
+        def encode_batch(texts):
+            raise RuntimeError("boom")
+
+        batcher = EmbeddingBatcher(encode_batch, max_batch_size=4, max_latency_ms=1)
+        results = await asyncio.gather(batcher.submit("x"), batcher.submit("y"), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert batcher.get_stats()["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_embedder_encode_falls_back_when_batch_fails(self):
+        """AsyncEmbedder.encode uses the fallback vector if the batched call fails."""
+        with patch('orka.utils.embedder.SentenceTransformer') as MockST:
+            mock_model = Mock()
+            mock_model.encode.side_effect = RuntimeError("model down")
+            mock_model.get_sentence_embedding_dimension.return_value = 384
+            MockST.return_value = mock_model
+            embedder = AsyncEmbedder(max_batch_latency_ms=0)
+            embedder.model = mock_model
+            embedder.model_loaded = True
+
+            result = await embedder.encode("text")
+
+            assert np.allclose(result, embedder._fallback_encode("text"))
+
+
 class TestToBytes:
     """Test suite for to_bytes function."""
 